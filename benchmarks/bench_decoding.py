@@ -0,0 +1,97 @@
+"""
+Measure how long decoding a large body holds the event loop.
+
+A synthetic `/players` page is decoded by `JsonDecoder` while a ticker task
+sleeps 1 ms at a time; the longest gap between two ticks is the worst stall
+any concurrent request would have seen. The "inline" row decodes with
+`json.loads` on the loop, "thread" offloads it to a thread pool, and the
+"sliced" rows decode incrementally with the given slice size.
+
+Usage:
+------
+    API_FOOTBALL_KEY=x python benchmarks/bench_decoding.py --rows 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from api_football_sdk.decoding import JsonDecoder
+
+
+def _page(rows: int) -> dict[str, Any]:
+    players = []
+    for index in range(rows):
+        players.append(
+            {
+                "player": {
+                    "id": index,
+                    "name": f"Player {index}",
+                    "age": 20 + index % 15,
+                },
+                "statistics": [
+                    {
+                        "team": {
+                            "id": index % 20 + 1,
+                            "name": f"Team {index % 20 + 1}",
+                        },
+                        "games": {"appearences": 30, "minutes": 2500, "rating": "7.1"},
+                        "goals": {"total": index % 12, "assists": index % 7},
+                        "passes": {"total": 900, "key": 30, "accuracy": 85},
+                    }
+                ],
+            }
+        )
+    return {"paging": {"current": 1, "total": 1}, "response": players}
+
+
+async def _measure(decoder: JsonDecoder, body: bytes) -> tuple[float, float]:
+    stall = 0.0
+
+    async def ticker() -> None:
+        nonlocal stall
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(0.001)
+            stall = max(stall, time.perf_counter() - started - 0.001)
+
+    task = asyncio.create_task(ticker())
+    await asyncio.sleep(0.01)
+    stall = 0.0
+    started = time.perf_counter()
+    await decoder.decode("/players", body)
+    elapsed = time.perf_counter() - started
+    await asyncio.sleep(0.005)  # let the ticker see the last gap
+    task.cancel()
+    return elapsed, stall
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=20000, help="players per page")
+    args = parser.parse_args()
+
+    body = json.dumps(_page(args.rows)).encode()
+    print(
+        f"{'mode':<14} {'total ms':>10} {'max stall ms':>14}   ({len(body) / 1e6:.1f} MB)"
+    )
+    with ThreadPoolExecutor(1) as executor:
+        configs = [
+            ("inline", JsonDecoder(None)),
+            ("thread", JsonDecoder(0, executor=executor)),
+        ] + [
+            (f"sliced {size // 1024}k", JsonDecoder(0, slice_bytes=size))
+            for size in (16 * 1024, 64 * 1024, 256 * 1024)
+        ]
+        for label, decoder in configs:
+            elapsed, stall = await _measure(decoder, body)
+            print(f"{label:<14} {elapsed * 1000:>10.1f} {stall * 1000:>14.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
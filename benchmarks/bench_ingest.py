@@ -0,0 +1,120 @@
+"""
+Measure bulk ingest throughput against the number of worker processes.
+
+Synthetic `/fixtures` pages are served from memory, so the numbers isolate
+the CPU side of a backfill: JSON decoding and flattening into `EntityStore`
+rows. The "inline" row decodes on the event loop, as a hook-based ingest
+would; the other rows use an `IngestPipeline` with 1, 2, 4, ... workers,
+up to the number of CPUs. Worker start-up is excluded by a warm-up run.
+
+Usage:
+------
+    API_FOOTBALL_KEY=x python benchmarks/bench_ingest.py --pages 400 --rows 380
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import time
+from concurrent.futures import Executor, Future
+from typing import Any, Callable
+
+import httpx
+
+from api_football_sdk.adapters.memory import MemoryTransport
+from api_football_sdk.client import ApiFootballClient
+from api_football_sdk.ingest import IngestPipeline
+from api_football_sdk.storage import EntityStore
+
+
+class _InlineExecutor(Executor):
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future:
+        future: Future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as exc:
+            future.set_exception(exc)
+        return future
+
+
+def _page(page: int, rows: int) -> dict[str, Any]:
+    fixtures = []
+    for index in range(rows):
+        home, away = index % 20 + 1, (index + 7) % 20 + 1
+        fixtures.append(
+            {
+                "fixture": {
+                    "id": page * rows + index,
+                    "referee": "M. Oliver",
+                    "timezone": "UTC",
+                    "timestamp": 1723834800 + index * 3600,
+                    "venue": {"id": home, "name": f"Stadium {home}", "city": "City"},
+                    "status": {"long": "Match Finished", "short": "FT", "elapsed": 90},
+                },
+                "league": {
+                    "id": 39,
+                    "name": "Premier League",
+                    "country": "England",
+                    "season": 2000 + page,
+                    "round": f"Regular Season - {index // 10 + 1}",
+                },
+                "teams": {
+                    "home": {"id": home, "name": f"Team {home}", "winner": True},
+                    "away": {"id": away, "name": f"Team {away}", "winner": False},
+                },
+                "goals": {"home": 1, "away": 0},
+                "score": {"halftime": {"home": 0, "away": 0}},
+            }
+        )
+    return {"results": rows, "response": fixtures}
+
+
+async def _run(pipeline: IngestPipeline, pages: int) -> float:
+    requests = [("/fixtures", {"league": 39, "season": 2000 + p}) for p in range(pages)]
+    with EntityStore() as store:
+        started = time.perf_counter()
+        await pipeline.ingest(requests, store)
+        elapsed = time.perf_counter() - started
+    return pages / elapsed
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--rows", type=int, default=380, help="fixtures per page")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    bodies = {
+        2000 + page: json.dumps(_page(page, args.rows)).encode()
+        for page in range(args.pages)
+    }
+    transport = MemoryTransport(record=False)
+    transport.add_route(
+        "/fixtures",
+        handler=lambda request: httpx.Response(
+            200, content=bodies[int(request.url.params["season"])]
+        ),
+    )
+
+    counts = [1]
+    while counts[-1] * 2 <= args.max_workers:
+        counts.append(counts[-1] * 2)
+
+    print(f"{'workers':<8} {'pages/s':>10} {'rows/s':>10}   ({args.pages} pages)")
+    async with ApiFootballClient(transport=transport, max_concurrency=64) as client:
+        configs: list[tuple[str, IngestPipeline]] = [
+            ("inline", IngestPipeline(client, executor=_InlineExecutor(), workers=1))
+        ] + [(str(n), IngestPipeline(client, workers=n)) for n in counts]
+        for label, pipeline in configs:
+            async with pipeline:
+                await _run(pipeline, min(args.pages, 4 * pipeline.workers))
+                rate = await _run(pipeline, args.pages)
+            print(f"{label:<8} {rate:>10.1f} {rate * args.rows:>10.0f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
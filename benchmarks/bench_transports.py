@@ -0,0 +1,112 @@
+"""
+Compare request throughput of the available transports.
+
+Each transport is driven through `ApiFootballClient.get_json`, so the
+numbers include retries bookkeeping, the concurrency limit, and JSON
+decoding. By default requests go to a local keep-alive HTTP/1.1 server
+started by this script; pass `--base-url` to measure against a real
+endpoint (required for a meaningful HTTP/2 comparison, which needs TLS).
+
+Usage:
+------
+    API_FOOTBALL_KEY=x python benchmarks/bench_transports.py --requests 5000
+    API_FOOTBALL_KEY=x python benchmarks/bench_transports.py \\
+        --transports httpx http2 --base-url https://my-mirror.example/v3
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+
+from api_football_sdk.adapters.base import TRANSPORTS, create_transport
+from api_football_sdk.adapters.memory import MemoryTransport
+from api_football_sdk.client import ApiFootballClient
+
+
+def _body(rows: int) -> bytes:
+    fixture = {
+        "fixture": {"id": 1, "referee": "M. Oliver", "timestamp": 1723834800},
+        "league": {"id": 39, "name": "Premier League", "season": 2024},
+        "teams": {"home": {"id": 33, "name": "Manchester United"}, "away": {"id": 36}},
+        "goals": {"home": 1, "away": 0},
+    }
+    return json.dumps({"results": rows, "response": [fixture] * rows}).encode()
+
+
+async def _start_server(body: bytes) -> tuple[asyncio.AbstractServer, int]:
+    head = (
+        b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+        b"Content-Length: %d\r\n\r\n" % len(body)
+    )
+
+    async def handle(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                await reader.readuntil(b"\r\n\r\n")
+                writer.write(head + body)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    return server, server.sockets[0].getsockname()[1]
+
+
+async def _run(client: ApiFootballClient, requests: int) -> float:
+    started = time.perf_counter()
+    await asyncio.gather(*(client.get_json("/fixtures") for _ in range(requests)))
+    return requests / (time.perf_counter() - started)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--transports", nargs="+", default=["httpx", "aiohttp", "memory"]
+    )
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--rows", type=int, default=20, help="fixtures per response")
+    parser.add_argument("--base-url", help="benchmark a real endpoint instead")
+    args = parser.parse_args()
+
+    body = _body(args.rows)
+    server = None
+    base_url = args.base_url
+    if base_url is None:
+        server, port = await _start_server(body)
+        base_url = f"http://127.0.0.1:{port}/v3"
+
+    print(
+        f"{'transport':<10} {'req/s':>10}   ({args.requests} requests, "
+        f"concurrency {args.concurrency}, {len(body)} byte bodies)"
+    )
+    for name in args.transports:
+        if name not in TRANSPORTS:
+            parser.error(f"unknown transport {name!r}")
+        if name == "memory":
+            transport = MemoryTransport(record=False)
+            transport.add_route("/fixtures", json.loads(body))
+        else:
+            transport = create_transport(name, base_url=base_url)
+
+        async with ApiFootballClient(
+            transport=transport, max_concurrency=args.concurrency
+        ) as client:
+            await _run(client, min(args.concurrency, args.requests))  # warm the pool
+            rate = await _run(client, args.requests)
+        print(f"{name:<10} {rate:>10.0f}")
+
+    if server is not None:
+        server.close()
+        await server.wait_closed()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,9 @@
+"""
+Run the `api-football` command with `python -m api_football_sdk`.
+"""
+
+import sys
+
+from api_football_sdk.cli import main
+
+sys.exit(main())
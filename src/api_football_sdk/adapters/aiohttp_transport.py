@@ -0,0 +1,197 @@
+"""
+Transport backed by `aiohttp.ClientSession`.
+
+Requires the optional `aiohttp` package (`pip install "api-football-sdk[aiohttp]"`).
+Responses are converted to `httpx.Response` and failures to
+`httpx.RequestError` subclasses, so the client behaves identically on top
+of either transport.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, AsyncIterator, Mapping
+
+import httpx
+
+from api_football_sdk.adapters.base import Transport
+from api_football_sdk.exceptions import ConfigurationError
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - exercised only without the extra
+    aiohttp = None  # type: ignore[assignment]
+
+__all__: list[str] = ["AiohttpTransport"]
+
+# aiohttp has already decoded the body, so these no longer describe it.
+_DROPPED_HEADERS = frozenset(
+    {"content-encoding", "content-length", "transfer-encoding"}
+)
+
+
+class AiohttpTransport(Transport):
+    """
+    Transport sharing one pooled `aiohttp.ClientSession`.
+
+    The session is created lazily on first use, inside the running loop.
+    """
+
+    def __init__(
+        self,
+        *,
+        base_url: str,
+        headers: Mapping[str, str],
+        timeout: float,
+        limit: int = 100,
+    ) -> None:
+        if aiohttp is None:
+            raise ConfigurationError(
+                'The aiohttp transport requires the "aiohttp" package: '
+                'pip install "api-football-sdk[aiohttp]"'
+            )
+        self.base_url = self._base_url = base_url.rstrip("/")
+        self._headers = dict(headers)
+        self._timeout = timeout
+        self._limit = limit
+        self._session: aiohttp.ClientSession | None = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=self._headers,
+                timeout=aiohttp.ClientTimeout(total=self._timeout),
+                connector=aiohttp.TCPConnector(limit=self._limit),
+            )
+        return self._session
+
+    async def send(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+        timeout: float | None = None,
+    ) -> httpx.Response:
+        """
+        Send one request through the pooled session.
+
+        :param method: HTTP method.
+        :param url: Endpoint relative path.
+        :param params: Query string parameters.
+        :param json: Request body.
+        :param timeout: Overrides the session timeout, in seconds.
+        :return: The HTTP response.
+        """
+        request, raw = await self._open(method, url, params, json, timeout)
+        try:
+            content = await raw.read()
+        except (asyncio.TimeoutError, aiohttp.ClientError) as exc:
+            raise _translate(exc, request) from exc
+        finally:
+            raw.release()
+        return httpx.Response(
+            raw.status, headers=_headers(raw), content=content, request=request
+        )
+
+    async def stream(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+        timeout: float | None = None,
+    ) -> httpx.Response:
+        """
+        Send one request, leaving the body to be read as it arrives.
+
+        :param method: HTTP method.
+        :param url: Endpoint relative path.
+        :param params: Query string parameters.
+        :param json: Request body.
+        :param timeout: Overrides the session timeout, in seconds.
+        :return: The HTTP response, with its body unread.
+        """
+        request, raw = await self._open(method, url, params, json, timeout)
+        return httpx.Response(
+            raw.status,
+            headers=_headers(raw),
+            stream=_AiohttpByteStream(raw, request),
+            request=request,
+        )
+
+    async def _open(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None,
+        json: dict[str, Any] | None,
+        timeout: float | None,
+    ) -> tuple[httpx.Request, aiohttp.ClientResponse]:
+        query = {key: str(value) for key, value in (params or {}).items()}
+        request = httpx.Request(method, self._base_url + url, params=query)
+        options: dict[str, Any] = {"params": query, "json": json}
+        if timeout is not None:
+            options["timeout"] = aiohttp.ClientTimeout(total=timeout)
+        try:
+            raw = await self._get_session().request(
+                method, self._base_url + url, **options
+            )
+        except (asyncio.TimeoutError, aiohttp.ClientError) as exc:
+            raise _translate(exc, request) from exc
+        return request, raw
+
+    async def aclose(self) -> None:
+        """
+        Close the pooled session.
+
+        :return: None
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+class _AiohttpByteStream(httpx.AsyncByteStream):
+    """
+    Body of an open aiohttp response, read chunk by chunk.
+    """
+
+    def __init__(self, raw: aiohttp.ClientResponse, request: httpx.Request) -> None:
+        self._raw = raw
+        self._request = request
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        try:
+            async for chunk in self._raw.content.iter_any():
+                yield chunk
+        except (asyncio.TimeoutError, aiohttp.ClientError) as exc:
+            raise _translate(exc, self._request) from exc
+
+    async def aclose(self) -> None:
+        self._raw.release()
+
+
+def _headers(raw: aiohttp.ClientResponse) -> list[tuple[str, str]]:
+    return [
+        (name, value)
+        for name, value in raw.headers.items()
+        if name.lower() not in _DROPPED_HEADERS
+    ]
+
+
+def _translate(exc: Exception, request: httpx.Request) -> httpx.RequestError:
+    """
+    Map an aiohttp failure to the matching `httpx.RequestError`.
+
+    :param exc: Timeout or `aiohttp.ClientError` raised by aiohttp.
+    :param request: Request being sent, attached to the new exception.
+    :return: The exception to raise instead.
+    """
+    if isinstance(exc, asyncio.TimeoutError):
+        return httpx.ReadTimeout(str(exc) or "Request timed out", request=request)
+    if isinstance(exc, aiohttp.ClientConnectionError):
+        return httpx.ConnectError(str(exc), request=request)
+    return httpx.TransportError(str(exc), request=request)
@@ -0,0 +1,157 @@
+"""
+Transport adapter interface for the API Football client.
+
+A transport sends exactly one HTTP request and returns the raw response.
+Retries, concurrency limits, and JSON decoding live in `ApiFootballClient`
+above it, so transports can be swapped (or benchmarked against each other)
+without changing client behavior.
+
+Every transport returns an `httpx.Response` and reports network failures as
+`httpx.RequestError` subclasses, which is what the client's retry logic and
+exception hierarchy are built on.
+
+Usage example:
+--------------
+    from api_football_sdk.adapters.base import create_transport
+    from api_football_sdk.client import ApiFootballClient
+
+    client = ApiFootballClient(transport=create_transport("aiohttp"))
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from types import TracebackType
+from typing import Any, Mapping, Type
+
+import httpx
+
+from api_football_sdk.exceptions import ConfigurationError
+
+__all__: list[str] = ["Transport", "TRANSPORTS", "create_transport"]
+
+TRANSPORTS: tuple[str, ...] = ("httpx", "http2", "aiohttp", "memory")
+"""Names accepted by `create_transport`."""
+
+
+class Transport(ABC):
+    """
+    Sends single HTTP requests to the API.
+
+    Implementations must not retry, and must raise `httpx.RequestError`
+    subclasses (e.g., `httpx.ConnectError`, `httpx.TimeoutException`) for
+    network-level failures. HTTP error statuses are returned, not raised.
+    """
+
+    base_url: str | None = None
+    """API base URL requests are sent to; None means `settings.api_base_url`."""
+
+    @abstractmethod
+    async def send(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+        timeout: float | None = None,
+    ) -> httpx.Response:
+        """
+        Send one request.
+
+        :param method: HTTP method (GET, POST, etc.).
+        :param url: Endpoint relative path (e.g., "/fixtures").
+        :param params: Query string parameters.
+        :param json: Request body (for POST/PUT methods).
+        :param timeout: Overrides the transport's default timeout, in seconds.
+        :return: The HTTP response, with its body fully read.
+        """
+
+    async def stream(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+        timeout: float | None = None,
+    ) -> httpx.Response:
+        """
+        Send one request, returning once the response headers have arrived.
+
+        The caller reads the body with `response.aiter_bytes()` and must
+        release it with `response.aclose()`. This default reads the whole
+        body through `send`; network transports override it to stream.
+
+        :param method: HTTP method (GET, POST, etc.).
+        :param url: Endpoint relative path (e.g., "/fixtures").
+        :param params: Query string parameters.
+        :param json: Request body (for POST/PUT methods).
+        :param timeout: Overrides the transport's default timeout, in seconds.
+        :return: The HTTP response, with its body possibly unread.
+        """
+        return await self.send(method, url, params=params, json=json, timeout=timeout)
+
+    async def aclose(self) -> None:
+        """
+        Release pooled connections and other resources.
+
+        :return: None
+        """
+
+    async def __aenter__(self) -> Transport:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+
+def create_transport(
+    name: str = "httpx",
+    *,
+    base_url: str | None = None,
+    headers: Mapping[str, str] | None = None,
+    timeout: float | None = None,
+) -> Transport:
+    """
+    Build a transport by name.
+
+    :param name: One of `TRANSPORTS`: "httpx" (HTTP/1.1), "http2" (httpx with
+        HTTP/2), "aiohttp", or "memory" (no network; register routes on it).
+    :param base_url: API base URL; defaults to `settings.api_base_url`.
+    :param headers: Headers sent with every request; defaults to
+        `settings.default_headers`.
+    :param timeout: Default timeout in seconds; defaults to `settings.http_timeout`.
+    :return: A new transport.
+    :raises ConfigurationError: If the name is unknown or its optional
+        dependency is not installed.
+    """
+    from api_football_sdk.config import settings
+
+    options: dict[str, Any] = {
+        "base_url": base_url or str(settings.api_base_url),
+        "headers": dict(headers if headers is not None else settings.default_headers),
+        "timeout": timeout or settings.http_timeout,
+    }
+
+    if name in ("httpx", "http2"):
+        from api_football_sdk.adapters.httpx_transport import HttpxTransport
+
+        return HttpxTransport(http2=name == "http2", **options)
+    if name == "aiohttp":
+        from api_football_sdk.adapters.aiohttp_transport import AiohttpTransport
+
+        return AiohttpTransport(**options)
+    if name == "memory":
+        from api_football_sdk.adapters.memory import MemoryTransport
+
+        return MemoryTransport(base_url=options["base_url"])
+
+    raise ConfigurationError(
+        f"Unknown transport {name!r}; expected one of {', '.join(TRANSPORTS)}"
+    )
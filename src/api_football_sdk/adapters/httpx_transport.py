@@ -0,0 +1,118 @@
+"""
+Transport backed by `httpx.AsyncClient`, over HTTP/1.1 or HTTP/2.
+
+HTTP/2 multiplexes concurrent requests over a single connection and needs
+the optional `h2` package (`pip install "api-football-sdk[http2]"`).
+"""
+
+from __future__ import annotations
+
+from typing import Any, Mapping
+
+import httpx
+
+from api_football_sdk.adapters.base import Transport
+from api_football_sdk.exceptions import ConfigurationError
+
+__all__: list[str] = ["HttpxTransport"]
+
+
+class HttpxTransport(Transport):
+    """
+    Default transport, sharing one pooled `httpx.AsyncClient`.
+    """
+
+    def __init__(
+        self,
+        *,
+        base_url: str,
+        headers: Mapping[str, str],
+        timeout: float,
+        http2: bool = False,
+        limits: httpx.Limits | None = None,
+    ) -> None:
+        self.base_url = base_url
+        try:
+            self._client = httpx.AsyncClient(
+                base_url=base_url,
+                headers=dict(headers),
+                timeout=timeout,
+                follow_redirects=True,
+                http2=http2,
+                limits=limits or httpx.Limits(),
+            )
+        except ImportError as exc:
+            raise ConfigurationError(
+                'HTTP/2 requires the "h2" package: '
+                'pip install "api-football-sdk[http2]"'
+            ) from exc
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """
+        The underlying `httpx.AsyncClient`.
+
+        :return: The pooled client.
+        """
+        return self._client
+
+    async def send(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+        timeout: float | None = None,
+    ) -> httpx.Response:
+        """
+        Send one request through the pooled client.
+
+        :param method: HTTP method.
+        :param url: Endpoint relative path.
+        :param params: Query string parameters.
+        :param json: Request body.
+        :param timeout: Overrides the client timeout, in seconds.
+        :return: The HTTP response.
+        """
+        if timeout is None:
+            return await self._client.request(method, url, params=params, json=json)
+        return await self._client.request(
+            method, url, params=params, json=json, timeout=timeout
+        )
+
+    async def stream(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+        timeout: float | None = None,
+    ) -> httpx.Response:
+        """
+        Send one request, leaving the body to be read as it arrives.
+
+        :param method: HTTP method.
+        :param url: Endpoint relative path.
+        :param params: Query string parameters.
+        :param json: Request body.
+        :param timeout: Overrides the client timeout, in seconds.
+        :return: The HTTP response, with its body unread.
+        """
+        request = self._client.build_request(
+            method,
+            url,
+            params=params,
+            json=json,
+            timeout=httpx.USE_CLIENT_DEFAULT if timeout is None else timeout,
+        )
+        return await self._client.send(request, stream=True)
+
+    async def aclose(self) -> None:
+        """
+        Close the underlying AsyncClient connection.
+
+        :return: None
+        """
+        await self._client.aclose()
@@ -0,0 +1,136 @@
+"""
+In-memory transport that answers requests without any network I/O.
+
+Useful for tests and for benchmarking everything above the transport
+(retries, limits, decoding, caches) at full speed.
+
+Usage example:
+--------------
+    from api_football_sdk.adapters.memory import MemoryTransport
+    from api_football_sdk.client import ApiFootballClient
+
+    transport = MemoryTransport()
+    transport.add_route("/timezone", {"response": ["Europe/London"]})
+    client = ApiFootballClient(transport=transport)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json as jsonlib
+from typing import Any, Awaitable, Callable, Union
+
+import httpx
+
+from api_football_sdk.adapters.base import Transport
+
+__all__: list[str] = ["MemoryTransport", "Handler"]
+
+Handler = Callable[[httpx.Request], Union[httpx.Response, Awaitable[httpx.Response]]]
+"""Callable building the response for a request; may be a coroutine function."""
+
+
+class MemoryTransport(Transport):
+    """
+    Transport serving registered routes from memory.
+
+    Routes are matched by method and path; query parameters are available
+    to handlers through `request.url.params`. Unmatched requests get a 404,
+    or are passed to the fallback handler when one is given. Requests sent
+    are recorded in `requests` unless `record` is False.
+    """
+
+    def __init__(
+        self,
+        handler: Handler | None = None,
+        *,
+        base_url: str = "http://testserver",
+        latency: float = 0.0,
+        record: bool = True,
+    ) -> None:
+        self._fallback = handler
+        self._record = record
+        self.base_url = self._base_url = base_url.rstrip("/")
+        self._latency = latency
+        self._routes: dict[tuple[str, str], Handler] = {}
+        self.requests: list[httpx.Request] = []
+
+    def add_route(
+        self,
+        path: str,
+        payload: Any = None,
+        *,
+        method: str = "GET",
+        status_code: int = 200,
+        headers: dict[str, str] | None = None,
+        handler: Handler | None = None,
+    ) -> None:
+        """
+        Register a response for a path.
+
+        :param path: Endpoint relative path (e.g., "/fixtures").
+        :param payload: JSON-serializable body, encoded once at registration.
+        :param method: HTTP method to match.
+        :param status_code: Status code of the response.
+        :param headers: Extra response headers.
+        :param handler: Builds the response per request instead of `payload`.
+        :return: None
+        """
+        if handler is None:
+            body = jsonlib.dumps(payload).encode()
+            response_headers = {"content-type": "application/json", **(headers or {})}
+
+            def handler(request: httpx.Request) -> httpx.Response:
+                return httpx.Response(
+                    status_code,
+                    headers=response_headers,
+                    content=body,
+                    request=request,
+                )
+
+        self._routes[(method.upper(), path)] = handler
+
+    async def send(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+        timeout: float | None = None,
+    ) -> httpx.Response:
+        """
+        Answer a request from the registered routes.
+
+        :param method: HTTP method.
+        :param url: Endpoint relative path.
+        :param params: Query string parameters.
+        :param json: Request body.
+        :param timeout: Applied to the simulated latency and async handlers.
+        :return: The HTTP response.
+        """
+        request = httpx.Request(method, self._base_url + url, params=params, json=json)
+        if self._record:
+            self.requests.append(request)
+
+        handler = self._routes.get((method.upper(), url), self._fallback)
+        if handler is None:
+            return httpx.Response(404, request=request)
+
+        if timeout is None:
+            return await self._respond(handler, request)
+        try:
+            return await asyncio.wait_for(self._respond(handler, request), timeout)
+        except asyncio.TimeoutError as exc:
+            raise httpx.ReadTimeout("Request timed out", request=request) from exc
+
+    async def _respond(
+        self, handler: Handler, request: httpx.Request
+    ) -> httpx.Response:
+        if self._latency:
+            await asyncio.sleep(self._latency)
+        response = handler(request)
+        if not isinstance(response, httpx.Response):
+            response = await response
+        response.request = request
+        return response
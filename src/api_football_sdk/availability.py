@@ -0,0 +1,198 @@
+"""
+In-memory index of unavailable players per fixture and team.
+
+`AvailabilityIndex` is filled from the bulk forms of the `/injuries` and
+`/sidelined` endpoints, so lineup services can answer "who is out for this
+match" with dictionary lookups and no per-player request.
+
+Usage example:
+--------------
+    from api_football_sdk.availability import AvailabilityIndex
+
+    index = AvailabilityIndex()
+    await index.load_league(league_id=39, season=2024)
+    missing = index.unavailable(fixture_id=1035037, team_id=33)
+"""
+
+from __future__ import annotations
+
+from datetime import date
+from typing import Any, Iterable
+
+from api_football_sdk.endpoints.injuries import (
+    get_injuries_by_date,
+    get_injuries_by_fixtures,
+    get_injuries_by_league,
+)
+from api_football_sdk.endpoints.sidelined import get_sidelined_by_players
+
+__all__: list[str] = ["AvailabilityIndex"]
+
+MISSING_FIXTURE: str = "Missing Fixture"
+"""Injury type of players confirmed absent (as opposed to "Questionable")."""
+
+
+def _as_date(value: str | date) -> date:
+    return value if isinstance(value, date) else date.fromisoformat(value[:10])
+
+
+class AvailabilityIndex:
+    """
+    Index of fixture -> team -> unavailable players.
+
+    Injury rows replace any earlier entry for the same fixture, team, and
+    player. Sidelined periods are kept per player and answer date queries
+    for players without a fixture-specific injury report.
+    """
+
+    def __init__(self) -> None:
+        self._fixtures: dict[int, dict[int, dict[int, dict[str, Any]]]] = {}
+        self._sidelined: dict[int, list[tuple[date, date | None, str]]] = {}
+
+    def __contains__(self, fixture_id: object) -> bool:
+        return fixture_id in self._fixtures
+
+    def add_injuries(self, injuries: Iterable[dict[str, Any]]) -> int:
+        """
+        Index rows from any `/injuries` response.
+
+        :param injuries: Injury rows with `player`, `team`, and `fixture`.
+        :return: Number of rows indexed.
+        """
+        added = 0
+        for injury in injuries:
+            fixture_id = (injury.get("fixture") or {}).get("id")
+            team_id = (injury.get("team") or {}).get("id")
+            player_id = (injury.get("player") or {}).get("id")
+            if fixture_id is None or team_id is None or player_id is None:
+                continue
+            teams = self._fixtures.setdefault(fixture_id, {})
+            teams.setdefault(team_id, {})[player_id] = injury["player"]
+            added += 1
+        return added
+
+    def add_sidelined(self, player_id: int, periods: Iterable[dict[str, Any]]) -> None:
+        """
+        Replace the sidelined periods of a player.
+
+        :param player_id: The ID of the player.
+        :param periods: Periods from the `/sidelined` endpoint.
+        :return: None
+        """
+        parsed = []
+        for period in periods:
+            if not period.get("start"):
+                continue
+            end = period.get("end")
+            parsed.append(
+                (
+                    _as_date(period["start"]),
+                    _as_date(end) if end else None,
+                    period.get("type") or "",
+                )
+            )
+        self._sidelined[player_id] = parsed
+
+    async def load_league(self, league_id: int, season: int) -> int:
+        """
+        Index every injury of a league season with one request.
+
+        :param league_id: ID of the league.
+        :param season: Season year.
+        :return: Number of rows indexed.
+        """
+        return self.add_injuries(await get_injuries_by_league(league_id, season))
+
+    async def load_date(self, day: str) -> int:
+        """
+        Index every injury for the fixtures of a date with one request.
+
+        :param day: Date in YYYY-MM-DD format.
+        :return: Number of rows indexed.
+        """
+        return self.add_injuries(await get_injuries_by_date(day))
+
+    async def load_fixtures(self, fixture_ids: list[int]) -> int:
+        """
+        Index the injuries of specific fixtures, batched by ID.
+
+        Fixtures with no reported injuries are recorded as known, so
+        `unavailable` can tell them apart from fixtures never loaded.
+
+        :param fixture_ids: List of fixture IDs.
+        :return: Number of rows indexed.
+        """
+        added = self.add_injuries(await get_injuries_by_fixtures(fixture_ids))
+        for fixture_id in fixture_ids:
+            self._fixtures.setdefault(fixture_id, {})
+        return added
+
+    async def load_sidelined(self, player_ids: list[int]) -> None:
+        """
+        Index the sidelined history of many players, batched by ID.
+
+        :param player_ids: List of player IDs.
+        :return: None
+        """
+        periods = await get_sidelined_by_players(player_ids)
+        for player_id in player_ids:
+            self.add_sidelined(player_id, periods.get(player_id, []))
+
+    def unavailable(
+        self,
+        fixture_id: int,
+        team_id: int,
+        *,
+        confirmed_only: bool = False,
+    ) -> list[dict[str, Any]]:
+        """
+        List the players of a team reported unavailable for a fixture.
+
+        :param fixture_id: The ID of the fixture.
+        :param team_id: The ID of the team.
+        :param confirmed_only: Skip players whose absence is only "Questionable".
+        :return: Player entries (id, name, type, reason).
+        """
+        players = self._fixtures.get(fixture_id, {}).get(team_id, {}).values()
+        if confirmed_only:
+            return [
+                player for player in players if player.get("type") == MISSING_FIXTURE
+            ]
+        return list(players)
+
+    def unavailable_by_team(self, fixture_id: int) -> dict[int, list[dict[str, Any]]]:
+        """
+        List unavailable players of both teams of a fixture.
+
+        :param fixture_id: The ID of the fixture.
+        :return: Player entries keyed by team ID.
+        """
+        return {
+            team_id: list(players.values())
+            for team_id, players in self._fixtures.get(fixture_id, {}).items()
+        }
+
+    def is_available(self, fixture_id: int, team_id: int, player_id: int) -> bool:
+        """
+        Tell whether a player has no injury report for a fixture.
+
+        :param fixture_id: The ID of the fixture.
+        :param team_id: The ID of the team.
+        :param player_id: The ID of the player.
+        :return: False if the player is reported unavailable.
+        """
+        return player_id not in self._fixtures.get(fixture_id, {}).get(team_id, {})
+
+    def sidelined_on(self, player_id: int, day: str | date) -> str | None:
+        """
+        Return why a player was sidelined on a date, if they were.
+
+        :param player_id: The ID of the player.
+        :param day: Date (YYYY-MM-DD string or `date`).
+        :return: The sidelined type (e.g., "Suspended"), or None.
+        """
+        when = _as_date(day)
+        for start, end, kind in self._sidelined.get(player_id, ()):
+            if start <= when and (end is None or when <= end):
+                return kind
+        return None
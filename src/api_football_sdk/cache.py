@@ -0,0 +1,213 @@
+"""
+Response cache with stale-while-revalidate and stale-if-error modes.
+
+`ResponseCache` keeps decoded `get_json` payloads per path and query
+parameters. Each cached path has a `CachePolicy`: within `ttl` an entry is
+fresh and served without a request; for `max_stale` seconds after that it
+is served immediately while the client refreshes it in a background task
+(stale-while-revalidate); and for `stale_if_error` seconds after expiry it
+is served in place of an error when the upstream is failing.
+
+Paths without a policy are never cached.
+
+Usage example:
+--------------
+    from api_football_sdk.cache import CachePolicy, ResponseCache
+    from api_football_sdk.client import ApiFootballClient
+
+    cache = ResponseCache({"/standings": CachePolicy(ttl=60, max_stale=600)})
+    client = ApiFootballClient(cache=cache)
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Any, Mapping
+
+__all__: list[str] = [
+    "CacheEntry",
+    "CachePolicy",
+    "DEFAULT_POLICIES",
+    "ResponseCache",
+    "cache_key",
+]
+
+CacheKey = tuple[str, tuple[tuple[str, str], ...]]
+
+
+def cache_key(url: str, params: Mapping[str, Any] | None) -> CacheKey:
+    """
+    Build the cache key of a request, independent of parameter order.
+
+    :param url: Endpoint relative path.
+    :param params: Query string parameters.
+    :return: Hashable key.
+    """
+    return url, tuple(
+        sorted((key, str(value)) for key, value in (params or {}).items())
+    )
+
+
+class CachePolicy:
+    """
+    Freshness rules of one endpoint, in seconds.
+
+    :param ttl: Age up to which an entry is served without revalidation.
+    :param max_stale: Extra age during which a stale entry is served at
+        once and refreshed in the background; 0 disables the mode.
+    :param stale_if_error: Extra age during which an expired entry is served
+        when the refresh fails; 0 disables the fallback.
+    """
+
+    __slots__ = ("ttl", "max_stale", "stale_if_error")
+
+    def __init__(
+        self, ttl: float, *, max_stale: float = 0.0, stale_if_error: float = 0.0
+    ) -> None:
+        if ttl < 0 or max_stale < 0 or stale_if_error < 0:
+            raise ValueError("cache durations must not be negative")
+        self.ttl = ttl
+        self.max_stale = max_stale
+        self.stale_if_error = stale_if_error
+
+    def __repr__(self) -> str:
+        return (
+            f"CachePolicy(ttl={self.ttl}, max_stale={self.max_stale}, "
+            f"stale_if_error={self.stale_if_error})"
+        )
+
+
+DEFAULT_POLICIES: Mapping[str, CachePolicy] = {
+    "/standings": CachePolicy(300, max_stale=3600, stale_if_error=86400),
+    "/players/topscorers": CachePolicy(900, max_stale=6 * 3600, stale_if_error=86400),
+    "/players/topassists": CachePolicy(900, max_stale=6 * 3600, stale_if_error=86400),
+    "/teams/statistics": CachePolicy(900, max_stale=6 * 3600, stale_if_error=86400),
+}
+"""Policies used by `ResponseCache()` for the read-heavy aggregate endpoints."""
+
+
+class CacheEntry:
+    """
+    A cached payload and the monotonic time it was stored.
+    """
+
+    __slots__ = ("payload", "stored_at")
+
+    def __init__(self, payload: dict[str, Any], stored_at: float) -> None:
+        self.payload = payload
+        self.stored_at = stored_at
+
+    @property
+    def age(self) -> float:
+        """
+        Seconds since the payload was fetched.
+
+        :return: The age.
+        """
+        return time.monotonic() - self.stored_at
+
+
+class ResponseCache:
+    """
+    Bounded LRU cache of decoded payloads, with per-endpoint policies.
+
+    Cached payloads are shared between callers and must not be mutated.
+    """
+
+    def __init__(
+        self,
+        policies: Mapping[str, CachePolicy] | None = None,
+        *,
+        max_entries: int = 1024,
+    ) -> None:
+        self._policies = dict(DEFAULT_POLICIES if policies is None else policies)
+        self._max_entries = max_entries
+        self._entries: OrderedDict[CacheKey, CacheEntry] = OrderedDict()
+        self.hits = 0
+        self.stale_hits = 0
+        self.error_hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def set_policy(self, url: str, policy: CachePolicy | None) -> None:
+        """
+        Set or remove the policy of an endpoint.
+
+        :param url: Endpoint relative path (e.g., "/standings").
+        :param policy: The policy, or None to stop caching the endpoint.
+        :return: None
+        """
+        if policy is None:
+            self._policies.pop(url, None)
+            self.invalidate(url)
+        else:
+            self._policies[url] = policy
+
+    def policy_for(self, url: str) -> CachePolicy | None:
+        """
+        Return the policy of an endpoint.
+
+        :param url: Endpoint relative path.
+        :return: The policy, or None if the endpoint is not cached.
+        """
+        return self._policies.get(url)
+
+    def get(self, key: CacheKey) -> CacheEntry | None:
+        """
+        Return the entry of a key, whatever its age.
+
+        :param key: Key built with `cache_key`.
+        :return: The entry, or None.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: CacheKey, payload: dict[str, Any], *, age: float = 0.0) -> None:
+        """
+        Store a payload, evicting the least recently used.
+
+        :param key: Key built with `cache_key`.
+        :param payload: Decoded response body.
+        :param age: Seconds since the payload was fetched, for payloads
+            restored from elsewhere; 0 for a fresh fetch.
+        :return: None
+        """
+        self._entries[key] = CacheEntry(payload, time.monotonic() - age)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, url: str | None = None) -> int:
+        """
+        Drop cached entries.
+
+        :param url: Only drop entries of this endpoint; all when None.
+        :return: Number of entries dropped.
+        """
+        if url is None:
+            dropped = len(self._entries)
+            self._entries.clear()
+            return dropped
+        keys = [key for key in self._entries if key[0] == url]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    def stats(self) -> dict[str, int]:
+        """
+        Counters of how requests were answered.
+
+        :return: Fresh hits, stale hits, stale-if-error hits, misses, and size.
+        """
+        return {
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "error_hits": self.error_hits,
+            "misses": self.misses,
+            "entries": len(self._entries),
+        }
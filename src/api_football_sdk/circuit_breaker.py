@@ -0,0 +1,233 @@
+"""
+Circuit breaker protecting callers from a degraded upstream.
+
+`CircuitBreaker` tracks the outcome of recent requests per host (and
+optionally per endpoint path). When the failure rate over a sliding time
+window crosses a threshold, the circuit opens and requests fail at once
+with `CircuitOpenError` instead of waiting out timeouts and retries. After
+`open_timeout` seconds the circuit half-opens and lets a few probe
+requests through; it closes again when they succeed and re-opens when one
+fails.
+
+Network errors and 5xx responses count as failures. Rate limiting (429)
+and other client errors say nothing about upstream health and are ignored.
+
+Usage example:
+--------------
+    from api_football_sdk.circuit_breaker import CircuitBreaker
+    from api_football_sdk.client import ApiFootballClient
+
+    breaker = CircuitBreaker(failure_threshold=0.5, per_path=True)
+    client = ApiFootballClient(circuit_breaker=breaker)
+    print(breaker.snapshot())
+"""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from typing import Any
+
+from api_football_sdk.exceptions import CircuitOpenError
+
+__all__: list[str] = ["CLOSED", "HALF_OPEN", "OPEN", "CircuitBreaker"]
+
+CLOSED: str = "closed"
+OPEN: str = "open"
+HALF_OPEN: str = "half_open"
+
+Scope = tuple[str, str]
+
+
+class _Circuit:
+    __slots__ = (
+        "state",
+        "outcomes",
+        "failures",
+        "opened_at",
+        "probes",
+        "probe_successes",
+        "times_opened",
+        "rejected",
+    )
+
+    def __init__(self) -> None:
+        self.state = CLOSED
+        self.outcomes: deque[tuple[float, bool]] = deque()
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probes = 0
+        self.probe_successes = 0
+        self.times_opened = 0
+        self.rejected = 0
+
+
+class CircuitBreaker:
+    """
+    Failure-rate circuit breaker keyed by host, or by host and path.
+
+    :param failure_threshold: Failure rate in (0, 1] that opens the circuit.
+    :param minimum_calls: Outcomes needed in the window before the rate is
+        trusted.
+    :param window: Length of the sliding window of outcomes, in seconds.
+    :param open_timeout: Seconds an open circuit rejects requests before
+        half-opening.
+    :param half_open_probes: Concurrent probe requests allowed while
+        half-open; this many successes close the circuit.
+    :param per_path: Keep a separate circuit per endpoint path.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: float = 0.5,
+        minimum_calls: int = 10,
+        window: float = 30.0,
+        open_timeout: float = 30.0,
+        half_open_probes: int = 1,
+        per_path: bool = False,
+    ) -> None:
+        if not 0 < failure_threshold <= 1:
+            raise ValueError("failure_threshold must be in (0, 1]")
+        self._threshold = failure_threshold
+        self._minimum_calls = minimum_calls
+        self._window = window
+        self._open_timeout = open_timeout
+        self._half_open_probes = half_open_probes
+        self._per_path = per_path
+        self._circuits: dict[Scope, _Circuit] = {}
+
+    def scope(self, host: str, path: str) -> Scope:
+        """
+        Return the key of the circuit guarding a request.
+
+        :param host: Upstream host.
+        :param path: Endpoint relative path.
+        :return: (host, path) when per-path, else (host, "*").
+        """
+        return host, path if self._per_path else "*"
+
+    def state(self, host: str, path: str = "*") -> str:
+        """
+        Current state of the circuit guarding a request.
+
+        :param host: Upstream host.
+        :param path: Endpoint relative path.
+        :return: CLOSED, OPEN, or HALF_OPEN.
+        """
+        circuit = self._circuits.get(self.scope(host, path))
+        if circuit is None:
+            return CLOSED
+        self._expire_open(circuit)
+        return circuit.state
+
+    def _expire_open(self, circuit: _Circuit) -> None:
+        if (
+            circuit.state == OPEN
+            and time.monotonic() - circuit.opened_at >= self._open_timeout
+        ):
+            circuit.state = HALF_OPEN
+            circuit.probes = 0
+            circuit.probe_successes = 0
+
+    def before_request(self, host: str, path: str) -> Scope:
+        """
+        Admit a request, or fail fast while its circuit is open.
+
+        Every admitted request must be followed by `record`.
+
+        :param host: Upstream host.
+        :param path: Endpoint relative path.
+        :return: The scope to pass to `record`.
+        :raises CircuitOpenError: If the circuit is open, or half-open with
+            all probe slots taken.
+        """
+        scope = self.scope(host, path)
+        circuit = self._circuits.get(scope)
+        if circuit is None:
+            circuit = self._circuits[scope] = _Circuit()
+        self._expire_open(circuit)
+
+        if circuit.state == OPEN:
+            circuit.rejected += 1
+            retry_after = self._open_timeout - (time.monotonic() - circuit.opened_at)
+            raise CircuitOpenError(scope[0], scope[1], max(retry_after, 0.0))
+        if circuit.state == HALF_OPEN:
+            if circuit.probes >= self._half_open_probes:
+                circuit.rejected += 1
+                raise CircuitOpenError(scope[0], scope[1], 0.0)
+            circuit.probes += 1
+        return scope
+
+    def record(self, scope: Scope, success: bool | None) -> None:
+        """
+        Report the outcome of a request admitted by `before_request`.
+
+        :param scope: Value returned by `before_request`.
+        :param success: True or False for a healthy or failed upstream
+            answer; None for outcomes that say nothing about its health
+            (e.g., 429, 4xx, cancellation).
+        :return: None
+        """
+        circuit = self._circuits[scope]
+        now = time.monotonic()
+
+        if circuit.state == HALF_OPEN:
+            circuit.probes = max(circuit.probes - 1, 0)
+            if success is False:
+                self._open(circuit, now)
+            elif success:
+                circuit.probe_successes += 1
+                if circuit.probe_successes >= self._half_open_probes:
+                    circuit.state = CLOSED
+                    circuit.outcomes.clear()
+                    circuit.failures = 0
+            return
+        if success is None or circuit.state == OPEN:
+            return
+
+        circuit.outcomes.append((now, not success))
+        circuit.failures += not success
+        while circuit.outcomes and now - circuit.outcomes[0][0] > self._window:
+            _, failed = circuit.outcomes.popleft()
+            circuit.failures -= failed
+
+        calls = len(circuit.outcomes)
+        if calls >= self._minimum_calls and circuit.failures / calls >= self._threshold:
+            self._open(circuit, now)
+
+    def _open(self, circuit: _Circuit, now: float) -> None:
+        circuit.state = OPEN
+        circuit.opened_at = now
+        circuit.times_opened += 1
+        circuit.outcomes.clear()
+        circuit.failures = 0
+
+    def reset(self) -> None:
+        """
+        Close every circuit and forget all outcomes.
+
+        :return: None
+        """
+        self._circuits.clear()
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """
+        Metrics of every circuit, keyed by "host" or "host path".
+
+        :return: State, calls and failures in the window, failure rate, and
+            counts of openings and rejected requests.
+        """
+        metrics: dict[str, dict[str, Any]] = {}
+        for (host, path), circuit in self._circuits.items():
+            self._expire_open(circuit)
+            calls = len(circuit.outcomes)
+            metrics[host if path == "*" else f"{host} {path}"] = {
+                "state": circuit.state,
+                "calls": calls,
+                "failures": circuit.failures,
+                "failure_rate": circuit.failures / calls if calls else 0.0,
+                "times_opened": circuit.times_opened,
+                "rejected": circuit.rejected,
+            }
+        return metrics
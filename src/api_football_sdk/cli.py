@@ -0,0 +1,441 @@
+"""
+Command-line entry point for bulk exports.
+
+`api-football` covers the bulk pulls that otherwise end up as one-off
+scripts: the fixtures of a league-season, a list of fixtures hydrated with
+their events, lineups, statistics, and players, and the reference datasets.
+Rows are written as JSON lines or, with the `parquet` extra, as a Parquet
+file, while a status line on stderr reports throughput, quota, and errors.
+
+Bulk requests are admitted with `QuotaTracker.plan`. A pull that fits in
+what is left of the day's allowance runs as fast as `--concurrency` and
+`--rate-limit` let it; one that does not is paced until the daily reset,
+or refused with `--quota-policy refuse`.
+
+Usage example:
+--------------
+    api-football export-season --league 39 --season 2024 --details -o epl.jsonl
+    api-football hydrate 1035037 1035038 -o fixtures.parquet
+    api-football hydrate --file fixture_ids.txt --concurrency 20 --rate-limit 8
+    api-football reference leagues -o leagues.jsonl
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from typing import IO, Any, Awaitable, Callable, Iterable, Literal, Mapping, Sequence
+
+from api_football_sdk import __version__
+from api_football_sdk.client import ApiFootballClient
+from api_football_sdk.exceptions import (
+    APIFootballError,
+    ConfigurationError,
+    QuotaExceededError,
+)
+from api_football_sdk.quota import QuotaTracker
+from api_football_sdk.scheduler import Priority
+
+__all__: list[str] = [
+    "FIXTURE_IDS_PER_REQUEST",
+    "REFERENCE_DATASETS",
+    "build_parser",
+    "main",
+]
+
+FIXTURE_IDS_PER_REQUEST: int = 20
+"""Fixtures hydrated per `/fixtures?ids=` request, the API maximum."""
+
+REFERENCE_DATASETS: Mapping[str, tuple[str, str | None]] = {
+    "countries": ("/countries", None),
+    "seasons": ("/leagues/seasons", "season"),
+    "leagues": ("/leagues", None),
+    "timezones": ("/timezone", "timezone"),
+    "teams-countries": ("/teams/countries", None),
+    "bookmakers": ("/odds/bookmakers", None),
+    "bets": ("/odds/bets", None),
+}
+"""Reference dataset names, with their path and the column of scalar rows."""
+
+Request = tuple[str, dict[str, Any]]
+
+
+# ---------------------------------------------------------------- writers
+
+
+class _JsonLinesWriter:
+    def __init__(self, path: str) -> None:
+        self._owned = path != "-"
+        self._fh: IO[str] = (
+            open(path, "w", encoding="utf-8") if self._owned else sys.stdout
+        )
+
+    def write(self, row: Any) -> None:
+        self._fh.write(json.dumps(row, ensure_ascii=False, separators=(",", ":")))
+        self._fh.write("\n")
+
+    def close(self) -> None:
+        if self._owned:
+            self._fh.close()
+        else:
+            self._fh.flush()
+
+
+class _ParquetWriter:
+    # Rows are written in row groups of `batch_rows`, with the schema
+    # inferred from the first group: nested fields that are null on every
+    # row of it cannot take values later, so keep the groups large.
+    batch_rows = 10_000
+
+    def __init__(self, path: str) -> None:
+        if path == "-":
+            raise ConfigurationError("Parquet output needs a file: use --output PATH")
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError as exc:
+            raise ConfigurationError(
+                'Parquet output requires the "pyarrow" package: '
+                'pip install "api-football-sdk[parquet]"'
+            ) from exc
+        self._pa = pyarrow
+        self._pq = pyarrow.parquet
+        self._path = path
+        self._writer: Any = None
+        self._rows: list[Any] = []
+
+    def write(self, row: Any) -> None:
+        self._rows.append(row)
+        if len(self._rows) >= self.batch_rows:
+            self._write_batch()
+
+    def _write_batch(self) -> None:
+        rows, self._rows = self._rows, []
+        if self._writer is None:
+            table = self._pa.Table.from_pylist(rows)
+            self._writer = self._pq.ParquetWriter(self._path, table.schema)
+        else:
+            try:
+                table = self._pa.Table.from_pylist(rows, schema=self._writer.schema)
+            except (self._pa.ArrowInvalid, self._pa.ArrowTypeError) as exc:
+                raise ConfigurationError(
+                    f"Rows do not match the Parquet schema of the first "
+                    f"{self.batch_rows} rows ({exc}): use --format jsonl"
+                ) from exc
+        self._writer.write_table(table)
+
+    def close(self) -> None:
+        try:
+            if self._rows or self._writer is None:
+                self._write_batch()
+        finally:
+            if self._writer is not None:
+                self._writer.close()
+
+
+def _open_writer(path: str, output_format: str | None) -> Any:
+    if output_format is None:
+        output_format = "parquet" if path.endswith(".parquet") else "jsonl"
+    if output_format == "parquet":
+        return _ParquetWriter(path)
+    return _JsonLinesWriter(path)
+
+
+# ---------------------------------------------------------------- progress
+
+
+class _Progress:
+    """Counters of an export, and the status line written to stderr."""
+
+    def __init__(self, quota: QuotaTracker, stream: IO[str]) -> None:
+        self._quota = quota
+        self._stream = stream
+        self._used = quota.used
+        self._started = time.monotonic()
+        self._width = 0
+        self.rows = 0
+        self.errors: list[str] = []
+
+    @property
+    def requests(self) -> int:
+        return self._quota.used - self._used
+
+    def line(self) -> str:
+        elapsed = max(time.monotonic() - self._started, 1e-9)
+        remaining, limit = self._quota.remaining, self._quota.limit
+        quota = "?" if remaining is None else f"{remaining}/{limit or '?'}"
+        return (
+            f"{self.rows} rows | {self.requests} requests "
+            f"({self.requests / elapsed:.1f}/s) | quota {quota} | "
+            f"{len(self.errors)} errors | {elapsed:.1f}s"
+        )
+
+    def show(self) -> None:
+        line = self.line()
+        self._stream.write("\r" + line.ljust(self._width))
+        self._stream.flush()
+        self._width = len(line)
+
+    async def tick(self, interval: float) -> None:
+        while True:
+            self.show()
+            await asyncio.sleep(interval)
+
+    def summary(self) -> None:
+        if self._width:
+            self._stream.write("\r" + " " * self._width + "\r")
+        self._stream.write(self.line() + "\n")
+        for error in self.errors[:10]:
+            self._stream.write(f"  error: {error}\n")
+        if len(self.errors) > 10:
+            self._stream.write(f"  ... and {len(self.errors) - 10} more errors\n")
+        self._stream.flush()
+
+
+# ---------------------------------------------------------------- export
+
+
+class _Export:
+    """Fetches for one command, writing every `response` row it receives."""
+
+    def __init__(
+        self,
+        client: ApiFootballClient,
+        writer: Any,
+        progress: _Progress,
+        *,
+        policy: Literal["refuse", "throttle"],
+    ) -> None:
+        self.client = client
+        self._writer = writer
+        self._progress = progress
+        self._policy = policy
+
+    def emit(self, row: Any, column: str | None = None) -> None:
+        self._writer.write({column: row} if column is not None else row)
+        self._progress.rows += 1
+
+    async def stream(
+        self, url: str, params: dict[str, Any] | None = None, column: str | None = None
+    ) -> None:
+        """Write the rows of every page of an endpoint as they stream in."""
+        rows = self.client.stream_pages(
+            url, params=params, priority=Priority.BACKGROUND
+        )
+        async for row in rows:
+            self.emit(row, column)
+
+    async def fetch_all(self, requests: Sequence[Request]) -> None:
+        """
+        Send independent requests concurrently, within a quota plan.
+
+        The first request is sent alone so its quota headers are known when
+        the rest is planned. A failed request is recorded and skipped; running
+        out of quota stops the export.
+        """
+        if not requests:
+            return
+        await self._fetch(*requests[0])
+        if len(requests) == 1:
+            return
+        plan = self.client.quota.plan(len(requests) - 1, policy=self._policy)
+        rest = iter(requests[1:])
+
+        async def work() -> None:
+            # Workers share one iterator, so each request is sent once.
+            for url, params in rest:
+                await plan.pace()
+                await self._fetch(url, params)
+
+        workers = min(self.client.max_concurrency, len(requests) - 1)
+        tasks = [asyncio.ensure_future(work()) for _ in range(workers)]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            plan.release()
+
+    async def hydrate(self, fixture_ids: Iterable[int]) -> None:
+        """Write fixtures with their events, lineups, statistics, and players."""
+        ids = list(dict.fromkeys(fixture_ids))
+        await self.fetch_all(
+            [
+                ("/fixtures", {"ids": "-".join(map(str, batch))})
+                for batch in (
+                    ids[i : i + FIXTURE_IDS_PER_REQUEST]
+                    for i in range(0, len(ids), FIXTURE_IDS_PER_REQUEST)
+                )
+            ]
+        )
+
+    async def _fetch(self, url: str, params: dict[str, Any]) -> None:
+        try:
+            payload = await self.client.get_json(
+                url, params=params, priority=Priority.BACKGROUND
+            )
+        except QuotaExceededError:
+            raise
+        except APIFootballError as exc:
+            self._progress.errors.append(f"{url} {params}: {exc}")
+            return
+        for row in payload.get("response", []):
+            self.emit(row)
+
+
+async def _export_season(export: _Export, args: argparse.Namespace) -> None:
+    params = {"league": args.league, "season": args.season}
+    if not args.details:
+        await export.stream("/fixtures", params)
+        return
+    rows = export.client.stream_pages(
+        "/fixtures", params=params, priority=Priority.BACKGROUND
+    )
+    await export.hydrate([row["fixture"]["id"] async for row in rows])
+
+
+async def _hydrate(export: _Export, args: argparse.Namespace) -> None:
+    await export.hydrate(args.fixture_ids)
+
+
+async def _reference(export: _Export, args: argparse.Namespace) -> None:
+    url, column = REFERENCE_DATASETS[args.dataset]
+    await export.stream(url, column=column)
+
+
+# ---------------------------------------------------------------- entry point
+
+
+def _read_ids(path: str) -> list[int]:
+    fh = sys.stdin if path == "-" else open(path, encoding="utf-8")
+    try:
+        return [int(line) for line in fh if line.strip()]
+    finally:
+        if fh is not sys.stdin:
+            fh.close()
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Build the argument parser of the `api-football` command.
+
+    :return: The parser; each subcommand sets `handler`.
+    """
+    common = argparse.ArgumentParser(add_help=False)
+    group = common.add_argument_group("output and throughput")
+    group.add_argument(
+        "-o", "--output", default="-", help="output file, '-' for stdout (default)"
+    )
+    group.add_argument(
+        "--format",
+        choices=("jsonl", "parquet"),
+        help="output format (default: from the output file extension, else "
+        f"jsonl); parquet infers its schema from the first "
+        f"{_ParquetWriter.batch_rows} rows",
+    )
+    group.add_argument("--concurrency", type=int, help="requests in flight at once")
+    group.add_argument("--rate-limit", type=float, help="maximum requests per second")
+    group.add_argument(
+        "--quota-policy",
+        choices=("throttle", "refuse"),
+        default="throttle",
+        help="when a pull exceeds today's quota: pace it until the reset "
+        "(default), or refuse to start",
+    )
+    group.add_argument(
+        "-q", "--quiet", action="store_true", help="do not report progress"
+    )
+
+    parser = argparse.ArgumentParser(
+        prog="api-football", description="Bulk exports from the API Football."
+    )
+    parser.add_argument("--version", action="version", version=__version__)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    season = commands.add_parser(
+        "export-season", parents=[common], help="export the fixtures of a season"
+    )
+    season.add_argument("--league", type=int, required=True, help="league ID")
+    season.add_argument("--season", type=int, required=True, help="season year")
+    season.add_argument(
+        "--details",
+        action="store_true",
+        help="hydrate every fixture with events, lineups, statistics, and players",
+    )
+    season.set_defaults(handler=_export_season)
+
+    hydrate = commands.add_parser(
+        "hydrate",
+        parents=[common],
+        help="export fixtures with events, lineups, statistics, and players",
+    )
+    hydrate.add_argument("fixture_ids", type=int, nargs="*", metavar="FIXTURE_ID")
+    hydrate.add_argument(
+        "--file", help="file with one fixture ID per line, '-' for stdin"
+    )
+    hydrate.set_defaults(handler=_hydrate)
+
+    reference = commands.add_parser(
+        "reference", parents=[common], help="dump a reference dataset"
+    )
+    reference.add_argument("dataset", choices=sorted(REFERENCE_DATASETS))
+    reference.set_defaults(handler=_reference)
+    return parser
+
+
+def _build_client(args: argparse.Namespace) -> ApiFootballClient:
+    return ApiFootballClient(
+        max_concurrency=args.concurrency, rate_limit=args.rate_limit
+    )
+
+
+async def _run(
+    args: argparse.Namespace,
+    handler: Callable[[_Export, argparse.Namespace], Awaitable[None]],
+) -> int:
+    writer = _open_writer(args.output, args.format)
+    async with _build_client(args) as client:
+        progress = _Progress(client.quota, sys.stderr)
+        export = _Export(client, writer, progress, policy=args.quota_policy)
+        ticker = None
+        if not args.quiet and sys.stderr.isatty():
+            ticker = asyncio.ensure_future(progress.tick(0.5))
+        try:
+            await handler(export, args)
+        finally:
+            if ticker is not None:
+                ticker.cancel()
+            writer.close()
+            if not args.quiet:
+                progress.summary()
+    return 1 if progress.errors else 0
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """
+    Run the `api-football` command.
+
+    :param argv: Arguments without the program name; defaults to `sys.argv`.
+    :return: Exit status: 0 on success, 1 if any request failed.
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command == "hydrate":
+        if args.file:
+            try:
+                args.fixture_ids = [*args.fixture_ids, *_read_ids(args.file)]
+            except (OSError, ValueError) as exc:
+                parser.error(f"cannot read fixture IDs: {exc}")
+        if not args.fixture_ids:
+            parser.error("hydrate needs fixture IDs or --file")
+    try:
+        return asyncio.run(_run(args, args.handler))
+    except APIFootballError as exc:
+        print(f"api-football: error: {exc}", file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        return 130
@@ -1,8 +1,27 @@
 """
 HTTP client for interacting with the API Football endpoints.
 
-This module wraps `httpx.AsyncClient`, injecting authentication headers
-and providing automatic retry with exponential backoff on transient failures.
+This module sends requests through a pluggable transport (by default
+`httpx.AsyncClient`, see `api_football_sdk.adapters`), injecting
+authentication headers, scheduling requests by priority under the
+concurrency and rate limits (see `api_football_sdk.scheduler`), tracking
+the daily quota (see `api_football_sdk.quota`), failing fast while the
+upstream's circuit is open (see `api_football_sdk.circuit_breaker`),
+sharing the rate limit with other processes when given a coordination
+backend (see `api_football_sdk.coordination`),
+optionally hedging slow interactive requests (see `api_football_sdk.hedging`),
+and providing automatic retry with exponential backoff on transient failures,
+within the deadline of the operation if any (see `api_football_sdk.deadline`).
+JSON bodies fetched through `get_json` are decoded once and passed to any registered response hooks,
+and may be served from a `ResponseCache` in stale-while-revalidate mode.
+With an `EntityGraph`, the leagues, teams, and venues they embed are
+interned into shared per-client tables (see `api_football_sdk.entities`).
+Large bodies can instead be parsed incrementally with `stream_json` (see
+`api_football_sdk.streaming`), yielding rows as they arrive.
+Decoding is timed per endpoint, and bodies above a size threshold are decoded
+without holding the event loop for the whole body (see
+`api_football_sdk.decoding`); with a `LoopMonitor`, steps that still block
+the loop are reported with their endpoint (see `api_football_sdk.loop_monitor`).
 
 Usage example:
 --------------
@@ -16,23 +35,69 @@ Usage example:
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import functools
 import logging
 from types import TracebackType
-from typing import Any, Optional, Type
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    ContextManager,
+    Optional,
+    Type,
+)
 
 import httpx
 
+from api_football_sdk.adapters.base import Transport, create_transport
+from api_football_sdk.cache import CacheKey, CachePolicy, ResponseCache, cache_key
+from api_football_sdk.circuit_breaker import CircuitBreaker
+from api_football_sdk.coordination import (
+    CoordinationBackend,
+    SQLiteBackend,
+    SharedRateLimiter,
+)
+from api_football_sdk.deadline import (
+    Deadline,
+    DeadlineLike,
+    as_deadline,
+    deadline_scope,
+    without_deadline,
+)
 from api_football_sdk.config import settings
+from api_football_sdk.decoding import JsonDecoder
+from api_football_sdk.entities import EntityGraph
 from api_football_sdk.exceptions import (
+    APIFootballError,
     APIFootballHTTPError,
     APIFootballRateLimitError,
     APIFootballRequestError,
+    CircuitOpenError,
+    DeadlineExceededError,
+    ParsingError,
+    QuotaExceededError,
 )
-
-__all__: list[str] = ["ApiFootballClient", "get_client"]
+from api_football_sdk.hedging import Hedger
+from api_football_sdk.loop_monitor import LoopMonitor
+from api_football_sdk.quota import QuotaTracker
+from api_football_sdk.scheduler import Priority, RequestScheduler, current_priority
+from api_football_sdk.streaming import JsonStream
+
+__all__: list[str] = [
+    "ApiFootballClient",
+    "ResponseHook",
+    "configure_client",
+    "get_client",
+    "set_client",
+]
 
 logger = logging.getLogger(__name__)
 
+ResponseHook = Callable[[str, dict[str, Any], dict[str, Any]], None]
+"""Callback receiving the path, query parameters, and decoded JSON payload."""
+
 
 class ApiFootballClient:
     """
@@ -40,26 +105,208 @@ class ApiFootballClient:
 
     Should be reused across the entire application lifecycle to take
     advantage of connection pooling and efficient resource usage.
+    At most `max_concurrency` requests are sent at once, and at most
+    `rate_limit` per second when set; callers may fan out freely and
+    excess requests queue by priority (see `request_priority`), so live
+    traffic overtakes queued background work.
+
+    The transport only moves bytes; retries, limits, and decoding happen
+    here, so any `Transport` (httpx over HTTP/1.1 or HTTP/2, aiohttp, or
+    the in-memory one) yields the same behavior.
     """
 
     DEFAULT_TIMEOUT: float = 10.0
     MAX_RETRIES: int = 3
     BACKOFF_FACTOR: float = 0.5
+    MIN_ATTEMPT_TIME: float = 0.1
 
     def __init__(
         self,
         *,
         timeout: float | None = None,
         max_retries: int | None = None,
+        max_concurrency: int | None = None,
+        rate_limit: float | None = None,
+        transport: Transport | None = None,
+        scheduler: RequestScheduler | None = None,
+        quota: QuotaTracker | None = None,
+        cache: ResponseCache | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        hedging: Hedger | None = None,
+        entities: EntityGraph | None = None,
+        coordination: CoordinationBackend | None = None,
+        decoder: JsonDecoder | None = None,
+        loop_monitor: LoopMonitor | None = None,
     ) -> None:
         self._timeout = timeout or self.DEFAULT_TIMEOUT
         self._max_retries = max_retries or self.MAX_RETRIES
-        self._client = httpx.AsyncClient(
-            base_url=str(settings.api_base_url),
-            headers=settings.default_headers,
+        self._owns_coordination = False
+        if coordination is None and settings.coordination_file:
+            coordination = SQLiteBackend(settings.coordination_file)
+            self._owns_coordination = True
+        self._coordination = coordination
+        rate = rate_limit or settings.http_rate_limit
+        self._rate_limiter: SharedRateLimiter | None = None
+        if coordination is not None and rate is not None:
+            # The shared bucket replaces the scheduler's local one.
+            self._rate_limiter = SharedRateLimiter(coordination, rate=rate)
+            rate = None
+        self._scheduler = scheduler or RequestScheduler(
+            max_concurrency=max_concurrency or settings.http_max_concurrency,
+            rate=rate,
+        )
+        self._quota = quota or QuotaTracker(
+            settings.quota_file, reserve=settings.quota_reserve
+        )
+        self._cache = cache
+        self._inflight: dict[CacheKey, asyncio.Task[dict[str, Any]]] = {}
+        self._response_hooks: list[ResponseHook] = []
+        self._transport = transport or create_transport(
+            settings.http_transport,
             timeout=self._timeout,
-            follow_redirects=True,
         )
+        base_url = self._transport.base_url or str(settings.api_base_url)
+        self._host = httpx.URL(base_url).host or "upstream"
+        if circuit_breaker is None and settings.http_circuit_breaker:
+            circuit_breaker = CircuitBreaker()
+        self._circuit_breaker = circuit_breaker
+        self._hedger = hedging
+        self._entities = entities
+        self._decoder = decoder or JsonDecoder(settings.json_offload_bytes)
+        if loop_monitor is None and settings.debug_loop_blocking:
+            loop_monitor = LoopMonitor()
+        self._loop_monitor = loop_monitor
+
+    @property
+    def transport(self) -> Transport:
+        """
+        The transport used to send requests.
+
+        :return: The transport instance.
+        """
+        return self._transport
+
+    @property
+    def max_concurrency(self) -> int:
+        """
+        Maximum number of requests in flight at once.
+
+        :return: The concurrency limit.
+        """
+        return self._scheduler.max_concurrency
+
+    @property
+    def circuit_breaker(self) -> CircuitBreaker | None:
+        """
+        The circuit breaker guarding the upstream, if enabled.
+
+        :return: The circuit breaker, or None.
+        """
+        return self._circuit_breaker
+
+    @property
+    def hedger(self) -> Hedger | None:
+        """
+        The hedging policy of GET requests, if enabled.
+
+        :return: The hedger, or None.
+        """
+        return self._hedger
+
+    @property
+    def coordination(self) -> CoordinationBackend | None:
+        """
+        The state shared with other workers using the same API key, if any.
+
+        :return: The coordination backend, or None.
+        """
+        return self._coordination
+
+    @property
+    def rate_limiter(self) -> SharedRateLimiter | None:
+        """
+        The rate limit shared through the coordination backend, if any.
+
+        :return: The shared limiter, or None when the scheduler's local
+            token bucket applies.
+        """
+        return self._rate_limiter
+
+    @property
+    def entities(self) -> EntityGraph | None:
+        """
+        The tables interning entities embedded in decoded payloads, if any.
+
+        :return: The entity graph, or None when normalizing is disabled.
+        """
+        return self._entities
+
+    @property
+    def decoder(self) -> JsonDecoder:
+        """
+        The decoder of `get_json` bodies, with its per-endpoint timings.
+
+        :return: The JSON decoder.
+        """
+        return self._decoder
+
+    @property
+    def loop_monitor(self) -> LoopMonitor | None:
+        """
+        The monitor reporting steps that block the event loop, if any.
+
+        :return: The loop monitor, or None when not debugging.
+        """
+        return self._loop_monitor
+
+    @property
+    def cache(self) -> ResponseCache | None:
+        """
+        The response cache used by `get_json`, if any.
+
+        :return: The cache, or None when caching is disabled.
+        """
+        return self._cache
+
+    @property
+    def quota(self) -> QuotaTracker:
+        """
+        The tracker of the day's request usage.
+
+        :return: The quota tracker.
+        """
+        return self._quota
+
+    @property
+    def scheduler(self) -> RequestScheduler:
+        """
+        The scheduler granting request slots by priority.
+
+        :return: The scheduler instance.
+        """
+        return self._scheduler
+
+    def add_response_hook(self, hook: ResponseHook) -> None:
+        """
+        Register a callback invoked with every payload decoded by `get_json`.
+
+        Hooks run synchronously on the event loop and must not mutate the
+        payload. Exceptions raised by a hook are logged and swallowed.
+
+        :param hook: Callable taking (path, params, payload).
+        :return: None
+        """
+        self._response_hooks.append(hook)
+
+    def remove_response_hook(self, hook: ResponseHook) -> None:
+        """
+        Unregister a callback added with `add_response_hook`.
+
+        :param hook: The callback to remove.
+        :return: None
+        """
+        if hook in self._response_hooks:
+            self._response_hooks.remove(hook)
 
     async def __aenter__(self) -> ApiFootballClient:
         return self
@@ -74,11 +321,16 @@ class ApiFootballClient:
 
     async def aclose(self) -> None:
         """
-        Close the underlying AsyncClient connection.
+        Close the underlying transport and its pooled connections.
 
         :return: None
         """
-        await self._client.aclose()
+        for task in list(self._inflight.values()):
+            task.cancel()
+        self._quota.save()
+        await self._transport.aclose()
+        if self._owns_coordination and self._coordination is not None:
+            await self._coordination.aclose()
 
     async def request(
         self,
@@ -87,29 +339,74 @@ class ApiFootballClient:
         *,
         params: dict[str, Any] | None = None,
         json: dict[str, Any] | None = None,
+        priority: Priority | None = None,
+        deadline: DeadlineLike = None,
+        stream: bool = False,
     ) -> httpx.Response:
         """
         Perform an HTTP request with retry logic on transient errors.
 
+        Every attempt waits for its own slot from the scheduler, so retries
+        of background requests do not jump ahead of queued live ones. With
+        hedging enabled, a live or interactive GET attempt still pending
+        after its endpoint's latency percentile is duplicated, and the
+        first answer wins.
+
+        Under a deadline, each attempt's timeout is cut to the time left and
+        a retry is skipped when less than its backoff plus
+        `MIN_ATTEMPT_TIME` would remain.
+
         :param method: HTTP method (GET, POST, etc.).
         :param url: Endpoint relative path (e.g., "/fixtures").
         :param params: Query string parameters.
         :param json: Request body (for POST/PUT methods).
+        :param priority: Scheduling class; defaults to the `request_priority`
+            context, or interactive.
+        :param deadline: A `Deadline` or seconds from now; the earlier of
+            this and the `deadline_scope` context applies.
+        :param stream: Return as soon as the headers arrive, leaving the body
+            unread (see `Transport.stream`); the caller must close the
+            response. Streamed requests are never hedged.
         :return: The HTTP response object.
         :raises APIFootballHTTPError: On API-related HTTP errors.
         :raises APIFootballRateLimitError: On HTTP 429 Too Many Requests.
         :raises APIFootballRequestError: On network-level request failures.
+        :raises QuotaExceededError: If the current quota job's share is spent.
+        :raises CircuitOpenError: If the upstream's circuit is open; raised at
+            once, without further retries.
+        :raises DeadlineExceededError: If the deadline passes first.
         """
         attempt = 0
+        effective_deadline = as_deadline(deadline)
 
         while True:
+            timeout: float | None = None
+            if effective_deadline is not None:
+                timeout = effective_deadline.remaining()
+                if timeout <= 0:
+                    raise DeadlineExceededError(url)
+                timeout = min(timeout, self._timeout)
             try:
-                response = await self._client.request(
-                    method=method,
-                    url=url,
-                    params=params,
-                    json=json,
-                )
+                if (
+                    self._hedger is not None
+                    and not stream
+                    and method == "GET"
+                    and (priority or current_priority()) != Priority.BACKGROUND
+                ):
+                    send = self._send_hedged(
+                        self._hedger, method, url, params, json, priority, timeout
+                    )
+                else:
+                    send = self._send(
+                        method, url, params, json, priority, timeout, stream
+                    )
+                if effective_deadline is None:
+                    response = await send
+                else:
+                    response = await self._within(send, effective_deadline, url)
+                if stream and response.status_code >= 400:
+                    # Error bodies are small; read them for the exception.
+                    await response.aread()
 
                 if response.status_code == 429:
                     raise APIFootballRateLimitError.from_response(response)
@@ -133,6 +430,15 @@ class ApiFootballClient:
                     raise APIFootballRequestError(exc) from exc
 
                 backoff_time = self.BACKOFF_FACTOR * (2 ** (attempt - 1))
+                if (
+                    effective_deadline is not None
+                    and effective_deadline.remaining()
+                    < backoff_time + self.MIN_ATTEMPT_TIME
+                ):
+                    logger.warning(
+                        "Not retrying %s after %s: deadline too close", url, exc
+                    )
+                    raise DeadlineExceededError(url) from exc
                 logger.warning(
                     "Transient error on attempt %d/%d: %s. Retrying in %.2fs...",
                     attempt,
@@ -142,20 +448,405 @@ class ApiFootballClient:
                 )
                 await asyncio.sleep(backoff_time)
 
+    @staticmethod
+    async def _within(
+        send: Awaitable[httpx.Response], deadline: Deadline, url: str
+    ) -> httpx.Response:
+        # Also bounds the time spent waiting for a scheduler slot.
+        try:
+            return await asyncio.wait_for(send, max(deadline.remaining(), 0.0))
+        except asyncio.TimeoutError as exc:
+            raise DeadlineExceededError(url) from exc
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None,
+        json: dict[str, Any] | None,
+        priority: Priority | None,
+        timeout: float | None = None,
+        stream: bool = False,
+        holding: asyncio.Future[float] | None = None,
+    ) -> httpx.Response:
+        # `holding` receives the loop time at which the slot was acquired.
+        breaker = self._circuit_breaker
+        scope = breaker.before_request(self._host, url) if breaker else None
+        healthy: bool | None = None
+        try:
+            if self._rate_limiter is not None:
+                await self._rate_limiter.acquire(priority)
+            async with self._scheduler.slot(priority):
+                if holding is not None and not holding.done():
+                    holding.set_result(asyncio.get_running_loop().time())
+                self._quota.check()
+                send = self._transport.stream if stream else self._transport.send
+                response = await send(
+                    method,
+                    url,
+                    params=params,
+                    json=json,
+                    timeout=timeout,
+                )
+            if response.status_code != 429:
+                healthy = response.status_code < 500
+        except httpx.RequestError:
+            healthy = False
+            raise
+        finally:
+            if breaker is not None and scope is not None:
+                breaker.record(scope, healthy)
+
+        self._quota.observe(response.headers)
+        return response
+
+    async def _send_hedged(
+        self,
+        hedger: Hedger,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None,
+        json: dict[str, Any] | None,
+        priority: Priority | None,
+        timeout: float | None = None,
+    ) -> httpx.Response:
+        # The hedge delay and the recorded latency run from the moment an
+        # attempt holds its slot: time queued behind the rate limiter or
+        # the scheduler is congestion, which a duplicate would only add to.
+        loop = asyncio.get_running_loop()
+        delay = hedger.delay_for(url)
+        started: dict[asyncio.Future[httpx.Response], asyncio.Future[float]] = {}
+
+        def attempt() -> asyncio.Future[httpx.Response]:
+            holding: asyncio.Future[float] = loop.create_future()
+            task = asyncio.ensure_future(
+                self._send(
+                    method, url, params, json, priority, timeout, holding=holding
+                )
+            )
+            started[task] = holding
+            return task
+
+        primary = attempt()
+        pending = {primary}
+        try:
+            if delay is not None:
+                await asyncio.wait(
+                    {primary, started[primary]}, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not primary.done():
+                    done, _ = await asyncio.wait(pending, timeout=delay)
+                    if not done and hedger.try_hedge():
+                        pending.add(attempt())
+
+            errors: list[BaseException] = []
+            failed: httpx.Response | None = None
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    exc = task.exception()
+                    if exc is not None:
+                        errors.append(exc)
+                        continue
+                    response = task.result()
+                    status = response.status_code
+                    if status >= 500 or status == 429:
+                        # Another attempt may still succeed; wait for it.
+                        failed = response
+                        continue
+                    hedger.record(url, loop.time() - started[task].result())
+                    if task is not primary:
+                        hedger.hedge_wins += 1
+                    return response
+            if failed is not None:
+                return failed
+            raise errors[0]
+        finally:
+            for task in pending:
+                task.cancel()
+
     async def get(
         self,
         url: str,
         *,
         params: dict[str, Any] | None = None,
+        priority: Priority | None = None,
+        deadline: DeadlineLike = None,
     ) -> httpx.Response:
         """
         Perform a GET request.
 
         :param url: Endpoint relative path.
         :param params: Query string parameters.
+        :param priority: Scheduling class; defaults to the current context.
+        :param deadline: Deadline or seconds from now; see `request`.
         :return: HTTP response.
         """
-        return await self.request("GET", url, params=params)
+        return await self.request(
+            "GET", url, params=params, priority=priority, deadline=deadline
+        )
+
+    async def get_json(
+        self,
+        url: str,
+        *,
+        params: dict[str, Any] | None = None,
+        priority: Priority | None = None,
+        deadline: DeadlineLike = None,
+    ) -> dict[str, Any]:
+        """
+        Perform a GET request and decode its JSON body.
+
+        The decoded payload is passed to every registered response hook
+        before being returned. When the client has a cache with a policy for
+        `url`, fresh entries are returned without a request, stale ones are
+        returned at once and refreshed in the background, and expired ones
+        stand in for upstream failures within the policy's limits.
+
+        :param url: Endpoint relative path.
+        :param params: Query string parameters.
+        :param priority: Scheduling class; defaults to the current context.
+        :param deadline: Deadline or seconds from now; see `request`.
+        :return: Decoded response body.
+        :raises ParsingError: If the body is not valid JSON.
+        """
+        with deadline_scope(deadline):
+            if self._cache is not None:
+                policy = self._cache.policy_for(url)
+                if policy is not None:
+                    return await self._get_cached(
+                        self._cache, policy, url, params, priority
+                    )
+            return await self._fetch_json(url, params=params, priority=priority)
+
+    async def _fetch_json(
+        self,
+        url: str,
+        *,
+        params: dict[str, Any] | None = None,
+        priority: Priority | None = None,
+    ) -> dict[str, Any]:
+        response = await self.get(url, params=params, priority=priority)
+        try:
+            payload = await self._decoder.decode(
+                url, response.content, self._loop_monitor
+            )
+        except ValueError as exc:
+            raise ParsingError(f"Invalid JSON from {url}: {exc}") from exc
+        if self._entities is not None:
+            with self._section(url, "entities"):
+                payload = self._entities.normalize(url, payload)
+
+        self._run_hooks(url, params, payload)
+        return payload
+
+    def _run_hooks(
+        self, url: str, params: dict[str, Any] | None, payload: dict[str, Any]
+    ) -> None:
+        if not self._response_hooks:
+            return
+        with self._section(url, "hooks"):
+            for hook in self._response_hooks:
+                try:
+                    hook(url, params or {}, payload)
+                except Exception:
+                    logger.exception("Response hook %r failed for %s", hook, url)
+
+    def _section(self, url: str, stage: str) -> ContextManager[Any]:
+        if self._loop_monitor is None:
+            return contextlib.nullcontext()
+        return self._loop_monitor.section(url, stage)
+
+    async def _get_cached(
+        self,
+        cache: ResponseCache,
+        policy: CachePolicy,
+        url: str,
+        params: dict[str, Any] | None,
+        priority: Priority | None,
+    ) -> dict[str, Any]:
+        key = cache_key(url, params)
+        entry = cache.get(key)
+        if entry is not None:
+            age = entry.age
+            if age <= policy.ttl:
+                cache.hits += 1
+                return entry.payload
+            if age <= policy.ttl + policy.max_stale:
+                cache.stale_hits += 1
+                self._refresh(key, url, params, Priority.BACKGROUND)
+                return entry.payload
+
+        cache.misses += 1
+        try:
+            # Concurrent misses for the same key share one request.
+            return await asyncio.shield(self._refresh(key, url, params, priority))
+        except (
+            APIFootballRequestError,
+            APIFootballHTTPError,
+            ParsingError,
+            CircuitOpenError,
+            DeadlineExceededError,
+            QuotaExceededError,
+        ) as exc:
+            status = getattr(exc, "status_code", None)
+            if (
+                entry is None
+                or (status is not None and status < 500 and status != 429)
+                or entry.age > policy.ttl + policy.stale_if_error
+            ):
+                raise
+            cache.error_hits += 1
+            logger.warning("Serving stale %s after upstream error: %s", url, exc)
+            return entry.payload
+
+    def _refresh(
+        self,
+        key: CacheKey,
+        url: str,
+        params: dict[str, Any] | None,
+        priority: Priority | None,
+    ) -> asyncio.Task[dict[str, Any]]:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(
+                self._fetch_and_store(key, url, params, priority)
+            )
+            self._inflight[key] = task
+            # Background refreshes may finish with nobody awaiting them.
+            task.add_done_callback(lambda done: done.cancelled() or done.exception())
+        return task
+
+    async def _fetch_and_store(
+        self,
+        key: CacheKey,
+        url: str,
+        params: dict[str, Any] | None,
+        priority: Priority | None,
+    ) -> dict[str, Any]:
+        try:
+            if priority == Priority.BACKGROUND:
+                # Revalidation must not inherit the deadline of the request
+                # that happened to trigger it.
+                with without_deadline():
+                    payload = await self._fetch_json(
+                        url, params=params, priority=priority
+                    )
+            else:
+                payload = await self._fetch_json(url, params=params, priority=priority)
+        except APIFootballError as exc:
+            logger.warning("Refresh of %s failed: %s", url, exc)
+            raise
+        finally:
+            self._inflight.pop(key, None)
+        if self._cache is not None:
+            self._cache.put(key, payload)
+        return payload
+
+    def stream_json(
+        self,
+        url: str,
+        *,
+        params: dict[str, Any] | None = None,
+        key: str = "response",
+        priority: Priority | None = None,
+        deadline: DeadlineLike = None,
+    ) -> JsonStream:
+        """
+        Perform a GET request and iterate over its JSON array as it is parsed.
+
+        The body is read in chunks and each item of the `key` array is
+        yielded as soon as it is complete, so memory use depends on the size
+        of one item rather than of the response. The request is sent, and
+        retried on transient failures, when iteration starts; errors while
+        reading the body are not retried, since items were already yielded.
+
+        The scheduler slot is released once the headers have arrived.
+        Streamed payloads bypass the response cache. When response hooks are
+        registered, the items of the body are also kept, and the hooks are
+        called with the reassembled payload once the body has been read to
+        the end, as `get_json` would have called them.
+
+        :param url: Endpoint relative path.
+        :param params: Query string parameters.
+        :param key: Top-level member whose array items are yielded.
+        :param priority: Scheduling class; defaults to the current context.
+        :param deadline: Deadline or seconds from now; see `request`. Also
+            checked between body chunks.
+        :return: Async iterator of items, with the other top-level members
+            in its `fields`.
+        :raises ParsingError: While iterating, if the body is not valid JSON.
+        """
+        effective_deadline = as_deadline(deadline)
+
+        def open_response() -> Awaitable[httpx.Response]:
+            return self.request(
+                "GET",
+                url,
+                params=params,
+                priority=priority,
+                deadline=effective_deadline,
+                stream=True,
+            )
+
+        transform = None
+        if self._entities is not None and key == "response":
+            transform = functools.partial(self._entities.normalize_row, url)
+        return JsonStream(
+            open_response,
+            url,
+            key=key,
+            deadline=effective_deadline,
+            transform=transform,
+            on_complete=(
+                functools.partial(self._run_hooks, url, params)
+                if self._response_hooks
+                else None
+            ),
+        )
+
+    async def stream_pages(
+        self,
+        url: str,
+        *,
+        params: dict[str, Any] | None = None,
+        key: str = "response",
+        priority: Priority | None = None,
+        deadline: DeadlineLike = None,
+    ) -> AsyncIterator[Any]:
+        """
+        Stream the items of every page of a paginated endpoint.
+
+        Pages are fetched one at a time with `stream_json`, until the
+        `paging.total` member of a page says it was the last one.
+
+        :param url: Endpoint relative path.
+        :param params: Query string parameters, without `page`.
+        :param key: Top-level member whose array items are yielded.
+        :param priority: Scheduling class; defaults to the current context.
+        :param deadline: Deadline or seconds from now, shared by all pages.
+        :return: Async iterator over the items of every page.
+        """
+        effective_deadline = as_deadline(deadline)
+        page = 1
+        while True:
+            rows = self.stream_json(
+                url,
+                params={**(params or {}), "page": page},
+                key=key,
+                priority=priority,
+                deadline=effective_deadline,
+            )
+            async with rows:
+                async for row in rows:
+                    yield row
+
+            paging = rows.fields.get("paging") or {}
+            if page >= int(paging.get("total") or 1):
+                return
+            page += 1
 
     async def post(
         self,
@@ -163,6 +854,8 @@ class ApiFootballClient:
         *,
         params: dict[str, Any] | None = None,
         json: dict[str, Any] | None = None,
+        priority: Priority | None = None,
+        deadline: DeadlineLike = None,
     ) -> httpx.Response:
         """
         Perform a POST request.
@@ -170,9 +863,13 @@ class ApiFootballClient:
         :param url: Endpoint relative path.
         :param params: Query string parameters.
         :param json: Request body payload.
+        :param priority: Scheduling class; defaults to the current context.
+        :param deadline: Deadline or seconds from now; see `request`.
         :return: HTTP response.
         """
-        return await self.request("POST", url, params=params, json=json)
+        return await self.request(
+            "POST", url, params=params, json=json, priority=priority, deadline=deadline
+        )
 
 
 _client_instance: Optional[ApiFootballClient] = None
@@ -188,3 +885,32 @@ def get_client() -> ApiFootballClient:
     if _client_instance is None:
         _client_instance = ApiFootballClient()
     return _client_instance
+
+
+def set_client(client: ApiFootballClient | None) -> ApiFootballClient | None:
+    """
+    Replace the client returned by `get_client`, and so used by every
+    endpoint function.
+
+    The previous client is not closed.
+
+    :param client: The new shared client, or None to build a default one on
+        next use.
+    :return: The previous shared client, if one was built.
+    """
+    global _client_instance
+    previous, _client_instance = _client_instance, client
+    return previous
+
+
+def configure_client(**options: Any) -> ApiFootballClient:
+    """
+    Build the shared client with the given options (e.g., a `cache`,
+    `hedging`, or `entities`) and make endpoint functions use it.
+
+    :param options: Keyword arguments of `ApiFootballClient`.
+    :return: The new shared client.
+    """
+    client = ApiFootballClient(**options)
+    set_client(client)
+    return client
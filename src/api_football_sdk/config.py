@@ -10,7 +10,7 @@ All settings are strongly typed and validated at import time.
 from __future__ import annotations
 
 import functools
-from typing import Final, Mapping
+from typing import Final, Literal, Mapping
 
 from pydantic import AnyHttpUrl, Field, field_validator
 from pydantic_settings import BaseSettings
@@ -38,6 +38,17 @@ class Settings(BaseSettings):
     http_timeout: float = Field(10.0, alias="API_FOOTBALL_HTTP_TIMEOUT")
     http_max_retries: int = Field(3, alias="API_FOOTBALL_HTTP_MAX_RETRIES")
     http_backoff_factor: float = Field(0.5, alias="API_FOOTBALL_HTTP_BACKOFF_FACTOR")
+    http_max_concurrency: int = Field(10, alias="API_FOOTBALL_HTTP_MAX_CONCURRENCY")
+    http_rate_limit: float | None = Field(None, alias="API_FOOTBALL_HTTP_RATE_LIMIT")
+    http_transport: Literal["httpx", "http2", "aiohttp", "memory"] = Field(
+        "httpx", alias="API_FOOTBALL_HTTP_TRANSPORT"
+    )
+    http_circuit_breaker: bool = Field(True, alias="API_FOOTBALL_HTTP_CIRCUIT_BREAKER")
+    quota_file: str | None = Field(None, alias="API_FOOTBALL_QUOTA_FILE")
+    quota_reserve: int = Field(0, alias="API_FOOTBALL_QUOTA_RESERVE")
+    coordination_file: str | None = Field(None, alias="API_FOOTBALL_COORDINATION_FILE")
+    json_offload_bytes: int = Field(512 * 1024, alias="API_FOOTBALL_JSON_OFFLOAD_BYTES")
+    debug_loop_blocking: bool = Field(False, alias="API_FOOTBALL_DEBUG_LOOP_BLOCKING")
     user_agent: str = Field(default="api-football-sdk/1.0", alias="USER_AGENT")
 
     model_config: Final[dict[str, object]] = {
@@ -77,11 +88,47 @@ class Settings(BaseSettings):
             raise ValueError("must be greater than 0")
         return value
 
-    @field_validator("http_max_retries", mode="before")
+    @field_validator("http_rate_limit", mode="before")
+    @classmethod
+    def _validate_optional_positive_float(cls, value: float | None) -> float | None:
+        """
+        Ensure an unset or positive requests-per-second limit.
+
+        :param value: The value to validate.
+        :return: The validated positive float, or None when unset.
+        :raises ValueError: If the value is not positive.
+        """
+        if value is None or value == "":
+            return None
+        if isinstance(value, str):
+            value = float(value)
+        if value <= 0:
+            raise ValueError("must be greater than 0")
+        return value
+
+    @field_validator("http_max_concurrency", mode="before")
+    @classmethod
+    def _validate_positive_int(cls, value: int) -> int:
+        """
+        Ensure a positive concurrency limit.
+
+        :param value: The value to validate.
+        :return: The validated positive integer.
+        :raises ValueError: If the value is not positive.
+        """
+        if isinstance(value, str):
+            value = int(value)
+        if value <= 0:
+            raise ValueError("must be greater than 0")
+        return value
+
+    @field_validator(
+        "http_max_retries", "quota_reserve", "json_offload_bytes", mode="before"
+    )
     @classmethod
     def _validate_non_negative(cls, value: int) -> int:
         """
-        Ensure a non-negative retry count.
+        Ensure a non-negative count (retries, reserved calls, or bytes).
 
         :param value: The value to validate.
         :return: The validated non-negative integer.
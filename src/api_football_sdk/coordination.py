@@ -0,0 +1,555 @@
+"""
+Coordination of several clients, processes, or hosts sharing one API key.
+
+Each `ApiFootballClient` rate-limits itself alone, so N workers against one
+subscription send N times the plan's rate. A `CoordinationBackend` holds
+the state they must share:
+
+- a token bucket, used by `SharedRateLimiter` in place of each client's
+  local one, so all workers together stay under the rate limit;
+- work queues, used by `WorkQueue`, from which workers claim disjoint
+  items (e.g., fixture IDs to hydrate) under a lease, so no item is done
+  twice and items of a crashed worker are picked up again once their lease
+  expires.
+
+`SQLiteBackend` coordinates the processes of one host through a database
+file. `MemoryBackend` coordinates the clients of one process and stands in
+for networked implementations (e.g., over Redis) in tests; those only need
+to implement the `CoordinationBackend` methods atomically.
+
+Usage example:
+--------------
+    from api_football_sdk.client import ApiFootballClient
+    from api_football_sdk.coordination import SQLiteBackend, WorkQueue
+
+    backend = SQLiteBackend("/tmp/api-football.db")
+    client = ApiFootballClient(coordination=backend, rate_limit=5)
+    queue = WorkQueue(backend, "hydrate-events")
+    await queue.add(fixture_ids)
+    async for fixture_id in queue:
+        await get_events_by_fixture(fixture_id)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator, Hashable, Iterable, Mapping
+
+from api_football_sdk.scheduler import DEFAULT_RESERVES, Priority, current_priority
+
+__all__: list[str] = [
+    "CoordinationBackend",
+    "MemoryBackend",
+    "SQLiteBackend",
+    "SharedRateLimiter",
+    "WorkQueue",
+]
+
+# Work item states.
+_PENDING = 0
+_CLAIMED = 1
+_DONE = 2
+
+
+class CoordinationBackend(ABC):
+    """
+    Shared state behind `SharedRateLimiter` and `WorkQueue`.
+
+    Every method must be atomic with respect to every other worker using
+    the same store. Times are wall-clock seconds (`time.time()`), since
+    they are compared across processes.
+    """
+
+    @abstractmethod
+    async def take_token(
+        self, bucket: str, rate: float, burst: float, floor: float = 0.0
+    ) -> float:
+        """
+        Refill a token bucket and take one token if enough are left.
+
+        A missing bucket starts full.
+
+        :param bucket: Bucket name.
+        :param rate: Tokens added per second.
+        :param burst: Bucket capacity.
+        :param floor: Tokens that must remain after taking one.
+        :return: 0.0 if a token was taken, else seconds until one could be.
+        """
+
+    @abstractmethod
+    async def add_items(self, queue: str, items: Iterable[Hashable]) -> int:
+        """
+        Add items to a work queue; items already known are ignored.
+
+        :param queue: Queue name.
+        :param items: Work items (str or int).
+        :return: Number of new items.
+        """
+
+    @abstractmethod
+    async def claim_items(
+        self, queue: str, worker: str, limit: int, lease: float
+    ) -> list[Hashable]:
+        """
+        Claim pending items, or items whose lease has expired.
+
+        :param queue: Queue name.
+        :param worker: Claiming worker ID.
+        :param limit: Maximum number of items.
+        :param lease: Seconds before unfinished claims may be taken over.
+        :return: The claimed items, oldest first.
+        """
+
+    @abstractmethod
+    async def complete_items(
+        self, queue: str, worker: str, items: Iterable[Hashable]
+    ) -> int:
+        """
+        Mark items claimed by a worker as done.
+
+        :param queue: Queue name.
+        :param worker: Worker ID that claimed the items.
+        :param items: Items to mark.
+        :return: Number of items marked; items claimed by someone else since
+            are not.
+        """
+
+    @abstractmethod
+    async def release_items(
+        self, queue: str, worker: str, items: Iterable[Hashable]
+    ) -> int:
+        """
+        Return items claimed by a worker to the pending state.
+
+        :param queue: Queue name.
+        :param worker: Worker ID that claimed the items.
+        :param items: Items to release.
+        :return: Number of items released.
+        """
+
+    @abstractmethod
+    async def counts(self, queue: str) -> dict[str, int]:
+        """
+        Number of items per state.
+
+        :param queue: Queue name.
+        :return: Counts of "pending", "claimed", and "done" items.
+        """
+
+    async def aclose(self) -> None:
+        """
+        Release connections and other resources.
+
+        :return: None
+        """
+
+
+def _take(
+    tokens: float, updated: float, now: float, rate: float, burst: float, floor: float
+) -> tuple[float, float]:
+    """
+    Token bucket step shared by the backends.
+
+    :return: The new token count, and 0.0 or the seconds to wait.
+    """
+    tokens = min(burst, tokens + max(now - updated, 0.0) * rate)
+    if tokens >= floor + 1.0:
+        return tokens - 1.0, 0.0
+    return tokens, (floor + 1.0 - tokens) / rate
+
+
+class MemoryBackend(CoordinationBackend):
+    """
+    Coordination state kept in this process.
+
+    Shares a rate limit and work queues between the clients and tasks of
+    one process, and stands in for networked backends in tests.
+    """
+
+    def __init__(self) -> None:
+        self._buckets: dict[str, tuple[float, float]] = {}
+        self._queues: dict[str, dict[Hashable, list[Any]]] = {}
+
+    async def take_token(
+        self, bucket: str, rate: float, burst: float, floor: float = 0.0
+    ) -> float:
+        now = time.time()
+        tokens, updated = self._buckets.get(bucket, (burst, now))
+        tokens, wait = _take(tokens, updated, now, rate, burst, floor)
+        self._buckets[bucket] = (tokens, now)
+        return wait
+
+    async def add_items(self, queue: str, items: Iterable[Hashable]) -> int:
+        entries = self._queues.setdefault(queue, {})
+        added = 0
+        for item in items:
+            if item not in entries:
+                entries[item] = [_PENDING, None, 0.0]
+                added += 1
+        return added
+
+    async def claim_items(
+        self, queue: str, worker: str, limit: int, lease: float
+    ) -> list[Hashable]:
+        now = time.time()
+        claimed: list[Hashable] = []
+        for item, entry in self._queues.get(queue, {}).items():
+            if len(claimed) >= limit:
+                break
+            state, _, lease_until = entry
+            if state == _PENDING or (state == _CLAIMED and lease_until < now):
+                entry[:] = [_CLAIMED, worker, now + lease]
+                claimed.append(item)
+        return claimed
+
+    async def complete_items(
+        self, queue: str, worker: str, items: Iterable[Hashable]
+    ) -> int:
+        return self._move(queue, worker, items, _DONE)
+
+    async def release_items(
+        self, queue: str, worker: str, items: Iterable[Hashable]
+    ) -> int:
+        return self._move(queue, worker, items, _PENDING)
+
+    def _move(
+        self, queue: str, worker: str, items: Iterable[Hashable], state: int
+    ) -> int:
+        entries = self._queues.get(queue, {})
+        moved = 0
+        for item in items:
+            entry = entries.get(item)
+            if entry is not None and entry[0] == _CLAIMED and entry[1] == worker:
+                entry[:] = [state, None if state == _PENDING else worker, 0.0]
+                moved += 1
+        return moved
+
+    async def counts(self, queue: str) -> dict[str, int]:
+        states = [entry[0] for entry in self._queues.get(queue, {}).values()]
+        return {
+            "pending": states.count(_PENDING),
+            "claimed": states.count(_CLAIMED),
+            "done": states.count(_DONE),
+        }
+
+
+class SQLiteBackend(CoordinationBackend):
+    """
+    Coordination state in a SQLite file shared by the processes of one host.
+
+    Every operation is one `BEGIN IMMEDIATE` transaction, which SQLite
+    serializes across processes with its file lock. Calls run in a worker
+    thread so lock waits never block the event loop.
+
+    :param path: Database file; every coordinated process must use the
+        same one.
+    :param timeout: Seconds to wait for another process's transaction.
+    """
+
+    def __init__(self, path: str, *, timeout: float = 30.0) -> None:
+        self._conn = sqlite3.connect(
+            path, timeout=timeout, isolation_level=None, check_same_thread=False
+        )
+        self._lock = threading.Lock()
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS buckets "
+            "(name TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)"
+        )
+        # No type on `item`, so ints and strings keep their type.
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS work (queue TEXT NOT NULL, item NOT NULL, "
+            "state INTEGER NOT NULL, worker TEXT, lease_until REAL, "
+            "PRIMARY KEY (queue, item))"
+        )
+
+    async def _run(self, operation: Any, *args: Any) -> Any:
+        def transaction() -> Any:
+            with self._lock:
+                self._conn.execute("BEGIN IMMEDIATE")
+                try:
+                    result = operation(*args)
+                except BaseException:
+                    self._conn.execute("ROLLBACK")
+                    raise
+                self._conn.execute("COMMIT")
+                return result
+
+        return await asyncio.to_thread(transaction)
+
+    async def take_token(
+        self, bucket: str, rate: float, burst: float, floor: float = 0.0
+    ) -> float:
+        def take() -> float:
+            now = time.time()
+            row = self._conn.execute(
+                "SELECT tokens, updated FROM buckets WHERE name = ?", (bucket,)
+            ).fetchone()
+            tokens, updated = row if row is not None else (burst, now)
+            tokens, wait = _take(tokens, updated, now, rate, burst, floor)
+            self._conn.execute(
+                "INSERT INTO buckets VALUES (?, ?, ?) ON CONFLICT (name) "
+                "DO UPDATE SET tokens = excluded.tokens, updated = excluded.updated",
+                (bucket, tokens, now),
+            )
+            return wait
+
+        return await self._run(take)
+
+    async def add_items(self, queue: str, items: Iterable[Hashable]) -> int:
+        rows = [(queue, item, _PENDING) for item in items]
+
+        def add() -> int:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO work (queue, item, state) VALUES (?, ?, ?)",
+                rows,
+            )
+            return self._conn.total_changes - before
+
+        return await self._run(add)
+
+    async def claim_items(
+        self, queue: str, worker: str, limit: int, lease: float
+    ) -> list[Hashable]:
+        def claim() -> list[Hashable]:
+            now = time.time()
+            items = [
+                item
+                for (item,) in self._conn.execute(
+                    "SELECT item FROM work WHERE queue = ? AND (state = ? "
+                    "OR (state = ? AND lease_until < ?)) ORDER BY rowid LIMIT ?",
+                    (queue, _PENDING, _CLAIMED, now, limit),
+                )
+            ]
+            self._conn.executemany(
+                "UPDATE work SET state = ?, worker = ?, lease_until = ? "
+                "WHERE queue = ? AND item = ?",
+                [(_CLAIMED, worker, now + lease, queue, item) for item in items],
+            )
+            return items
+
+        return await self._run(claim)
+
+    async def complete_items(
+        self, queue: str, worker: str, items: Iterable[Hashable]
+    ) -> int:
+        return await self._move(queue, worker, items, _DONE)
+
+    async def release_items(
+        self, queue: str, worker: str, items: Iterable[Hashable]
+    ) -> int:
+        return await self._move(queue, worker, items, _PENDING)
+
+    async def _move(
+        self, queue: str, worker: str, items: Iterable[Hashable], state: int
+    ) -> int:
+        owner = None if state == _PENDING else worker
+        rows = [(state, owner, queue, item, _CLAIMED, worker) for item in items]
+
+        def move() -> int:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "UPDATE work SET state = ?, worker = ?, lease_until = NULL "
+                "WHERE queue = ? AND item = ? AND state = ? AND worker = ?",
+                rows,
+            )
+            return self._conn.total_changes - before
+
+        return await self._run(move)
+
+    async def counts(self, queue: str) -> dict[str, int]:
+        def count() -> dict[int, int]:
+            return dict(
+                self._conn.execute(
+                    "SELECT state, COUNT(*) FROM work WHERE queue = ? GROUP BY state",
+                    (queue,),
+                ).fetchall()
+            )
+
+        counts = await self._run(count)
+        return {
+            "pending": counts.get(_PENDING, 0),
+            "claimed": counts.get(_CLAIMED, 0),
+            "done": counts.get(_DONE, 0),
+        }
+
+    async def aclose(self) -> None:
+        """
+        Close the database connection.
+
+        :return: None
+        """
+        with self._lock:
+            self._conn.close()
+
+
+class SharedRateLimiter:
+    """
+    Token bucket shared by every client using the same backend and key.
+
+    As in `RequestScheduler`, a priority class may only take a token while
+    more than its reserve fraction of the bucket is left, so when the
+    shared budget runs short background work waits first.
+
+    :param backend: Shared state.
+    :param rate: Requests per second allowed for all workers together.
+    :param burst: Bucket capacity; defaults to `rate`, and at least enough
+        for every class to take a token from a full bucket.
+    :param key: Bucket name; one per API key.
+    :param reserves: Fraction of the bucket each class must leave.
+    """
+
+    def __init__(
+        self,
+        backend: CoordinationBackend,
+        *,
+        rate: float,
+        burst: float | None = None,
+        key: str = "requests",
+        reserves: Mapping[Priority, float] | None = None,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+        self._backend = backend
+        self._rate = rate
+        self._key = key
+        self._reserves = {**DEFAULT_RESERVES, **(reserves or {})}
+        if burst is None:
+            # A class needs `reserve * burst + 1` tokens, which a bucket of
+            # `1 / (1 - reserve)` tokens or more can hold.
+            reserve = max(self._reserves.values())
+            burst = max(1.0, rate, 1.0 / (1.0 - reserve) if reserve < 1.0 else 1.0)
+        if burst < 1.0:
+            raise ValueError("burst must allow at least one request")
+        self._burst = float(burst)
+        self.granted = 0
+        self.waited = 0.0
+
+    @property
+    def rate(self) -> float:
+        """
+        Requests per second allowed for all workers together.
+
+        :return: The shared rate limit.
+        """
+        return self._rate
+
+    async def acquire(self, priority: Priority | None = None) -> None:
+        """
+        Wait until a token can be taken from the shared bucket.
+
+        :param priority: Priority class; defaults to `current_priority()`.
+        :return: None
+        """
+        priority = current_priority() if priority is None else priority
+        # Capped so that a full bucket always admits every class.
+        floor = min(self._reserves[priority] * self._burst, self._burst - 1.0)
+        while True:
+            wait = await self._backend.take_token(
+                self._key, self._rate, self._burst, floor
+            )
+            if wait <= 0:
+                self.granted += 1
+                return
+            self.waited += wait
+            await asyncio.sleep(wait)
+
+
+class WorkQueue:
+    """
+    A named queue of work items claimed by workers under a lease.
+
+    Iterating claims items in batches and yields them one by one; an item
+    is marked done when the loop asks for the next one. When the loop stops
+    early, the current item and the rest of its batch are released once the
+    iterator is closed (use `contextlib.aclosing` to close it at once); the
+    items of a worker that died are claimed again when their lease expires.
+
+    :param backend: Shared state.
+    :param name: Queue name, shared by the cooperating workers.
+    :param worker: ID of this worker; a random one by default.
+    :param lease: Seconds a claim lasts before others may take it over.
+    :param batch: Items claimed per round trip while iterating.
+    """
+
+    def __init__(
+        self,
+        backend: CoordinationBackend,
+        name: str,
+        *,
+        worker: str | None = None,
+        lease: float = 300.0,
+        batch: int = 10,
+    ) -> None:
+        self._backend = backend
+        self.name = name
+        self.worker = worker or uuid.uuid4().hex
+        self._lease = lease
+        self._batch = batch
+
+    async def add(self, items: Iterable[Hashable]) -> int:
+        """
+        Add items; items added before, even if done, are ignored.
+
+        :param items: Work items (str or int).
+        :return: Number of new items.
+        """
+        return await self._backend.add_items(self.name, items)
+
+    async def claim(self, limit: int | None = None) -> list[Hashable]:
+        """
+        Claim items for this worker.
+
+        :param limit: Maximum number of items; defaults to `batch`.
+        :return: The claimed items; empty when nothing is left to claim.
+        """
+        return await self._backend.claim_items(
+            self.name, self.worker, limit or self._batch, self._lease
+        )
+
+    async def complete(self, items: Iterable[Hashable]) -> int:
+        """
+        Mark claimed items as done.
+
+        :param items: Items claimed by this worker.
+        :return: Number of items marked.
+        """
+        return await self._backend.complete_items(self.name, self.worker, items)
+
+    async def release(self, items: Iterable[Hashable]) -> int:
+        """
+        Give claimed items back to the queue.
+
+        :param items: Items claimed by this worker.
+        :return: Number of items released.
+        """
+        return await self._backend.release_items(self.name, self.worker, items)
+
+    async def counts(self) -> dict[str, int]:
+        """
+        Number of pending, claimed, and done items.
+
+        :return: Counts per state.
+        """
+        return await self._backend.counts(self.name)
+
+    async def __aiter__(self) -> AsyncIterator[Hashable]:
+        while True:
+            batch = await self.claim()
+            if not batch:
+                return
+            index = 0
+            try:
+                for index, item in enumerate(batch):
+                    yield item
+                    await self.complete([item])
+                index = len(batch)
+            finally:
+                if index < len(batch):
+                    await self.release(batch[index:])
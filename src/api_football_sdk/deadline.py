@@ -0,0 +1,144 @@
+"""
+Deadlines shared by every request of a multi-request operation.
+
+A `Deadline` is an absolute point in time. Inside `deadline_scope(...)`
+every request the client sends (including those of tasks started within
+the block) shrinks its per-attempt timeout to the time left, skips retries
+that could not finish in time, and fails with `DeadlineExceededError` once
+the deadline has passed. Nested scopes keep the earliest deadline, so an
+inner helper can tighten but never extend its caller's budget.
+
+Usage example:
+--------------
+    from api_football_sdk.deadline import deadline_scope
+    from api_football_sdk.endpoints.fixtures import get_fixture_by_id
+    from api_football_sdk.endpoints.events import get_events_by_fixture
+
+    with deadline_scope(2.0):
+        fixture = await get_fixture_by_id(1035037)
+        events = await get_events_by_fixture(1035037)
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Union
+
+__all__: list[str] = [
+    "Deadline",
+    "DeadlineLike",
+    "as_deadline",
+    "current_deadline",
+    "deadline_scope",
+    "without_deadline",
+]
+
+
+class Deadline:
+    """
+    Absolute deadline on the `time.monotonic()` clock.
+    """
+
+    __slots__ = ("expires_at",)
+
+    def __init__(self, expires_at: float) -> None:
+        self.expires_at = expires_at
+
+    @classmethod
+    def after(cls, seconds: float) -> Deadline:
+        """
+        Build a deadline a number of seconds from now.
+
+        :param seconds: Time budget.
+        :return: The deadline.
+        """
+        return cls(time.monotonic() + seconds)
+
+    def remaining(self) -> float:
+        """
+        Seconds left, negative once the deadline has passed.
+
+        :return: The time left.
+        """
+        return self.expires_at - time.monotonic()
+
+    @property
+    def expired(self) -> bool:
+        """
+        Whether the deadline has passed.
+
+        :return: True once no time is left.
+        """
+        return self.remaining() <= 0
+
+    def __repr__(self) -> str:
+        return f"Deadline(remaining={self.remaining():.3f}s)"
+
+
+DeadlineLike = Union[Deadline, float, None]
+"""A `Deadline`, a budget in seconds from now, or None for no deadline."""
+
+_deadline: ContextVar[Deadline | None] = ContextVar(
+    "api_football_deadline", default=None
+)
+
+
+def current_deadline() -> Deadline | None:
+    """
+    Return the deadline of the innermost `deadline_scope`.
+
+    :return: The deadline, or None outside any scope.
+    """
+    return _deadline.get()
+
+
+def as_deadline(value: DeadlineLike) -> Deadline | None:
+    """
+    Combine a deadline argument with the current scope.
+
+    :param value: A `Deadline`, seconds from now, or None.
+    :return: The earlier of `value` and `current_deadline()`, if any.
+    """
+    if value is not None and not isinstance(value, Deadline):
+        value = Deadline.after(value)
+    current = _deadline.get()
+    if value is None or (
+        current is not None and current.expires_at <= value.expires_at
+    ):
+        return current
+    return value
+
+
+@contextmanager
+def deadline_scope(value: DeadlineLike) -> Iterator[Deadline | None]:
+    """
+    Apply a deadline to every request made inside the block.
+
+    :param value: A `Deadline`, seconds from now, or None (no-op).
+    :return: Context manager yielding the effective deadline.
+    """
+    deadline = as_deadline(value)
+    token = _deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _deadline.reset(token)
+
+
+@contextmanager
+def without_deadline() -> Iterator[None]:
+    """
+    Run the block free of any enclosing deadline.
+
+    For background work started on behalf of a request with a deadline
+    (e.g., cache revalidation) that should not inherit it.
+
+    :return: Context manager.
+    """
+    token = _deadline.set(None)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
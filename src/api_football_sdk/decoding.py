@@ -0,0 +1,204 @@
+"""
+Timed JSON decoding that keeps large bodies from blocking the event loop.
+
+`json.loads` on a multi-megabyte `/players` page runs for tens to hundreds
+of milliseconds, during which no other request makes progress.
+`JsonDecoder`, used by `ApiFootballClient.get_json`, records the size and
+decode time of every body per endpoint, and decodes bodies above
+`offload_threshold` bytes off the critical path:
+
+- by default, incrementally on the loop with `JsonArrayParser`, yielding
+  to other tasks after every `slice_bytes` of input, so the loop is held
+  for one slice at a time rather than for the whole body;
+- with an `executor`, by `json.loads` in that executor.
+
+A thread pool only helps on free-threaded Python builds: on CPython with
+the GIL, `json.loads` keeps the GIL for the whole call and stalls the loop
+as much as decoding inline.
+
+Usage example:
+--------------
+    from api_football_sdk.client import ApiFootballClient
+    from api_football_sdk.decoding import JsonDecoder
+
+    client = ApiFootballClient(decoder=JsonDecoder(offload_threshold=256 * 1024))
+    ...
+    print(client.decoder.stats()["/players"])
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+import time
+from concurrent.futures import Executor
+from typing import TYPE_CHECKING, Any, ContextManager
+
+from api_football_sdk.streaming import JsonArrayParser
+
+if TYPE_CHECKING:
+    from api_football_sdk.loop_monitor import LoopMonitor
+
+__all__: list[str] = ["DecodeStats", "JsonDecoder"]
+
+logger = logging.getLogger(__name__)
+
+
+class DecodeStats:
+    """
+    Decoding counters of one endpoint.
+    """
+
+    __slots__ = ("count", "bytes", "seconds", "max_seconds", "offloaded")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.bytes = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+        self.offloaded = 0
+
+    def add(self, size: int, seconds: float, offloaded: bool) -> None:
+        """
+        Record one decoded body.
+
+        :param size: Body size in bytes.
+        :param seconds: Time spent decoding on the event loop, or in the
+            executor for bodies decoded there.
+        :param offloaded: Whether the body was decoded off the critical path.
+        :return: None
+        """
+        self.count += 1
+        self.bytes += size
+        self.seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.offloaded += offloaded
+
+    def as_dict(self) -> dict[str, float]:
+        """
+        The counters, with the mean decode time.
+
+        :return: Count, bytes, total, mean, and max seconds, and offloaded.
+        """
+        return {
+            "count": self.count,
+            "bytes": self.bytes,
+            "seconds": self.seconds,
+            "mean_seconds": self.seconds / self.count if self.count else 0.0,
+            "max_seconds": self.max_seconds,
+            "offloaded": self.offloaded,
+        }
+
+
+def _timed_loads(body: bytes) -> tuple[Any, float]:
+    started = time.perf_counter()
+    payload = json.loads(body)
+    return payload, time.perf_counter() - started
+
+
+class JsonDecoder:
+    """
+    Decodes response bodies, timing them per endpoint.
+
+    :param offload_threshold: Bodies larger than this many bytes are decoded
+        in slices or in `executor`; None decodes everything inline.
+    :param slice_bytes: Input decoded between two yields to the loop.
+    :param executor: Executor for large bodies instead of slicing.
+    """
+
+    def __init__(
+        self,
+        offload_threshold: int | None = 512 * 1024,
+        *,
+        slice_bytes: int = 64 * 1024,
+        executor: Executor | None = None,
+    ) -> None:
+        if slice_bytes <= 0:
+            raise ValueError("slice_bytes must be positive")
+        self.offload_threshold = offload_threshold
+        self.slice_bytes = slice_bytes
+        self._executor = executor
+        self._stats: dict[str, DecodeStats] = {}
+
+    async def decode(
+        self, url: str, body: bytes, monitor: LoopMonitor | None = None
+    ) -> Any:
+        """
+        Decode one JSON body.
+
+        :param url: Endpoint the body was fetched from.
+        :param body: Raw response body.
+        :param monitor: Reports decoding steps that block the loop, if any.
+        :return: The decoded value.
+        :raises ValueError: If the body is not valid JSON.
+        """
+        offload = (
+            self.offload_threshold is not None and len(body) > self.offload_threshold
+        )
+        if offload and self._executor is not None:
+            loop = asyncio.get_running_loop()
+            payload, seconds = await loop.run_in_executor(
+                self._executor, _timed_loads, body
+            )
+        elif offload and body.lstrip()[:1] == b"{":
+            payload, seconds = await self._decode_sliced(url, body, monitor)
+        else:
+            offload = False
+            with _section(monitor, url, "decode"):
+                payload, seconds = _timed_loads(body)
+
+        self._stats.setdefault(url, DecodeStats()).add(len(body), seconds, offload)
+        logger.debug(
+            "Decoded %d bytes from %s in %.1f ms%s",
+            len(body),
+            url,
+            seconds * 1000,
+            " (offloaded)" if offload else "",
+        )
+        return payload
+
+    async def _decode_sliced(
+        self, url: str, body: bytes, monitor: LoopMonitor | None
+    ) -> tuple[dict[str, Any], float]:
+        parser = JsonArrayParser("response")
+        items: list[Any] = []
+        view = memoryview(body)
+        seconds = 0.0
+        for start in range(0, len(body), self.slice_bytes):
+            with _section(monitor, url, "decode"):
+                started = time.perf_counter()
+                items.extend(parser.feed(view[start : start + self.slice_bytes]))
+                seconds += time.perf_counter() - started
+            await asyncio.sleep(0)
+        with _section(monitor, url, "decode"):
+            started = time.perf_counter()
+            items.extend(parser.close())
+            seconds += time.perf_counter() - started
+        payload = dict(parser.fields)
+        # A non-array `response` was kept in `fields` as is.
+        payload.setdefault("response", items)
+        return payload, seconds
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """
+        Decoding counters per endpoint.
+
+        :return: Mapping of endpoint path to `DecodeStats.as_dict`.
+        """
+        return {url: stats.as_dict() for url, stats in self._stats.items()}
+
+    def reset(self) -> None:
+        """
+        Clear the counters.
+
+        :return: None
+        """
+        self._stats.clear()
+
+
+def _section(monitor: LoopMonitor | None, url: str, stage: str) -> ContextManager[Any]:
+    if monitor is None:
+        return contextlib.nullcontext()
+    return monitor.section(url, stage)
@@ -28,8 +28,8 @@ async def get_coach_by_team(team_id: int) -> dict[str, Any]:
     :return: Metadata about the coach (name, nationality, photo, etc.).
     """
     client = get_client()
-    response = await client.get("/coachs", params={"team": team_id})
-    results = response.json().get("response", [])
+    payload = await client.get_json("/coachs", params={"team": team_id})
+    results = payload.get("response", [])
 
     if not results:
         return {}
@@ -45,8 +45,8 @@ async def get_coach_by_id(coach_id: int) -> dict[str, Any]:
     :return: Metadata about the coach.
     """
     client = get_client()
-    response = await client.get("/coachs", params={"id": coach_id})
-    results = response.json().get("response", [])
+    payload = await client.get_json("/coachs", params={"id": coach_id})
+    results = payload.get("response", [])
 
     if not results:
         return {}
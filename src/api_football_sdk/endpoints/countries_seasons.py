@@ -27,8 +27,8 @@ async def get_supported_seasons() -> list[int]:
     :return: List of season years (e.g., [2008, 2009, ..., 2024]).
     """
     client = get_client()
-    response = await client.get("/leagues/seasons")
-    return response.json().get("response", [])
+    payload = await client.get_json("/leagues/seasons")
+    return payload.get("response", [])
 
 
 async def get_supported_countries() -> list[dict[str, Any]]:
@@ -38,5 +38,5 @@ async def get_supported_countries() -> list[dict[str, Any]]:
     :return: Each entry includes the country name and code.
     """
     client = get_client()
-    response = await client.get("/countries")
-    return response.json().get("response", [])
+    payload = await client.get_json("/countries")
+    return payload.get("response", [])
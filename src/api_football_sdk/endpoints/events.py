@@ -33,8 +33,8 @@ async def get_events_by_fixture(fixture_id: int) -> list[dict[str, Any]]:
     :return: List of events that occurred during the match.
     """
     client = get_client()
-    response = await client.get("/fixtures/events", params={"fixture": fixture_id})
-    return response.json().get("response", [])
+    payload = await client.get_json("/fixtures/events", params={"fixture": fixture_id})
+    return payload.get("response", [])
 
 
 async def get_events_by_fixture_and_player(
@@ -49,11 +49,11 @@ async def get_events_by_fixture_and_player(
     :return: List of events involving the given player.
     """
     client = get_client()
-    response = await client.get(
+    payload = await client.get_json(
         "/fixtures/events",
         params={"fixture": fixture_id, "player": player_id},
     )
-    return response.json().get("response", [])
+    return payload.get("response", [])
 
 
 async def get_events_by_fixture_and_team(
@@ -68,8 +68,8 @@ async def get_events_by_fixture_and_team(
     :return: List of events related to the team in the match.
     """
     client = get_client()
-    response = await client.get(
+    payload = await client.get_json(
         "/fixtures/events",
         params={"fixture": fixture_id, "team": team_id},
     )
-    return response.json().get("response", [])
+    return payload.get("response", [])
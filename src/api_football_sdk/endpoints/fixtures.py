@@ -2,7 +2,8 @@
 Endpoints for retrieving and filtering match fixtures.
 
 This module wraps the `/fixtures`, `/fixtures/headtohead`, and `/fixtures/rounds`
-endpoints of the API Football.
+endpoints of the API Football. `get_fixture_bundle` combines a fixture with
+its events, lineups, and statistics under one deadline.
 
 Usage example:
 --------------
@@ -13,9 +14,16 @@ Usage example:
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
 from api_football_sdk.client import get_client
+from api_football_sdk.deadline import DeadlineLike, deadline_scope
+from api_football_sdk.endpoints.events import get_events_by_fixture
+from api_football_sdk.endpoints.lineups import get_lineups_by_fixture
+from api_football_sdk.endpoints.statistics import get_statistics_by_fixture
+from api_football_sdk.exceptions import APIFootballError
+from api_football_sdk.scheduler import Priority, current_priority
 
 __all__: list[str] = [
     "get_fixture_by_id",
@@ -32,6 +40,7 @@ __all__: list[str] = [
     "get_fixtures_rounds",
     "get_fixtures_rounds_with_dates",
     "get_fixtures_head_to_head",
+    "get_fixture_bundle",
 ]
 
 
@@ -43,8 +52,8 @@ async def get_fixture_by_id(fixture_id: int) -> dict[str, Any]:
     :return: Metadata about the fixture.
     """
     client = get_client()
-    response = await client.get("/fixtures", params={"id": fixture_id})
-    results = response.json().get("response", [])
+    payload = await client.get_json("/fixtures", params={"id": fixture_id})
+    results = payload.get("response", [])
     return results[0] if results else {}
 
 
@@ -57,8 +66,8 @@ async def get_fixtures_by_ids(ids: list[int]) -> list[dict[str, Any]]:
     """
     fixture_ids = "-".join(str(fixture_id) for fixture_id in ids)
     client = get_client()
-    response = await client.get("/fixtures", params={"ids": fixture_ids})
-    return response.json().get("response", [])
+    payload = await client.get_json("/fixtures", params={"ids": fixture_ids})
+    return payload.get("response", [])
 
 
 async def get_fixtures_by_date(date: str) -> list[dict[str, Any]]:
@@ -69,8 +78,8 @@ async def get_fixtures_by_date(date: str) -> list[dict[str, Any]]:
     :return: List of fixtures on that date.
     """
     client = get_client()
-    response = await client.get("/fixtures", params={"date": date})
-    return response.json().get("response", [])
+    payload = await client.get_json("/fixtures", params={"date": date})
+    return payload.get("response", [])
 
 
 async def get_fixtures_by_status(status: str) -> list[dict[str, Any]]:
@@ -81,19 +90,25 @@ async def get_fixtures_by_status(status: str) -> list[dict[str, Any]]:
     :return: List of fixtures matching the status.
     """
     client = get_client()
-    response = await client.get("/fixtures", params={"status": status})
-    return response.json().get("response", [])
+    payload = await client.get_json("/fixtures", params={"status": status})
+    return payload.get("response", [])
 
 
 async def get_fixtures_in_progress() -> list[dict[str, Any]]:
     """
     Retrieve fixtures that are currently live.
 
+    Sent at live priority unless the caller declared another one.
+
     :return: List of live fixtures.
     """
     client = get_client()
-    response = await client.get("/fixtures", params={"live": "all"})
-    return response.json().get("response", [])
+    payload = await client.get_json(
+        "/fixtures",
+        params={"live": "all"},
+        priority=current_priority(Priority.LIVE),
+    )
+    return payload.get("response", [])
 
 
 async def get_last_fixtures(count: int) -> list[dict[str, Any]]:
@@ -104,8 +119,8 @@ async def get_last_fixtures(count: int) -> list[dict[str, Any]]:
     :return: List of recent fixtures.
     """
     client = get_client()
-    response = await client.get("/fixtures", params={"last": count})
-    return response.json().get("response", [])
+    payload = await client.get_json("/fixtures", params={"last": count})
+    return payload.get("response", [])
 
 
 async def get_next_fixtures(count: int) -> list[dict[str, Any]]:
@@ -116,8 +131,8 @@ async def get_next_fixtures(count: int) -> list[dict[str, Any]]:
     :return: List of upcoming fixtures.
     """
     client = get_client()
-    response = await client.get("/fixtures", params={"next": count})
-    return response.json().get("response", [])
+    payload = await client.get_json("/fixtures", params={"next": count})
+    return payload.get("response", [])
 
 
 async def get_fixtures_by_league(league_id: int, season: int) -> list[dict[str, Any]]:
@@ -129,10 +144,10 @@ async def get_fixtures_by_league(league_id: int, season: int) -> list[dict[str,
     :return: List of fixtures.
     """
     client = get_client()
-    response = await client.get(
+    payload = await client.get_json(
         "/fixtures", params={"league": league_id, "season": season}
     )
-    return response.json().get("response", [])
+    return payload.get("response", [])
 
 
 async def get_fixtures_by_team(team_id: int, season: int) -> list[dict[str, Any]]:
@@ -144,8 +159,10 @@ async def get_fixtures_by_team(team_id: int, season: int) -> list[dict[str, Any]
     :return: List of fixtures.
     """
     client = get_client()
-    response = await client.get("/fixtures", params={"team": team_id, "season": season})
-    return response.json().get("response", [])
+    payload = await client.get_json(
+        "/fixtures", params={"team": team_id, "season": season}
+    )
+    return payload.get("response", [])
 
 
 async def get_fixtures_by_dates(
@@ -164,7 +181,7 @@ async def get_fixtures_by_dates(
     :return: List of fixtures in the range.
     """
     client = get_client()
-    response = await client.get(
+    payload = await client.get_json(
         "/fixtures",
         params={
             "league": league_id,
@@ -173,7 +190,7 @@ async def get_fixtures_by_dates(
             "to": to_date,
         },
     )
-    return response.json().get("response", [])
+    return payload.get("response", [])
 
 
 async def get_fixtures_by_round(
@@ -190,7 +207,7 @@ async def get_fixtures_by_round(
     :return: List of fixtures.
     """
     client = get_client()
-    response = await client.get(
+    payload = await client.get_json(
         "/fixtures",
         params={
             "league": league_id,
@@ -198,7 +215,7 @@ async def get_fixtures_by_round(
             "round": round_name,
         },
     )
-    return response.json().get("response", [])
+    return payload.get("response", [])
 
 
 async def get_fixtures_rounds(league_id: int, season: int) -> list[str]:
@@ -210,10 +227,10 @@ async def get_fixtures_rounds(league_id: int, season: int) -> list[str]:
     :return: List of rounds.
     """
     client = get_client()
-    response = await client.get(
+    payload = await client.get_json(
         "/fixtures/rounds", params={"league": league_id, "season": season}
     )
-    return response.json().get("response", [])
+    return payload.get("response", [])
 
 
 async def get_fixtures_rounds_with_dates(league_id: int, season: int) -> list[str]:
@@ -225,11 +242,11 @@ async def get_fixtures_rounds_with_dates(league_id: int, season: int) -> list[st
     :return: List of rounds with dates.
     """
     client = get_client()
-    response = await client.get(
+    payload = await client.get_json(
         "/fixtures/rounds",
         params={"league": league_id, "season": season, "dates": "true"},
     )
-    return response.json().get("response", [])
+    return payload.get("response", [])
 
 
 async def get_fixtures_head_to_head(
@@ -238,11 +255,53 @@ async def get_fixtures_head_to_head(
     """
     Retrieve head-to-head fixtures between two teams.
 
+    The pair is sent in ascending ID order, so `(1, 2)` and `(2, 1)`
+    resolve to the same upstream request.
+
     :param team1_id: ID of the first team.
     :param team2_id: ID of the second team.
     :return: List of head-to-head fixtures.
     """
-    h2h = f"{team1_id}-{team2_id}"
+    low, high = sorted((team1_id, team2_id))
+    h2h = f"{low}-{high}"
     client = get_client()
-    response = await client.get("/fixtures/headtohead", params={"h2h": h2h})
-    return response.json().get("response", [])
+    payload = await client.get_json("/fixtures/headtohead", params={"h2h": h2h})
+    return payload.get("response", [])
+
+
+async def get_fixture_bundle(
+    fixture_id: int,
+    *,
+    deadline: DeadlineLike = None,
+) -> dict[str, Any]:
+    """
+    Retrieve a fixture with its events, lineups, and statistics.
+
+    The four requests run concurrently under one deadline. Parts that fail
+    or do not finish in time are returned as None and listed under
+    `missing`, so a page with a latency budget renders what arrived.
+
+    :param fixture_id: The ID of the fixture.
+    :param deadline: Deadline or seconds from now for the whole bundle.
+    :return: Dict with `fixture`, `events`, `lineups`, `statistics`, and
+        `missing` (names of the parts that could not be fetched).
+    """
+    parts = {
+        "fixture": get_fixture_by_id(fixture_id),
+        "events": get_events_by_fixture(fixture_id),
+        "lineups": get_lineups_by_fixture(fixture_id),
+        "statistics": get_statistics_by_fixture(fixture_id),
+    }
+    with deadline_scope(deadline):
+        results = await asyncio.gather(*parts.values(), return_exceptions=True)
+
+    bundle: dict[str, Any] = {"missing": []}
+    for name, result in zip(parts, results):
+        if isinstance(result, APIFootballError):
+            bundle[name] = None
+            bundle["missing"].append(name)
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            bundle[name] = result
+    return bundle
@@ -0,0 +1,137 @@
+"""
+Endpoints for retrieving injured and suspended players.
+
+This module wraps the `/injuries` endpoint of the API Football, including
+its bulk forms (a whole league season, a date, or many fixtures at once).
+
+Usage example:
+--------------
+    from api_football_sdk.endpoints.injuries import get_injuries_by_league
+
+    injuries = await get_injuries_by_league(league_id=39, season=2024)
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from api_football_sdk.client import get_client
+from api_football_sdk.deadline import DeadlineLike, deadline_scope
+
+__all__: list[str] = [
+    "get_injuries_by_fixture",
+    "get_injuries_by_fixtures",
+    "get_injuries_by_league",
+    "get_injuries_by_team",
+    "get_injuries_by_player",
+    "get_injuries_by_date",
+]
+
+MAX_IDS_PER_REQUEST: int = 20
+"""Upper bound on fixture IDs accepted by a single `ids` query."""
+
+
+async def get_injuries_by_fixture(fixture_id: int) -> list[dict[str, Any]]:
+    """
+    Get the players unavailable for a fixture.
+
+    :param fixture_id: The ID of the fixture.
+    :return: List of injured or suspended players with their team.
+    """
+    client = get_client()
+    payload = await client.get_json("/injuries", params={"fixture": fixture_id})
+    return payload.get("response", [])
+
+
+async def get_injuries_by_fixtures(
+    fixture_ids: list[int],
+    *,
+    deadline: DeadlineLike = None,
+) -> list[dict[str, Any]]:
+    """
+    Get the players unavailable for many fixtures at once.
+
+    IDs are sent in batches of `MAX_IDS_PER_REQUEST`, concurrently.
+
+    :param fixture_ids: List of fixture IDs.
+    :param deadline: Deadline or seconds from now for all the batches.
+    :return: Injuries of all the given fixtures.
+    :raises DeadlineExceededError: If the batches do not finish in time.
+    """
+    client = get_client()
+    batches = [
+        fixture_ids[start : start + MAX_IDS_PER_REQUEST]
+        for start in range(0, len(fixture_ids), MAX_IDS_PER_REQUEST)
+    ]
+    with deadline_scope(deadline):
+        payloads = await asyncio.gather(
+            *(
+                client.get_json(
+                    "/injuries",
+                    params={"ids": "-".join(str(fixture_id) for fixture_id in batch)},
+                )
+                for batch in batches
+            )
+        )
+    return [injury for payload in payloads for injury in payload.get("response", [])]
+
+
+async def get_injuries_by_league(league_id: int, season: int) -> list[dict[str, Any]]:
+    """
+    Get every injury recorded in a league and season.
+
+    :param league_id: ID of the league.
+    :param season: Season year.
+    :return: List of injuries across all fixtures of the season.
+    """
+    client = get_client()
+    payload = await client.get_json(
+        "/injuries",
+        params={"league": league_id, "season": season},
+    )
+    return payload.get("response", [])
+
+
+async def get_injuries_by_team(team_id: int, season: int) -> list[dict[str, Any]]:
+    """
+    Get every injury of a team in a season.
+
+    :param team_id: ID of the team.
+    :param season: Season year.
+    :return: List of injuries of the team's players.
+    """
+    client = get_client()
+    payload = await client.get_json(
+        "/injuries",
+        params={"team": team_id, "season": season},
+    )
+    return payload.get("response", [])
+
+
+async def get_injuries_by_player(player_id: int, season: int) -> list[dict[str, Any]]:
+    """
+    Get every injury of a player in a season.
+
+    :param player_id: ID of the player.
+    :param season: Season year.
+    :return: List of fixtures the player was unavailable for.
+    """
+    client = get_client()
+    payload = await client.get_json(
+        "/injuries",
+        params={"player": player_id, "season": season},
+    )
+    return payload.get("response", [])
+
+
+async def get_injuries_by_date(date: str) -> list[dict[str, Any]]:
+    """
+    Get every injury for the fixtures played on a date.
+
+    :param date: Date in YYYY-MM-DD format.
+    :return: List of injuries across all fixtures of that date.
+    """
+    client = get_client()
+    payload = await client.get_json("/injuries", params={"date": date})
+    return payload.get("response", [])
@@ -36,8 +36,8 @@ async def get_all_leagues() -> list[dict[str, Any]]:
     :return: List of leagues with associated metadata and coverage.
     """
     client = get_client()
-    response = await client.get("/leagues")
-    return response.json().get("response", [])
+    payload = await client.get_json("/leagues")
+    return payload.get("response", [])
 
 
 async def get_league_by_id(league_id: int) -> dict[str, Any]:
@@ -48,8 +48,8 @@ async def get_league_by_id(league_id: int) -> dict[str, Any]:
     :return: Metadata and coverage for the league.
     """
     client = get_client()
-    response = await client.get("/leagues", params={"id": league_id})
-    results = response.json().get("response", [])
+    payload = await client.get_json("/leagues", params={"id": league_id})
+    results = payload.get("response", [])
     return results[0] if results else {}
 
 
@@ -61,8 +61,8 @@ async def get_leagues_by_country(country_name: str) -> list[dict[str, Any]]:
     :return: List of leagues in the given country.
     """
     client = get_client()
-    response = await client.get("/leagues", params={"country": country_name})
-    return response.json().get("response", [])
+    payload = await client.get_json("/leagues", params={"country": country_name})
+    return payload.get("response", [])
 
 
 async def get_leagues_by_country_code(country_code: str) -> list[dict[str, Any]]:
@@ -73,8 +73,8 @@ async def get_leagues_by_country_code(country_code: str) -> list[dict[str, Any]]
     :return: List of leagues in the given country code.
     """
     client = get_client()
-    response = await client.get("/leagues", params={"code": country_code})
-    return response.json().get("response", [])
+    payload = await client.get_json("/leagues", params={"code": country_code})
+    return payload.get("response", [])
 
 
 async def get_leagues_by_season(season: int) -> list[dict[str, Any]]:
@@ -85,8 +85,8 @@ async def get_leagues_by_season(season: int) -> list[dict[str, Any]]:
     :return: Leagues active during the given season.
     """
     client = get_client()
-    response = await client.get("/leagues", params={"season": season})
-    return response.json().get("response", [])
+    payload = await client.get_json("/leagues", params={"season": season})
+    return payload.get("response", [])
 
 
 async def get_leagues_by_team(team_id: int) -> list[dict[str, Any]]:
@@ -97,8 +97,8 @@ async def get_leagues_by_team(team_id: int) -> list[dict[str, Any]]:
     :return: Leagues where the team has played.
     """
     client = get_client()
-    response = await client.get("/leagues", params={"team": team_id})
-    return response.json().get("response", [])
+    payload = await client.get_json("/leagues", params={"team": team_id})
+    return payload.get("response", [])
 
 
 async def get_leagues_by_type(competition_type: str) -> list[dict[str, Any]]:
@@ -109,8 +109,8 @@ async def get_leagues_by_type(competition_type: str) -> list[dict[str, Any]]:
     :return: Leagues matching the given type.
     """
     client = get_client()
-    response = await client.get("/leagues", params={"type": competition_type})
-    return response.json().get("response", [])
+    payload = await client.get_json("/leagues", params={"type": competition_type})
+    return payload.get("response", [])
 
 
 async def get_current_leagues() -> list[dict[str, Any]]:
@@ -120,5 +120,5 @@ async def get_current_leagues() -> list[dict[str, Any]]:
     :return: Leagues currently in progress.
     """
     client = get_client()
-    response = await client.get("/leagues", params={"current": "true"})
-    return response.json().get("response", [])
+    payload = await client.get_json("/leagues", params={"current": "true"})
+    return payload.get("response", [])
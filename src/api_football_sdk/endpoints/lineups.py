@@ -30,8 +30,8 @@ async def get_lineups_by_fixture(fixture_id: int) -> list[dict[str, Any]]:
     :return: Lineups information for both home and away teams.
     """
     client = get_client()
-    response = await client.get("/fixtures/lineups", params={"fixture": fixture_id})
-    return response.json().get("response", [])
+    payload = await client.get_json("/fixtures/lineups", params={"fixture": fixture_id})
+    return payload.get("response", [])
 
 
 async def get_lineups_by_fixture_and_team(
@@ -46,9 +46,9 @@ async def get_lineups_by_fixture_and_team(
     :return: Lineup information for the selected team.
     """
     client = get_client()
-    response = await client.get(
+    payload = await client.get_json(
         "/fixtures/lineups",
         params={"fixture": fixture_id, "team": team_id},
     )
-    results = response.json().get("response", [])
+    results = payload.get("response", [])
     return results[0] if results else {}
@@ -0,0 +1,533 @@
+"""
+Endpoints for retrieving pre-match and live odds.
+
+This module wraps the `/odds`, `/odds/live`, `/odds/live/bets`, `/odds/mapping`,
+`/odds/bookmakers`, and `/odds/bets` endpoints of the API Football.
+
+Paginated routes are exposed as async iterators that fetch one page at a
+time and parse it as it streams in, so large league or date pulls never
+hold more than one row in memory.
+`OddsSnapshotStore` keeps the latest prices in compact typed arrays.
+In-play odds are requested at live priority unless the caller declared
+another one with `request_priority`.
+
+Usage example:
+--------------
+    from api_football_sdk.endpoints.odds import OddsSnapshotStore, iter_odds_by_league
+
+    store = OddsSnapshotStore()
+    async for row in iter_odds_by_league(league_id=39, season=2024, bet_id=1):
+        store.add(row)
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from typing import Any, AsyncIterator, Iterable, Iterator
+
+from api_football_sdk.client import get_client
+from api_football_sdk.scheduler import Priority, current_priority
+
+__all__: list[str] = [
+    "get_odds_by_fixture",
+    "iter_odds_by_league",
+    "iter_odds_by_date",
+    "iter_odds_mapping",
+    "get_live_odds",
+    "get_live_odds_by_fixture",
+    "get_live_odds_by_league",
+    "get_live_odds_bets",
+    "get_odds_bookmakers",
+    "get_odds_bets",
+    "iter_odds_prices",
+    "OddsSnapshotStore",
+    "LIVE_BOOKMAKER_ID",
+]
+
+LIVE_BOOKMAKER_ID: int = 0
+"""Bookmaker ID used for `/odds/live` rows, which carry no bookmaker."""
+
+
+def _filters(bookmaker_id: int | None, bet_id: int | None) -> dict[str, Any]:
+    params: dict[str, Any] = {}
+    if bookmaker_id is not None:
+        params["bookmaker"] = bookmaker_id
+    if bet_id is not None:
+        params["bet"] = bet_id
+    return params
+
+
+def _iter_pages(url: str, params: dict[str, Any]) -> AsyncIterator[dict[str, Any]]:
+    """
+    Yield the rows of a paginated endpoint, one page at a time.
+
+    Each page is parsed as it streams in, so memory use stays at about one
+    row and one body chunk; with response hooks registered on the client,
+    one page of rows is kept so the hooks receive it.
+
+    :param url: Endpoint relative path.
+    :param params: Query string parameters, without `page`.
+    :return: Async iterator over the rows of every page.
+    """
+    return get_client().stream_pages(url, params=params)
+
+
+async def get_odds_by_fixture(
+    fixture_id: int,
+    *,
+    bookmaker_id: int | None = None,
+    bet_id: int | None = None,
+) -> dict[str, Any]:
+    """
+    Get pre-match odds for a fixture.
+
+    :param fixture_id: The ID of the fixture.
+    :param bookmaker_id: Only include this bookmaker.
+    :param bet_id: Only include this bet (market).
+    :return: Odds grouped by bookmaker and bet.
+    """
+    client = get_client()
+    payload = await client.get_json(
+        "/odds",
+        params={"fixture": fixture_id, **_filters(bookmaker_id, bet_id)},
+    )
+    results = payload.get("response", [])
+    return results[0] if results else {}
+
+
+def iter_odds_by_league(
+    league_id: int,
+    season: int,
+    *,
+    bookmaker_id: int | None = None,
+    bet_id: int | None = None,
+) -> AsyncIterator[dict[str, Any]]:
+    """
+    Stream pre-match odds for every fixture of a league and season.
+
+    :param league_id: ID of the league.
+    :param season: Season year.
+    :param bookmaker_id: Only include this bookmaker.
+    :param bet_id: Only include this bet (market).
+    :return: Async iterator of per-fixture odds.
+    """
+    return _iter_pages(
+        "/odds",
+        {"league": league_id, "season": season, **_filters(bookmaker_id, bet_id)},
+    )
+
+
+def iter_odds_by_date(
+    date: str,
+    *,
+    bookmaker_id: int | None = None,
+    bet_id: int | None = None,
+) -> AsyncIterator[dict[str, Any]]:
+    """
+    Stream pre-match odds for every fixture played on a date.
+
+    :param date: Date in YYYY-MM-DD format.
+    :param bookmaker_id: Only include this bookmaker.
+    :param bet_id: Only include this bet (market).
+    :return: Async iterator of per-fixture odds.
+    """
+    return _iter_pages("/odds", {"date": date, **_filters(bookmaker_id, bet_id)})
+
+
+def iter_odds_mapping() -> AsyncIterator[dict[str, Any]]:
+    """
+    Stream the fixtures for which pre-match odds are available.
+
+    :return: Async iterator of fixture, league, and update metadata.
+    """
+    return _iter_pages("/odds/mapping", {})
+
+
+async def get_live_odds(bet_id: int | None = None) -> list[dict[str, Any]]:
+    """
+    Get in-play odds for every fixture currently covered.
+
+    :param bet_id: Only include this live bet (market).
+    :return: List of live odds per fixture.
+    """
+    client = get_client()
+    payload = await client.get_json(
+        "/odds/live",
+        params=_filters(None, bet_id),
+        priority=current_priority(Priority.LIVE),
+    )
+    return payload.get("response", [])
+
+
+async def get_live_odds_by_fixture(
+    fixture_id: int,
+    bet_id: int | None = None,
+) -> dict[str, Any]:
+    """
+    Get in-play odds for a fixture.
+
+    :param fixture_id: The ID of the fixture.
+    :param bet_id: Only include this live bet (market).
+    :return: Live odds for the fixture.
+    """
+    client = get_client()
+    payload = await client.get_json(
+        "/odds/live",
+        params={"fixture": fixture_id, **_filters(None, bet_id)},
+        priority=current_priority(Priority.LIVE),
+    )
+    results = payload.get("response", [])
+    return results[0] if results else {}
+
+
+async def get_live_odds_by_league(
+    league_id: int,
+    bet_id: int | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Get in-play odds for every live fixture of a league.
+
+    :param league_id: ID of the league.
+    :param bet_id: Only include this live bet (market).
+    :return: List of live odds per fixture.
+    """
+    client = get_client()
+    payload = await client.get_json(
+        "/odds/live",
+        params={"league": league_id, **_filters(None, bet_id)},
+        priority=current_priority(Priority.LIVE),
+    )
+    return payload.get("response", [])
+
+
+async def get_live_odds_bets() -> list[dict[str, Any]]:
+    """
+    Get all bets (markets) available for in-play odds.
+
+    :return: List of live bets with their IDs and names.
+    """
+    client = get_client()
+    payload = await client.get_json("/odds/live/bets")
+    return payload.get("response", [])
+
+
+async def get_odds_bookmakers() -> list[dict[str, Any]]:
+    """
+    Get all bookmakers available for pre-match odds.
+
+    :return: List of bookmakers with their IDs and names.
+    """
+    client = get_client()
+    payload = await client.get_json("/odds/bookmakers")
+    return payload.get("response", [])
+
+
+async def get_odds_bets() -> list[dict[str, Any]]:
+    """
+    Get all bets (markets) available for pre-match odds.
+
+    :return: List of bets with their IDs and names.
+    """
+    client = get_client()
+    payload = await client.get_json("/odds/bets")
+    return payload.get("response", [])
+
+
+def _outcome_label(value: dict[str, Any]) -> str:
+    label = str(value.get("value"))
+    handicap = value.get("handicap")
+    return f"{label} {handicap}" if handicap not in (None, "") else label
+
+
+def _price(value: dict[str, Any]) -> float | None:
+    if value.get("suspended"):
+        return math.nan
+    try:
+        return float(value.get("odd"))
+    except (TypeError, ValueError):
+        return None
+
+
+def iter_odds_prices(row: dict[str, Any]) -> Iterator[tuple[int, int, str, float]]:
+    """
+    Flatten one odds response row into individual prices.
+
+    Accepts rows from both `/odds` (grouped by bookmaker) and `/odds/live`
+    (a single `odds` list, reported under `LIVE_BOOKMAKER_ID`). Outcomes
+    with a handicap are labelled "<value> <handicap>" (e.g., "Over 2.5").
+
+    :param row: A single element of an odds response.
+    :return: Iterator of (bookmaker ID, market ID, outcome, price); suspended
+        prices are NaN and unparseable ones are skipped.
+    """
+    if "odds" in row:
+        groups = [(LIVE_BOOKMAKER_ID, row.get("odds") or [])]
+    else:
+        groups = [
+            (bookmaker["id"], bookmaker.get("bets") or [])
+            for bookmaker in row.get("bookmakers") or []
+        ]
+
+    for bookmaker_id, bets in groups:
+        for bet in bets:
+            for value in bet.get("values") or []:
+                price = _price(value)
+                if price is not None:
+                    yield bookmaker_id, bet["id"], _outcome_label(value), price
+
+
+class OddsSnapshotStore:
+    """
+    Columnar store for the latest odds of many fixtures.
+
+    Each price is one row across parallel typed arrays (fixture, bookmaker,
+    market, outcome, price), about 16 bytes per price instead of several
+    hundred for the equivalent nested dicts. Outcome labels are interned
+    to integer codes. The rows of a fixture are contiguous; storing a new
+    snapshot for a fixture appends a fresh block and retires the old one,
+    and retired rows are compacted away once they outnumber live ones.
+
+    Prices are kept as float32 and returned rounded to 4 decimals.
+    Suspended live prices are stored as NaN.
+    """
+
+    def __init__(self) -> None:
+        self._fixtures = array("I")
+        self._bookmakers = array("H")
+        self._markets = array("H")
+        self._outcomes = array("I")
+        self._prices = array("f")
+        self._blocks: dict[int, tuple[int, int]] = {}
+        self._updated: dict[int, str] = {}
+        self._dead = 0
+        self._labels: list[str] = []
+        self._label_ids: dict[str, int] = {}
+        self._bookmaker_names: dict[int, str] = {LIVE_BOOKMAKER_ID: "Live"}
+        self._market_names: dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._prices) - self._dead
+
+    def __contains__(self, fixture_id: object) -> bool:
+        return fixture_id in self._blocks
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Memory used by the column arrays, in bytes.
+
+        :return: Allocated size of all columns.
+        """
+        return sum(
+            column.itemsize * len(column)
+            for column in (
+                self._fixtures,
+                self._bookmakers,
+                self._markets,
+                self._outcomes,
+                self._prices,
+            )
+        )
+
+    def add(self, row: dict[str, Any]) -> int:
+        """
+        Store the odds snapshot of one fixture, replacing any previous one.
+
+        Accepts the same pre-match and live rows as `iter_odds_prices`.
+
+        :param row: A single element of an odds response.
+        :return: Number of prices stored.
+        """
+        fixture_id = (row.get("fixture") or {}).get("id")
+        if fixture_id is None:
+            return 0
+
+        self._retire(fixture_id)
+        start = len(self._prices)
+        for bookmaker_id, market_id, label, price in self._flatten(row):
+            self._fixtures.append(fixture_id)
+            self._bookmakers.append(bookmaker_id)
+            self._markets.append(market_id)
+            self._outcomes.append(self._intern(label))
+            self._prices.append(price)
+
+        self._blocks[fixture_id] = (start, len(self._prices))
+        if row.get("update"):
+            self._updated[fixture_id] = row["update"]
+        self._maybe_compact()
+        return len(self._prices) - start
+
+    def extend(self, rows: Iterable[dict[str, Any]]) -> int:
+        """
+        Store several odds snapshots.
+
+        :param rows: Elements of an odds response.
+        :return: Total number of prices stored.
+        """
+        return sum(self.add(row) for row in rows)
+
+    def remove(self, fixture_id: int) -> None:
+        """
+        Drop every price of a fixture.
+
+        :param fixture_id: The ID of the fixture.
+        :return: None
+        """
+        self._retire(fixture_id)
+        self._updated.pop(fixture_id, None)
+        self._maybe_compact()
+
+    def fixtures(self) -> list[int]:
+        """
+        List the fixtures currently stored.
+
+        :return: Fixture IDs.
+        """
+        return list(self._blocks)
+
+    def updated_at(self, fixture_id: int) -> str | None:
+        """
+        Return the upstream `update` timestamp of a fixture's snapshot.
+
+        :param fixture_id: The ID of the fixture.
+        :return: ISO timestamp, or None if unknown.
+        """
+        return self._updated.get(fixture_id)
+
+    def price(
+        self,
+        fixture_id: int,
+        bookmaker_id: int,
+        market_id: int,
+        outcome: str,
+    ) -> float | None:
+        """
+        Look up a single price.
+
+        :param fixture_id: The ID of the fixture.
+        :param bookmaker_id: The ID of the bookmaker.
+        :param market_id: The ID of the bet (market).
+        :param outcome: Outcome label (e.g., "Home", "Over 2.5").
+        :return: The decimal price, or None if not stored.
+        """
+        code = self._label_ids.get(outcome)
+        block = self._blocks.get(fixture_id)
+        if code is None or block is None:
+            return None
+        for index in range(*block):
+            if (
+                self._outcomes[index] == code
+                and self._markets[index] == market_id
+                and self._bookmakers[index] == bookmaker_id
+            ):
+                return round(self._prices[index], 4)
+        return None
+
+    def iter_prices(self, fixture_id: int) -> Iterator[tuple[int, int, str, float]]:
+        """
+        Iterate over the prices of a fixture.
+
+        :param fixture_id: The ID of the fixture.
+        :return: Iterator of (bookmaker ID, market ID, outcome, price).
+        """
+        start, stop = self._blocks.get(fixture_id, (0, 0))
+        for index in range(start, stop):
+            yield (
+                self._bookmakers[index],
+                self._markets[index],
+                self._labels[self._outcomes[index]],
+                round(self._prices[index], 4),
+            )
+
+    def columns(self) -> dict[str, array]:
+        """
+        Return compacted copies of the column arrays.
+
+        The arrays support the buffer protocol, so they can be wrapped
+        without copying (e.g., `numpy.frombuffer(columns["price"], "f4")`).
+        Outcome codes index into `outcome_labels()`.
+
+        :return: Mapping of column name to typed array.
+        """
+        self._compact()
+        return {
+            "fixture": array("I", self._fixtures),
+            "bookmaker": array("H", self._bookmakers),
+            "market": array("H", self._markets),
+            "outcome": array("I", self._outcomes),
+            "price": array("f", self._prices),
+        }
+
+    def outcome_labels(self) -> list[str]:
+        """
+        Return the outcome labels indexed by their integer code.
+
+        :return: List of labels.
+        """
+        return list(self._labels)
+
+    def bookmaker_name(self, bookmaker_id: int) -> str | None:
+        """
+        Return the name seen for a bookmaker ID.
+
+        :param bookmaker_id: The ID of the bookmaker.
+        :return: Bookmaker name, or None if never seen.
+        """
+        return self._bookmaker_names.get(bookmaker_id)
+
+    def market_name(self, market_id: int) -> str | None:
+        """
+        Return the name seen for a bet (market) ID.
+
+        :param market_id: The ID of the bet.
+        :return: Market name, or None if never seen.
+        """
+        return self._market_names.get(market_id)
+
+    def _flatten(self, row: dict[str, Any]) -> Iterator[tuple[int, int, str, float]]:
+        for bookmaker in row.get("bookmakers") or []:
+            self._bookmaker_names[bookmaker["id"]] = bookmaker.get("name", "")
+            for bet in bookmaker.get("bets") or []:
+                self._market_names[bet["id"]] = bet.get("name", "")
+        for bet in row.get("odds") or []:
+            self._market_names[bet["id"]] = bet.get("name", "")
+        return iter_odds_prices(row)
+
+    def _intern(self, label: str) -> int:
+        code = self._label_ids.get(label)
+        if code is None:
+            code = len(self._labels)
+            self._labels.append(label)
+            self._label_ids[label] = code
+        return code
+
+    def _retire(self, fixture_id: int) -> None:
+        block = self._blocks.pop(fixture_id, None)
+        if block is not None:
+            self._dead += block[1] - block[0]
+
+    def _maybe_compact(self) -> None:
+        if self._dead and self._dead >= len(self._prices) - self._dead:
+            self._compact()
+
+    def _compact(self) -> None:
+        if not self._dead:
+            return
+
+        fixtures, bookmakers = array("I"), array("H")
+        markets, outcomes, prices = array("H"), array("I"), array("f")
+        blocks: dict[int, tuple[int, int]] = {}
+        for fixture_id, (start, stop) in self._blocks.items():
+            offset = len(prices)
+            fixtures.extend(self._fixtures[start:stop])
+            bookmakers.extend(self._bookmakers[start:stop])
+            markets.extend(self._markets[start:stop])
+            outcomes.extend(self._outcomes[start:stop])
+            prices.extend(self._prices[start:stop])
+            blocks[fixture_id] = (offset, len(prices))
+
+        self._fixtures, self._bookmakers = fixtures, bookmakers
+        self._markets, self._outcomes, self._prices = markets, outcomes, prices
+        self._blocks = blocks
+        self._dead = 0
@@ -5,6 +5,10 @@ This module wraps the `/players`, `/players/seasons`, `/fixtures/players`,
 `/players/squads`, `/players/profiles`, and `/players/teams`
 endpoints of the API Football.
 
+League-wide player lists and profiles run to megabytes; their `iter_*`
+forms walk every page and parse each one as it streams in, yielding one
+player at a time.
+
 Usage example:
 --------------
     from api_football_sdk.endpoints.players import get_players_by_team
@@ -14,7 +18,7 @@ Usage example:
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, AsyncIterator
 
 from api_football_sdk.client import get_client
 
@@ -22,12 +26,14 @@ __all__: list[str] = [
     "get_player_by_id",
     "get_players_by_team",
     "get_players_by_league",
+    "iter_players_by_league",
     "get_players_in_fixture",
     "get_players_seasons",
     "get_seasons_by_player",
     "get_player_teams",
     "get_team_squad",
     "get_players_profiles",
+    "iter_players_profiles",
 ]
 
 
@@ -40,8 +46,10 @@ async def get_player_by_id(player_id: int, season: int) -> dict[str, Any]:
     :return: Player metadata and statistics.
     """
     client = get_client()
-    response = await client.get("/players", params={"id": player_id, "season": season})
-    results = response.json().get("response", [])
+    payload = await client.get_json(
+        "/players", params={"id": player_id, "season": season}
+    )
+    results = payload.get("response", [])
     return results[0] if results else {}
 
 
@@ -54,8 +62,10 @@ async def get_players_by_team(team_id: int, season: int) -> list[dict[str, Any]]
     :return: List of players with metadata and statistics.
     """
     client = get_client()
-    response = await client.get("/players", params={"team": team_id, "season": season})
-    return response.json().get("response", [])
+    payload = await client.get_json(
+        "/players", params={"team": team_id, "season": season}
+    )
+    return payload.get("response", [])
 
 
 async def get_players_by_league(league_id: int, season: int) -> list[dict[str, Any]]:
@@ -67,11 +77,27 @@ async def get_players_by_league(league_id: int, season: int) -> list[dict[str, A
     :return: List of players with metadata and statistics.
     """
     client = get_client()
-    response = await client.get(
+    payload = await client.get_json(
         "/players",
         params={"league": league_id, "season": season},
     )
-    return response.json().get("response", [])
+    return payload.get("response", [])
+
+
+def iter_players_by_league(
+    league_id: int, season: int
+) -> AsyncIterator[dict[str, Any]]:
+    """
+    Stream every player of a league and season, across all pages.
+
+    :param league_id: League ID.
+    :param season: Season year.
+    :return: Async iterator of players with metadata and statistics.
+    """
+    client = get_client()
+    return client.stream_pages(
+        "/players", params={"league": league_id, "season": season}
+    )
 
 
 async def get_players_in_fixture(fixture_id: int) -> list[dict[str, Any]]:
@@ -82,8 +108,8 @@ async def get_players_in_fixture(fixture_id: int) -> list[dict[str, Any]]:
     :return: List of players and their roles in the match.
     """
     client = get_client()
-    response = await client.get("/fixtures/players", params={"fixture": fixture_id})
-    return response.json().get("response", [])
+    payload = await client.get_json("/fixtures/players", params={"fixture": fixture_id})
+    return payload.get("response", [])
 
 
 async def get_players_seasons() -> list[int]:
@@ -93,8 +119,8 @@ async def get_players_seasons() -> list[int]:
     :return: List of season years.
     """
     client = get_client()
-    response = await client.get("/players/seasons")
-    return response.json().get("response", [])
+    payload = await client.get_json("/players/seasons")
+    return payload.get("response", [])
 
 
 async def get_seasons_by_player(player_id: int) -> list[int]:
@@ -105,8 +131,8 @@ async def get_seasons_by_player(player_id: int) -> list[int]:
     :return: List of seasons played by the player.
     """
     client = get_client()
-    response = await client.get("/players/seasons", params={"player": player_id})
-    return response.json().get("response", [])
+    payload = await client.get_json("/players/seasons", params={"player": player_id})
+    return payload.get("response", [])
 
 
 async def get_player_teams(player_id: int) -> list[dict[str, Any]]:
@@ -117,8 +143,8 @@ async def get_player_teams(player_id: int) -> list[dict[str, Any]]:
     :return: List of teams the player has been associated with.
     """
     client = get_client()
-    response = await client.get("/players/teams", params={"player": player_id})
-    return response.json().get("response", [])
+    payload = await client.get_json("/players/teams", params={"player": player_id})
+    return payload.get("response", [])
 
 
 async def get_team_squad(team_id: int) -> list[dict[str, Any]]:
@@ -129,8 +155,8 @@ async def get_team_squad(team_id: int) -> list[dict[str, Any]]:
     :return: Squad members with their metadata.
     """
     client = get_client()
-    response = await client.get("/players/squads", params={"team": team_id})
-    return response.json().get("response", [])
+    payload = await client.get_json("/players/squads", params={"team": team_id})
+    return payload.get("response", [])
 
 
 async def get_players_profiles() -> list[dict[str, Any]]:
@@ -140,5 +166,15 @@ async def get_players_profiles() -> list[dict[str, Any]]:
     :return: List of players with static profile information.
     """
     client = get_client()
-    response = await client.get("/players/profiles")
-    return response.json().get("response", [])
+    payload = await client.get_json("/players/profiles")
+    return payload.get("response", [])
+
+
+def iter_players_profiles() -> AsyncIterator[dict[str, Any]]:
+    """
+    Stream every player profile in the database, across all pages.
+
+    :return: Async iterator of players with static profile information.
+    """
+    client = get_client()
+    return client.stream_pages("/players/profiles")
@@ -0,0 +1,188 @@
+"""
+Endpoints for retrieving match predictions.
+
+This module wraps the `/predictions` endpoint of the API Football and
+provides `PredictionsPrefetcher`, which loads the predictions of a whole
+round in one concurrent burst and keeps them until kickoff.
+
+Usage example:
+--------------
+    from api_football_sdk.endpoints.predictions import PredictionsPrefetcher
+
+    prefetcher = PredictionsPrefetcher()
+    predictions = await prefetcher.prefetch_round(39, 2024, "Regular Season - 1")
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any, Iterable
+
+from api_football_sdk.client import get_client
+from api_football_sdk.deadline import DeadlineLike, deadline_scope
+from api_football_sdk.endpoints.fixtures import (
+    get_fixtures_by_round,
+    get_next_fixtures,
+)
+from api_football_sdk.exceptions import APIFootballError, DeadlineExceededError
+
+__all__: list[str] = ["get_predictions_by_fixture", "PredictionsPrefetcher"]
+
+logger = logging.getLogger(__name__)
+
+
+async def get_predictions_by_fixture(fixture_id: int) -> dict[str, Any]:
+    """
+    Get the predictions for a fixture.
+
+    :param fixture_id: The ID of the fixture.
+    :return: Predictions, team comparison, and head-to-head summary.
+    """
+    client = get_client()
+    payload = await client.get_json("/predictions", params={"fixture": fixture_id})
+    results = payload.get("response", [])
+    return results[0] if results else {}
+
+
+class PredictionsPrefetcher:
+    """
+    Bulk loader and cache for fixture predictions.
+
+    Predictions do not change before kickoff, so each one is cached until
+    its fixture's kickoff timestamp. Missing predictions are requested all
+    at once; the client's `max_concurrency` bounds how many are in flight.
+    Predictions of fixtures already under way are returned but not cached.
+    """
+
+    def __init__(self) -> None:
+        self._cache: dict[int, tuple[dict[str, Any], float]] = {}
+        self._inflight: dict[int, asyncio.Task[dict[str, Any]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def get(self, fixture_id: int) -> dict[str, Any] | None:
+        """
+        Return a cached prediction without any remote call.
+
+        :param fixture_id: The ID of the fixture.
+        :return: The prediction, or None if not cached or past kickoff.
+        """
+        entry = self._cache.get(fixture_id)
+        if entry is None:
+            return None
+        prediction, expires_at = entry
+        if time.time() >= expires_at:
+            del self._cache[fixture_id]
+            return None
+        return prediction
+
+    async def prefetch(
+        self,
+        fixtures: Iterable[dict[str, Any]],
+        *,
+        deadline: DeadlineLike = None,
+    ) -> dict[int, dict[str, Any]]:
+        """
+        Load the predictions of many fixtures.
+
+        A fixture whose prediction cannot be fetched is logged and left out
+        of the result; the others are still returned and cached.
+
+        :param fixtures: Fixtures as returned by the `/fixtures` endpoints;
+            their `fixture.timestamp` is used as the cache expiry.
+        :param deadline: Deadline or seconds from now for all the fetches.
+        :return: Predictions keyed by fixture ID.
+        :raises DeadlineExceededError: If the fetches do not finish in time.
+        """
+        kickoffs: dict[int, float] = {}
+        for fixture in fixtures:
+            details = fixture.get("fixture") or {}
+            if details.get("id") is not None:
+                kickoffs[details["id"]] = float(details.get("timestamp") or 0)
+
+        results: dict[int, dict[str, Any]] = {}
+        missing: list[int] = []
+        for fixture_id in kickoffs:
+            cached = self.get(fixture_id)
+            if cached is None:
+                missing.append(fixture_id)
+            else:
+                results[fixture_id] = cached
+
+        with deadline_scope(deadline):
+            fetched = await asyncio.gather(
+                *(
+                    self._fetch(fixture_id, kickoffs[fixture_id])
+                    for fixture_id in missing
+                ),
+                return_exceptions=True,
+            )
+        for fixture_id, result in zip(missing, fetched):
+            if isinstance(result, DeadlineExceededError):
+                raise result
+            if isinstance(result, APIFootballError):
+                logger.warning(
+                    "Prediction of fixture %s failed: %s", fixture_id, result
+                )
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                results[fixture_id] = result
+        return results
+
+    async def prefetch_next(self, count: int) -> dict[int, dict[str, Any]]:
+        """
+        Load the predictions of the next upcoming fixtures.
+
+        :param count: Number of upcoming fixtures.
+        :return: Predictions keyed by fixture ID.
+        """
+        return await self.prefetch(await get_next_fixtures(count))
+
+    async def prefetch_round(
+        self,
+        league_id: int,
+        season: int,
+        round_name: str,
+    ) -> dict[int, dict[str, Any]]:
+        """
+        Load the predictions of every fixture in a round.
+
+        :param league_id: ID of the league.
+        :param season: Season year.
+        :param round_name: Name of the round.
+        :return: Predictions keyed by fixture ID.
+        """
+        fixtures = await get_fixtures_by_round(league_id, season, round_name)
+        return await self.prefetch(fixtures)
+
+    def clear_expired(self) -> int:
+        """
+        Drop every prediction whose fixture has kicked off.
+
+        :return: Number of entries removed.
+        """
+        now = time.time()
+        expired = [
+            fixture_id
+            for fixture_id, (_, expires_at) in self._cache.items()
+            if now >= expires_at
+        ]
+        for fixture_id in expired:
+            del self._cache[fixture_id]
+        return len(expired)
+
+    async def _fetch(self, fixture_id: int, kickoff: float) -> dict[str, Any]:
+        task = self._inflight.get(fixture_id)
+        if task is None:
+            task = asyncio.ensure_future(get_predictions_by_fixture(fixture_id))
+            self._inflight[fixture_id] = task
+            task.add_done_callback(lambda _: self._inflight.pop(fixture_id, None))
+
+        prediction = await asyncio.shield(task)
+        if prediction and kickoff > time.time():
+            self._cache[fixture_id] = (prediction, kickoff)
+        return prediction
@@ -0,0 +1,407 @@
+"""
+Name search over teams, leagues, players, venues, countries, and coaches.
+
+The `search_*` functions wrap the `search` parameter of the corresponding
+API Football endpoints. `SearchIndex` answers the same kind of query
+locally: it indexes every team, league, player, and venue the SDK fetches
+and serves accent-insensitive prefix matches without a remote call, which
+makes it suitable for per-keystroke autocomplete.
+
+Usage example:
+--------------
+    from api_football_sdk.endpoints.search import SearchIndex
+
+    index = SearchIndex()
+    index.attach()
+    await get_all_leagues()          # fetched leagues are indexed as a side effect
+    index.search("premi")            # [{"type": "league", "name": "Premier League", ...}]
+"""
+
+from __future__ import annotations
+
+import heapq
+import re
+import unicodedata
+from typing import Any, Iterable
+
+from api_football_sdk.client import ApiFootballClient, get_client
+
+__all__: list[str] = [
+    "search_teams",
+    "search_leagues",
+    "search_players",
+    "search_venues",
+    "search_countries",
+    "search_coaches",
+    "SearchIndex",
+    "normalize_name",
+]
+
+
+async def _search(url: str, query: str) -> list[dict[str, Any]]:
+    client = get_client()
+    payload = await client.get_json(url, params={"search": query})
+    return payload.get("response", [])
+
+
+async def search_teams(query: str) -> list[dict[str, Any]]:
+    """
+    Search teams by name or country.
+
+    :param query: At least 3 characters.
+    :return: List of matching teams with their venue.
+    """
+    return await _search("/teams", query)
+
+
+async def search_leagues(query: str) -> list[dict[str, Any]]:
+    """
+    Search leagues by name or country.
+
+    :param query: At least 3 characters.
+    :return: List of matching leagues.
+    """
+    return await _search("/leagues", query)
+
+
+async def search_players(query: str) -> list[dict[str, Any]]:
+    """
+    Search player profiles by last name.
+
+    :param query: At least 3 characters.
+    :return: List of matching player profiles.
+    """
+    return await _search("/players/profiles", query)
+
+
+async def search_venues(query: str) -> list[dict[str, Any]]:
+    """
+    Search venues by name, city, or country.
+
+    :param query: At least 3 characters.
+    :return: List of matching venues.
+    """
+    return await _search("/venues", query)
+
+
+async def search_countries(query: str) -> list[dict[str, Any]]:
+    """
+    Search countries by name.
+
+    :param query: At least 3 characters.
+    :return: List of matching countries.
+    """
+    return await _search("/countries", query)
+
+
+async def search_coaches(query: str) -> list[dict[str, Any]]:
+    """
+    Search coaches by name.
+
+    :param query: At least 3 characters.
+    :return: List of matching coaches.
+    """
+    return await _search("/coachs", query)
+
+
+# Latin letters that NFKD does not decompose into base letter + accent.
+_FOLD = str.maketrans(
+    {"ø": "o", "đ": "d", "ł": "l", "ı": "i", "æ": "ae", "œ": "oe", "þ": "th"}
+)
+_TOKEN = re.compile(r"[^\W_]+")
+
+EntityKey = tuple[str, int]
+
+
+def normalize_name(text: str) -> str:
+    """
+    Fold a name for comparison: case-insensitive and accent-insensitive.
+
+    :param text: Any display name (e.g., "Atlético Madrid").
+    :return: The folded name (e.g., "atletico madrid").
+    """
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return stripped.translate(_FOLD)
+
+
+def _tokenize(*texts: Any) -> list[str]:
+    tokens: list[str] = []
+    for text in texts:
+        if text:
+            tokens.extend(_TOKEN.findall(normalize_name(str(text))))
+    return tokens
+
+
+class SearchIndex:
+    """
+    Local prefix index over entity names.
+
+    Every token of an entity's name (and a few related fields, such as a
+    league's country or a venue's city) is indexed under each of its first
+    `MAX_PREFIX` prefixes. A query matches entities having, for each query
+    token, some indexed token starting with it. Results rank exact name
+    matches first, then names starting with the query, then shorter names.
+
+    Entities are added or replaced one at a time, so feeding new responses
+    only touches the entities they contain.
+    """
+
+    MAX_PREFIX: int = 10
+
+    def __init__(self) -> None:
+        self._entries: dict[EntityKey, dict[str, Any]] = {}
+        self._tokens: dict[EntityKey, frozenset[str]] = {}
+        self._folded_names: dict[EntityKey, str] = {}
+        self._prefixes: dict[str, set[EntityKey]] = {}
+        self._client: ApiFootballClient | None = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(
+        self,
+        kind: str,
+        entity_id: int,
+        name: str,
+        *,
+        aliases: Iterable[Any] = (),
+        **extra: Any,
+    ) -> None:
+        """
+        Index an entity, replacing any previous entry with the same key.
+
+        :param kind: Entity type ("team", "league", "player", "venue", ...).
+        :param entity_id: ID of the entity within its type.
+        :param name: Display name, returned in results.
+        :param aliases: Extra searchable texts (e.g., city, country, full name).
+        :param extra: Additional fields returned with the entry.
+        :return: None
+        """
+        key = (kind, entity_id)
+        tokens = frozenset(_tokenize(name, *aliases))
+        previous = self._tokens.get(key)
+        if previous is not None:
+            self._unlink(key, previous - tokens, keep=tokens)
+            new_tokens = tokens - previous
+        else:
+            new_tokens = tokens
+
+        for token in new_tokens:
+            for size in range(1, min(len(token), self.MAX_PREFIX) + 1):
+                self._prefixes.setdefault(token[:size], set()).add(key)
+
+        self._tokens[key] = tokens
+        self._folded_names[key] = normalize_name(name)
+        self._entries[key] = {"type": kind, "id": entity_id, "name": name, **extra}
+
+    def remove(self, kind: str, entity_id: int) -> None:
+        """
+        Drop an entity from the index.
+
+        :param kind: Entity type.
+        :param entity_id: ID of the entity within its type.
+        :return: None
+        """
+        key = (kind, entity_id)
+        tokens = self._tokens.pop(key, None)
+        if tokens is not None:
+            self._unlink(key, tokens, keep=frozenset())
+            del self._entries[key]
+            del self._folded_names[key]
+
+    def search(
+        self,
+        query: str,
+        *,
+        kinds: Iterable[str] | None = None,
+        limit: int = 10,
+    ) -> list[dict[str, Any]]:
+        """
+        Find entities whose names match every token of a query as a prefix.
+
+        :param query: Free text, typically a partially typed name.
+        :param kinds: Only return these entity types.
+        :param limit: Maximum number of results.
+        :return: Matching entries, best first. Entries are shared; do not mutate.
+        """
+        tokens = _tokenize(query)
+        if not tokens:
+            return []
+
+        candidates: set[EntityKey] | None = None
+        for token in sorted(set(tokens), key=len, reverse=True):
+            matches = self._lookup(token)
+            candidates = matches if candidates is None else candidates & matches
+            if not candidates:
+                return []
+
+        if kinds is not None:
+            allowed = set(kinds)
+            candidates = {key for key in candidates if key[0] in allowed}
+
+        folded_query = " ".join(tokens)
+
+        def rank(key: EntityKey) -> tuple[int, int, str]:
+            name = self._folded_names[key]
+            if name == folded_query:
+                tier = 0
+            elif name.startswith(folded_query):
+                tier = 1
+            else:
+                tier = 2
+            return tier, len(name), name
+
+        best = heapq.nsmallest(limit, candidates, key=rank)
+        return [self._entries[key] for key in best]
+
+    def add_rows(self, url: str, rows: Iterable[dict[str, Any]]) -> None:
+        """
+        Index the entities contained in rows of a known endpoint.
+
+        Supports `/teams`, `/leagues`, `/players`, `/players/profiles`,
+        `/players/squads`, and `/venues`; other paths are ignored.
+
+        :param url: Endpoint relative path the rows came from.
+        :param rows: Elements of the endpoint's `response` list.
+        :return: None
+        """
+        handler = _HANDLERS.get(url)
+        if handler is None:
+            return
+        for row in rows:
+            if isinstance(row, dict):
+                handler(self, row)
+
+    def add_response(
+        self, url: str, params: dict[str, Any], payload: dict[str, Any]
+    ) -> None:
+        """
+        Response hook feeding every fetched payload into the index.
+
+        :param url: Endpoint relative path.
+        :param params: Query string parameters (unused).
+        :param payload: Decoded response body.
+        :return: None
+        """
+        rows = payload.get("response")
+        if isinstance(rows, list):
+            self.add_rows(url, rows)
+
+    def attach(self, client: ApiFootballClient | None = None) -> None:
+        """
+        Keep the index up to date with everything a client fetches.
+
+        :param client: Client to observe; defaults to the shared client.
+        :return: None
+        """
+        self.detach()
+        self._client = client or get_client()
+        self._client.add_response_hook(self.add_response)
+
+    def detach(self) -> None:
+        """
+        Stop observing the client passed to `attach`.
+
+        :return: None
+        """
+        if self._client is not None:
+            self._client.remove_response_hook(self.add_response)
+            self._client = None
+
+    def _lookup(self, token: str) -> set[EntityKey]:
+        if len(token) <= self.MAX_PREFIX:
+            return self._prefixes.get(token, set())
+        return {
+            key
+            for key in self._prefixes.get(token[: self.MAX_PREFIX], ())
+            if any(indexed.startswith(token) for indexed in self._tokens[key])
+        }
+
+    def _unlink(
+        self, key: EntityKey, tokens: Iterable[str], *, keep: frozenset[str]
+    ) -> None:
+        for token in tokens:
+            for size in range(1, min(len(token), self.MAX_PREFIX) + 1):
+                prefix = token[:size]
+                # A token the entity keeps may still need this prefix.
+                if any(other.startswith(prefix) for other in keep):
+                    continue
+                keys = self._prefixes.get(prefix)
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del self._prefixes[prefix]
+
+
+def _add_team(index: SearchIndex, team: dict[str, Any]) -> None:
+    if team.get("id") is not None and team.get("name"):
+        index.add(
+            "team",
+            team["id"],
+            team["name"],
+            aliases=(team.get("code"), team.get("country")),
+            logo=team.get("logo"),
+            country=team.get("country"),
+        )
+
+
+def _add_venue(index: SearchIndex, venue: dict[str, Any]) -> None:
+    if venue.get("id") is not None and venue.get("name"):
+        index.add(
+            "venue",
+            venue["id"],
+            venue["name"],
+            aliases=(venue.get("city"),),
+            city=venue.get("city"),
+        )
+
+
+def _add_player(index: SearchIndex, player: dict[str, Any]) -> None:
+    if player.get("id") is not None and player.get("name"):
+        index.add(
+            "player",
+            player["id"],
+            player["name"],
+            aliases=(player.get("firstname"), player.get("lastname")),
+            photo=player.get("photo"),
+        )
+
+
+def _index_team_row(index: SearchIndex, row: dict[str, Any]) -> None:
+    _add_team(index, row.get("team") or {})
+    _add_venue(index, row.get("venue") or {})
+
+
+def _index_league_row(index: SearchIndex, row: dict[str, Any]) -> None:
+    league = row.get("league") or {}
+    country = (row.get("country") or {}).get("name")
+    if league.get("id") is not None and league.get("name"):
+        index.add(
+            "league",
+            league["id"],
+            league["name"],
+            aliases=(country,),
+            country=country,
+            logo=league.get("logo"),
+        )
+
+
+def _index_player_row(index: SearchIndex, row: dict[str, Any]) -> None:
+    _add_player(index, row.get("player") or {})
+
+
+def _index_squad_row(index: SearchIndex, row: dict[str, Any]) -> None:
+    _add_team(index, row.get("team") or {})
+    for player in row.get("players") or []:
+        _add_player(index, player)
+
+
+_HANDLERS = {
+    "/teams": _index_team_row,
+    "/leagues": _index_league_row,
+    "/players": _index_player_row,
+    "/players/profiles": _index_player_row,
+    "/players/squads": _index_squad_row,
+    "/venues": _add_venue,
+}
@@ -0,0 +1,113 @@
+"""
+Endpoints for retrieving the sidelined history of players and coaches.
+
+This module wraps the `/sidelined` endpoint of the API Football, including
+its bulk forms for many players or coaches at once.
+
+Usage example:
+--------------
+    from api_football_sdk.endpoints.sidelined import get_sidelined_by_players
+
+    sidelined = await get_sidelined_by_players([276, 278])
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from api_football_sdk.client import get_client
+from api_football_sdk.deadline import DeadlineLike, deadline_scope
+
+__all__: list[str] = [
+    "get_sidelined_by_player",
+    "get_sidelined_by_players",
+    "get_sidelined_by_coach",
+    "get_sidelined_by_coaches",
+]
+
+MAX_IDS_PER_REQUEST: int = 20
+"""Upper bound on IDs accepted by a single `players` or `coachs` query."""
+
+
+async def _get_bulk(
+    key: str, ids: list[int], deadline: DeadlineLike
+) -> dict[int, list[dict[str, Any]]]:
+    client = get_client()
+    batches = [
+        ids[start : start + MAX_IDS_PER_REQUEST]
+        for start in range(0, len(ids), MAX_IDS_PER_REQUEST)
+    ]
+    with deadline_scope(deadline):
+        payloads = await asyncio.gather(
+            *(
+                client.get_json(
+                    "/sidelined",
+                    params={key: "-".join(str(entity_id) for entity_id in batch)},
+                )
+                for batch in batches
+            )
+        )
+    return {
+        entry["id"]: entry.get("sidelined", [])
+        for payload in payloads
+        for entry in payload.get("response", [])
+    }
+
+
+async def get_sidelined_by_player(player_id: int) -> list[dict[str, Any]]:
+    """
+    Get every period a player was sidelined.
+
+    :param player_id: The ID of the player.
+    :return: List of periods with type, start, and end dates.
+    """
+    client = get_client()
+    payload = await client.get_json("/sidelined", params={"player": player_id})
+    return payload.get("response", [])
+
+
+async def get_sidelined_by_players(
+    player_ids: list[int],
+    *,
+    deadline: DeadlineLike = None,
+) -> dict[int, list[dict[str, Any]]]:
+    """
+    Get the sidelined periods of many players at once.
+
+    IDs are sent in batches of `MAX_IDS_PER_REQUEST`, concurrently.
+
+    :param player_ids: List of player IDs.
+    :param deadline: Deadline or seconds from now for all the batches.
+    :return: Periods keyed by player ID.
+    """
+    return await _get_bulk("players", player_ids, deadline)
+
+
+async def get_sidelined_by_coach(coach_id: int) -> list[dict[str, Any]]:
+    """
+    Get every period a coach was sidelined.
+
+    :param coach_id: The ID of the coach.
+    :return: List of periods with type, start, and end dates.
+    """
+    client = get_client()
+    payload = await client.get_json("/sidelined", params={"coach": coach_id})
+    return payload.get("response", [])
+
+
+async def get_sidelined_by_coaches(
+    coach_ids: list[int],
+    *,
+    deadline: DeadlineLike = None,
+) -> dict[int, list[dict[str, Any]]]:
+    """
+    Get the sidelined periods of many coaches at once.
+
+    IDs are sent in batches of `MAX_IDS_PER_REQUEST`, concurrently.
+
+    :param coach_ids: List of coach IDs.
+    :param deadline: Deadline or seconds from now for all the batches.
+    :return: Periods keyed by coach ID.
+    """
+    return await _get_bulk("coachs", coach_ids, deadline)
@@ -30,11 +30,11 @@ async def get_standings_by_league(league_id: int, season: int) -> list[dict[str,
     :return: List where each element represents a team in the standings.
     """
     client = get_client()
-    response = await client.get(
+    payload = await client.get_json(
         "/standings",
         params={"league": league_id, "season": season},
     )
-    return response.json().get("response", [])
+    return payload.get("response", [])
 
 
 async def get_standings_by_team(team_id: int, season: int) -> list[dict[str, Any]]:
@@ -48,8 +48,8 @@ async def get_standings_by_team(team_id: int, season: int) -> list[dict[str, Any
     :return: List of standings groups containing the specified team.
     """
     client = get_client()
-    response = await client.get(
+    payload = await client.get_json(
         "/standings",
         params={"team": team_id, "season": season},
     )
-    return response.json().get("response", [])
+    return payload.get("response", [])
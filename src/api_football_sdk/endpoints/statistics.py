@@ -33,8 +33,10 @@ async def get_statistics_by_fixture(fixture_id: int) -> list[dict[str, Any]]:
     :return: List of statistics per team.
     """
     client = get_client()
-    response = await client.get("/fixtures/statistics", params={"fixture": fixture_id})
-    return response.json().get("response", [])
+    payload = await client.get_json(
+        "/fixtures/statistics", params={"fixture": fixture_id}
+    )
+    return payload.get("response", [])
 
 
 async def get_statistics_by_fixture_and_type(
@@ -49,11 +51,11 @@ async def get_statistics_by_fixture_and_type(
     :return: List of filtered statistics matching the requested type.
     """
     client = get_client()
-    response = await client.get(
+    payload = await client.get_json(
         "/fixtures/statistics",
         params={"fixture": fixture_id, "type": stat_type},
     )
-    return response.json().get("response", [])
+    return payload.get("response", [])
 
 
 async def get_statistics_by_fixture_and_team(
@@ -68,8 +70,8 @@ async def get_statistics_by_fixture_and_team(
     :return: List of statistics for the selected team.
     """
     client = get_client()
-    response = await client.get(
+    payload = await client.get_json(
         "/fixtures/statistics",
         params={"fixture": fixture_id, "team": team_id},
     )
-    return response.json().get("response", [])
+    return payload.get("response", [])
@@ -40,11 +40,11 @@ async def get_team_statistics(
     :return: Detailed performance metrics for the team.
     """
     client = get_client()
-    response = await client.get(
+    payload = await client.get_json(
         "/teams/statistics",
         params={"team": team_id, "league": league_id, "season": season},
     )
-    return response.json().get("response", {})
+    return payload.get("response", {})
 
 
 async def get_team_by_id(team_id: int) -> dict[str, Any]:
@@ -55,8 +55,8 @@ async def get_team_by_id(team_id: int) -> dict[str, Any]:
     :return: Metadata for the given team (name, logo, founded year, etc.).
     """
     client = get_client()
-    response = await client.get("/teams", params={"id": team_id})
-    results = response.json().get("response", [])
+    payload = await client.get_json("/teams", params={"id": team_id})
+    results = payload.get("response", [])
     return results[0] if results else {}
 
 
@@ -68,8 +68,8 @@ async def get_team_seasons(team_id: int) -> list[int]:
     :return: List of season years the team participated in.
     """
     client = get_client()
-    response = await client.get("/teams/seasons", params={"team": team_id})
-    return response.json().get("response", [])
+    payload = await client.get_json("/teams/seasons", params={"team": team_id})
+    return payload.get("response", [])
 
 
 async def get_teams_countries() -> list[dict[str, Any]]:
@@ -79,5 +79,5 @@ async def get_teams_countries() -> list[dict[str, Any]]:
     :return: Each entry contains the country name and its code.
     """
     client = get_client()
-    response = await client.get("/teams/countries")
-    return response.json().get("response", [])
+    payload = await client.get_json("/teams/countries")
+    return payload.get("response", [])
@@ -0,0 +1,29 @@
+"""
+Endpoint for retrieving the supported timezones.
+
+The values returned can be passed as the `timezone` parameter of the
+`/fixtures` endpoint.
+
+Usage example:
+--------------
+    from api_football_sdk.endpoints.timezone import get_timezones
+
+    timezones = await get_timezones()
+"""
+
+from __future__ import annotations
+
+from api_football_sdk.client import get_client
+
+__all__: list[str] = ["get_timezones"]
+
+
+async def get_timezones() -> list[str]:
+    """
+    Get the list of timezones supported by the API.
+
+    :return: Timezone names (e.g., ["Europe/London", "America/Sao_Paulo"]).
+    """
+    client = get_client()
+    payload = await client.get_json("/timezone")
+    return payload.get("response", [])
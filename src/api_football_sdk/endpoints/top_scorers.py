@@ -34,11 +34,11 @@ async def get_top_scorers(league_id: int, season: int) -> list[dict[str, Any]]:
     :return: List of top scorers with goals count and player metadata.
     """
     client = get_client()
-    response = await client.get(
+    payload = await client.get_json(
         "/players/topscorers",
         params={"league": league_id, "season": season},
     )
-    return response.json().get("response", [])
+    return payload.get("response", [])
 
 
 async def get_top_assists(league_id: int, season: int) -> list[dict[str, Any]]:
@@ -50,11 +50,11 @@ async def get_top_assists(league_id: int, season: int) -> list[dict[str, Any]]:
     :return: List of players with highest number of assists.
     """
     client = get_client()
-    response = await client.get(
+    payload = await client.get_json(
         "/players/topassists",
         params={"league": league_id, "season": season},
     )
-    return response.json().get("response", [])
+    return payload.get("response", [])
 
 
 async def get_top_red_cards(league_id: int, season: int) -> list[dict[str, Any]]:
@@ -66,11 +66,11 @@ async def get_top_red_cards(league_id: int, season: int) -> list[dict[str, Any]]
     :return: List of players with most red cards.
     """
     client = get_client()
-    response = await client.get(
+    payload = await client.get_json(
         "/players/topredcards",
         params={"league": league_id, "season": season},
     )
-    return response.json().get("response", [])
+    return payload.get("response", [])
 
 
 async def get_top_yellow_cards(league_id: int, season: int) -> list[dict[str, Any]]:
@@ -82,8 +82,8 @@ async def get_top_yellow_cards(league_id: int, season: int) -> list[dict[str, An
     :return: List of players with most yellow cards.
     """
     client = get_client()
-    response = await client.get(
+    payload = await client.get_json(
         "/players/topyellowcards",
         params={"league": league_id, "season": season},
     )
-    return response.json().get("response", [])
+    return payload.get("response", [])
@@ -34,8 +34,8 @@ async def get_trophies_by_player(player_id: int) -> list[dict[str, Any]]:
     :return: List of trophies the player has won.
     """
     client = get_client()
-    response = await client.get("/trophies", params={"player": player_id})
-    return response.json().get("response", [])
+    payload = await client.get_json("/trophies", params={"player": player_id})
+    return payload.get("response", [])
 
 
 async def get_trophies_by_coach(coach_id: int) -> list[dict[str, Any]]:
@@ -46,8 +46,8 @@ async def get_trophies_by_coach(coach_id: int) -> list[dict[str, Any]]:
     :return: List of trophies the coach has won.
     """
     client = get_client()
-    response = await client.get("/trophies", params={"coach": coach_id})
-    return response.json().get("response", [])
+    payload = await client.get_json("/trophies", params={"coach": coach_id})
+    return payload.get("response", [])
 
 
 async def get_trophies_by_players(player_ids: list[int]) -> list[dict[str, Any]]:
@@ -59,8 +59,8 @@ async def get_trophies_by_players(player_ids: list[int]) -> list[dict[str, Any]]
     """
     ids = "-".join(str(player_id) for player_id in player_ids)
     client = get_client()
-    response = await client.get("/trophies", params={"players": ids})
-    return response.json().get("response", [])
+    payload = await client.get_json("/trophies", params={"players": ids})
+    return payload.get("response", [])
 
 
 async def get_trophies_by_coaches(coach_ids: list[int]) -> list[dict[str, Any]]:
@@ -72,5 +72,5 @@ async def get_trophies_by_coaches(coach_ids: list[int]) -> list[dict[str, Any]]:
     """
     ids = "-".join(str(coach_id) for coach_id in coach_ids)
     client = get_client()
-    response = await client.get("/trophies", params={"coachs": ids})
-    return response.json().get("response", [])
+    payload = await client.get_json("/trophies", params={"coachs": ids})
+    return payload.get("response", [])
@@ -0,0 +1,74 @@
+"""
+Endpoints for retrieving venue (stadium) metadata.
+
+This module wraps the `/venues` endpoint of the API Football,
+supporting lookups by ID, name, city, and country.
+
+Usage example:
+--------------
+    from api_football_sdk.endpoints.venues import get_venues_by_city
+
+    venues = await get_venues_by_city("Manchester")
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from api_football_sdk.client import get_client
+
+__all__: list[str] = [
+    "get_venue_by_id",
+    "get_venues_by_name",
+    "get_venues_by_city",
+    "get_venues_by_country",
+]
+
+
+async def get_venue_by_id(venue_id: int) -> dict[str, Any]:
+    """
+    Get details for a specific venue by its ID.
+
+    :param venue_id: The unique ID of the venue.
+    :return: Venue metadata (name, address, city, capacity, surface, image).
+    """
+    client = get_client()
+    payload = await client.get_json("/venues", params={"id": venue_id})
+    results = payload.get("response", [])
+    return results[0] if results else {}
+
+
+async def get_venues_by_name(name: str) -> list[dict[str, Any]]:
+    """
+    Get venues matching an exact name.
+
+    :param name: Venue name (e.g., "Old Trafford").
+    :return: List of matching venues.
+    """
+    client = get_client()
+    payload = await client.get_json("/venues", params={"name": name})
+    return payload.get("response", [])
+
+
+async def get_venues_by_city(city: str) -> list[dict[str, Any]]:
+    """
+    Get all venues located in a city.
+
+    :param city: City name (e.g., "Manchester").
+    :return: List of venues in the city.
+    """
+    client = get_client()
+    payload = await client.get_json("/venues", params={"city": city})
+    return payload.get("response", [])
+
+
+async def get_venues_by_country(country_name: str) -> list[dict[str, Any]]:
+    """
+    Get all venues located in a country.
+
+    :param country_name: Country name (e.g., "England").
+    :return: List of venues in the country.
+    """
+    client = get_client()
+    payload = await client.get_json("/venues", params={"country": country_name})
+    return payload.get("response", [])
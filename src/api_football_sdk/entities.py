@@ -0,0 +1,275 @@
+"""
+Interning of the league, team, and venue objects embedded in responses.
+
+Every fixture of `get_fixtures_by_league` embeds full `league`,
+`teams.home`, `teams.away`, and `fixture.venue` objects, so a season of
+380 fixtures holds 760 copies of the same 20 team dicts; players,
+standings, and events repeat the pattern. `EntityGraph` replaces these
+copies with shared dicts from per-client entity tables keyed by ID.
+
+Payload shapes do not change. Fields that describe the entity in one
+context only (a team's `winner` in a fixture, a league's `season` and
+`round`) stay where they are: each distinct set of such values gets one
+shared variant of the entity. When a later response carries new values
+for an entity's own fields, every variant is updated in place, so the
+change is visible through every payload that references it.
+
+Usage example:
+--------------
+    from api_football_sdk.client import ApiFootballClient
+    from api_football_sdk.entities import EntityGraph
+
+    client = ApiFootballClient(entities=EntityGraph())
+    ...
+    print(client.entities.teams.get(33), client.entities.stats())
+"""
+
+from __future__ import annotations
+
+from typing import Any, Hashable, Iterable, Mapping
+
+__all__: list[str] = ["EntityGraph", "EntityTable", "SCHEMAS"]
+
+_MISSING = object()
+
+# Path to an embedded object ("*" walks every list item), its table, and
+# the fields that belong to the embedding context rather than the entity.
+Rule = tuple[tuple[str, ...], str, tuple[str, ...]]
+Variant = tuple[tuple[str, Hashable], ...]
+
+_FIXTURE: tuple[Rule, ...] = (
+    (("league",), "leagues", ("season", "round")),
+    (("teams", "home"), "teams", ("winner",)),
+    (("teams", "away"), "teams", ("winner",)),
+    (("fixture", "venue"), "venues", ()),
+)
+_PLAYER_STATISTICS: tuple[Rule, ...] = (
+    (("statistics", "*", "team"), "teams", ()),
+    (("statistics", "*", "league"), "leagues", ("season",)),
+)
+
+SCHEMAS: Mapping[str, tuple[Rule, ...]] = {
+    "/fixtures": _FIXTURE,
+    "/fixtures/headtohead": _FIXTURE,
+    "/fixtures/events": ((("team",), "teams", ()),),
+    "/teams": ((("team",), "teams", ()), (("venue",), "venues", ())),
+    "/leagues": ((("league",), "leagues", ()),),
+    "/venues": (((), "venues", ()),),
+    "/standings": ((("league", "standings", "*", "*", "team"), "teams", ()),),
+    "/players": _PLAYER_STATISTICS,
+    "/players/topscorers": _PLAYER_STATISTICS,
+    "/players/topassists": _PLAYER_STATISTICS,
+    "/players/squads": ((("team",), "teams", ()),),
+    "/injuries": (
+        (("team",), "teams", ()),
+        (("league",), "leagues", ("season",)),
+    ),
+    "/odds": ((("league",), "leagues", ("season",)),),
+}
+"""Embedded entities interned per endpoint path."""
+
+
+class EntityTable:
+    """
+    Shared dicts of one entity type, keyed by ID.
+
+    `get` returns the canonical dict of an entity: the union of its own
+    fields seen so far. Context variants are copies of it plus their
+    context fields, kept in sync on every update.
+
+    :param name: Table name (e.g., "teams").
+    """
+
+    __slots__ = ("name", "_entities", "_variants", "interned")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._entities: dict[Any, dict[str, Any]] = {}
+        self._variants: dict[Any, dict[Variant, dict[str, Any]]] = {}
+        self.interned = 0
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+    def __contains__(self, entity_id: object) -> bool:
+        return entity_id in self._entities
+
+    def get(self, entity_id: Any) -> dict[str, Any] | None:
+        """
+        Return the canonical dict of an entity.
+
+        :param entity_id: Entity ID.
+        :return: The shared dict, or None if the entity was never seen.
+        """
+        return self._entities.get(entity_id)
+
+    def ids(self) -> list[Any]:
+        """
+        IDs of every entity in the table.
+
+        :return: The IDs, in first-seen order.
+        """
+        return list(self._entities)
+
+    def intern(
+        self, obj: dict[str, Any], context: tuple[str, ...] = ()
+    ) -> dict[str, Any]:
+        """
+        Return the shared dict standing for an embedded object.
+
+        The object's own fields update the entity first; fields that are
+        None never overwrite known values.
+
+        :param obj: Decoded object with an `id` field.
+        :param context: Fields of `obj` that describe its embedding context.
+        :return: The shared dict to use in place of `obj`, or `obj` itself
+            when it has no ID or an unhashable context value.
+        """
+        entity_id = obj.get("id")
+        if entity_id is None:
+            return obj
+        key: Variant = tuple((field, obj[field]) for field in context if field in obj)
+        try:
+            hash(key)
+        except TypeError:
+            return obj
+
+        entity = self._entities.get(entity_id)
+        if entity is None:
+            entity = {k: v for k, v in obj.items() if k not in context}
+            self._entities[entity_id] = entity
+            self._variants[entity_id] = {(): entity}
+        else:
+            self.update(entity_id, obj, context)
+
+        variants = self._variants[entity_id]
+        variant = variants.get(key)
+        if variant is None:
+            variant = variants[key] = {**entity, **dict(key)}
+        self.interned += 1
+        return variant
+
+    def update(
+        self,
+        entity_id: Any,
+        fields: Mapping[str, Any],
+        context: Iterable[str] = (),
+    ) -> bool:
+        """
+        Apply new field values to an entity and every variant of it.
+
+        :param entity_id: Entity ID.
+        :param fields: New values; None values and `context` fields are
+            ignored.
+        :param context: Field names that are not part of the entity.
+        :return: True if anything changed.
+        """
+        entity = self._entities.get(entity_id)
+        if entity is None:
+            return False
+        skip = frozenset(context)
+        changes = {
+            k: v
+            for k, v in fields.items()
+            if v is not None and k not in skip and entity.get(k, _MISSING) != v
+        }
+        if not changes:
+            return False
+        # The canonical dict is the variant without context, key ().
+        for key, variant in self._variants[entity_id].items():
+            pinned = {field for field, _ in key}
+            for field, value in changes.items():
+                if field not in pinned:
+                    variant[field] = value
+        return True
+
+
+class EntityGraph:
+    """
+    Per-client league, team, and venue tables, and the payload normalizer.
+
+    :param schemas: Embedded entities to intern per endpoint path;
+        defaults to `SCHEMAS`.
+    """
+
+    def __init__(self, schemas: Mapping[str, tuple[Rule, ...]] | None = None) -> None:
+        self._schemas = dict(SCHEMAS if schemas is None else schemas)
+        self.leagues = EntityTable("leagues")
+        self.teams = EntityTable("teams")
+        self.venues = EntityTable("venues")
+        self._tables = {
+            table.name: table for table in (self.leagues, self.teams, self.venues)
+        }
+
+    def table(self, name: str) -> EntityTable:
+        """
+        Return an entity table by name.
+
+        :param name: "leagues", "teams", or "venues".
+        :return: The table.
+        """
+        return self._tables[name]
+
+    def normalize(self, url: str, payload: dict[str, Any]) -> dict[str, Any]:
+        """
+        Intern the embedded entities of every row of a payload, in place.
+
+        :param url: Endpoint path the payload was fetched from.
+        :param payload: Decoded response body.
+        :return: The same payload.
+        """
+        rows = payload.get("response")
+        if isinstance(rows, list) and url in self._schemas:
+            for index, row in enumerate(rows):
+                rows[index] = self.normalize_row(url, row)
+        return payload
+
+    def normalize_row(self, url: str, row: Any) -> Any:
+        """
+        Intern the embedded entities of one `response` item.
+
+        :param url: Endpoint path the row was fetched from.
+        :param row: One item of the `response` array.
+        :return: The row, or its shared dict when the row is itself an
+            entity (e.g., `/venues`).
+        """
+        for path, table, context in self._schemas.get(url, ()):
+            if not path:
+                if isinstance(row, dict):
+                    row = self._tables[table].intern(row, context)
+                continue
+            self._intern_at(row, path, self._tables[table], context)
+        return row
+
+    def _intern_at(
+        self,
+        node: Any,
+        path: tuple[str, ...],
+        table: EntityTable,
+        context: tuple[str, ...],
+    ) -> None:
+        head, rest = path[0], path[1:]
+        if head == "*":
+            children = node if isinstance(node, list) else ()
+            if not rest:
+                return
+            for child in children:
+                self._intern_at(child, rest, table, context)
+            return
+        if not isinstance(node, dict):
+            return
+        child = node.get(head)
+        if rest:
+            self._intern_at(child, rest, table, context)
+        elif isinstance(child, dict):
+            node[head] = table.intern(child, context)
+
+    def stats(self) -> dict[str, int]:
+        """
+        Entities per table and objects replaced by shared dicts.
+
+        :return: Counts keyed by table name, plus "interned".
+        """
+        counts = {name: len(table) for name, table in self._tables.items()}
+        counts["interned"] = sum(table.interned for table in self._tables.values())
+        return counts
@@ -93,6 +93,35 @@ class UnsupportedOperation(APIFootballError):
     """
 
 
+class CircuitOpenError(APIFootballError):
+    """
+    Raised without sending a request while the upstream's circuit is open.
+    """
+
+    def __init__(self, host: str, path: str, retry_after: float) -> None:
+        self.host: Final[str] = host
+        self.path: Final[str] = path
+        self.retry_after: Final[float] = retry_after
+        scope = host if path == "*" else f"{host}{path}"
+        super().__init__(f"Circuit open for {scope}; retry in {retry_after:.1f}s")
+
+
+class DeadlineExceededError(APIFootballError):
+    """
+    Raised when a request cannot complete before its operation's deadline.
+    """
+
+    def __init__(self, url: str) -> None:
+        self.url: Final[str] = url
+        super().__init__(f"Deadline exceeded before {url} completed")
+
+
+class QuotaExceededError(APIFootballError):
+    """
+    Raised when a request or bulk operation would exceed the daily quota budget.
+    """
+
+
 class ParsingError(APIFootballError):
     """
     Raised when the response could not be parsed into a valid model.
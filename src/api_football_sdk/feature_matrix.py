@@ -0,0 +1,369 @@
+"""
+Dense fixture × statistic matrices for a league-season.
+
+`/fixtures/statistics` returns, per team, a list of `{type, value}` pairs
+whose values mix ints, None, and strings such as "55%" or "1.42".
+`StatisticsMatrixBuilder` fetches the statistics of every finished fixture
+of a season, 20 fixtures per `/fixtures?ids=` request, and parses them in
+one pass into a preallocated float32 buffer with a fixed column schema:
+one home and one away column per statistic in `STAT_COLUMNS`.
+
+Percentages become fractions (0.55) and missing values NaN. The result is
+a `FeatureMatrix` of typed arrays, convertible to NumPy without copying
+(`numpy` extra). Built rows are cached per fixture, in memory and
+optionally on disk, so rebuilding a season in progress only fetches the
+fixtures finished since.
+
+Usage example:
+--------------
+    from api_football_sdk.feature_matrix import StatisticsMatrixBuilder
+
+    builder = StatisticsMatrixBuilder(cache_dir=".features")
+    matrix = await builder.build(league_id=39, season=2024)
+    fixture_ids, values = matrix.to_numpy()  # int64 (n,), float32 (n, 36)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import math
+import os
+import struct
+import sys
+from array import array
+from typing import Any, Iterable, Mapping, Sequence
+
+from api_football_sdk.client import ApiFootballClient, get_client
+from api_football_sdk.exceptions import ConfigurationError, ParsingError
+
+__all__: list[str] = [
+    "FINISHED_STATUSES",
+    "STAT_COLUMNS",
+    "FeatureMatrix",
+    "StatisticsMatrixBuilder",
+    "parse_stat_value",
+]
+
+STAT_COLUMNS: Mapping[str, str] = {
+    "Shots on Goal": "shots_on_goal",
+    "Shots off Goal": "shots_off_goal",
+    "Total Shots": "total_shots",
+    "Blocked Shots": "blocked_shots",
+    "Shots insidebox": "shots_insidebox",
+    "Shots outsidebox": "shots_outsidebox",
+    "Fouls": "fouls",
+    "Corner Kicks": "corner_kicks",
+    "Offsides": "offsides",
+    "Ball Possession": "ball_possession",
+    "Yellow Cards": "yellow_cards",
+    "Red Cards": "red_cards",
+    "Goalkeeper Saves": "goalkeeper_saves",
+    "Total passes": "total_passes",
+    "Passes accurate": "passes_accurate",
+    "Passes %": "passes_pct",
+    "expected_goals": "expected_goals",
+    "goals_prevented": "goals_prevented",
+}
+"""Statistic types, in column order, and the stem of their column names."""
+
+FINISHED_STATUSES: frozenset[str] = frozenset({"FT", "AET", "PEN"})
+"""Fixture short statuses whose statistics are final."""
+
+_IDS_PER_REQUEST = 20
+_MAGIC = b"AFSM"
+_NAN = math.nan
+
+
+def parse_stat_value(value: Any) -> float:
+    """
+    Convert one statistic value to a float.
+
+    :param value: An int, a float, a numeric string, a percentage string
+        ("55%"), or None.
+    :return: The number, a fraction for percentages, or NaN when missing or
+        unparsable.
+    """
+    if value is None:
+        return _NAN
+    if isinstance(value, (int, float)):
+        return float(value)
+    text = str(value).strip()
+    try:
+        if text.endswith("%"):
+            return float(text[:-1]) / 100
+        return float(text)
+    except ValueError:
+        return _NAN
+
+
+class FeatureMatrix:
+    """
+    Row-major float32 matrix of statistics, one row per fixture.
+
+    `values` holds `len(fixture_ids) * len(columns)` floats; both arrays
+    support the buffer protocol.
+
+    :param columns: Column names.
+    :param fixture_ids: Fixture ID of every row, as an `array("q")`.
+    :param values: Row-major values, as an `array("f")`.
+    """
+
+    __slots__ = ("columns", "fixture_ids", "values", "_rows")
+
+    def __init__(
+        self, columns: Sequence[str], fixture_ids: array, values: array
+    ) -> None:
+        if len(values) != len(fixture_ids) * len(columns):
+            raise ValueError("values do not match the matrix shape")
+        self.columns = tuple(columns)
+        self.fixture_ids = fixture_ids
+        self.values = values
+        self._rows = {fixture_id: i for i, fixture_id in enumerate(fixture_ids)}
+
+    def __len__(self) -> int:
+        return len(self.fixture_ids)
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """
+        Number of rows and columns.
+
+        :return: (fixtures, columns).
+        """
+        return len(self.fixture_ids), len(self.columns)
+
+    def row(self, fixture_id: int) -> list[float] | None:
+        """
+        Return the values of one fixture.
+
+        :param fixture_id: The ID of the fixture.
+        :return: One float per column, or None if the fixture is absent.
+        """
+        index = self._rows.get(fixture_id)
+        if index is None:
+            return None
+        width = len(self.columns)
+        return self.values[index * width : (index + 1) * width].tolist()
+
+    def column(self, name: str) -> list[float]:
+        """
+        Return one column.
+
+        :param name: Column name (e.g., "home_ball_possession").
+        :return: One float per fixture, in row order.
+        """
+        index = self.columns.index(name)
+        return self.values[index :: len(self.columns)].tolist()
+
+    def to_numpy(self) -> tuple[Any, Any]:
+        """
+        Wrap the matrix in NumPy arrays without copying.
+
+        :return: Fixture IDs as int64 of shape (n,), and values as float32 of
+            shape (n, columns).
+        :raises ConfigurationError: If NumPy is not installed.
+        """
+        try:
+            import numpy
+        except ImportError as exc:
+            raise ConfigurationError(
+                'NumPy output requires the "numpy" package: '
+                'pip install "api-football-sdk[numpy]"'
+            ) from exc
+        ids = numpy.frombuffer(self.fixture_ids, dtype=numpy.int64)
+        values = numpy.frombuffer(self.values, dtype=numpy.float32)
+        return ids, values.reshape(self.shape)
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        """
+        Write the matrix to a binary file, atomically.
+
+        :param path: Destination file.
+        :return: None
+        """
+        header = json.dumps(
+            {
+                "columns": self.columns,
+                "rows": len(self),
+                "byteorder": sys.byteorder,
+            }
+        ).encode()
+        tmp = f"{os.fspath(path)}.tmp"
+        with open(tmp, "wb") as fh:
+            fh.write(_MAGIC + struct.pack("<I", len(header)) + header)
+            fh.write(self.fixture_ids.tobytes())
+            fh.write(self.values.tobytes())
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str | os.PathLike[str]) -> FeatureMatrix:
+        """
+        Read a matrix written by `save`.
+
+        :param path: Source file.
+        :return: The matrix.
+        :raises ParsingError: If the file is not a saved matrix.
+        """
+        with open(path, "rb") as fh:
+            data = fh.read()
+        try:
+            if data[:4] != _MAGIC:
+                raise ValueError("bad magic")
+            (size,) = struct.unpack_from("<I", data, 4)
+            header = json.loads(data[8 : 8 + size])
+            offset = 8 + size
+            rows, columns = header["rows"], header["columns"]
+            fixture_ids = array("q", data[offset : offset + 8 * rows])
+            offset += 8 * rows
+            values = array("f", data[offset : offset + 4 * rows * len(columns)])
+            if header["byteorder"] != sys.byteorder:
+                fixture_ids.byteswap()
+                values.byteswap()
+            return cls(columns, fixture_ids, values)
+        except (ValueError, KeyError, struct.error) as exc:
+            raise ParsingError(f"Invalid feature matrix file {path}: {exc}") from None
+
+
+class StatisticsMatrixBuilder:
+    """
+    Builds season `FeatureMatrix` objects from fixture statistics.
+
+    Only fixtures with a status in `statuses` get a row. Rows are cached by
+    fixture ID for the builder's lifetime; with `cache_dir`, each built
+    season is also saved there and seeds the cache of later builders.
+    Fixtures whose statistics are not published yet get an all-NaN row
+    and are fetched again by the next build.
+
+    :param client: Client used to fetch; defaults to the shared client.
+    :param stat_columns: Statistic types and their column stems; defaults
+        to `STAT_COLUMNS`. Types not listed are ignored.
+    :param statuses: Fixture short statuses to include.
+    :param cache_dir: Directory for saved season matrices, if any.
+    """
+
+    def __init__(
+        self,
+        client: ApiFootballClient | None = None,
+        *,
+        stat_columns: Mapping[str, str] | None = None,
+        statuses: Iterable[str] = FINISHED_STATUSES,
+        cache_dir: str | os.PathLike[str] | None = None,
+    ) -> None:
+        self._client = client
+        stems = dict(STAT_COLUMNS if stat_columns is None else stat_columns)
+        self._offsets = {stat: i for i, stat in enumerate(stems)}
+        self.columns: tuple[str, ...] = tuple(
+            f"{side}_{stem}" for side in ("home", "away") for stem in stems.values()
+        )
+        self._statuses = frozenset(statuses)
+        self._cache_dir = cache_dir
+        self._rows: dict[int, array] = {}
+        self.fetched = 0
+
+    def _cache_path(self, league_id: int, season: int) -> str | None:
+        if self._cache_dir is None:
+            return None
+        return os.path.join(self._cache_dir, f"statistics-{league_id}-{season}.afsm")
+
+    def _load_cached(self, path: str | None) -> None:
+        if path is None or not os.path.exists(path):
+            return
+        matrix = FeatureMatrix.load(path)
+        if matrix.columns != self.columns:
+            return
+        width = len(self.columns)
+        for index, fixture_id in enumerate(matrix.fixture_ids):
+            row = matrix.values[index * width : (index + 1) * width]
+            # All-NaN rows are fixtures saved before their statistics existed.
+            if not all(math.isnan(value) for value in row):
+                self._rows.setdefault(fixture_id, row)
+
+    def parse(self, fixture: Mapping[str, Any]) -> array:
+        """
+        Build the row of one fixture from its embedded statistics.
+
+        The home side is matched by team ID against `teams.home`, falling
+        back to the order of the `statistics` list.
+
+        :param fixture: A `/fixtures` row carrying `statistics`.
+        :return: One float32 per column, NaN where missing.
+        """
+        offsets = self._offsets
+        width = len(offsets)
+        row = array("f", [_NAN]) * (2 * width)
+        home_id = ((fixture.get("teams") or {}).get("home") or {}).get("id")
+        for position, team_stats in enumerate(fixture.get("statistics") or ()):
+            team_id = (team_stats.get("team") or {}).get("id")
+            if home_id is not None and team_id is not None:
+                base = 0 if team_id == home_id else width
+            else:
+                base = 0 if position == 0 else width
+            for entry in team_stats.get("statistics") or ():
+                offset = offsets.get(entry.get("type"))
+                if offset is not None:
+                    row[base + offset] = parse_stat_value(entry.get("value"))
+        return row
+
+    async def build(self, league_id: int, season: int) -> FeatureMatrix:
+        """
+        Build the matrix of a league-season.
+
+        Fixtures are listed with one request; statistics of the finished
+        fixtures not cached yet are fetched 20 per request, concurrently.
+
+        :param league_id: The ID of the league.
+        :param season: The season year.
+        :return: One row per finished fixture, in kickoff order.
+        """
+        client = self._client or get_client()
+        path = self._cache_path(league_id, season)
+        self._load_cached(path)
+
+        payload = await client.get_json(
+            "/fixtures", params={"league": league_id, "season": season}
+        )
+        fixtures = sorted(
+            (
+                row
+                for row in payload.get("response", [])
+                if ((row.get("fixture") or {}).get("status") or {}).get("short")
+                in self._statuses
+            ),
+            key=lambda row: (
+                row["fixture"].get("timestamp") or 0,
+                row["fixture"]["id"],
+            ),
+        )
+        fixture_ids = [row["fixture"]["id"] for row in fixtures]
+        missing = [
+            fixture_id for fixture_id in fixture_ids if fixture_id not in self._rows
+        ]
+        batches = [
+            missing[i : i + _IDS_PER_REQUEST]
+            for i in range(0, len(missing), _IDS_PER_REQUEST)
+        ]
+        pages = await asyncio.gather(
+            *(
+                client.get_json("/fixtures", params={"ids": "-".join(map(str, batch))})
+                for batch in batches
+            )
+        )
+        for page in pages:
+            for row in page.get("response", []):
+                if not row.get("statistics"):
+                    # Not published yet: left uncached so later builds retry.
+                    continue
+                self._rows[row["fixture"]["id"]] = self.parse(row)
+                self.fetched += 1
+
+        values = array("f")
+        width = len(self.columns)
+        for fixture_id in fixture_ids:
+            # A fixture the API did not return keeps an all-NaN row.
+            values.extend(self._rows.get(fixture_id) or array("f", [_NAN]) * width)
+        matrix = FeatureMatrix(self.columns, array("q", fixture_ids), values)
+        if path is not None:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            matrix.save(path)
+        return matrix
@@ -0,0 +1,301 @@
+"""
+Head-to-head lookups served from locally known fixtures.
+
+The `/fixtures/headtohead` endpoint is keyed by an ordered team pair, and
+prematch pages ask for it once per upcoming fixture. This module keeps an
+index of fixtures by canonical (unordered) team pair, fed from league
+fixtures that were already fetched, and only falls back to the remote
+endpoint for pairs the local data cannot answer.
+
+Usage example:
+--------------
+    from api_football_sdk.head_to_head import HeadToHeadService
+
+    h2h = HeadToHeadService()
+    await h2h.load_league(league_id=39, season=2024)
+    meetings = await h2h.get(33, 40, league_id=39, season=2024)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Iterable
+
+from api_football_sdk.deadline import DeadlineLike, deadline_scope
+from api_football_sdk.endpoints.fixtures import (
+    get_fixtures_by_league,
+    get_fixtures_head_to_head,
+)
+
+__all__: list[str] = ["HeadToHeadService", "canonical_pair"]
+
+TeamPair = tuple[int, int]
+
+
+def canonical_pair(team1_id: int, team2_id: int) -> TeamPair:
+    """
+    Return the order-independent key for a pair of teams.
+
+    :param team1_id: ID of the first team.
+    :param team2_id: ID of the second team.
+    :return: The pair in ascending ID order.
+    """
+    return (team1_id, team2_id) if team1_id <= team2_id else (team2_id, team1_id)
+
+
+def _fixture_pair(fixture: dict[str, Any]) -> TeamPair | None:
+    teams = fixture.get("teams") or {}
+    home = (teams.get("home") or {}).get("id")
+    away = (teams.get("away") or {}).get("id")
+    if home is None or away is None:
+        return None
+    return canonical_pair(home, away)
+
+
+def _fixture_id(fixture: dict[str, Any]) -> int | None:
+    return (fixture.get("fixture") or {}).get("id")
+
+
+def _fixture_timestamp(fixture: dict[str, Any]) -> int:
+    return (fixture.get("fixture") or {}).get("timestamp") or 0
+
+
+class HeadToHeadService:
+    """
+    Canonical head-to-head index with remote fallback.
+
+    A pair is answered locally when either:
+
+    * its full history was fetched from `/fixtures/headtohead` less than
+      `max_age` seconds ago (later fixtures fed through `add_fixtures`
+      keep it current), or
+    * the query is scoped to a league and season that was loaded in full.
+
+    Everything else is fetched remotely once per canonical pair, merged
+    into the index, and reused for both orderings.
+    """
+
+    DEFAULT_MAX_AGE: float = 6 * 60 * 60.0
+    DEFAULT_CONCURRENCY: int = 5
+
+    def __init__(
+        self,
+        *,
+        max_age: float | None = DEFAULT_MAX_AGE,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> None:
+        self._max_age = max_age
+        self._concurrency = concurrency
+        self._meetings: dict[TeamPair, dict[int, dict[str, Any]]] = {}
+        self._complete: dict[TeamPair, float] = {}
+        self._loaded_seasons: set[tuple[int, int]] = set()
+        self._inflight: dict[TeamPair, asyncio.Task[None]] = {}
+
+    def add_fixtures(self, fixtures: Iterable[dict[str, Any]]) -> int:
+        """
+        Index fixtures by their canonical team pair.
+
+        Fixtures already present are replaced, so feeding refreshed data
+        (e.g., final scores) updates the stored meeting in place.
+
+        :param fixtures: Fixtures as returned by the `/fixtures` endpoints.
+        :return: Number of fixtures indexed.
+        """
+        added = 0
+        for fixture in fixtures:
+            pair = _fixture_pair(fixture)
+            fixture_id = _fixture_id(fixture)
+            if pair is None or fixture_id is None:
+                continue
+            self._meetings.setdefault(pair, {})[fixture_id] = fixture
+            added += 1
+        return added
+
+    async def load_league(self, league_id: int, season: int) -> int:
+        """
+        Fetch and index every fixture of a league season.
+
+        Once loaded, head-to-head queries scoped to this league and season
+        are answered without remote calls.
+
+        :param league_id: ID of the league.
+        :param season: Season year.
+        :return: Number of fixtures indexed.
+        """
+        fixtures = await get_fixtures_by_league(league_id, season)
+        added = self.add_fixtures(fixtures)
+        self._loaded_seasons.add((league_id, season))
+        return added
+
+    def mark_league_loaded(self, league_id: int, season: int) -> None:
+        """
+        Declare that a full league season was fed through `add_fixtures`.
+
+        :param league_id: ID of the league.
+        :param season: Season year.
+        :return: None
+        """
+        self._loaded_seasons.add((league_id, season))
+
+    def covers(
+        self,
+        team1_id: int,
+        team2_id: int,
+        *,
+        league_id: int | None = None,
+        season: int | None = None,
+    ) -> bool:
+        """
+        Tell whether a query can be answered from local data alone.
+
+        :param team1_id: ID of the first team.
+        :param team2_id: ID of the second team.
+        :param league_id: Optional league scope.
+        :param season: Optional season scope.
+        :return: True if no remote call is needed.
+        """
+        pair = canonical_pair(team1_id, team2_id)
+        fetched_at = self._complete.get(pair)
+        if fetched_at is not None and (
+            self._max_age is None or time.monotonic() - fetched_at < self._max_age
+        ):
+            return True
+        return (
+            league_id is not None
+            and season is not None
+            and (league_id, season) in self._loaded_seasons
+        )
+
+    async def get(
+        self,
+        team1_id: int,
+        team2_id: int,
+        *,
+        league_id: int | None = None,
+        season: int | None = None,
+        last: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Retrieve head-to-head fixtures between two teams.
+
+        :param team1_id: ID of the first team.
+        :param team2_id: ID of the second team.
+        :param league_id: Restrict meetings to this league.
+        :param season: Restrict meetings to this season.
+        :param last: Only return the most recent `last` meetings.
+        :return: Meetings in chronological order.
+        """
+        if not self.covers(team1_id, team2_id, league_id=league_id, season=season):
+            await self._fetch_pair(canonical_pair(team1_id, team2_id))
+        return self._select(
+            canonical_pair(team1_id, team2_id),
+            league_id=league_id,
+            season=season,
+            last=last,
+        )
+
+    async def get_many(
+        self,
+        pairs: Iterable[TeamPair],
+        *,
+        league_id: int | None = None,
+        season: int | None = None,
+        last: int | None = None,
+        deadline: DeadlineLike = None,
+    ) -> dict[TeamPair, list[dict[str, Any]]]:
+        """
+        Retrieve head-to-head fixtures for many team pairs at once.
+
+        Pairs are deduplicated regardless of order; only pairs not covered
+        locally are fetched, concurrently and bounded by `concurrency`.
+
+        :param pairs: Team pairs in any order.
+        :param league_id: Restrict meetings to this league.
+        :param season: Restrict meetings to this season.
+        :param last: Only return the most recent `last` meetings per pair.
+        :param deadline: Deadline or seconds from now for all the fetches.
+        :return: Meetings keyed by canonical pair.
+        :raises DeadlineExceededError: If the fetches do not finish in time.
+        """
+        wanted = {canonical_pair(a, b) for a, b in pairs}
+        gaps = [
+            pair
+            for pair in wanted
+            if not self.covers(*pair, league_id=league_id, season=season)
+        ]
+        if gaps:
+            semaphore = asyncio.Semaphore(self._concurrency)
+
+            async def fetch(pair: TeamPair) -> None:
+                async with semaphore:
+                    await self._fetch_pair(pair)
+
+            with deadline_scope(deadline):
+                await asyncio.gather(*(fetch(pair) for pair in gaps))
+
+        return {
+            pair: self._select(pair, league_id=league_id, season=season, last=last)
+            for pair in wanted
+        }
+
+    async def get_for_fixtures(
+        self,
+        fixtures: Iterable[dict[str, Any]],
+        *,
+        last: int | None = None,
+    ) -> dict[int, list[dict[str, Any]]]:
+        """
+        Retrieve head-to-head history for every matchup of a round.
+
+        :param fixtures: Upcoming fixtures (e.g., from `get_fixtures_by_round`).
+        :param last: Only return the most recent `last` meetings per matchup.
+        :return: Meetings keyed by the upcoming fixture ID.
+        """
+        matchups: dict[int, TeamPair] = {}
+        for fixture in fixtures:
+            pair = _fixture_pair(fixture)
+            fixture_id = _fixture_id(fixture)
+            if pair is not None and fixture_id is not None:
+                matchups[fixture_id] = pair
+
+        meetings = await self.get_many(matchups.values(), last=last)
+        return {fixture_id: meetings[pair] for fixture_id, pair in matchups.items()}
+
+    async def _fetch_pair(self, pair: TeamPair) -> None:
+        # Concurrent lookups of the same pair share one upstream request.
+        task = self._inflight.get(pair)
+        if task is None:
+            task = asyncio.ensure_future(self._load_pair(pair))
+            self._inflight[pair] = task
+            task.add_done_callback(lambda _: self._inflight.pop(pair, None))
+        await asyncio.shield(task)
+
+    async def _load_pair(self, pair: TeamPair) -> None:
+        fixtures = await get_fixtures_head_to_head(*pair)
+        self.add_fixtures(fixtures)
+        self._complete[pair] = time.monotonic()
+
+    def _select(
+        self,
+        pair: TeamPair,
+        *,
+        league_id: int | None,
+        season: int | None,
+        last: int | None,
+    ) -> list[dict[str, Any]]:
+        meetings = [
+            fixture
+            for fixture in self._meetings.get(pair, {}).values()
+            if (
+                league_id is None
+                or (fixture.get("league") or {}).get("id") == league_id
+            )
+            and (
+                season is None or (fixture.get("league") or {}).get("season") == season
+            )
+        ]
+        meetings.sort(key=_fixture_timestamp)
+        if last is not None:
+            meetings = meetings[-last:] if last > 0 else []
+        return meetings
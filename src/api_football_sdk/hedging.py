@@ -0,0 +1,184 @@
+"""
+Hedged requests to cut the latency tail of interactive calls.
+
+`Hedger` records the latency of recent requests per endpoint path. When a
+request is still pending after a chosen percentile of that endpoint's
+latency (p95 by default), the client sends a duplicate and keeps whichever
+answers first. Every request earns a fraction of a hedge token and every
+duplicate spends a whole one, so at most `budget` (5% by default) extra
+requests are sent and hedging cannot burn through the daily quota.
+
+Latencies and the hedge delay are counted from the moment a request holds
+its scheduler slot, so time spent queued on a busy client neither inflates
+the percentiles nor triggers duplicates.
+
+Hedging is opt-in and only applies to GET requests at live or interactive
+priority; background work never hedges.
+
+Usage example:
+--------------
+    from api_football_sdk.client import ApiFootballClient
+    from api_football_sdk.hedging import Hedger
+
+    client = ApiFootballClient(hedging=Hedger(percentile=0.95, budget=0.05))
+    ...
+    print(client.hedger.stats())
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+
+__all__: list[str] = ["Hedger", "LatencyWindow"]
+
+
+class LatencyWindow:
+    """
+    Ring buffer of the most recent latencies of one endpoint, in seconds.
+    """
+
+    __slots__ = ("_samples", "_size", "_next", "_sorted")
+
+    def __init__(self, size: int = 256) -> None:
+        self._samples = array("d")
+        self._size = size
+        self._next = 0
+        self._sorted: list[float] | None = None
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def add(self, latency: float) -> None:
+        """
+        Record one latency, replacing the oldest once the window is full.
+
+        :param latency: Seconds from send to response.
+        :return: None
+        """
+        if len(self._samples) < self._size:
+            self._samples.append(latency)
+        else:
+            self._samples[self._next] = latency
+        self._next = (self._next + 1) % self._size
+        self._sorted = None
+
+    def percentile(self, q: float) -> float:
+        """
+        Nearest-rank percentile of the recorded latencies.
+
+        :param q: Percentile in (0, 1] (e.g., 0.95).
+        :return: The latency, or 0.0 without samples.
+        """
+        if not self._samples:
+            return 0.0
+        if self._sorted is None:
+            self._sorted = sorted(self._samples)
+        rank = max(math.ceil(q * len(self._sorted)) - 1, 0)
+        return self._sorted[rank]
+
+
+class Hedger:
+    """
+    Decides when to hedge and keeps the hedge budget.
+
+    :param percentile: Latency percentile after which a duplicate is sent.
+    :param budget: Extra requests allowed per request sent, in [0, 1].
+    :param min_samples: Latencies an endpoint needs before it is hedged.
+    :param min_delay: Lower bound of the hedge delay, in seconds.
+    :param max_burst: Hedge tokens that can be saved up for a burst.
+    :param window: Latencies kept per endpoint.
+    """
+
+    def __init__(
+        self,
+        *,
+        percentile: float = 0.95,
+        budget: float = 0.05,
+        min_samples: int = 20,
+        min_delay: float = 0.05,
+        max_burst: float = 10.0,
+        window: int = 256,
+    ) -> None:
+        if not 0 < percentile < 1:
+            raise ValueError("percentile must be in (0, 1)")
+        if not 0 <= budget <= 1:
+            raise ValueError("budget must be in [0, 1]")
+        self._percentile = percentile
+        self._budget = budget
+        self._min_samples = min_samples
+        self._min_delay = min_delay
+        self._max_burst = max_burst
+        self._window = window
+        self._tokens = 0.0
+        self._latencies: dict[str, LatencyWindow] = {}
+        self.requests = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+
+    def record(self, url: str, latency: float) -> None:
+        """
+        Record the latency of a completed request.
+
+        :param url: Endpoint relative path.
+        :param latency: Seconds from send to response.
+        :return: None
+        """
+        latencies = self._latencies.get(url)
+        if latencies is None:
+            latencies = self._latencies[url] = LatencyWindow(self._window)
+        latencies.add(latency)
+
+    def delay_for(self, url: str) -> float | None:
+        """
+        Count a new request and return how long to wait before hedging it.
+
+        :param url: Endpoint relative path.
+        :return: Seconds to wait, or None when the endpoint has too few
+            samples to hedge.
+        """
+        self.requests += 1
+        self._tokens = min(self._tokens + self._budget, self._max_burst)
+        latencies = self._latencies.get(url)
+        if latencies is None or len(latencies) < self._min_samples:
+            return None
+        return max(latencies.percentile(self._percentile), self._min_delay)
+
+    def try_hedge(self) -> bool:
+        """
+        Spend a hedge token if one is available.
+
+        :return: True if a duplicate may be sent.
+        """
+        if self._tokens < 1.0:
+            return False
+        self._tokens -= 1.0
+        self.hedged += 1
+        return True
+
+    def percentile(self, url: str, q: float | None = None) -> float:
+        """
+        Latency percentile of an endpoint.
+
+        :param url: Endpoint relative path.
+        :param q: Percentile; defaults to the hedging percentile.
+        :return: The latency in seconds, or 0.0 without samples.
+        """
+        latencies = self._latencies.get(url)
+        if latencies is None:
+            return 0.0
+        return latencies.percentile(self._percentile if q is None else q)
+
+    def stats(self) -> dict[str, float]:
+        """
+        Hedging counters.
+
+        :return: Requests seen, duplicates sent, duplicates that answered
+            first, and the hedge rate.
+        """
+        return {
+            "requests": self.requests,
+            "hedged": self.hedged,
+            "hedge_wins": self.hedge_wins,
+            "hedge_rate": self.hedged / self.requests if self.requests else 0.0,
+        }
@@ -0,0 +1,310 @@
+"""
+Bulk ingest pipeline decoding responses in worker processes.
+
+In a large backfill the event loop is bound by JSON decoding and by
+flattening payloads into rows, not by the network. `IngestPipeline` keeps
+the loop for I/O only: raw response bodies fetched by `ApiFootballClient`
+are handed to a `ProcessPoolExecutor`, where they are decoded and passed to
+a transform, and only the transform's compact result travels back.
+
+The fetch, decode, and result stages are joined by bounded queues. When
+workers fall behind, fetchers block instead of buffering bodies, so memory
+stays bounded by `max_pending` responses whatever the size of the backfill.
+
+The default transform, `entity_rows`, builds the table rows of an
+`EntityStore` in the worker; `ingest` then only merges and writes them.
+
+Usage example:
+--------------
+    from api_football_sdk.ingest import IngestPipeline
+    from api_football_sdk.storage import EntityStore
+
+    requests = [("/fixtures", {"league": 39, "season": s}) for s in range(2010, 2025)]
+    with EntityStore("football.db") as store:
+        async with IngestPipeline(workers=4) as pipeline:
+            print(await pipeline.ingest(requests, store))
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import multiprocessing
+import os
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor
+from types import TracebackType
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Iterable, Type, Union
+
+from api_football_sdk.client import ApiFootballClient, get_client
+from api_football_sdk.exceptions import (
+    APIFootballError,
+    ConfigurationError,
+    ParsingError,
+)
+from api_football_sdk.scheduler import Priority
+from api_football_sdk.storage import EntityStore, StagedRows
+
+__all__: list[str] = ["IngestPipeline", "Transform", "decode_rows", "entity_rows"]
+
+Request = tuple[str, dict[str, Any]]
+Transform = Callable[[str, dict[str, Any], dict[str, Any]], Any]
+"""Picklable callable taking (path, params, payload), run in a worker."""
+
+_DONE = object()
+
+# Store used by `entity_rows` to build rows, one per worker process.
+_worker_store: EntityStore | None = None
+
+
+def entity_rows(
+    url: str, params: dict[str, Any], payload: dict[str, Any]
+) -> StagedRows:
+    """
+    Flatten a payload into the rows `EntityStore` would write for it.
+
+    :param url: Endpoint path the payload was fetched from.
+    :param params: Query parameters of the request.
+    :param payload: Decoded response body.
+    :return: Rows per table, and event rows per fixture.
+    """
+    global _worker_store
+    if _worker_store is None:
+        _worker_store = EntityStore(batch_size=sys.maxsize)
+    _worker_store.add_response(url, params, payload)
+    return _worker_store.drain()
+
+
+def decode_rows(url: str, params: dict[str, Any], payload: dict[str, Any]) -> Any:
+    """
+    Return the `response` member of a payload unchanged.
+
+    :param url: Endpoint path the payload was fetched from.
+    :param params: Query parameters of the request.
+    :param payload: Decoded response body.
+    :return: The decoded rows.
+    """
+    return payload.get("response", [])
+
+
+def _decode_and_transform(
+    transform: Transform, url: str, params: dict[str, Any], body: bytes
+) -> Any:
+    try:
+        payload = json.loads(body)
+    except ValueError as exc:
+        raise ParsingError(f"Invalid JSON from {url}: {exc}") from None
+    return transform(url, params, payload)
+
+
+async def _aiter(
+    requests: Union[Iterable[Request], AsyncIterable[Request]],
+) -> AsyncIterator[Request]:
+    if isinstance(requests, AsyncIterable):
+        async for request in requests:
+            yield request
+    else:
+        for request in requests:
+            yield request
+
+
+class IngestPipeline:
+    """
+    Fetch on the event loop, decode and transform in worker processes.
+
+    Requests are sent at background priority. Failed requests and bodies
+    that fail to decode or transform are recorded in `failures` and
+    skipped; the pipeline keeps going.
+
+    :param client: Client used to fetch; defaults to the shared client.
+    :param transform: Picklable function run on every decoded payload in
+        a worker; its result is what `run` yields.
+    :param workers: Worker processes; defaults to the number of CPUs.
+    :param max_pending: Capacity of each queue between stages; defaults to
+        twice the number of workers.
+    :param fetch_concurrency: Requests in flight at once; defaults to
+        `max_pending`. The client's own limits still apply.
+    :param executor: Executor to use instead of a private process pool;
+        it is not shut down by `close`.
+    """
+
+    def __init__(
+        self,
+        client: ApiFootballClient | None = None,
+        *,
+        transform: Transform = entity_rows,
+        workers: int | None = None,
+        max_pending: int | None = None,
+        fetch_concurrency: int | None = None,
+        executor: Executor | None = None,
+    ) -> None:
+        self._client = client
+        self._transform = transform
+        self._workers = workers or os.cpu_count() or 1
+        self._max_pending = max_pending or 2 * self._workers
+        self._fetch_concurrency = fetch_concurrency or self._max_pending
+        self._executor = executor
+        self._owns_executor = executor is None
+        self.failures: list[tuple[str, dict[str, Any], BaseException]] = []
+        self.fetched = 0
+        self.transformed = 0
+        self.bytes_fetched = 0
+
+    @property
+    def workers(self) -> int:
+        """
+        Number of decode tasks, and of worker processes when owned.
+
+        :return: The worker count.
+        """
+        return self._workers
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            # Forking a process that runs an event loop and threads is unsafe.
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    def close(self) -> None:
+        """
+        Shut down the worker processes, if the pipeline started them.
+
+        :return: None
+        """
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    async def __aenter__(self) -> IngestPipeline:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def stats(self) -> dict[str, int]:
+        """
+        Counters of the work done so far.
+
+        :return: Responses fetched, results transformed, failures, and bytes
+            fetched.
+        """
+        return {
+            "fetched": self.fetched,
+            "transformed": self.transformed,
+            "failed": len(self.failures),
+            "bytes_fetched": self.bytes_fetched,
+        }
+
+    async def run(
+        self, requests: Union[Iterable[Request], AsyncIterable[Request]]
+    ) -> AsyncIterator[tuple[str, dict[str, Any], Any]]:
+        """
+        Fetch every request and yield the transformed payloads.
+
+        Results are yielded in completion order. Stopping iteration early
+        cancels the requests and decodes still pending.
+
+        :param requests: (path, params) pairs, sync or async iterable.
+        :return: Async iterator of (path, params, result).
+        """
+        client = self._client or get_client()
+        executor = self._get_executor()
+        loop = asyncio.get_running_loop()
+        fetch_queue: asyncio.Queue[Request | None] = asyncio.Queue(self._max_pending)
+        decode_queue: asyncio.Queue[tuple[str, dict[str, Any], bytes] | None] = (
+            asyncio.Queue(self._max_pending)
+        )
+        results: asyncio.Queue[Any] = asyncio.Queue(self._max_pending)
+
+        async def produce() -> None:
+            async for url, params in _aiter(requests):
+                await fetch_queue.put((url, params))
+            for _ in range(self._fetch_concurrency):
+                await fetch_queue.put(None)
+
+        async def fetch() -> None:
+            while (request := await fetch_queue.get()) is not None:
+                url, params = request
+                try:
+                    response = await client.get(
+                        url, params=params, priority=Priority.BACKGROUND
+                    )
+                except APIFootballError as exc:
+                    self.failures.append((url, params, exc))
+                    continue
+                self.fetched += 1
+                self.bytes_fetched += len(response.content)
+                await decode_queue.put((url, params, response.content))
+
+        async def decode() -> None:
+            while (item := await decode_queue.get()) is not None:
+                url, params, body = item
+                try:
+                    result = await loop.run_in_executor(
+                        executor,
+                        _decode_and_transform,
+                        self._transform,
+                        url,
+                        params,
+                        body,
+                    )
+                except Exception as exc:
+                    self.failures.append((url, params, exc))
+                    continue
+                self.transformed += 1
+                await results.put((url, params, result))
+
+        async def supervise() -> None:
+            try:
+                await asyncio.gather(producer, *fetchers)
+                for _ in decoders:
+                    await decode_queue.put(None)
+                await asyncio.gather(*decoders)
+            finally:
+                await results.put(_DONE)
+
+        producer = asyncio.ensure_future(produce())
+        fetchers = [
+            asyncio.ensure_future(fetch()) for _ in range(self._fetch_concurrency)
+        ]
+        decoders = [asyncio.ensure_future(decode()) for _ in range(self._workers)]
+        supervisor = asyncio.ensure_future(supervise())
+        tasks = [producer, *fetchers, *decoders, supervisor]
+        try:
+            while (item := await results.get()) is not _DONE:
+                yield item
+            # Re-raise a failure of the request iterable, if any.
+            await supervisor
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def ingest(
+        self,
+        requests: Union[Iterable[Request], AsyncIterable[Request]],
+        store: EntityStore,
+    ) -> dict[str, int]:
+        """
+        Fetch every request and write its entities to a store.
+
+        :param requests: (path, params) pairs, sync or async iterable.
+        :param store: Store that receives the rows and owns the database.
+        :return: The pipeline's `stats`, after the final flush.
+        :raises ConfigurationError: If the pipeline's transform is not
+            `entity_rows`.
+        """
+        if self._transform is not entity_rows:
+            raise ConfigurationError("ingest() requires the entity_rows transform")
+        async for _, _, staged in self.run(requests):
+            store.stage_rows(staged)
+        store.flush()
+        return self.stats()
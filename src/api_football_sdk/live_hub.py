@@ -0,0 +1,623 @@
+"""
+Live fixture and event feed shared by many consumers.
+
+`LiveHub` owns the upstream traffic: every `interval` seconds it sends one
+`/fixtures?live=all` request, whose rows embed each fixture's events, and
+publishes what changed since the previous poll. Consumers subscribe to
+filtered topics (leagues, fixtures, event types, message kinds) and read
+from their own bounded queue, so the upstream cost is one request per
+poll however many consumers and live fixtures there are.
+
+Other processes subscribe over a local socket with `subscribe_remote`;
+their messages are sent as JSON lines.
+
+A subscriber that does not keep up is handled by its queue's policy:
+"drop_oldest" (default) discards the oldest queued message, "drop_newest"
+discards the incoming one, and "block" makes the hub wait, delaying every
+subscriber until the slow one catches up. Dropped messages are counted.
+
+Usage example:
+--------------
+    from api_football_sdk.live_hub import LiveHub, subscribe_remote
+
+    hub = LiveHub(interval=15)
+    hub.start()
+    await hub.serve("/tmp/api-football-live.sock")
+
+    async with hub.subscribe(leagues=[39], event_types=["Goal"]) as goals:
+        async for message in goals:
+            print(message.fixture_id, message.data["player"]["name"])
+
+    # In another process:
+    feed = await subscribe_remote("/tmp/api-football-live.sock", fixtures=[1035037])
+    async with feed:
+        async for message in feed:
+            ...
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import time
+from typing import Any, AsyncIterator, Iterable, Literal, Mapping, Union
+
+from api_football_sdk.endpoints.fixtures import get_fixtures_in_progress
+from api_football_sdk.exceptions import APIFootballError, ConfigurationError
+from api_football_sdk.match_calendar import TERMINAL_STATUSES
+
+__all__: list[str] = [
+    "ENDED",
+    "EVENT",
+    "FIXTURE",
+    "LiveHub",
+    "Message",
+    "RemoteSubscription",
+    "Subscription",
+    "subscribe_remote",
+]
+
+logger = logging.getLogger(__name__)
+
+DropPolicy = Literal["drop_oldest", "drop_newest", "block"]
+Address = Union[str, "os.PathLike[str]", tuple[str, int]]
+
+FIXTURE: str = "fixture"
+"""Kind of messages carrying a live fixture whose status or score changed."""
+
+EVENT: str = "event"
+"""Kind of messages carrying one new match event."""
+
+ENDED: str = "ended"
+"""Kind of messages sent when a fixture leaves the live list."""
+
+_CLOSED = object()
+
+
+class Message:
+    """
+    One published change.
+
+    :param kind: `FIXTURE`, `EVENT`, or `ENDED`.
+    :param league_id: League of the fixture.
+    :param fixture_id: The fixture.
+    :param data: The fixture row (without its events) or the event.
+    :param event_type: Event `type` (e.g., "Goal", "Card"), for events.
+    """
+
+    __slots__ = ("kind", "league_id", "fixture_id", "event_type", "data", "at")
+
+    def __init__(
+        self,
+        kind: str,
+        league_id: int | None,
+        fixture_id: int,
+        data: dict[str, Any],
+        event_type: str | None = None,
+        at: float | None = None,
+    ) -> None:
+        self.kind = kind
+        self.league_id = league_id
+        self.fixture_id = fixture_id
+        self.event_type = event_type
+        self.data = data
+        self.at = time.time() if at is None else at
+
+    def __repr__(self) -> str:
+        return (
+            f"Message({self.kind!r}, fixture={self.fixture_id}, "
+            f"event_type={self.event_type!r})"
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Serialize the message for the socket protocol.
+
+        :return: JSON-compatible dict.
+        """
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> Message:
+        """
+        Rebuild a message serialized by `to_dict`.
+
+        :param data: The serialized message.
+        :return: The message.
+        """
+        return cls(**{slot: data.get(slot) for slot in cls.__slots__})
+
+
+class Subscription:
+    """
+    A consumer's filtered, bounded view of the hub's messages.
+
+    Filters left as None match everything. Iterate with `async for`; the
+    iteration ends when the subscription or the hub is closed.
+
+    :param hub: The hub delivering the messages.
+    :param leagues: League IDs to receive.
+    :param fixtures: Fixture IDs to receive.
+    :param event_types: Event types to receive; other kinds still match.
+    :param kinds: Message kinds to receive.
+    :param maxsize: Capacity of the queue.
+    :param policy: What to do when the queue is full.
+    """
+
+    def __init__(
+        self,
+        hub: LiveHub,
+        *,
+        leagues: Iterable[int] | None = None,
+        fixtures: Iterable[int] | None = None,
+        event_types: Iterable[str] | None = None,
+        kinds: Iterable[str] | None = None,
+        maxsize: int = 1000,
+        policy: DropPolicy = "drop_oldest",
+    ) -> None:
+        if policy not in ("drop_oldest", "drop_newest", "block"):
+            raise ConfigurationError(f"Unknown drop policy {policy!r}")
+        self._hub = hub
+        self._leagues = None if leagues is None else frozenset(leagues)
+        self._fixtures = None if fixtures is None else frozenset(fixtures)
+        self._event_types = None if event_types is None else frozenset(event_types)
+        self._kinds = None if kinds is None else frozenset(kinds)
+        self._policy = policy
+        self._queue: asyncio.Queue[Any] = asyncio.Queue(maxsize)
+        self.closed = False
+        self.delivered = 0
+        self.dropped = 0
+
+    def matches(self, message: Message) -> bool:
+        """
+        Whether a message passes the subscription's filters.
+
+        :param message: A published message.
+        :return: True if it should be delivered.
+        """
+        return (
+            (self._kinds is None or message.kind in self._kinds)
+            and (self._leagues is None or message.league_id in self._leagues)
+            and (self._fixtures is None or message.fixture_id in self._fixtures)
+            and (
+                self._event_types is None
+                or message.kind != EVENT
+                or message.event_type in self._event_types
+            )
+        )
+
+    async def offer(self, message: Message) -> None:
+        """
+        Queue a message according to the drop policy.
+
+        :param message: A message that matched the filters.
+        :return: None
+        """
+        if self.closed:
+            return
+        queue = self._queue
+        if self._policy == "block":
+            await queue.put(message)
+        elif not queue.full():
+            queue.put_nowait(message)
+        elif self._policy == "drop_oldest":
+            queue.get_nowait()
+            queue.put_nowait(message)
+            self.dropped += 1
+        else:
+            self.dropped += 1
+            return
+        self.delivered += 1
+
+    async def get(self) -> Message:
+        """
+        Wait for the next message.
+
+        :return: The message.
+        :raises StopAsyncIteration: If the subscription is closed.
+        """
+        if self.closed:
+            raise StopAsyncIteration
+        message = await self._queue.get()
+        if message is _CLOSED:
+            raise StopAsyncIteration
+        return message
+
+    def __aiter__(self) -> Subscription:
+        return self
+
+    async def __anext__(self) -> Message:
+        return await self.get()
+
+    async def __aenter__(self) -> Subscription:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Unsubscribe; pending messages are discarded.
+
+        :return: None
+        """
+        if self.closed:
+            return
+        self.closed = True
+        self._hub._unsubscribe(self)
+        # Make room for the marker, also waking a blocked `offer`.
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self._queue.put_nowait(_CLOSED)
+
+
+def _event_key(event: Mapping[str, Any]) -> tuple[Any, ...]:
+    time_ = event.get("time") or {}
+    return (
+        time_.get("elapsed"),
+        time_.get("extra"),
+        (event.get("team") or {}).get("id"),
+        (event.get("player") or {}).get("id"),
+        event.get("type"),
+        event.get("detail"),
+    )
+
+
+def _fixture_state(row: Mapping[str, Any]) -> tuple[Any, ...]:
+    status = (row.get("fixture") or {}).get("status") or {}
+    goals = row.get("goals") or {}
+    return (
+        status.get("short"),
+        status.get("elapsed"),
+        goals.get("home"),
+        goals.get("away"),
+    )
+
+
+class LiveHub:
+    """
+    Single poller of live fixtures fanning changes out to subscribers.
+
+    The hub polls only while it has subscribers, local or remote. The
+    first poll publishes every live fixture and all of its events so far.
+
+    :param interval: Seconds between polls.
+    """
+
+    DEFAULT_INTERVAL: float = 15.0
+
+    def __init__(self, *, interval: float = DEFAULT_INTERVAL) -> None:
+        self._interval = interval
+        self._subscriptions: list[Subscription] = []
+        self._states: dict[int, tuple[Any, ...]] = {}
+        self._events: dict[int, set[tuple[Any, ...]]] = {}
+        self._rows: dict[int, dict[str, Any]] = {}
+        self._task: asyncio.Task[None] | None = None
+        self._servers: list[asyncio.AbstractServer] = []
+        self.polls = 0
+        self.published = 0
+
+    # ------------------------------------------------------------- subscribers
+
+    def subscribe(
+        self,
+        *,
+        leagues: Iterable[int] | None = None,
+        fixtures: Iterable[int] | None = None,
+        event_types: Iterable[str] | None = None,
+        kinds: Iterable[str] | None = None,
+        maxsize: int = 1000,
+        policy: DropPolicy = "drop_oldest",
+    ) -> Subscription:
+        """
+        Subscribe to the messages matching filters.
+
+        :param leagues: League IDs to receive; None for all.
+        :param fixtures: Fixture IDs to receive; None for all.
+        :param event_types: Event types to receive; None for all.
+        :param kinds: Message kinds to receive; None for all.
+        :param maxsize: Messages queued before the policy applies.
+        :param policy: "drop_oldest", "drop_newest", or "block".
+        :return: The subscription; close it to unsubscribe.
+        """
+        subscription = Subscription(
+            self,
+            leagues=leagues,
+            fixtures=fixtures,
+            event_types=event_types,
+            kinds=kinds,
+            maxsize=maxsize,
+            policy=policy,
+        )
+        self._subscriptions.append(subscription)
+        return subscription
+
+    def _unsubscribe(self, subscription: Subscription) -> None:
+        if subscription in self._subscriptions:
+            self._subscriptions.remove(subscription)
+
+    def fixtures(self) -> list[dict[str, Any]]:
+        """
+        The latest row of every fixture live at the last poll.
+
+        Lets a late subscriber start from the current state.
+
+        :return: Fixture rows, events included.
+        """
+        return list(self._rows.values())
+
+    async def publish(self, message: Message) -> int:
+        """
+        Deliver a message to every matching subscriber.
+
+        :param message: The message.
+        :return: Number of subscribers it matched.
+        """
+        self.published += 1
+        matched = 0
+        for subscription in list(self._subscriptions):
+            if subscription.matches(message):
+                matched += 1
+                await subscription.offer(message)
+        return matched
+
+    # ------------------------------------------------------------- polling
+
+    async def poll_once(self) -> int:
+        """
+        Fetch the live fixtures once and publish what changed.
+
+        :return: Number of messages published.
+        """
+        rows = await get_fixtures_in_progress()
+        self.polls += 1
+        return await self.process(rows)
+
+    async def process(
+        self, rows: Iterable[Mapping[str, Any]], *, partial: bool = False
+    ) -> int:
+        """
+        Publish the changes between the previous live list and `rows`.
+
+        By default `rows` is the complete live list, and fixtures missing
+        from it have ended. With `partial`, `rows` covers only some fixtures
+        (e.g., from `LivePollScheduler`): missing fixtures are kept, and a
+        fixture ends when its status is terminal.
+
+        :param rows: `/fixtures?live=all` or `/fixtures?ids=` response rows.
+        :param partial: Whether `rows` may omit fixtures still in play.
+        :return: Number of messages published.
+        """
+        messages: list[Message] = []
+        live: set[int] = set()
+        for row in rows:
+            fixture_id = (row.get("fixture") or {}).get("id")
+            if fixture_id is None:
+                continue
+            live.add(fixture_id)
+            league_id = (row.get("league") or {}).get("id")
+            events = row.get("events") or []
+            fixture = {key: value for key, value in row.items() if key != "events"}
+            state = _fixture_state(row)
+            if self._states.get(fixture_id) != state:
+                self._states[fixture_id] = state
+                messages.append(Message(FIXTURE, league_id, fixture_id, fixture))
+            seen = self._events.setdefault(fixture_id, set())
+            for event in events:
+                key = _event_key(event)
+                if key not in seen:
+                    seen.add(key)
+                    messages.append(
+                        Message(EVENT, league_id, fixture_id, event, event.get("type"))
+                    )
+            self._rows[fixture_id] = dict(row)
+
+        if partial:
+            ended = [f for f in live if self._states[f][0] in TERMINAL_STATUSES]
+        else:
+            ended = [f for f in self._rows if f not in live]
+        for fixture_id in ended:
+            row = self._rows.pop(fixture_id)
+            self._states.pop(fixture_id, None)
+            self._events.pop(fixture_id, None)
+            fixture = {key: value for key, value in row.items() if key != "events"}
+            league_id = (row.get("league") or {}).get("id")
+            messages.append(Message(ENDED, league_id, fixture_id, fixture))
+
+        for message in messages:
+            await self.publish(message)
+        return len(messages)
+
+    async def run(self) -> None:
+        """
+        Poll every `interval` seconds while there are subscribers, until
+        cancelled.
+
+        :return: None
+        """
+        while True:
+            started = time.monotonic()
+            if self._subscriptions:
+                try:
+                    await self.poll_once()
+                except APIFootballError as exc:
+                    logger.warning("Live poll failed: %s", exc)
+            elapsed = time.monotonic() - started
+            await asyncio.sleep(max(0.0, self._interval - elapsed))
+
+    def start(self) -> asyncio.Task[None]:
+        """
+        Start polling in a background task.
+
+        :return: The polling task.
+        """
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+        return self._task
+
+    async def stop(self) -> None:
+        """
+        Stop polling and serving, and end every subscription.
+
+        :return: None
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        for server in self._servers:
+            server.close()
+            await server.wait_closed()
+        self._servers = []
+        for subscription in list(self._subscriptions):
+            subscription.close()
+
+    def stats(self) -> dict[str, int]:
+        """
+        Counters of the hub.
+
+        :return: Polls, messages published, subscribers, live fixtures, and
+            messages delivered and dropped across current subscribers.
+        """
+        return {
+            "polls": self.polls,
+            "published": self.published,
+            "subscribers": len(self._subscriptions),
+            "live_fixtures": len(self._rows),
+            "delivered": sum(s.delivered for s in self._subscriptions),
+            "dropped": sum(s.dropped for s in self._subscriptions),
+        }
+
+    # ------------------------------------------------------------- socket
+
+    async def serve(
+        self,
+        address: Address,
+        *,
+        maxsize: int = 1000,
+        policy: DropPolicy = "drop_oldest",
+    ) -> asyncio.AbstractServer:
+        """
+        Accept subscribers from other processes on a local socket.
+
+        A client sends one JSON line with its filters (`leagues`,
+        `fixtures`, `event_types`, `kinds`), then reads messages as JSON
+        lines. A client that reads slowly fills its queue and the drop
+        policy applies.
+
+        :param address: Unix socket path, or (host, port) for TCP.
+        :param maxsize: Queue capacity of each remote subscriber.
+        :param policy: Drop policy of each remote subscriber.
+        :return: The server; `stop` closes it.
+        """
+
+        async def handle(
+            reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+        ) -> None:
+            subscription = None
+            try:
+                filters = json.loads(await reader.readline() or b"{}")
+                subscription = self.subscribe(
+                    leagues=filters.get("leagues"),
+                    fixtures=filters.get("fixtures"),
+                    event_types=filters.get("event_types"),
+                    kinds=filters.get("kinds"),
+                    maxsize=maxsize,
+                    policy=policy,
+                )
+                async for message in subscription:
+                    writer.write(json.dumps(message.to_dict()).encode() + b"\n")
+                    await writer.drain()
+            except (ValueError, AttributeError, ConnectionError) as exc:
+                logger.debug("Live subscriber disconnected: %s", exc)
+            finally:
+                if subscription is not None:
+                    subscription.close()
+                writer.close()
+
+        if isinstance(address, tuple):
+            server = await asyncio.start_server(handle, *address)
+        else:
+            server = await asyncio.start_unix_server(handle, os.fspath(address))
+        self._servers.append(server)
+        return server
+
+
+class RemoteSubscription:
+    """
+    Subscription to a `LiveHub` served by another process.
+
+    :param reader: Stream of the connection.
+    :param writer: Stream of the connection.
+    """
+
+    def __init__(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self._reader = reader
+        self._writer = writer
+
+    def __aiter__(self) -> AsyncIterator[Message]:
+        return self
+
+    async def __anext__(self) -> Message:
+        line = await self._reader.readline()
+        if not line:
+            raise StopAsyncIteration
+        return Message.from_dict(json.loads(line))
+
+    async def __aenter__(self) -> RemoteSubscription:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Disconnect from the hub.
+
+        :return: None
+        """
+        self._writer.close()
+        try:
+            await self._writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+async def subscribe_remote(
+    address: Address,
+    *,
+    leagues: Iterable[int] | None = None,
+    fixtures: Iterable[int] | None = None,
+    event_types: Iterable[str] | None = None,
+    kinds: Iterable[str] | None = None,
+) -> RemoteSubscription:
+    """
+    Subscribe to a hub served by `LiveHub.serve`.
+
+    :param address: Unix socket path, or (host, port) for TCP.
+    :param leagues: League IDs to receive; None for all.
+    :param fixtures: Fixture IDs to receive; None for all.
+    :param event_types: Event types to receive; None for all.
+    :param kinds: Message kinds to receive; None for all.
+    :return: The subscription, an async iterator of messages.
+    """
+    if isinstance(address, tuple):
+        reader, writer = await asyncio.open_connection(*address)
+    else:
+        reader, writer = await asyncio.open_unix_connection(os.fspath(address))
+    filters = {
+        "leagues": None if leagues is None else list(leagues),
+        "fixtures": None if fixtures is None else list(fixtures),
+        "event_types": None if event_types is None else list(event_types),
+        "kinds": None if kinds is None else list(kinds),
+    }
+    writer.write(json.dumps(filters).encode() + b"\n")
+    await writer.drain()
+    return RemoteSubscription(reader, writer)
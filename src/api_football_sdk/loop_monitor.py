@@ -0,0 +1,127 @@
+"""
+Debug reporting of SDK code that blocks the event loop.
+
+Everything the client does between two awaits runs on the event loop:
+decoding bodies, interning entities, and calling response hooks. A step
+that takes longer than `threshold` seconds delays every other task by as
+much. `LoopMonitor` times these steps and reports the slow ones with the
+endpoint and stage ("decode", "entities", "hooks") that caused them: they
+are logged as warnings, kept in `reports`, and passed to `on_block`.
+
+Enable it by passing a monitor to the client, or for the default client by
+setting `API_FOOTBALL_DEBUG_LOOP_BLOCKING=1`. Blocking outside the SDK is
+reported by asyncio's own debug mode (`PYTHONASYNCIODEBUG=1`).
+
+Usage example:
+--------------
+    from api_football_sdk.client import ApiFootballClient
+    from api_football_sdk.loop_monitor import LoopMonitor
+
+    monitor = LoopMonitor(threshold=0.02)
+    client = ApiFootballClient(loop_monitor=monitor)
+    ...
+    for report in monitor.reports:
+        print(report.url, report.stage, report.duration)
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import time
+from collections import deque
+from typing import Callable, Iterator
+
+__all__: list[str] = ["BlockingReport", "LoopMonitor"]
+
+logger = logging.getLogger(__name__)
+
+
+class BlockingReport:
+    """
+    One step that held the event loop for too long.
+
+    :param url: Endpoint being processed.
+    :param stage: What the SDK was doing (e.g., "decode").
+    :param duration: Seconds the loop was held.
+    :param at: UNIX time the step ended.
+    """
+
+    __slots__ = ("url", "stage", "duration", "at")
+
+    def __init__(self, url: str, stage: str, duration: float, at: float) -> None:
+        self.url = url
+        self.stage = stage
+        self.duration = duration
+        self.at = at
+
+    def __repr__(self) -> str:
+        return (
+            f"BlockingReport(url={self.url!r}, stage={self.stage!r}, "
+            f"duration={self.duration:.3f})"
+        )
+
+
+class LoopMonitor:
+    """
+    Times synchronous SDK steps and reports those over `threshold`.
+
+    :param threshold: Seconds a step may hold the loop before it is reported.
+    :param on_block: Called with every report.
+    :param history: Number of reports kept in `reports`.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.05,
+        *,
+        on_block: Callable[[BlockingReport], None] | None = None,
+        history: int = 100,
+    ) -> None:
+        if threshold <= 0:
+            raise ValueError("threshold must be positive")
+        self.threshold = threshold
+        self._on_block = on_block
+        self.reports: deque[BlockingReport] = deque(maxlen=history)
+        self.blocked = 0
+
+    @contextlib.contextmanager
+    def section(self, url: str, stage: str) -> Iterator[None]:
+        """
+        Time a block of code that runs without awaiting.
+
+        :param url: Endpoint being processed.
+        :param stage: What the block does.
+        :return: Context manager reporting the block if it is too slow.
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - started
+            if duration > self.threshold:
+                self.report(url, stage, duration)
+
+    def report(self, url: str, stage: str, duration: float) -> None:
+        """
+        Record a step that blocked the loop.
+
+        :param url: Endpoint being processed.
+        :param stage: What the SDK was doing.
+        :param duration: Seconds the loop was held.
+        :return: None
+        """
+        report = BlockingReport(url, stage, duration, time.time())
+        self.blocked += 1
+        self.reports.append(report)
+        logger.warning(
+            "Event loop blocked for %.1f ms by %s of %s",
+            duration * 1000,
+            stage,
+            url,
+        )
+        if self._on_block is not None:
+            try:
+                self._on_block(report)
+            except Exception:
+                logger.exception("Loop monitor callback %r failed", self._on_block)
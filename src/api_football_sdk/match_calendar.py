@@ -0,0 +1,415 @@
+"""
+Kickoff calendar and the live polling schedule derived from it.
+
+Live endpoints are only worth polling while matches are on. `MatchCalendar`
+records the kickoff time and status of upcoming fixtures, loaded with
+`get_next_fixtures`, `get_fixtures_by_date`, or the match days of a season
+from `get_fixtures_rounds_with_dates`. `LivePollScheduler` then polls only
+the fixtures inside a match window, batched 20 per `/fixtures?ids=`
+request, at a cadence that follows each fixture's status:
+
+- from `lead` seconds before kickoff: every `pre_match` seconds;
+- in play (and past kickoff while still "NS"): every `in_play` seconds;
+- at half-time and other breaks: every `half_time` seconds;
+- once finished (FT, AET, PEN) or called off: not at all.
+
+Between match windows it sleeps until the next window opens. On each
+match day the day's fixtures are reloaded once, so kickoff changes and
+fixtures not known in advance are picked up.
+
+Usage example:
+--------------
+    from api_football_sdk.live_hub import LiveHub
+    from api_football_sdk.match_calendar import LivePollScheduler, MatchCalendar
+
+    calendar = MatchCalendar(leagues=[39, 140])
+    await calendar.load_rounds(39, 2024)
+    await calendar.load_rounds(140, 2024)
+    hub = LiveHub()
+    scheduler = LivePollScheduler(
+        calendar, on_rows=lambda rows: hub.process(rows, partial=True)
+    )
+    scheduler.start()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Iterable, Mapping, Union
+
+from api_football_sdk.endpoints.fixtures import (
+    get_fixtures_by_date,
+    get_fixtures_by_ids,
+    get_fixtures_rounds_with_dates,
+    get_next_fixtures,
+)
+from api_football_sdk.exceptions import APIFootballError
+from api_football_sdk.scheduler import Priority, request_priority
+
+__all__: list[str] = [
+    "BREAK_STATUSES",
+    "IN_PLAY_STATUSES",
+    "TERMINAL_STATUSES",
+    "LivePollScheduler",
+    "MatchCalendar",
+]
+
+logger = logging.getLogger(__name__)
+
+IN_PLAY_STATUSES: frozenset[str] = frozenset({"1H", "2H", "ET", "P", "LIVE"})
+"""Statuses of fixtures being played."""
+
+BREAK_STATUSES: frozenset[str] = frozenset({"HT", "BT", "INT", "SUSP"})
+"""Statuses of fixtures paused: half-time, breaks, interruptions."""
+
+TERMINAL_STATUSES: frozenset[str] = frozenset(
+    {"FT", "AET", "PEN", "PST", "CANC", "ABD", "AWD", "WO"}
+)
+"""Statuses after which a fixture is no longer polled."""
+
+RowsCallback = Callable[[list[dict[str, Any]]], Union[Awaitable[Any], Any]]
+
+_IDS_PER_REQUEST = 20
+
+
+def _utc_date(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, timezone.utc).date().isoformat()
+
+
+class MatchCalendar:
+    """
+    Kickoff times and statuses of known fixtures, and the season match days.
+
+    Rows added later replace earlier ones, so polled rows keep the
+    calendar current (e.g., a postponed kickoff).
+
+    :param leagues: League IDs to keep; None keeps every league.
+    """
+
+    def __init__(self, leagues: Iterable[int] | None = None) -> None:
+        self._leagues = None if leagues is None else frozenset(leagues)
+        self._fixtures: dict[int, tuple[float, str, int | None]] = {}
+        self._matchdays: set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self._fixtures)
+
+    def __contains__(self, fixture_id: object) -> bool:
+        return fixture_id in self._fixtures
+
+    def add(self, rows: Iterable[Mapping[str, Any]]) -> int:
+        """
+        Record or update fixtures from `/fixtures` rows.
+
+        :param rows: Fixture rows with `fixture.timestamp` and status.
+        :return: Number of rows recorded.
+        """
+        added = 0
+        for row in rows:
+            fixture = row.get("fixture") or {}
+            fixture_id, kickoff = fixture.get("id"), fixture.get("timestamp")
+            if fixture_id is None or kickoff is None:
+                continue
+            league_id = (row.get("league") or {}).get("id")
+            if self._leagues is not None and league_id not in self._leagues:
+                continue
+            status = (fixture.get("status") or {}).get("short") or "NS"
+            self._fixtures[fixture_id] = (float(kickoff), status, league_id)
+            self._matchdays.add(_utc_date(kickoff))
+            added += 1
+        return added
+
+    def kickoff(self, fixture_id: int) -> float | None:
+        """
+        Kickoff time of a fixture.
+
+        :param fixture_id: The ID of the fixture.
+        :return: Epoch seconds, or None if unknown.
+        """
+        entry = self._fixtures.get(fixture_id)
+        return None if entry is None else entry[0]
+
+    def status(self, fixture_id: int) -> str | None:
+        """
+        Last known short status of a fixture.
+
+        :param fixture_id: The ID of the fixture.
+        :return: The status (e.g., "NS", "HT"), or None if unknown.
+        """
+        entry = self._fixtures.get(fixture_id)
+        return None if entry is None else entry[1]
+
+    def fixtures(self) -> list[tuple[int, float, str]]:
+        """
+        Every known fixture, in kickoff order.
+
+        :return: (fixture ID, kickoff, status) tuples.
+        """
+        return sorted(
+            (
+                (fixture_id, kickoff, status)
+                for fixture_id, (kickoff, status, _) in self._fixtures.items()
+            ),
+            key=lambda entry: (entry[1], entry[0]),
+        )
+
+    def matchdays(self) -> list[str]:
+        """
+        Days with at least one known fixture or scheduled round.
+
+        :return: Dates in YYYY-MM-DD format, sorted.
+        """
+        return sorted(self._matchdays)
+
+    def prune(self, before: float) -> int:
+        """
+        Forget finished fixtures that kicked off before a time.
+
+        :param before: Epoch seconds.
+        :return: Number of fixtures removed.
+        """
+        old = [
+            fixture_id
+            for fixture_id, (kickoff, status, _) in self._fixtures.items()
+            if kickoff < before and status in TERMINAL_STATUSES
+        ]
+        for fixture_id in old:
+            del self._fixtures[fixture_id]
+        return len(old)
+
+    async def load_next(self, count: int) -> int:
+        """
+        Add the next fixtures of every competition.
+
+        :param count: Number of upcoming fixtures to fetch.
+        :return: Number of fixtures recorded.
+        """
+        return self.add(await get_next_fixtures(count))
+
+    async def load_date(self, date: str) -> int:
+        """
+        Add every fixture of one day.
+
+        :param date: Date in YYYY-MM-DD format.
+        :return: Number of fixtures recorded.
+        """
+        return self.add(await get_fixtures_by_date(date))
+
+    async def load_rounds(self, league_id: int, season: int) -> list[str]:
+        """
+        Add the match days of a league-season from its round dates.
+
+        Round dates carry no kickoff times; `LivePollScheduler` loads each
+        match day's fixtures when the day starts.
+
+        :param league_id: The ID of the league.
+        :param season: The season year.
+        :return: The season's match days, sorted.
+        """
+        days: set[str] = set()
+        for entry in await get_fixtures_rounds_with_dates(league_id, season):
+            if isinstance(entry, dict):
+                days.update(entry.get("dates") or ())
+        self._matchdays.update(days)
+        return sorted(days)
+
+
+class LivePollScheduler:
+    """
+    Polls calendar fixtures only around their matches.
+
+    All fixtures due for a poll are fetched together, 20 per request, and
+    fixtures due within the next `in_play` seconds join the same requests,
+    so concurrent matches share requests. Rows are recorded in the calendar
+    and passed to `on_rows`.
+
+    :param calendar: Fixtures to follow.
+    :param on_rows: Called with the rows of every poll; may be async.
+    :param lead: Seconds before kickoff when polling starts.
+    :param pre_match: Poll interval from `lead` until kickoff.
+    :param in_play: Poll interval while playing.
+    :param half_time: Poll interval during breaks.
+    :param stale_after: Seconds after kickoff when a fixture still "NS" is
+        given up.
+    :param max_sleep: Longest sleep between two checks of the calendar.
+    """
+
+    def __init__(
+        self,
+        calendar: MatchCalendar,
+        on_rows: RowsCallback | None = None,
+        *,
+        lead: float = 600.0,
+        pre_match: float = 120.0,
+        in_play: float = 15.0,
+        half_time: float = 60.0,
+        stale_after: float = 3 * 3600.0,
+        max_sleep: float = 3600.0,
+    ) -> None:
+        self.calendar = calendar
+        self._on_rows = on_rows
+        self.lead = lead
+        self.pre_match = pre_match
+        self.in_play = in_play
+        self.half_time = half_time
+        self.stale_after = stale_after
+        self.max_sleep = max_sleep
+        self._next_poll: dict[int, float] = {}
+        self._loaded_day: str | None = None
+        self._task: asyncio.Task[None] | None = None
+        self.requests = 0
+        self.polls = 0
+
+    def interval(self, status: str, kickoff: float, now: float) -> float | None:
+        """
+        Poll interval of a fixture at a given time.
+
+        :param status: Short status of the fixture.
+        :param kickoff: Kickoff time, epoch seconds.
+        :param now: Current time, epoch seconds.
+        :return: Seconds between polls, or None if it should not be polled.
+        """
+        if status in TERMINAL_STATUSES:
+            return None
+        if status in IN_PLAY_STATUSES:
+            return self.in_play
+        if status in BREAK_STATUSES:
+            return self.half_time
+        if now < kickoff - self.lead:
+            return None
+        if now < kickoff:
+            return self.pre_match
+        if now - kickoff > self.stale_after:
+            return None
+        return self.in_play
+
+    def due(self, now: float) -> tuple[list[int], float | None]:
+        """
+        Fixtures to poll now, and when to check again.
+
+        :param now: Current time, epoch seconds.
+        :return: Fixture IDs due, and the epoch time of the next poll or
+            window opening (None when nothing is left to poll).
+        """
+        scheduled: list[tuple[int, float]] = []
+        opens: list[float] = []
+        for fixture_id, kickoff, status in self.calendar.fixtures():
+            interval = self.interval(status, kickoff, now)
+            if interval is None:
+                self._next_poll.pop(fixture_id, None)
+                if status not in TERMINAL_STATUSES and now < kickoff - self.lead:
+                    opens.append(kickoff - self.lead)
+                continue
+            scheduled.append((fixture_id, self._next_poll.get(fixture_id, now)))
+
+        due: list[int] = []
+        if any(at <= now for _, at in scheduled):
+            # Fixtures due soon ride along in the same requests.
+            due = [
+                fixture_id for fixture_id, at in scheduled if at <= now + self.in_play
+            ]
+        waiting = [at for fixture_id, at in scheduled if fixture_id not in due]
+        wake = min(waiting + opens, default=None)
+        return due, wake
+
+    async def poll_once(self, now: float | None = None) -> int:
+        """
+        Poll the fixtures due, if any.
+
+        :param now: Current time, epoch seconds; defaults to the clock.
+        :return: Number of requests sent.
+        """
+        now = time.time() if now is None else now
+        due, _ = self.due(now)
+        if not due:
+            return 0
+        batches = [
+            due[i : i + _IDS_PER_REQUEST] for i in range(0, len(due), _IDS_PER_REQUEST)
+        ]
+        with request_priority(Priority.LIVE):
+            results = await asyncio.gather(
+                *(get_fixtures_by_ids(batch) for batch in batches),
+                return_exceptions=True,
+            )
+        rows: list[dict[str, Any]] = []
+        for batch, result in zip(batches, results):
+            if isinstance(result, APIFootballError):
+                logger.warning("Live poll of %s failed: %s", batch, result)
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                rows.extend(result)
+        self.requests += len(batches)
+        self.polls += 1
+
+        self.calendar.add(rows)
+        for fixture_id in due:
+            status = self.calendar.status(fixture_id) or "NS"
+            kickoff = self.calendar.kickoff(fixture_id) or now
+            interval = self.interval(status, kickoff, now)
+            if interval is None:
+                self._next_poll.pop(fixture_id, None)
+            else:
+                self._next_poll[fixture_id] = now + interval
+        if rows and self._on_rows is not None:
+            result = self._on_rows(rows)
+            if inspect.isawaitable(result):
+                await result
+        return len(batches)
+
+    async def _refresh(self, now: float) -> None:
+        day = _utc_date(now)
+        if day == self._loaded_day or day not in self.calendar.matchdays():
+            return
+        try:
+            await self.calendar.load_date(day)
+        except APIFootballError as exc:
+            logger.warning("Calendar refresh failed: %s", exc)
+            return
+        self._loaded_day = day
+        self.calendar.prune(now - 86400)
+
+    async def run(self) -> None:
+        """
+        Poll on the calendar's schedule until cancelled.
+
+        :return: None
+        """
+        while True:
+            now = time.time()
+            await self._refresh(now)
+            try:
+                await self.poll_once(now)
+            except APIFootballError as exc:
+                logger.warning("Live poll failed: %s", exc)
+            _, wake = self.due(time.time())
+            delay = self.max_sleep if wake is None else wake - time.time()
+            await asyncio.sleep(min(max(delay, 0.0), self.max_sleep))
+
+    def start(self) -> asyncio.Task[None]:
+        """
+        Start polling in a background task.
+
+        :return: The polling task.
+        """
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+        return self._task
+
+    async def stop(self) -> None:
+        """
+        Stop the background polling task, if running.
+
+        :return: None
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
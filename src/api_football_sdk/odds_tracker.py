@@ -0,0 +1,425 @@
+"""
+Odds movement tracking over time.
+
+`OddsMovementTracker` polls the odds routes for a set of fixtures and keeps
+only price changes, one `PriceSeries` per (fixture, bookmaker, market,
+outcome). Each series stores time and price deltas in typed arrays (8 bytes
+per change) with periodic absolute checkpoints, so "price at time t" is a
+binary search plus a short scan rather than a replay of the whole history.
+
+Usage example:
+--------------
+    from api_football_sdk.odds_tracker import OddsMovementTracker
+
+    tracker = OddsMovementTracker([1035037, 1035038], interval=300, bet_id=1)
+    tracker.start()
+    ...
+    opened, current = tracker.movement(1035037, 8, 1, "Home")
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from array import array
+from bisect import bisect_right
+from datetime import datetime
+from typing import Any, Iterable
+
+from api_football_sdk.endpoints.odds import (
+    get_live_odds,
+    get_odds_by_fixture,
+    iter_odds_prices,
+)
+from api_football_sdk.exceptions import APIFootballError
+
+__all__: list[str] = ["OddsMovementTracker", "PriceSeries"]
+
+logger = logging.getLogger(__name__)
+
+SeriesKey = tuple[int, int, int, str]
+
+
+class PriceSeries:
+    """
+    Delta-encoded history of a single price.
+
+    Prices are stored as integer thousandths ("ticks") and times as whole
+    seconds. An absolute checkpoint is kept every `CHECKPOINT_EVERY` changes.
+    """
+
+    CHECKPOINT_EVERY: int = 32
+    SCALE: int = 1000
+
+    __slots__ = (
+        "_opened_at",
+        "_open",
+        "_last_at",
+        "_last",
+        "_dt",
+        "_dp",
+        "_checkpoint_at",
+        "_checkpoint_price",
+    )
+
+    def __init__(self, at: int, price: float) -> None:
+        ticks = round(price * self.SCALE)
+        self._opened_at = at
+        self._open = ticks
+        self._last_at = at
+        self._last = ticks
+        self._dt = array("I")
+        self._dp = array("i")
+        self._checkpoint_at = array("q", [at])
+        self._checkpoint_price = array("i", [ticks])
+
+    def __len__(self) -> int:
+        return len(self._dt) + 1
+
+    @property
+    def opened_at(self) -> int:
+        """Epoch seconds of the first observation."""
+        return self._opened_at
+
+    @property
+    def open(self) -> float:
+        """The first observed price."""
+        return self._open / self.SCALE
+
+    @property
+    def last(self) -> float:
+        """The most recent price."""
+        return self._last / self.SCALE
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the delta and checkpoint arrays, in bytes."""
+        return sum(
+            column.itemsize * len(column)
+            for column in (
+                self._dt,
+                self._dp,
+                self._checkpoint_at,
+                self._checkpoint_price,
+            )
+        )
+
+    def append(self, at: int, price: float) -> bool:
+        """
+        Record an observation, keeping it only if the price changed.
+
+        Observations older than the last change are clamped to its time.
+
+        :param at: Epoch seconds of the observation.
+        :param price: Decimal price.
+        :return: True if a change was stored.
+        """
+        ticks = round(price * self.SCALE)
+        if ticks == self._last:
+            return False
+
+        at = max(at, self._last_at)
+        self._dt.append(at - self._last_at)
+        self._dp.append(ticks - self._last)
+        self._last_at, self._last = at, ticks
+
+        if len(self._dt) % self.CHECKPOINT_EVERY == 0:
+            self._checkpoint_at.append(at)
+            self._checkpoint_price.append(ticks)
+        return True
+
+    def price_at(self, at: float) -> float | None:
+        """
+        Return the price in effect at a given time.
+
+        :param at: Epoch seconds.
+        :return: Decimal price, or None if `at` precedes the first observation.
+        """
+        if at < self._opened_at:
+            return None
+        if at >= self._last_at:
+            return self.last
+
+        checkpoint = bisect_right(self._checkpoint_at, at) - 1
+        when = self._checkpoint_at[checkpoint]
+        ticks = self._checkpoint_price[checkpoint]
+        index = checkpoint * self.CHECKPOINT_EVERY
+        while index < len(self._dt) and when + self._dt[index] <= at:
+            when += self._dt[index]
+            ticks += self._dp[index]
+            index += 1
+        return ticks / self.SCALE
+
+    def history(self) -> list[tuple[int, float]]:
+        """
+        Decode the full series.
+
+        :return: List of (epoch seconds, price) for every stored change.
+        """
+        when, ticks = self._opened_at, self._open
+        points = [(when, ticks / self.SCALE)]
+        for dt, dp in zip(self._dt, self._dp):
+            when += dt
+            ticks += dp
+            points.append((when, ticks / self.SCALE))
+        return points
+
+
+def _update_time(row: dict[str, Any]) -> int | None:
+    update = row.get("update")
+    if not update:
+        return None
+    try:
+        return int(datetime.fromisoformat(update).timestamp())
+    except ValueError:
+        return None
+
+
+class OddsMovementTracker:
+    """
+    Poll odds for a set of fixtures and keep their price movements.
+
+    Pre-match mode issues one `/odds` request per fixture per poll; live
+    mode issues a single `/odds/live` request per poll and keeps the rows
+    of tracked fixtures. Rows whose upstream `update` timestamp has not
+    changed since the previous poll are skipped without being flattened.
+    """
+
+    DEFAULT_INTERVAL: float = 60.0
+    DEFAULT_CONCURRENCY: int = 5
+
+    def __init__(
+        self,
+        fixture_ids: Iterable[int] = (),
+        *,
+        interval: float = DEFAULT_INTERVAL,
+        live: bool = False,
+        bookmaker_id: int | None = None,
+        bet_id: int | None = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> None:
+        self._fixture_ids: set[int] = set(fixture_ids)
+        self._interval = interval
+        self._live = live
+        self._bookmaker_id = bookmaker_id
+        self._bet_id = bet_id
+        self._concurrency = concurrency
+        self._series: dict[SeriesKey, PriceSeries] = {}
+        self._last_update: dict[int, int] = {}
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def fixture_ids(self) -> frozenset[int]:
+        """The fixtures currently tracked."""
+        return frozenset(self._fixture_ids)
+
+    def track(self, *fixture_ids: int) -> None:
+        """
+        Add fixtures to the polled set.
+
+        :param fixture_ids: Fixture IDs to track.
+        :return: None
+        """
+        self._fixture_ids.update(fixture_ids)
+
+    def untrack(self, *fixture_ids: int) -> None:
+        """
+        Stop polling fixtures; their recorded history is kept.
+
+        :param fixture_ids: Fixture IDs to stop tracking.
+        :return: None
+        """
+        self._fixture_ids.difference_update(fixture_ids)
+
+    def record(self, row: dict[str, Any], at: int | None = None) -> int:
+        """
+        Merge one odds response row into the tracked series.
+
+        :param row: A single element of an `/odds` or `/odds/live` response.
+        :param at: Observation time in epoch seconds; defaults to the row's
+            `update` timestamp, then to the current time.
+        :return: Number of price changes stored.
+        """
+        fixture_id = (row.get("fixture") or {}).get("id")
+        if fixture_id is None:
+            return 0
+
+        updated = _update_time(row)
+        if updated is not None:
+            if self._last_update.get(fixture_id) == updated:
+                return 0
+            self._last_update[fixture_id] = updated
+        when = at if at is not None else updated or int(time.time())
+
+        changes = 0
+        for bookmaker_id, market_id, outcome, price in iter_odds_prices(row):
+            if math.isnan(price):
+                continue
+            key = (fixture_id, bookmaker_id, market_id, outcome)
+            series = self._series.get(key)
+            if series is None:
+                self._series[key] = PriceSeries(when, price)
+                changes += 1
+            elif series.append(when, price):
+                changes += 1
+        return changes
+
+    async def poll_once(self) -> int:
+        """
+        Fetch the current odds of every tracked fixture once.
+
+        Failures for individual fixtures are logged and skipped.
+
+        :return: Number of price changes stored.
+        """
+        if not self._fixture_ids:
+            return 0
+
+        if self._live:
+            rows = await get_live_odds(bet_id=self._bet_id)
+            return sum(
+                self.record(row)
+                for row in rows
+                if (row.get("fixture") or {}).get("id") in self._fixture_ids
+            )
+
+        semaphore = asyncio.Semaphore(self._concurrency)
+
+        async def fetch(fixture_id: int) -> dict[str, Any]:
+            async with semaphore:
+                return await get_odds_by_fixture(
+                    fixture_id,
+                    bookmaker_id=self._bookmaker_id,
+                    bet_id=self._bet_id,
+                )
+
+        results = await asyncio.gather(
+            *(fetch(fixture_id) for fixture_id in self._fixture_ids),
+            return_exceptions=True,
+        )
+        changes = 0
+        for result in results:
+            if isinstance(result, APIFootballError):
+                logger.warning("Odds poll failed: %s", result)
+            elif isinstance(result, BaseException):
+                raise result
+            elif result:
+                changes += self.record(result)
+        return changes
+
+    async def run(self) -> None:
+        """
+        Poll every `interval` seconds until cancelled.
+
+        :return: None
+        """
+        while True:
+            started = time.monotonic()
+            try:
+                await self.poll_once()
+            except APIFootballError as exc:
+                logger.warning("Odds poll failed: %s", exc)
+            elapsed = time.monotonic() - started
+            await asyncio.sleep(max(0.0, self._interval - elapsed))
+
+    def start(self) -> asyncio.Task[None]:
+        """
+        Start polling in a background task.
+
+        :return: The polling task.
+        """
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+        return self._task
+
+    async def stop(self) -> None:
+        """
+        Stop the background polling task, if running.
+
+        :return: None
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def series(
+        self,
+        fixture_id: int,
+        bookmaker_id: int,
+        market_id: int,
+        outcome: str,
+    ) -> PriceSeries | None:
+        """
+        Return the series of a single price.
+
+        :param fixture_id: The ID of the fixture.
+        :param bookmaker_id: The ID of the bookmaker.
+        :param market_id: The ID of the bet (market).
+        :param outcome: Outcome label (e.g., "Home", "Over 2.5").
+        :return: The series, or None if never observed.
+        """
+        return self._series.get((fixture_id, bookmaker_id, market_id, outcome))
+
+    def price_at(
+        self,
+        fixture_id: int,
+        bookmaker_id: int,
+        market_id: int,
+        outcome: str,
+        at: float,
+    ) -> float | None:
+        """
+        Return the price in effect at a given time.
+
+        :param fixture_id: The ID of the fixture.
+        :param bookmaker_id: The ID of the bookmaker.
+        :param market_id: The ID of the bet (market).
+        :param outcome: Outcome label.
+        :param at: Epoch seconds.
+        :return: Decimal price, or None if unknown at that time.
+        """
+        series = self.series(fixture_id, bookmaker_id, market_id, outcome)
+        return series.price_at(at) if series is not None else None
+
+    def movement(
+        self,
+        fixture_id: int,
+        bookmaker_id: int,
+        market_id: int,
+        outcome: str,
+    ) -> tuple[float, float] | None:
+        """
+        Return the opening and current price.
+
+        :param fixture_id: The ID of the fixture.
+        :param bookmaker_id: The ID of the bookmaker.
+        :param market_id: The ID of the bet (market).
+        :param outcome: Outcome label.
+        :return: (opening price, current price), or None if never observed.
+        """
+        series = self.series(fixture_id, bookmaker_id, market_id, outcome)
+        return (series.open, series.last) if series is not None else None
+
+    def movements(self, fixture_id: int) -> dict[SeriesKey, tuple[float, float]]:
+        """
+        Return the opening and current price of every series of a fixture.
+
+        :param fixture_id: The ID of the fixture.
+        :return: (opening price, current price) keyed by series key.
+        """
+        return {
+            key: (series.open, series.last)
+            for key, series in self._series.items()
+            if key[0] == fixture_id
+        }
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by all series arrays, in bytes."""
+        return sum(series.nbytes for series in self._series.values())
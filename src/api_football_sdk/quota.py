@@ -0,0 +1,450 @@
+"""
+Daily request quota tracking and budgeting for long-running jobs.
+
+RapidAPI plans allow a fixed number of requests per day and report the
+allowance and what is left of it in the `x-ratelimit-requests-limit` and
+`x-ratelimit-requests-remaining` response headers. `QuotaTracker` reads
+those headers on every response, counts the calls made by each job, and
+persists the day's usage to a JSON file so restarts do not lose track.
+
+Jobs register a share of the daily allowance. Requests made inside
+`quota_job(name)` are charged to that job and refused once its share is
+spent, and `plan` estimates whether a bulk operation fits before it
+starts, refusing it or pacing it until the daily reset.
+
+Usage example:
+--------------
+    from api_football_sdk.client import get_client
+    from api_football_sdk.quota import estimate_calls, quota_job
+
+    quota = get_client().quota
+    quota.register_job("backfill", share=0.4)
+    plan = quota.plan(estimate_calls(380, per_item=3), job="backfill")
+    with quota_job("backfill"):
+        for fixture_id in fixture_ids:
+            await plan.pace()
+            ...
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import math
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterator, Literal, Mapping
+
+from api_football_sdk.exceptions import QuotaExceededError
+
+__all__: list[str] = [
+    "LIMIT_HEADER",
+    "REMAINING_HEADER",
+    "QuotaPlan",
+    "QuotaTracker",
+    "current_job",
+    "estimate_calls",
+    "quota_job",
+]
+
+logger = logging.getLogger(__name__)
+
+LIMIT_HEADER: str = "x-ratelimit-requests-limit"
+"""Response header carrying the daily request allowance."""
+
+REMAINING_HEADER: str = "x-ratelimit-requests-remaining"
+"""Response header carrying the requests left for the day."""
+
+_job: ContextVar[str | None] = ContextVar("api_football_quota_job", default=None)
+
+
+def current_job() -> str | None:
+    """
+    Return the job declared by the innermost `quota_job` block.
+
+    :return: The job name, or None outside any job.
+    """
+    return _job.get()
+
+
+@contextmanager
+def quota_job(name: str) -> Iterator[str]:
+    """
+    Charge every request made inside the block to a job's budget.
+
+    The job follows the context into tasks created inside the block.
+
+    :param name: Name of a job registered with `QuotaTracker.register_job`.
+    :return: Context manager yielding the job name.
+    """
+    token = _job.set(name)
+    try:
+        yield name
+    finally:
+        _job.reset(token)
+
+
+def estimate_calls(items: int, *, per_item: int = 1, batch_size: int = 1) -> int:
+    """
+    Estimate the requests needed to fetch data for a number of items.
+
+    :param items: Number of items (e.g., fixtures of a season).
+    :param per_item: Requests per item or batch (e.g., events, lineups,
+        and statistics make 3).
+    :param batch_size: Items fetched per request (e.g., 20 for `ids=`).
+    :return: The number of requests.
+    """
+    return math.ceil(items / batch_size) * per_item
+
+
+def _today() -> str:
+    # The API Football allowance resets at midnight UTC.
+    return datetime.now(timezone.utc).date().isoformat()
+
+
+def _seconds_until_reset() -> float:
+    now = datetime.now(timezone.utc)
+    midnight = datetime.combine(
+        now.date() + timedelta(days=1), datetime.min.time(), timezone.utc
+    )
+    return (midnight - now).total_seconds()
+
+
+class QuotaPlan:
+    """
+    Admission of a bulk operation by `QuotaTracker.plan`.
+
+    `calls` requests were reserved against the daily allowance; `interval`
+    is the pause `pace` inserts between them (zero unless throttled).
+    Reserved calls still unused are returned by `release`.
+    """
+
+    def __init__(
+        self, tracker: QuotaTracker, calls: int, interval: float, job: str | None
+    ) -> None:
+        self.calls = calls
+        self.interval = interval
+        self.job = job
+        self._tracker = tracker
+        self._next = 0.0
+
+    async def pace(self) -> None:
+        """
+        Wait until the next call of the operation may be sent.
+
+        :return: None
+        """
+        delay = self._next - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        self._next = max(self._next, time.monotonic()) + self.interval
+
+    def release(self) -> None:
+        """
+        Return the reservation to the tracker.
+
+        :return: None
+        """
+        self._tracker._release(self)
+
+
+class QuotaTracker:
+    """
+    Tracks the day's request usage overall and per job.
+
+    The allowance and remaining count come from the quota headers; until a
+    response has been seen, `daily_limit` (when given) is used instead.
+    `reserve` requests are kept free for calls outside any job, so bulk
+    jobs cannot leave live traffic without quota.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str] | None = None,
+        *,
+        daily_limit: int | None = None,
+        reserve: int = 0,
+        save_every: int = 20,
+    ) -> None:
+        self._path = path
+        self._reserve = reserve
+        self._save_every = save_every
+        self._unsaved = 0
+        self._day = _today()
+        self._limit = daily_limit
+        self._remaining: int | None = None
+        self._used = 0
+        self._shares: dict[str, float] = {}
+        self._job_used: dict[str, int] = {}
+        self._reserved: dict[QuotaPlan, int] = {}
+        self._load()
+
+    # ------------------------------------------------------------- state
+
+    def _load(self) -> None:
+        if self._path is None or not os.path.exists(self._path):
+            return
+        try:
+            with open(self._path, encoding="utf-8") as fh:
+                state = json.load(fh)
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable quota file %s: %s", self._path, exc)
+            return
+        self._limit = state.get("limit", self._limit)
+        if state.get("day") == self._day:
+            self._remaining = state.get("remaining")
+            self._used = state.get("used", 0)
+            self._job_used = dict(state.get("jobs", {}))
+
+    def save(self) -> None:
+        """
+        Write the day's usage to the quota file, if one was given.
+
+        :return: None
+        """
+        self._unsaved = 0
+        if self._path is None:
+            return
+        state = {
+            "day": self._day,
+            "limit": self._limit,
+            "remaining": self._remaining,
+            "used": self._used,
+            "jobs": self._job_used,
+        }
+        tmp_path = f"{os.fspath(self._path)}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as fh:
+            json.dump(state, fh)
+        os.replace(tmp_path, self._path)
+
+    def _roll_over(self) -> None:
+        today = _today()
+        if today != self._day:
+            self._day = today
+            self._remaining = None
+            self._used = 0
+            self._job_used.clear()
+
+    # ------------------------------------------------------------- figures
+
+    @property
+    def limit(self) -> int | None:
+        """
+        Daily request allowance, or None while unknown.
+
+        :return: The allowance.
+        """
+        return self._limit
+
+    @property
+    def used(self) -> int:
+        """
+        Requests sent today by this process (and earlier runs sharing the file).
+
+        :return: The request count.
+        """
+        self._roll_over()
+        return self._used
+
+    @property
+    def remaining(self) -> int | None:
+        """
+        Requests left today, or None while the allowance is unknown.
+
+        The last header value is authoritative, as other clients may share
+        the same key.
+
+        :return: The remaining count.
+        """
+        self._roll_over()
+        if self._remaining is not None:
+            return self._remaining
+        if self._limit is None:
+            return None
+        return max(self._limit - self._used, 0)
+
+    def register_job(self, name: str, share: float) -> None:
+        """
+        Give a job a share of the daily allowance.
+
+        :param name: Job name used with `quota_job`.
+        :param share: Fraction of the daily allowance, in (0, 1].
+        :return: None
+        :raises ValueError: If the share is out of range or the shares of all
+            jobs would exceed the whole allowance.
+        """
+        if not 0 < share <= 1:
+            raise ValueError("share must be in (0, 1]")
+        others = sum(value for job, value in self._shares.items() if job != name)
+        if others + share > 1 + 1e-9:
+            raise ValueError(
+                f"job shares would exceed the allowance ({others + share:.2f})"
+            )
+        self._shares[name] = share
+        self._job_used.setdefault(name, 0)
+
+    def job_remaining(self, name: str) -> int | None:
+        """
+        Requests a job may still send today.
+
+        :param name: A registered job.
+        :return: The job's remaining budget, or None while the allowance is unknown.
+        """
+        self._roll_over()
+        if name not in self._shares:
+            raise KeyError(f"Unknown quota job {name!r}")
+        if self._limit is None:
+            return None
+        allowance = int(self._limit * self._shares[name])
+        return max(allowance - self._job_used.get(name, 0), 0)
+
+    def available(self, job: str | None = None) -> int | None:
+        """
+        Requests that may be started now without breaking any budget.
+
+        Counts the day's remaining allowance, minus open plan reservations
+        and, for jobs, the reserve kept for calls outside jobs.
+
+        :param job: Job to check the share of; None for unbudgeted calls.
+        :return: The available count, or None while the allowance is unknown.
+        """
+        remaining = self.remaining
+        if remaining is None:
+            return None
+        available = remaining - sum(self._reserved.values())
+        if job is not None:
+            available -= self._reserve
+            job_remaining = self.job_remaining(job)
+            if job_remaining is not None:
+                reserved = sum(
+                    n for plan, n in self._reserved.items() if plan.job == job
+                )
+                available = min(available, job_remaining - reserved)
+        return max(available, 0)
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Summary of the day's usage.
+
+        :return: Limit, used, remaining, and per-job usage.
+        """
+        return {
+            "day": self._day,
+            "limit": self.limit,
+            "used": self.used,
+            "remaining": self.remaining,
+            "jobs": {
+                name: {"share": share, "used": self._job_used.get(name, 0)}
+                for name, share in self._shares.items()
+            },
+        }
+
+    # ------------------------------------------------------------- client hooks
+
+    def check(self) -> None:
+        """
+        Refuse a request that the current job may no longer send.
+
+        Called by the client before each request. Calls covered by an open
+        plan of the job are let through while the plan has reserved calls
+        left; once it runs over its estimate, the job's share applies again.
+
+        :return: None
+        :raises QuotaExceededError: If the job's share or the day's
+            allowance is spent.
+        """
+        job = current_job()
+        remaining = self.remaining
+        if remaining is not None and remaining <= 0:
+            raise QuotaExceededError(f"Daily quota of {self._limit} requests exhausted")
+        if job is None or job not in self._shares:
+            return
+        if any(plan.job == job and n > 0 for plan, n in self._reserved.items()):
+            return
+        if self.job_remaining(job) == 0:
+            raise QuotaExceededError(f"Quota share of job {job!r} exhausted for today")
+
+    def observe(self, headers: Mapping[str, str]) -> None:
+        """
+        Count a request that reached the API and read its quota headers.
+
+        :param headers: Response headers.
+        :return: None
+        """
+        self._roll_over()
+        self._used += 1
+        job = current_job()
+        if job is not None:
+            self._job_used[job] = self._job_used.get(job, 0) + 1
+        for plan, reserved in self._reserved.items():
+            if plan.job == job and reserved:
+                self._reserved[plan] -= 1
+                break
+
+        limit = headers.get(LIMIT_HEADER)
+        remaining = headers.get(REMAINING_HEADER)
+        if limit is not None and limit.isdigit():
+            self._limit = int(limit)
+        if remaining is not None and remaining.isdigit():
+            self._remaining = int(remaining)
+        elif self._remaining is not None:
+            self._remaining = max(self._remaining - 1, 0)
+
+        self._unsaved += 1
+        if self._unsaved >= self._save_every:
+            self.save()
+
+    # ------------------------------------------------------------- planning
+
+    def plan(
+        self,
+        calls: int,
+        *,
+        job: str | None = None,
+        policy: Literal["refuse", "throttle"] = "refuse",
+    ) -> QuotaPlan:
+        """
+        Admit a bulk operation of an estimated number of calls.
+
+        With the "refuse" policy the operation must fit in what is available
+        today, and its calls are reserved so concurrent jobs cannot take
+        them. With "throttle", calls are paced so that what is available is
+        spread until the daily reset; the operation then spans several days
+        when it does not fit, and the job's share still caps each day.
+
+        :param calls: Estimated number of requests (see `estimate_calls`).
+        :param job: Job the calls are charged to.
+        :param policy: "refuse" or "throttle".
+        :return: The admitted plan; call `pace` before every request.
+        :raises QuotaExceededError: If refused, or nothing is available.
+        """
+        if job is not None and job not in self._shares:
+            raise KeyError(f"Unknown quota job {job!r}")
+        available = self.available(job)
+        if available is None:
+            # Allowance unknown until the first response; admit unpaced.
+            return QuotaPlan(self, calls, 0.0, job)
+
+        if policy == "refuse":
+            if calls > available:
+                raise QuotaExceededError(
+                    f"Operation needs {calls} requests but only {available} "
+                    f"are available today{f' to job {job!r}' if job else ''}"
+                )
+            plan = QuotaPlan(self, calls, 0.0, job)
+            self._reserved[plan] = calls
+            return plan
+
+        if available == 0:
+            raise QuotaExceededError(
+                f"No requests available today{f' to job {job!r}' if job else ''}"
+            )
+        interval = 0.0 if calls <= available else _seconds_until_reset() / available
+        return QuotaPlan(self, calls, interval, job)
+
+    def _release(self, plan: QuotaPlan) -> None:
+        self._reserved.pop(plan, None)
@@ -0,0 +1,508 @@
+"""
+Incremental rolling features of teams and players.
+
+`RollingFeatureStore` consumes finished fixtures, once each, and updates
+per-team and per-player state in constant time per fixture: a ring buffer
+of the last `window` values of every metric with running sums for the
+means, and an exponentially weighted mean. Teams keep separate state for
+all matches and for home and away matches.
+
+Fixtures with embedded `statistics` and `players` (as returned by
+`/fixtures?ids=`) also feed the statistic and player metrics; plain
+`/fixtures` rows feed goals and points only. `update_date` fetches a
+matchday and hydrates its finished fixtures 20 per request.
+
+The state is saved as float32 arrays behind a small JSON header, so a
+prediction run loads it, consumes the new matchday, and saves it again
+without revisiting older fixtures.
+
+Usage example:
+--------------
+    from api_football_sdk.rolling_features import RollingFeatureStore
+
+    store = RollingFeatureStore.load("features.afrf")  # or RollingFeatureStore()
+    await store.update_date("2024-08-17")
+    store.save("features.afrf")
+    print(store.team_features(33, split="home"))
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import math
+import os
+import struct
+import sys
+from array import array
+from typing import Any, Iterable, Mapping, Sequence
+
+from api_football_sdk.client import ApiFootballClient, get_client
+from api_football_sdk.exceptions import ParsingError
+from api_football_sdk.feature_matrix import (
+    FINISHED_STATUSES,
+    STAT_COLUMNS,
+    parse_stat_value,
+)
+
+__all__: list[str] = [
+    "PLAYER_METRICS",
+    "TEAM_METRICS",
+    "RollingFeatureStore",
+    "RollingWindow",
+]
+
+TEAM_METRICS: tuple[str, ...] = (
+    "goals_for",
+    "goals_against",
+    "points",
+    *STAT_COLUMNS.values(),
+)
+"""Metrics tracked per team; statistic metrics need embedded statistics."""
+
+PLAYER_METRICS: Mapping[str, tuple[str, str]] = {
+    "minutes": ("games", "minutes"),
+    "rating": ("games", "rating"),
+    "goals": ("goals", "total"),
+    "assists": ("goals", "assists"),
+    "shots": ("shots", "total"),
+    "shots_on": ("shots", "on"),
+    "passes": ("passes", "total"),
+    "key_passes": ("passes", "key"),
+    "tackles": ("tackles", "total"),
+    "duels_won": ("duels", "won"),
+}
+"""Metrics tracked per player, and their (group, field) in fixture players."""
+
+TEAM_SPLITS: tuple[str, ...] = ("all", "home", "away")
+"""Team state kept for all matches, home matches, and away matches."""
+
+_IDS_PER_REQUEST = 20
+_MAGIC = b"AFRF"
+_NAN = math.nan
+
+
+class RollingWindow:
+    """
+    Last-N means and exponentially weighted means of a metric vector.
+
+    NaN values are missing: they occupy a window slot but do not count
+    towards the mean, and leave the weighted mean unchanged.
+
+    :param metrics: Number of metrics per update.
+    :param window: Number of updates the means cover.
+    :param alpha: Weight of the newest value in the weighted means.
+    """
+
+    __slots__ = (
+        "_width",
+        "_window",
+        "_alpha",
+        "_ring",
+        "_sums",
+        "_counts",
+        "_ewma",
+        "_head",
+        "updates",
+    )
+
+    def __init__(self, metrics: int, window: int, alpha: float) -> None:
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha must be in (0, 1]")
+        self._width = metrics
+        self._window = window
+        self._alpha = alpha
+        self._ring = array("f", [_NAN]) * (window * metrics)
+        self._sums = [0.0] * metrics
+        self._counts = [0] * metrics
+        self._ewma = array("f", [_NAN]) * metrics
+        self._head = 0
+        self.updates = 0
+
+    def push(self, values: Sequence[float]) -> None:
+        """
+        Add one update, evicting the oldest once the window is full.
+
+        :param values: One value per metric, NaN where missing.
+        :return: None
+        """
+        ring, sums, counts, ewma = self._ring, self._sums, self._counts, self._ewma
+        alpha = self._alpha
+        base = self._head * self._width
+        for index, value in enumerate(values):
+            slot = base + index
+            old = ring[slot]
+            if not math.isnan(old):
+                sums[index] -= old
+                counts[index] -= 1
+            ring[slot] = value
+            if not math.isnan(value):
+                # Add the stored float32 value, which is what eviction subtracts.
+                value = ring[slot]
+                sums[index] += value
+                counts[index] += 1
+                previous = ewma[index]
+                ewma[index] = (
+                    value
+                    if math.isnan(previous)
+                    else previous + alpha * (value - previous)
+                )
+        self._head = (self._head + 1) % self._window
+        self.updates += 1
+
+    def means(self) -> list[float]:
+        """
+        Mean of every metric over the window.
+
+        :return: One mean per metric, NaN where no value was seen.
+        """
+        return [
+            total / count if count else _NAN
+            for total, count in zip(self._sums, self._counts)
+        ]
+
+    def ewma(self) -> list[float]:
+        """
+        Exponentially weighted mean of every metric.
+
+        :return: One value per metric, NaN where no value was seen.
+        """
+        return self._ewma.tolist()
+
+    def _state(self) -> tuple[dict[str, int], bytes]:
+        return (
+            {"head": self._head, "updates": self.updates},
+            self._ring.tobytes() + self._ewma.tobytes(),
+        )
+
+    def _restore(self, meta: Mapping[str, int], ring: array, ewma: array) -> None:
+        self._ring = ring
+        self._ewma = ewma
+        self._head = meta["head"]
+        self.updates = meta["updates"]
+        # Running sums are derived rather than stored.
+        for index in range(self._width):
+            values = [v for v in ring[index :: self._width] if not math.isnan(v)]
+            self._sums[index] = math.fsum(values)
+            self._counts[index] = len(values)
+
+
+def _points(goals_for: float, goals_against: float) -> float:
+    if math.isnan(goals_for) or math.isnan(goals_against):
+        return _NAN
+    if goals_for > goals_against:
+        return 3.0
+    return 1.0 if goals_for == goals_against else 0.0
+
+
+class RollingFeatureStore:
+    """
+    Rolling team and player features updated fixture by fixture.
+
+    Fixtures must be consumed in kickoff order for the windows to hold the
+    latest matches; `add_fixtures` sorts each batch. Fixtures already
+    consumed and fixtures not finished are skipped.
+
+    :param window: Matches covered by the last-N means.
+    :param alpha: Weight of the newest match in the weighted means.
+    :param client: Client used by `update_date`; defaults to the shared one.
+    """
+
+    def __init__(
+        self,
+        *,
+        window: int = 5,
+        alpha: float = 0.3,
+        client: ApiFootballClient | None = None,
+    ) -> None:
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha must be in (0, 1]")
+        self.window = window
+        self.alpha = alpha
+        self._client = client
+        self._teams: dict[tuple[int, str], RollingWindow] = {}
+        self._players: dict[int, RollingWindow] = {}
+        self._seen: set[int] = set()
+
+    def __contains__(self, fixture_id: object) -> bool:
+        return fixture_id in self._seen
+
+    # ------------------------------------------------------------- updates
+
+    def add_fixture(self, fixture: Mapping[str, Any]) -> bool:
+        """
+        Consume one fixture row.
+
+        :param fixture: A `/fixtures` row, with `statistics` and `players`
+            embedded when available.
+        :return: True if the fixture was consumed, False if it was skipped.
+        """
+        info = fixture.get("fixture") or {}
+        fixture_id = info.get("id")
+        status = (info.get("status") or {}).get("short")
+        if fixture_id is None or fixture_id in self._seen:
+            return False
+        if status not in FINISHED_STATUSES:
+            return False
+        teams = fixture.get("teams") or {}
+        goals = fixture.get("goals") or {}
+        home_id = (teams.get("home") or {}).get("id")
+        away_id = (teams.get("away") or {}).get("id")
+        if home_id is None or away_id is None:
+            return False
+
+        home_goals = parse_stat_value(goals.get("home"))
+        away_goals = parse_stat_value(goals.get("away"))
+        stats = self._team_statistics(fixture, home_id)
+        for team_id, side, scored, conceded in (
+            (home_id, "home", home_goals, away_goals),
+            (away_id, "away", away_goals, home_goals),
+        ):
+            values = [scored, conceded, _points(scored, conceded), *stats[side]]
+            for split in ("all", side):
+                self._team(team_id, split).push(values)
+
+        for block in fixture.get("players") or ():
+            for entry in block.get("players") or ():
+                self._add_player(entry)
+        self._seen.add(fixture_id)
+        return True
+
+    def add_fixtures(self, fixtures: Iterable[Mapping[str, Any]]) -> int:
+        """
+        Consume a batch of fixture rows in kickoff order.
+
+        :param fixtures: `/fixtures` rows.
+        :return: Number of fixtures consumed.
+        """
+        ordered = sorted(
+            fixtures,
+            key=lambda row: (
+                (row.get("fixture") or {}).get("timestamp") or 0,
+                (row.get("fixture") or {}).get("id") or 0,
+            ),
+        )
+        return sum(self.add_fixture(row) for row in ordered)
+
+    async def update_date(self, date: str) -> int:
+        """
+        Consume the finished fixtures of one day not consumed yet.
+
+        The day is listed with one request; its new finished fixtures are
+        then fetched with statistics and players, 20 per request.
+
+        :param date: Date in YYYY-MM-DD format.
+        :return: Number of fixtures consumed.
+        """
+        client = self._client or get_client()
+        payload = await client.get_json("/fixtures", params={"date": date})
+        ids = [
+            row["fixture"]["id"]
+            for row in payload.get("response", [])
+            if row["fixture"]["id"] not in self._seen
+            and (row["fixture"].get("status") or {}).get("short") in FINISHED_STATUSES
+        ]
+        pages = await asyncio.gather(
+            *(
+                client.get_json(
+                    "/fixtures",
+                    params={"ids": "-".join(map(str, ids[i : i + _IDS_PER_REQUEST]))},
+                )
+                for i in range(0, len(ids), _IDS_PER_REQUEST)
+            )
+        )
+        return self.add_fixtures(row for page in pages for row in page["response"])
+
+    def _team(self, team_id: int, split: str) -> RollingWindow:
+        key = (team_id, split)
+        state = self._teams.get(key)
+        if state is None:
+            state = self._teams[key] = RollingWindow(
+                len(TEAM_METRICS), self.window, self.alpha
+            )
+        return state
+
+    @staticmethod
+    def _team_statistics(
+        fixture: Mapping[str, Any], home_id: int
+    ) -> dict[str, list[float]]:
+        offsets = {stat: i for i, stat in enumerate(STAT_COLUMNS)}
+        stats = {side: [_NAN] * len(offsets) for side in ("home", "away")}
+        for team_stats in fixture.get("statistics") or ():
+            team_id = (team_stats.get("team") or {}).get("id")
+            values = stats["home" if team_id == home_id else "away"]
+            for entry in team_stats.get("statistics") or ():
+                offset = offsets.get(entry.get("type"))
+                if offset is not None:
+                    values[offset] = parse_stat_value(entry.get("value"))
+        return stats
+
+    def _add_player(self, entry: Mapping[str, Any]) -> None:
+        player_id = (entry.get("player") or {}).get("id")
+        statistics = entry.get("statistics") or ()
+        if player_id is None or not statistics:
+            return
+        stat = statistics[0]
+        values = [
+            parse_stat_value((stat.get(group) or {}).get(field))
+            for group, field in PLAYER_METRICS.values()
+        ]
+        if not values[0] > 0:
+            return  # unused substitute
+        state = self._players.get(player_id)
+        if state is None:
+            state = self._players[player_id] = RollingWindow(
+                len(PLAYER_METRICS), self.window, self.alpha
+            )
+        state.push(values)
+
+    # ------------------------------------------------------------- queries
+
+    @staticmethod
+    def _features(state: RollingWindow, metrics: Iterable[str]) -> dict[str, float]:
+        features: dict[str, float] = {"matches": float(state.updates)}
+        for metric, mean, ewma in zip(metrics, state.means(), state.ewma()):
+            features[f"{metric}_mean"] = mean
+            features[f"{metric}_ewm"] = ewma
+        return features
+
+    def team_features(
+        self, team_id: int, split: str = "all"
+    ) -> dict[str, float] | None:
+        """
+        Rolling features of a team.
+
+        :param team_id: The ID of the team.
+        :param split: "all", "home", or "away".
+        :return: `matches` plus `<metric>_mean` and `<metric>_ewm` for every
+            metric of `TEAM_METRICS`, or None if the team has no match.
+        """
+        if split not in TEAM_SPLITS:
+            raise ValueError(f"split must be one of {TEAM_SPLITS}")
+        state = self._teams.get((team_id, split))
+        return None if state is None else self._features(state, TEAM_METRICS)
+
+    def player_features(self, player_id: int) -> dict[str, float] | None:
+        """
+        Rolling features of a player, over the matches they played.
+
+        :param player_id: The ID of the player.
+        :return: `matches` plus `<metric>_mean` and `<metric>_ewm` for every
+            metric of `PLAYER_METRICS`, or None if the player has no match.
+        """
+        state = self._players.get(player_id)
+        return None if state is None else self._features(state, PLAYER_METRICS)
+
+    def stats(self) -> dict[str, int]:
+        """
+        Size of the store.
+
+        :return: Fixtures consumed, teams, and players.
+        """
+        return {
+            "fixtures": len(self._seen),
+            "teams": len({team_id for team_id, _ in self._teams}),
+            "players": len(self._players),
+        }
+
+    # ------------------------------------------------------------- persistence
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        """
+        Write the state to a binary file, atomically.
+
+        :param path: Destination file.
+        :return: None
+        """
+        entries: list[list[Any]] = []
+        blobs: list[bytes] = []
+        for kind, states in (
+            ("team", self._teams.items()),
+            ("player", self._players.items()),
+        ):
+            for key, state in states:
+                meta, blob = state._state()
+                entries.append([kind, key, meta["head"], meta["updates"]])
+                blobs.append(blob)
+        header = json.dumps(
+            {
+                "window": self.window,
+                "alpha": self.alpha,
+                "team_metrics": TEAM_METRICS,
+                "player_metrics": list(PLAYER_METRICS),
+                "fixtures": len(self._seen),
+                "entries": entries,
+                "byteorder": sys.byteorder,
+            },
+            separators=(",", ":"),
+        ).encode()
+        tmp = f"{os.fspath(path)}.tmp"
+        with open(tmp, "wb") as fh:
+            fh.write(_MAGIC + struct.pack("<I", len(header)) + header)
+            fh.write(array("q", sorted(self._seen)).tobytes())
+            for blob in blobs:
+                fh.write(blob)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(
+        cls, path: str | os.PathLike[str], *, client: ApiFootballClient | None = None
+    ) -> RollingFeatureStore:
+        """
+        Read a state written by `save`.
+
+        :param path: Source file.
+        :param client: Client used by `update_date`.
+        :return: The store.
+        :raises ParsingError: If the file is not a saved state, or was saved
+            with other metrics.
+        """
+        with open(path, "rb") as fh:
+            data = fh.read()
+        try:
+            if data[:4] != _MAGIC:
+                raise ValueError("bad magic")
+            (size,) = struct.unpack_from("<I", data, 4)
+            header = json.loads(data[8 : 8 + size])
+            if header["team_metrics"] != list(TEAM_METRICS) or header[
+                "player_metrics"
+            ] != list(PLAYER_METRICS):
+                raise ValueError("saved with other metrics")
+            store = cls(window=header["window"], alpha=header["alpha"], client=client)
+            swap = header["byteorder"] != sys.byteorder
+            offset = 8 + size
+            seen = _read_array("q", data, offset, header["fixtures"], swap)
+            store._seen = set(seen)
+            offset += seen.itemsize * len(seen)
+            for kind, key, head, updates in header["entries"]:
+                width = len(TEAM_METRICS if kind == "team" else PLAYER_METRICS)
+                ring = _read_array("f", data, offset, store.window * width, swap)
+                offset += 4 * len(ring)
+                ewma = _read_array("f", data, offset, width, swap)
+                offset += 4 * width
+                state = RollingWindow(width, store.window, store.alpha)
+                state._restore({"head": head, "updates": updates}, ring, ewma)
+                if kind == "team":
+                    store._teams[(key[0], key[1])] = state
+                else:
+                    store._players[key] = state
+            return store
+        except (ValueError, KeyError, TypeError, struct.error) as exc:
+            raise ParsingError(f"Invalid rolling feature file {path}: {exc}") from None
+
+
+def _read_array(
+    typecode: str, data: bytes, offset: int, length: int, swap: bool
+) -> array:
+    values = array(typecode)
+    end = offset + values.itemsize * length
+    if end > len(data):
+        raise ValueError("truncated file")
+    values.frombytes(data[offset:end])
+    if swap:
+        values.byteswap()
+    return values
@@ -0,0 +1,297 @@
+"""
+Priority-aware request scheduling for the API Football client.
+
+`RequestScheduler` decides which queued request is sent next. Requests
+belong to one of three priority classes (live, interactive, background);
+free slots are shared between backlogged classes in proportion to their
+weights, and an optional token bucket enforces the plan's rate limit. When
+tokens run short, lower classes must leave a reserve of tokens untouched,
+so background work is starved first and live traffic last.
+
+The priority of a request is taken from the `request_priority` context, so
+any endpoint function can be called at a given priority without changing
+its signature.
+
+Usage example:
+--------------
+    from api_football_sdk.endpoints.fixtures import get_fixtures_by_league
+    from api_football_sdk.scheduler import Priority, request_priority
+
+    with request_priority(Priority.BACKGROUND):
+        await get_fixtures_by_league(league_id=39, season=2024)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import AsyncIterator, Iterator, Mapping
+
+__all__: list[str] = [
+    "Priority",
+    "RequestScheduler",
+    "current_priority",
+    "request_priority",
+]
+
+
+class Priority(IntEnum):
+    """
+    Request priority classes, most urgent first.
+    """
+
+    LIVE = 0
+    INTERACTIVE = 1
+    BACKGROUND = 2
+
+
+DEFAULT_WEIGHTS: Mapping[Priority, float] = {
+    Priority.LIVE: 16.0,
+    Priority.INTERACTIVE: 4.0,
+    Priority.BACKGROUND: 1.0,
+}
+"""Share of free slots each backlogged class receives."""
+
+DEFAULT_RESERVES: Mapping[Priority, float] = {
+    Priority.LIVE: 0.0,
+    Priority.INTERACTIVE: 0.2,
+    Priority.BACKGROUND: 0.5,
+}
+"""Fraction of the token bucket a class must leave for more urgent ones."""
+
+_priority: ContextVar[Priority | None] = ContextVar(
+    "api_football_request_priority", default=None
+)
+
+
+def current_priority(default: Priority = Priority.INTERACTIVE) -> Priority:
+    """
+    Return the priority declared by the innermost `request_priority` block.
+
+    :param default: Priority used when none was declared.
+    :return: The active priority.
+    """
+    priority = _priority.get()
+    return default if priority is None else priority
+
+
+@contextmanager
+def request_priority(priority: Priority | str) -> Iterator[Priority]:
+    """
+    Send every request made inside the block at the given priority.
+
+    The priority follows the context into tasks created inside the block.
+
+    :param priority: A `Priority` or its name (e.g., "background").
+    :return: Context manager yielding the effective priority.
+    """
+    if isinstance(priority, str):
+        priority = Priority[priority.upper()]
+    token = _priority.set(priority)
+    try:
+        yield priority
+    finally:
+        _priority.reset(token)
+
+
+def _default_capacity(rate: float | None, reserves: Mapping[Priority, float]) -> float:
+    # A class needs `1 + reserve * capacity` tokens, which a bucket of
+    # `1 / (1 - reserve)` tokens or more can hold.
+    reserve = max(reserves.values())
+    floor = 1.0 / (1.0 - reserve) if reserve < 1.0 else 1.0
+    return max(1.0, rate or 1.0, floor)
+
+
+class RequestScheduler:
+    """
+    Grants request slots by priority class under a concurrency and rate limit.
+
+    Backlogged classes are served by stride scheduling: each grant advances
+    the class's virtual time by `1 / weight`, and the class with the
+    smallest virtual time goes next. With the default weights, live
+    requests get 16 slots for every background one when both are queued,
+    yet background work is never starved outright while tokens are ample.
+
+    With a `rate`, every request also takes a token from a bucket of
+    `burst` tokens refilled at `rate` per second. A class may only take a
+    token while more than `reserve * burst` tokens are left, so when the
+    budget runs short background waits first and live traffic is the last
+    to be delayed. The default `burst` is large enough for every class to
+    take a token from a full bucket, however low the rate.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrency: int = 10,
+        rate: float | None = None,
+        burst: float | None = None,
+        weights: Mapping[Priority, float] | None = None,
+        reserves: Mapping[Priority, float] | None = None,
+    ) -> None:
+        self._max_concurrency = max_concurrency
+        self._active = 0
+        self._rate = rate
+        self._weights = {**DEFAULT_WEIGHTS, **(weights or {})}
+        self._reserves = {**DEFAULT_RESERVES, **(reserves or {})}
+        self._capacity = float(burst or _default_capacity(rate, self._reserves))
+        if self._capacity < 1.0:
+            raise ValueError("burst must allow at least one request")
+        self._tokens = self._capacity
+        self._refilled = time.monotonic()
+        self._queues: dict[Priority, deque[asyncio.Future[None]]] = {
+            priority: deque() for priority in Priority
+        }
+        self._pass: dict[Priority, float] = {priority: 0.0 for priority in Priority}
+        self._vtime = 0.0
+        self._timer: asyncio.TimerHandle | None = None
+        self.granted: dict[Priority, int] = {priority: 0 for priority in Priority}
+
+    @property
+    def max_concurrency(self) -> int:
+        """
+        Maximum number of granted slots at once.
+
+        :return: The concurrency limit.
+        """
+        return self._max_concurrency
+
+    @property
+    def rate(self) -> float | None:
+        """
+        Token refill rate in requests per second, or None when unlimited.
+
+        :return: The rate limit.
+        """
+        return self._rate
+
+    @property
+    def tokens(self) -> float:
+        """
+        Tokens currently available in the bucket.
+
+        :return: The token count (the capacity when there is no rate limit).
+        """
+        self._refill()
+        return self._tokens
+
+    def queued(self, priority: Priority | None = None) -> int:
+        """
+        Number of requests waiting for a slot.
+
+        :param priority: Count only this class; all classes when None.
+        :return: The queue length.
+        """
+        if priority is not None:
+            return len(self._queues[priority])
+        return sum(len(queue) for queue in self._queues.values())
+
+    def _refill(self) -> None:
+        if self._rate is None:
+            return
+        now = time.monotonic()
+        self._tokens = min(
+            self._capacity, self._tokens + (now - self._refilled) * self._rate
+        )
+        self._refilled = now
+
+    def _threshold(self, priority: Priority) -> float:
+        # Capped so that a full bucket always admits every class.
+        return min(1.0 + self._reserves[priority] * self._capacity, self._capacity)
+
+    def _allowed(self, priority: Priority) -> bool:
+        return self._rate is None or self._tokens >= self._threshold(priority)
+
+    def _grant(self, priority: Priority) -> None:
+        self._active += 1
+        self.granted[priority] += 1
+        if self._rate is not None:
+            self._tokens -= 1.0
+        # A class that was idle must not bank credit for the time it was idle.
+        self._vtime = max(self._pass[priority], self._vtime)
+        self._pass[priority] = self._vtime + 1.0 / self._weights[priority]
+
+    def _dispatch(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._refill()
+        while self._active < self._max_concurrency:
+            for queue in self._queues.values():
+                while queue and queue[0].done():
+                    queue.popleft()
+            ready = [
+                priority
+                for priority, queue in self._queues.items()
+                if queue and self._allowed(priority)
+            ]
+            if not ready:
+                break
+            priority = min(ready, key=lambda p: (max(self._pass[p], self._vtime), p))
+            self._grant(priority)
+            self._queues[priority].popleft().set_result(None)
+
+        blocked = [priority for priority, queue in self._queues.items() if queue]
+        if blocked and self._rate is not None and self._timer is None:
+            if self._active < self._max_concurrency:
+                needed = min(self._threshold(priority) for priority in blocked)
+                delay = max(needed - self._tokens, 0.0) / self._rate
+                self._timer = asyncio.get_running_loop().call_later(
+                    delay, self._dispatch
+                )
+
+    async def acquire(self, priority: Priority | None = None) -> None:
+        """
+        Wait for a request slot; pair every call with `release`.
+
+        :param priority: Priority class; defaults to `current_priority()`.
+        :return: None
+        """
+        priority = current_priority() if priority is None else priority
+        self._refill()
+        if (
+            not self.queued()
+            and self._active < self._max_concurrency
+            and self._allowed(priority)
+        ):
+            self._grant(priority)
+            return
+
+        queue = self._queues[priority]
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        queue.append(future)
+        self._dispatch()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """
+        Return a slot obtained with `acquire`.
+
+        :return: None
+        """
+        self._active -= 1
+        if self.queued():
+            self._dispatch()
+
+    @asynccontextmanager
+    async def slot(self, priority: Priority | None = None) -> AsyncIterator[None]:
+        """
+        Hold a request slot for the duration of the block.
+
+        :param priority: Priority class; defaults to `current_priority()`.
+        :return: Async context manager.
+        """
+        await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
@@ -0,0 +1,743 @@
+"""
+Write-through persistence of fetched entities to an embedded database.
+
+`EntityStore` observes a client through its response hooks and normalizes
+fixtures, leagues, teams, venues, players, and fixture events into tables
+of a SQLite (standard library) or DuckDB (optional `duckdb` package)
+database. Rows are buffered and written with `executemany` upserts inside
+one transaction per batch, so bulk ingest is bound by the network rather
+than by row-at-a-time writes.
+
+The same store answers "what do we already have" locally, so callers can
+skip fetches for data that is already persisted.
+
+Usage example:
+--------------
+    from api_football_sdk.endpoints.fixtures import get_fixtures_by_league
+    from api_football_sdk.storage import EntityStore
+
+    with EntityStore("football.db") as store:
+        store.attach()
+        await get_fixtures_by_league(league_id=39, season=2024)
+        todo = store.fixtures_without_events(league_id=39, season=2024)
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from types import TracebackType
+from typing import Any, Callable, Iterable, Literal, Type
+
+from api_football_sdk.client import ApiFootballClient, get_client
+from api_football_sdk.exceptions import ConfigurationError
+
+__all__: list[str] = ["EntityStore", "FINISHED_STATUSES", "StagedRows", "TABLES"]
+
+FINISHED_STATUSES: frozenset[str] = frozenset({"FT", "AET", "PEN", "AWD", "WO"})
+"""Fixture status codes after which a match no longer changes."""
+
+_SCHEMA: dict[str, tuple[tuple[str, ...], str]] = {
+    "leagues": (("id", "name", "type", "country", "logo", "data"), "id"),
+    "venues": (("id", "name", "city", "country", "capacity", "surface", "data"), "id"),
+    "teams": (
+        ("id", "name", "code", "country", "founded", "venue_id", "logo", "data"),
+        "id",
+    ),
+    "players": (
+        ("id", "name", "firstname", "lastname", "nationality", "birth_date", "data"),
+        "id",
+    ),
+    "fixtures": (
+        (
+            "id",
+            "league_id",
+            "season",
+            "round",
+            "timestamp",
+            "status",
+            "home_id",
+            "away_id",
+            "home_goals",
+            "away_goals",
+            "venue_id",
+            "data",
+        ),
+        "id",
+    ),
+    "events": (
+        (
+            "fixture_id",
+            "seq",
+            "elapsed",
+            "extra",
+            "team_id",
+            "player_id",
+            "assist_id",
+            "type",
+            "detail",
+            "comments",
+        ),
+        "fixture_id, seq",
+    ),
+    # Fixtures whose complete event list was stored, including empty lists.
+    "events_fetched": (("fixture_id", "event_count"), "fixture_id"),
+}
+
+_INTEGER_COLUMNS = frozenset(
+    {
+        "id",
+        "capacity",
+        "founded",
+        "venue_id",
+        "league_id",
+        "season",
+        "timestamp",
+        "home_id",
+        "away_id",
+        "home_goals",
+        "away_goals",
+        "fixture_id",
+        "seq",
+        "elapsed",
+        "extra",
+        "team_id",
+        "player_id",
+        "assist_id",
+        "event_count",
+    }
+)
+
+TABLES: tuple[str, ...] = tuple(_SCHEMA)
+"""Names of the tables maintained by `EntityStore`."""
+
+# Event filters that make a `/fixtures/events` response partial.
+_EVENT_FILTERS = frozenset({"team", "player", "type"})
+
+_ID_CHUNK = 500
+
+Row = tuple[Any, ...]
+StagedRows = tuple[dict[str, list[Row]], dict[Any, list[Row]]]
+
+
+def _get(data: dict[str, Any] | None, key: str) -> dict[str, Any]:
+    value = (data or {}).get(key)
+    return value if isinstance(value, dict) else {}
+
+
+def _dump(data: dict[str, Any]) -> str:
+    return json.dumps(data, separators=(",", ":"))
+
+
+class EntityStore:
+    """
+    Normalized SQLite/DuckDB store fed by client responses.
+
+    Upserts never overwrite a known value with NULL, so the partial team
+    or venue objects embedded in fixtures do not erase the full rows
+    fetched from `/teams` or `/venues`. Events are replaced per fixture
+    whenever an unfiltered `/fixtures/events` response (or a fixture with
+    embedded events) is seen; fixtures whose event list came back empty
+    are recorded in `events_fetched` so they are not fetched again.
+
+    Writes are buffered until `batch_size` rows are pending or `flush` is
+    called; queries flush first, so they always see every stored response.
+    The hook runs on the event loop, so keep `batch_size` moderate when
+    writing to slow disks.
+    """
+
+    def __init__(
+        self,
+        path: str = ":memory:",
+        *,
+        backend: Literal["sqlite", "duckdb"] = "sqlite",
+        batch_size: int = 1000,
+    ) -> None:
+        if backend == "sqlite":
+            # Autocommit mode; transactions are opened explicitly per batch.
+            self._conn: Any = sqlite3.connect(path, isolation_level=None)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        elif backend == "duckdb":
+            try:
+                import duckdb
+            except ImportError as exc:
+                raise ConfigurationError(
+                    'The DuckDB backend requires the "duckdb" package: '
+                    'pip install "api-football-sdk[duckdb]"'
+                ) from exc
+            self._conn = duckdb.connect(path)
+        else:
+            raise ConfigurationError(f"Unknown storage backend {backend!r}")
+
+        self._backend = backend
+        self._batch_size = batch_size
+        self._pending: dict[str, dict[Any, Row]] = {table: {} for table in TABLES}
+        self._pending_events: dict[int, list[Row]] = {}
+        self._pending_count = 0
+        self._client: ApiFootballClient | None = None
+        self._create_tables()
+
+    def __enter__(self) -> EntityStore:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    @property
+    def backend(self) -> str:
+        """
+        Name of the database backend ("sqlite" or "duckdb").
+
+        :return: The backend name.
+        """
+        return self._backend
+
+    @property
+    def pending(self) -> int:
+        """
+        Number of rows buffered and not yet written.
+
+        :return: The pending row count.
+        """
+        return self._pending_count
+
+    def _create_tables(self) -> None:
+        for table, (columns, key) in _SCHEMA.items():
+            definitions = ", ".join(
+                f"{column} {'BIGINT' if column in _INTEGER_COLUMNS else 'TEXT'}"
+                for column in columns
+            )
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} "
+                f"({definitions}, PRIMARY KEY ({key}))"
+            )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS fixtures_league_season "
+            "ON fixtures (league_id, season)"
+        )
+
+    # ----------------------------------------------------------------- writes
+
+    def _stage(self, table: str, row: Row) -> None:
+        if row[0] is None:
+            return
+        bucket = self._pending[table]
+        previous = bucket.get(row[0])
+        if previous is None:
+            self._pending_count += 1
+        else:
+            # Merge the same way the upsert does: new values win unless NULL.
+            row = tuple(old if new is None else new for new, old in zip(row, previous))
+        bucket[row[0]] = row
+
+    def _stage_events(self, fixture_id: Any, events: Iterable[Any]) -> None:
+        if fixture_id is None:
+            return
+        rows = [
+            (
+                fixture_id,
+                seq,
+                _get(event, "time").get("elapsed"),
+                _get(event, "time").get("extra"),
+                _get(event, "team").get("id"),
+                _get(event, "player").get("id"),
+                _get(event, "assist").get("id"),
+                event.get("type"),
+                event.get("detail"),
+                event.get("comments"),
+            )
+            for seq, event in enumerate(events)
+            if isinstance(event, dict)
+        ]
+        self._stage_event_rows(fixture_id, rows)
+
+    def _stage_event_rows(self, fixture_id: Any, rows: list[Row]) -> None:
+        previous = self._pending_events.get(fixture_id)
+        self._pending_count += len(rows) - len(previous or ())
+        self._pending_events[fixture_id] = rows
+        self._stage("events_fetched", (fixture_id, len(rows)))
+
+    def _stage_league(self, league: dict[str, Any], data: dict | None) -> None:
+        self._stage(
+            "leagues",
+            (
+                league.get("id"),
+                league.get("name"),
+                league.get("type"),
+                league.get("country"),
+                league.get("logo"),
+                _dump(data) if data is not None else None,
+            ),
+        )
+
+    def _stage_venue(self, venue: dict[str, Any], full: bool) -> None:
+        self._stage(
+            "venues",
+            (
+                venue.get("id"),
+                venue.get("name"),
+                venue.get("city"),
+                venue.get("country"),
+                venue.get("capacity"),
+                venue.get("surface"),
+                _dump(venue) if full else None,
+            ),
+        )
+
+    def _stage_team(
+        self, team: dict[str, Any], venue_id: Any = None, data: dict | None = None
+    ) -> None:
+        self._stage(
+            "teams",
+            (
+                team.get("id"),
+                team.get("name"),
+                team.get("code"),
+                team.get("country"),
+                team.get("founded"),
+                venue_id,
+                team.get("logo"),
+                _dump(data) if data is not None else None,
+            ),
+        )
+
+    def _stage_player(self, player: dict[str, Any], data: dict | None) -> None:
+        self._stage(
+            "players",
+            (
+                player.get("id"),
+                player.get("name"),
+                player.get("firstname"),
+                player.get("lastname"),
+                player.get("nationality"),
+                _get(player, "birth").get("date"),
+                _dump(data) if data is not None else None,
+            ),
+        )
+
+    def add_fixtures(self, rows: Iterable[dict[str, Any]]) -> None:
+        """
+        Stage fixture rows, with their league, teams, venue, and events.
+
+        :param rows: Rows of any `/fixtures` response.
+        :return: None
+        """
+        for row in rows:
+            fixture = _get(row, "fixture")
+            league = _get(row, "league")
+            teams = _get(row, "teams")
+            goals = _get(row, "goals")
+            venue = _get(fixture, "venue")
+            home, away = _get(teams, "home"), _get(teams, "away")
+
+            self._stage_league(league, None)
+            self._stage_team(home)
+            self._stage_team(away)
+            self._stage_venue(venue, full=False)
+            self._stage(
+                "fixtures",
+                (
+                    fixture.get("id"),
+                    league.get("id"),
+                    league.get("season"),
+                    league.get("round"),
+                    fixture.get("timestamp"),
+                    _get(fixture, "status").get("short"),
+                    home.get("id"),
+                    away.get("id"),
+                    goals.get("home"),
+                    goals.get("away"),
+                    venue.get("id"),
+                    _dump(row),
+                ),
+            )
+            if isinstance(row.get("events"), list):
+                self._stage_events(fixture.get("id"), row["events"])
+        self._maybe_flush()
+
+    def add_events(self, fixture_id: int, events: Iterable[dict[str, Any]]) -> None:
+        """
+        Stage the complete event list of a fixture, replacing stored events.
+
+        :param fixture_id: Fixture the events belong to.
+        :param events: Rows of an unfiltered `/fixtures/events` response.
+        :return: None
+        """
+        self._stage_events(fixture_id, events)
+        self._maybe_flush()
+
+    def add_teams(self, rows: Iterable[dict[str, Any]]) -> None:
+        """
+        Stage rows of a `/teams` response, with their venues.
+
+        :param rows: Rows with `team` and `venue` objects.
+        :return: None
+        """
+        for row in rows:
+            venue = _get(row, "venue")
+            self._stage_team(_get(row, "team"), venue.get("id"), row)
+            self._stage_venue(venue, full=True)
+        self._maybe_flush()
+
+    def add_leagues(self, rows: Iterable[dict[str, Any]]) -> None:
+        """
+        Stage rows of a `/leagues` response.
+
+        :param rows: Rows with `league` and `country` objects.
+        :return: None
+        """
+        for row in rows:
+            league = dict(_get(row, "league"))
+            league.setdefault("country", _get(row, "country").get("name"))
+            self._stage_league(league, row)
+        self._maybe_flush()
+
+    def add_venues(self, rows: Iterable[dict[str, Any]]) -> None:
+        """
+        Stage rows of a `/venues` response.
+
+        :param rows: Venue objects.
+        :return: None
+        """
+        for row in rows:
+            self._stage_venue(row, full=True)
+        self._maybe_flush()
+
+    def add_players(self, rows: Iterable[dict[str, Any]]) -> None:
+        """
+        Stage rows of a `/players` or `/players/profiles` response.
+
+        :param rows: Rows with a `player` object.
+        :return: None
+        """
+        for row in rows:
+            self._stage_player(_get(row, "player"), row)
+        self._maybe_flush()
+
+    def add_squads(self, rows: Iterable[dict[str, Any]]) -> None:
+        """
+        Stage rows of a `/players/squads` response.
+
+        Squad entries only carry a player's id, name, and photo, so they never
+        replace the full profile stored from `/players`.
+
+        :param rows: Rows with `team` and `players`.
+        :return: None
+        """
+        for row in rows:
+            self._stage_team(_get(row, "team"))
+            for player in row.get("players") or ():
+                if isinstance(player, dict):
+                    self._stage_player(player, None)
+        self._maybe_flush()
+
+    def add_response(
+        self, url: str, params: dict[str, Any], payload: dict[str, Any]
+    ) -> None:
+        """
+        Response hook persisting every supported payload.
+
+        :param url: Endpoint path the payload was fetched from.
+        :param params: Query parameters of the request.
+        :param payload: Decoded response body.
+        :return: None
+        """
+        rows = payload.get("response")
+        if not isinstance(rows, list):
+            return
+        rows = [row for row in rows if isinstance(row, dict)]
+        if url == "/fixtures/events":
+            # An empty list is a complete answer too: record it as fetched.
+            if "fixture" in params and not _EVENT_FILTERS & params.keys():
+                self.add_events(int(params["fixture"]), rows)
+            return
+        if not rows:
+            return
+        handler = _HANDLERS.get(url)
+        if handler is not None:
+            handler(self, rows)
+
+    def attach(self, client: ApiFootballClient | None = None) -> None:
+        """
+        Persist everything a client fetches from now on.
+
+        :param client: Client to observe; defaults to the shared client.
+        :return: None
+        """
+        self.detach()
+        self._client = client or get_client()
+        self._client.add_response_hook(self.add_response)
+
+    def detach(self) -> None:
+        """
+        Stop observing the client passed to `attach`.
+
+        :return: None
+        """
+        if self._client is not None:
+            self._client.remove_response_hook(self.add_response)
+            self._client = None
+
+    def drain(self) -> StagedRows:
+        """
+        Remove and return the buffered rows without writing them.
+
+        Lets rows be built by `add_*` in another process and written by the
+        store that owns the database (see `api_football_sdk.ingest`).
+
+        :return: Rows per table, and event rows per fixture.
+        """
+        rows = {
+            table: list(bucket.values())
+            for table, bucket in self._pending.items()
+            if bucket
+        }
+        events = dict(self._pending_events)
+        for bucket in self._pending.values():
+            bucket.clear()
+        self._pending_events.clear()
+        self._pending_count = 0
+        return rows, events
+
+    def stage_rows(self, staged: StagedRows) -> None:
+        """
+        Buffer rows returned by `drain`, merging them like any other write.
+
+        :param staged: Rows per table, and event rows per fixture.
+        :return: None
+        """
+        rows, events = staged
+        for table, table_rows in rows.items():
+            for row in table_rows:
+                self._stage(table, row)
+        for fixture_id, event_rows in events.items():
+            self._stage_event_rows(fixture_id, event_rows)
+        self._maybe_flush()
+
+    def _maybe_flush(self) -> None:
+        if self._pending_count >= self._batch_size:
+            self.flush()
+
+    def flush(self) -> int:
+        """
+        Write all buffered rows in a single transaction.
+
+        :return: Number of rows written.
+        """
+        if not self._pending_count:
+            return 0
+        written = self._pending_count
+        self._conn.execute("BEGIN TRANSACTION")
+        try:
+            for table, bucket in self._pending.items():
+                if bucket:
+                    self._conn.executemany(_UPSERTS[table], list(bucket.values()))
+            if self._pending_events:
+                self._conn.executemany(
+                    "DELETE FROM events WHERE fixture_id = ?",
+                    [(fixture_id,) for fixture_id in self._pending_events],
+                )
+                rows = [row for rows in self._pending_events.values() for row in rows]
+                if rows:
+                    self._conn.executemany(_UPSERTS["events"], rows)
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+        for bucket in self._pending.values():
+            bucket.clear()
+        self._pending_events.clear()
+        self._pending_count = 0
+        return written
+
+    def close(self) -> None:
+        """
+        Detach, flush pending rows, and close the database.
+
+        :return: None
+        """
+        self.detach()
+        self.flush()
+        self._conn.close()
+
+    # ---------------------------------------------------------------- queries
+
+    def _query(self, sql: str, params: Iterable[Any] = ()) -> list[Row]:
+        self.flush()
+        return [tuple(row) for row in self._conn.execute(sql, list(params)).fetchall()]
+
+    def known_ids(self, table: str, ids: Iterable[int]) -> set[int]:
+        """
+        Return which of the given ids are already stored.
+
+        :param table: One of "fixtures", "leagues", "teams", "venues", "players".
+        :param ids: Candidate ids.
+        :return: The subset present in the table.
+        """
+        if table not in _SCHEMA or table in ("events", "events_fetched"):
+            raise ValueError(f"Unknown entity table {table!r}")
+        ids = list(dict.fromkeys(int(value) for value in ids))
+        known: set[int] = set()
+        for start in range(0, len(ids), _ID_CHUNK):
+            chunk = ids[start : start + _ID_CHUNK]
+            marks = ", ".join("?" * len(chunk))
+            known.update(
+                row[0]
+                for row in self._query(
+                    f"SELECT id FROM {table} WHERE id IN ({marks})", chunk
+                )
+            )
+        return known
+
+    def missing_ids(self, table: str, ids: Iterable[int]) -> list[int]:
+        """
+        Return the ids not stored yet, in input order and without duplicates.
+
+        :param table: One of "fixtures", "leagues", "teams", "venues", "players".
+        :param ids: Candidate ids.
+        :return: Ids that still need to be fetched.
+        """
+        ids = list(dict.fromkeys(int(value) for value in ids))
+        known = self.known_ids(table, ids)
+        return [value for value in ids if value not in known]
+
+    def fixture_ids(
+        self,
+        *,
+        league_id: int | None = None,
+        season: int | None = None,
+        statuses: Iterable[str] | None = None,
+    ) -> list[int]:
+        """
+        List stored fixture ids, ordered by kickoff.
+
+        :param league_id: Only fixtures of this league.
+        :param season: Only fixtures of this season.
+        :param statuses: Only fixtures with one of these short status codes.
+        :return: Matching fixture ids.
+        """
+        where, params = self._fixture_filter(league_id, season, statuses)
+        return [
+            row[0]
+            for row in self._query(
+                f"SELECT id FROM fixtures{where} ORDER BY timestamp, id", params
+            )
+        ]
+
+    def fixtures_without_events(
+        self, *, league_id: int | None = None, season: int | None = None
+    ) -> list[int]:
+        """
+        List finished fixtures whose events have not been stored yet.
+
+        :param league_id: Only fixtures of this league.
+        :param season: Only fixtures of this season.
+        :return: Fixture ids, ordered by kickoff.
+        """
+        where, params = self._fixture_filter(league_id, season, FINISHED_STATUSES)
+        return [
+            row[0]
+            for row in self._query(
+                f"SELECT id FROM fixtures{where} AND NOT EXISTS "
+                "(SELECT 1 FROM events_fetched "
+                "WHERE events_fetched.fixture_id = fixtures.id) "
+                "AND NOT EXISTS "
+                "(SELECT 1 FROM events WHERE events.fixture_id = fixtures.id) "
+                "ORDER BY timestamp, id",
+                params,
+            )
+        ]
+
+    @staticmethod
+    def _fixture_filter(
+        league_id: int | None, season: int | None, statuses: Iterable[str] | None
+    ) -> tuple[str, list[Any]]:
+        clauses: list[str] = ["1 = 1"]
+        params: list[Any] = []
+        if league_id is not None:
+            clauses.append("league_id = ?")
+            params.append(league_id)
+        if season is not None:
+            clauses.append("season = ?")
+            params.append(season)
+        if statuses is not None:
+            statuses = sorted(statuses)
+            clauses.append(f"status IN ({', '.join('?' * len(statuses))})")
+            params.extend(statuses)
+        return " WHERE " + " AND ".join(clauses), params
+
+    def get(self, table: str, entity_id: int) -> dict[str, Any] | None:
+        """
+        Return the last full API object stored for an entity.
+
+        :param table: One of "fixtures", "leagues", "teams", "venues", "players".
+        :param entity_id: Entity id.
+        :return: The stored object, or None if unknown or only seen partially.
+        """
+        if table not in _SCHEMA or table in ("events", "events_fetched"):
+            raise ValueError(f"Unknown entity table {table!r}")
+        rows = self._query(f"SELECT data FROM {table} WHERE id = ?", [entity_id])
+        if not rows or rows[0][0] is None:
+            return None
+        return json.loads(rows[0][0])
+
+    def events(self, fixture_id: int) -> list[dict[str, Any]]:
+        """
+        Return the stored events of a fixture, in API order.
+
+        :param fixture_id: Fixture id.
+        :return: Event rows as column dicts (empty if none stored).
+        """
+        columns = _SCHEMA["events"][0]
+        return [
+            dict(zip(columns, row))
+            for row in self._query(
+                "SELECT * FROM events WHERE fixture_id = ? ORDER BY seq", [fixture_id]
+            )
+        ]
+
+    def count(self, table: str) -> int:
+        """
+        Number of rows stored in a table.
+
+        :param table: One of `TABLES`.
+        :return: The row count.
+        """
+        if table not in _SCHEMA:
+            raise ValueError(f"Unknown table {table!r}")
+        return self._query(f"SELECT COUNT(*) FROM {table}")[0][0]
+
+
+def _upsert(table: str) -> str:
+    columns, key = _SCHEMA[table]
+    keys = {part.strip() for part in key.split(",")}
+    updates = ", ".join(
+        f"{column} = COALESCE(excluded.{column}, {table}.{column})"
+        for column in columns
+        if column not in keys
+    )
+    return (
+        f"INSERT INTO {table} ({', '.join(columns)}) "
+        f"VALUES ({', '.join('?' * len(columns))}) "
+        f"ON CONFLICT ({key}) DO UPDATE SET {updates}"
+    )
+
+
+_UPSERTS: dict[str, str] = {table: _upsert(table) for table in TABLES}
+
+_HANDLERS: dict[str, Callable[[EntityStore, list[dict[str, Any]]], None]] = {
+    "/fixtures": EntityStore.add_fixtures,
+    "/teams": EntityStore.add_teams,
+    "/leagues": EntityStore.add_leagues,
+    "/venues": EntityStore.add_venues,
+    "/players": EntityStore.add_players,
+    "/players/profiles": EntityStore.add_players,
+    "/players/squads": EntityStore.add_squads,
+}
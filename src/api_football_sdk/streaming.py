@@ -0,0 +1,320 @@
+"""
+Incremental parsing of large JSON responses.
+
+`/players/profiles`, league-wide `/players` pages, and odds responses can
+be megabytes. `JsonArrayParser` is fed the body chunk by chunk and returns
+the items of its `response` array as soon as each one is complete, keeping
+the other top-level members (`paging`, `errors`, ...) in `fields`. Only
+the unparsed tail of the body is buffered, so peak memory depends on the
+size of one row rather than of the whole response.
+
+`JsonStream`, returned by `ApiFootballClient.stream_json`, drives the
+parser from the body of a streamed HTTP response.
+
+Usage example:
+--------------
+    from api_football_sdk.client import get_client
+
+    rows = get_client().stream_json("/players/profiles", params={"page": 1})
+    async with rows:
+        async for player in rows:
+            print(player["player"]["name"])
+    print(rows.fields["paging"])
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+import httpx
+
+from api_football_sdk.deadline import Deadline
+from api_football_sdk.exceptions import (
+    APIFootballRequestError,
+    DeadlineExceededError,
+    ParsingError,
+)
+
+__all__: list[str] = ["JsonArrayParser", "JsonStream"]
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+# Parser states.
+_START = 0
+_FIRST_MEMBER = 1
+_MEMBER = 2
+_COLON = 3
+_VALUE = 4
+_AFTER_VALUE = 5
+_FIRST_ITEM = 6
+_ITEM = 7
+_AFTER_ITEM = 8
+_DONE = 9
+
+
+class JsonArrayParser:
+    """
+    Push parser yielding the items of one array member of a JSON object.
+
+    Items are decoded whole with the standard `json` decoder, so each one
+    is exactly what `response.json()[key][i]` would have been.
+
+    :param key: Top-level member whose array items are returned.
+    """
+
+    def __init__(self, key: str = "response") -> None:
+        self._key = key
+        self._decoder = json.JSONDecoder()
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._state = _START
+        self._member: str | None = None
+        # Buffered characters needed before an incomplete value is retried.
+        self._wanted = 0
+        self.fields: dict[str, Any] = {}
+
+    @property
+    def done(self) -> bool:
+        """
+        Whether the whole top-level object has been parsed.
+
+        :return: True once the closing brace was seen.
+        """
+        return self._state == _DONE
+
+    def feed(self, data: bytes) -> list[Any]:
+        """
+        Parse the next chunk of the body.
+
+        :param data: Raw UTF-8 bytes, split anywhere.
+        :return: Array items completed by this chunk, in order.
+        :raises ValueError: If the body is not a JSON object.
+        """
+        self._buffer = self._buffer[self._pos :] + self._utf8.decode(data)
+        self._pos = 0
+        if len(self._buffer) < self._wanted:
+            return []
+        return self._parse(final=False)
+
+    def close(self) -> list[Any]:
+        """
+        Finish parsing once the body has been fully read.
+
+        :return: Remaining array items.
+        :raises ValueError: If the body is truncated or not valid JSON.
+        """
+        self._buffer = self._buffer[self._pos :] + self._utf8.decode(b"", final=True)
+        self._pos = 0
+        items = self._parse(final=True)
+        if self._state != _DONE:
+            raise ValueError("Unexpected end of JSON body")
+        return items
+
+    def _decode(self, final: bool) -> tuple[bool, Any]:
+        buffer = self._buffer
+        try:
+            value, end = self._decoder.raw_decode(buffer, self._pos)
+        except json.JSONDecodeError:
+            if final:
+                raise
+            # Not complete yet: wait until the value has had room to double,
+            # so a large value is re-decoded a logarithmic number of times.
+            self._wanted = 2 * (len(buffer) - self._pos)
+            return False, None
+        if end == len(buffer) and not final:
+            # A number or literal may continue in the next chunk.
+            self._wanted = len(buffer) - self._pos + 1
+            return False, None
+        self._wanted = 0
+        self._pos = end
+        return True, value
+
+    def _expect(self, final: bool) -> str | None:
+        self._pos = _WHITESPACE.match(self._buffer, self._pos).end()  # type: ignore[union-attr]
+        if self._pos < len(self._buffer):
+            return self._buffer[self._pos]
+        if final and self._state != _DONE:
+            raise ValueError("Unexpected end of JSON body")
+        return None
+
+    def _fail(self, expected: str) -> None:
+        raise ValueError(f"Expected {expected} at offset {self._pos} of the JSON body")
+
+    def _parse(self, final: bool) -> list[Any]:
+        items: list[Any] = []
+        while True:
+            char = self._expect(final)
+            if char is None:
+                return items
+            state = self._state
+
+            if state == _START:
+                if char != "{":
+                    self._fail("an object")
+                self._pos += 1
+                self._state = _FIRST_MEMBER
+            elif state in (_FIRST_MEMBER, _MEMBER):
+                if char == "}" and state == _FIRST_MEMBER:
+                    self._pos += 1
+                    self._state = _DONE
+                    continue
+                if char != '"':
+                    self._fail("a member name")
+                complete, member = self._decode(final)
+                if not complete:
+                    return items
+                self._member = member
+                self._state = _COLON
+            elif state == _COLON:
+                if char != ":":
+                    self._fail("':'")
+                self._pos += 1
+                self._state = _VALUE
+            elif state == _VALUE:
+                if self._member == self._key and char == "[":
+                    self._pos += 1
+                    self._state = _FIRST_ITEM
+                    continue
+                complete, value = self._decode(final)
+                if not complete:
+                    return items
+                self.fields[self._member] = value  # type: ignore[index]
+                self._state = _AFTER_VALUE
+            elif state == _AFTER_VALUE:
+                if char == ",":
+                    self._state = _MEMBER
+                elif char == "}":
+                    self._state = _DONE
+                else:
+                    self._fail("',' or '}'")
+                self._pos += 1
+            elif state in (_FIRST_ITEM, _ITEM):
+                if char == "]" and state == _FIRST_ITEM:
+                    self._pos += 1
+                    self._state = _AFTER_VALUE
+                    continue
+                complete, value = self._decode(final)
+                if not complete:
+                    return items
+                items.append(value)
+                self._state = _AFTER_ITEM
+            elif state == _AFTER_ITEM:
+                if char == ",":
+                    self._state = _ITEM
+                elif char == "]":
+                    self._state = _AFTER_VALUE
+                else:
+                    self._fail("',' or ']'")
+                self._pos += 1
+            else:
+                self._fail("the end of the body")
+
+
+class JsonStream:
+    """
+    Async iterator over the array items of a streamed JSON response.
+
+    The request is sent when iteration starts, and the body is read and
+    parsed chunk by chunk as items are consumed. Top-level members other
+    than the array are collected in `fields`; those that precede the array
+    in the body (as `paging` and `errors` do in API Football responses) are
+    available before the first item.
+
+    Use it as an async context manager, or call `aclose`, to release the
+    connection when iteration stops early.
+
+    :param open_response: Coroutine function sending the request and
+        returning the response with its body unread.
+    :param url: Endpoint relative path, for error messages.
+    :param key: Top-level member whose array items are yielded.
+    :param deadline: Deadline checked between body chunks, if any.
+    :param transform: Applied to every item before it is yielded.
+    :param on_complete: Called with the reassembled payload (`fields` plus
+        the items under `key`) once the whole body was parsed; the items
+        are then kept until the end of the body.
+    """
+
+    def __init__(
+        self,
+        open_response: Callable[[], Awaitable[httpx.Response]],
+        url: str,
+        *,
+        key: str = "response",
+        deadline: Deadline | None = None,
+        transform: Callable[[Any], Any] | None = None,
+        on_complete: Callable[[dict[str, Any]], None] | None = None,
+    ) -> None:
+        self._open_response = open_response
+        self._url = url
+        self._key = key
+        self._deadline = deadline
+        self._transform = transform
+        self._on_complete = on_complete
+        self._rows: AsyncIterator[Any] | None = None
+        self.fields: dict[str, Any] = {}
+        self.bytes_read = 0
+
+    def __aiter__(self) -> AsyncIterator[Any]:
+        if self._rows is None:
+            self._rows = self._iter_rows()
+        return self._rows
+
+    async def __aenter__(self) -> JsonStream:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Stop iterating and close the response.
+
+        :return: None
+        """
+        if self._rows is not None:
+            await self._rows.aclose()  # type: ignore[attr-defined]
+
+    async def _iter_rows(self) -> AsyncIterator[Any]:
+        response = await self._open_response()
+        parser = JsonArrayParser(self._key)
+        self.fields = parser.fields
+        kept: list[Any] | None = [] if self._on_complete is not None else None
+        try:
+            chunks = response.aiter_bytes()
+            while True:
+                try:
+                    chunk = await chunks.__anext__()
+                except StopAsyncIteration:
+                    break
+                except httpx.RequestError as exc:
+                    raise APIFootballRequestError(exc) from exc
+                if self._deadline is not None and self._deadline.expired:
+                    raise DeadlineExceededError(self._url)
+                self.bytes_read += len(chunk)
+                for item in self._parse(parser.feed, chunk):
+                    if kept is not None:
+                        kept.append(item)
+                    yield item
+            for item in self._parse(parser.close):
+                if kept is not None:
+                    kept.append(item)
+                yield item
+            if self._on_complete is not None:
+                payload = dict(self.fields)
+                payload.setdefault(self._key, kept)
+                self._on_complete(payload)
+        finally:
+            await response.aclose()
+
+    def _parse(self, step: Callable[..., list[Any]], *args: bytes) -> list[Any]:
+        try:
+            items = step(*args)
+        except ValueError as exc:
+            raise ParsingError(f"Invalid JSON from {self._url}: {exc}") from exc
+        if self._transform is not None:
+            items = [self._transform(item) for item in items]
+        return items
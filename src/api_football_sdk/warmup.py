@@ -0,0 +1,385 @@
+"""
+Startup warmup from a reference-data snapshot.
+
+A fresh process otherwise fetches `/leagues`, `/countries`,
+`/leagues/seasons`, `/teams/countries`, and `/timezone` one after another
+before it can answer anything. `ReferenceWarmup` fetches them concurrently,
+opens pooled connections ahead of the first real request, and writes the
+payloads to a compressed `ReferenceSnapshot` file (msgpack when installed,
+JSON otherwise; `pip install "api-football-sdk[msgpack]"`).
+
+The next process loads that file in a few milliseconds, seeds the client's
+`ResponseCache` with it so `get_json` answers these paths without a request,
+and refreshes the snapshot in a background task once it is older than
+`max_age`.
+
+Usage example:
+--------------
+    from api_football_sdk.cache import ResponseCache
+    from api_football_sdk.client import ApiFootballClient
+    from api_football_sdk.warmup import ReferenceWarmup
+
+    client = ApiFootballClient(cache=ResponseCache())
+    warmup = ReferenceWarmup(client, path="/var/cache/api-football/reference.afrs")
+    snapshot = await warmup.start()
+    leagues = snapshot.response("/leagues")
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import time
+import zlib
+from typing import Any, Iterable, Literal, Mapping
+
+from api_football_sdk.cache import CachePolicy, cache_key
+from api_football_sdk.client import ApiFootballClient, get_client
+from api_football_sdk.exceptions import (
+    APIFootballError,
+    ConfigurationError,
+    ParsingError,
+)
+from api_football_sdk.scheduler import Priority
+
+__all__: list[str] = ["REFERENCE_PATHS", "ReferenceSnapshot", "ReferenceWarmup"]
+
+logger = logging.getLogger(__name__)
+
+REFERENCE_PATHS: tuple[str, ...] = (
+    "/leagues",
+    "/countries",
+    "/leagues/seasons",
+    "/teams/countries",
+    "/timezone",
+)
+"""Parameterless endpoints whose payloads make up the default snapshot."""
+
+Codec = Literal["msgpack", "json"]
+
+_MAGIC = b"AFRS"
+_CODECS: Mapping[str, bytes] = {"msgpack": b"M", "json": b"J"}
+
+
+def _msgpack() -> Any:
+    try:
+        import msgpack
+    except ImportError:
+        return None
+    return msgpack
+
+
+class ReferenceSnapshot:
+    """
+    Payloads of reference endpoints and the wall-clock time they were fetched.
+
+    :param payloads: Decoded response body of every path.
+    :param created_at: UNIX time of the fetch; defaults to now.
+    """
+
+    __slots__ = ("payloads", "created_at")
+
+    def __init__(
+        self,
+        payloads: Mapping[str, dict[str, Any]],
+        created_at: float | None = None,
+    ) -> None:
+        self.payloads = dict(payloads)
+        self.created_at = time.time() if created_at is None else created_at
+
+    @property
+    def age(self) -> float:
+        """
+        Seconds since the payloads were fetched.
+
+        :return: The age.
+        """
+        return max(0.0, time.time() - self.created_at)
+
+    def response(self, path: str) -> list[Any]:
+        """
+        Return the `response` array of one path.
+
+        :param path: Endpoint relative path (e.g., "/leagues").
+        :return: The rows, or an empty list if the path is absent.
+        """
+        return (self.payloads.get(path) or {}).get("response", [])
+
+    def dumps(self, codec: Codec | None = None) -> bytes:
+        """
+        Serialize and compress the snapshot.
+
+        :param codec: "msgpack" or "json"; defaults to msgpack when installed.
+        :return: The encoded snapshot.
+        :raises ConfigurationError: If msgpack is requested but not installed.
+        """
+        msgpack = _msgpack()
+        if codec is None:
+            codec = "json" if msgpack is None else "msgpack"
+        body = {"created_at": self.created_at, "payloads": self.payloads}
+        if codec == "msgpack":
+            if msgpack is None:
+                raise ConfigurationError(
+                    'msgpack snapshots require the "msgpack" package: '
+                    'pip install "api-football-sdk[msgpack]"'
+                )
+            data = msgpack.packb(body)
+        elif codec == "json":
+            data = json.dumps(body, separators=(",", ":")).encode()
+        else:
+            raise ValueError(f"Unknown snapshot codec {codec!r}")
+        return _MAGIC + _CODECS[codec] + zlib.compress(data)
+
+    @classmethod
+    def loads(cls, data: bytes) -> ReferenceSnapshot:
+        """
+        Decode a snapshot produced by `dumps`.
+
+        :param data: The encoded snapshot.
+        :return: The snapshot.
+        :raises ParsingError: If the data is not a snapshot.
+        :raises ConfigurationError: If the snapshot is msgpack-encoded and
+            msgpack is not installed.
+        """
+        if data[:4] != _MAGIC:
+            raise ParsingError("Invalid reference snapshot: bad magic")
+        codec = data[4:5]
+        if codec == _CODECS["msgpack"] and _msgpack() is None:
+            raise ConfigurationError(
+                'This snapshot requires the "msgpack" package: '
+                'pip install "api-football-sdk[msgpack]"'
+            )
+        try:
+            raw = zlib.decompress(data[5:])
+            if codec == _CODECS["msgpack"]:
+                body = _msgpack().unpackb(raw)
+            elif codec == _CODECS["json"]:
+                body = json.loads(raw)
+            else:
+                raise ValueError(f"unknown codec {codec!r}")
+            return cls(body["payloads"], body["created_at"])
+        except (ValueError, KeyError, TypeError, zlib.error) as exc:
+            raise ParsingError(f"Invalid reference snapshot: {exc}") from None
+
+    def save(self, path: str | os.PathLike[str], codec: Codec | None = None) -> None:
+        """
+        Write the snapshot to a file, atomically.
+
+        :param path: Destination file.
+        :param codec: See `dumps`.
+        :return: None
+        """
+        data = self.dumps(codec)
+        tmp = f"{os.fspath(path)}.tmp"
+        with open(tmp, "wb") as fh:
+            fh.write(data)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str | os.PathLike[str]) -> ReferenceSnapshot:
+        """
+        Read a snapshot written by `save`.
+
+        :param path: Source file.
+        :return: The snapshot.
+        :raises ParsingError: If the file is not a snapshot.
+        :raises ConfigurationError: See `loads`.
+        """
+        with open(path, "rb") as fh:
+            return cls.loads(fh.read())
+
+
+class ReferenceWarmup:
+    """
+    Prefetches reference data, keeps it in a snapshot file, and seeds the
+    client's cache with it.
+
+    Paths without a policy in the client's cache get `policy`. Without a
+    cache on the client, the data is only available through `snapshot`.
+
+    :param client: Client used to fetch; defaults to the shared client.
+    :param path: Snapshot file, if any.
+    :param paths: Endpoints to prefetch; defaults to `REFERENCE_PATHS`.
+    :param max_age: Age in seconds after which the snapshot is refreshed.
+    :param retry_interval: Seconds to wait after a failed refresh.
+    :param connections: Connections to open ahead of use; defaults to the
+        client's concurrency limit.
+    :param policy: Cache policy of the prefetched paths; defaults to a `ttl`
+        of `max_age`, served stale for up to a week and on errors for up to
+        30 days.
+    """
+
+    def __init__(
+        self,
+        client: ApiFootballClient | None = None,
+        *,
+        path: str | os.PathLike[str] | None = None,
+        paths: Iterable[str] = REFERENCE_PATHS,
+        max_age: float = 86400.0,
+        retry_interval: float = 300.0,
+        connections: int | None = None,
+        policy: CachePolicy | None = None,
+    ) -> None:
+        self._client = client
+        self._path = path
+        self.paths = tuple(paths)
+        self.max_age = max_age
+        self.retry_interval = retry_interval
+        self._connections = connections
+        self._policy = policy or CachePolicy(
+            max_age, max_stale=7 * 86400, stale_if_error=30 * 86400
+        )
+        self.snapshot: ReferenceSnapshot | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def client(self) -> ApiFootballClient:
+        """
+        The client used to fetch.
+
+        :return: The configured or shared client.
+        """
+        return self._client or get_client()
+
+    def seed(self, snapshot: ReferenceSnapshot) -> None:
+        """
+        Make `snapshot` current and store its payloads in the client's cache,
+        aged as the snapshot.
+
+        :param snapshot: The snapshot.
+        :return: None
+        """
+        self.snapshot = snapshot
+        client = self.client
+        cache = client.cache
+        if cache is None:
+            return
+        age = snapshot.age
+        for url, payload in snapshot.payloads.items():
+            if cache.policy_for(url) is None:
+                cache.set_policy(url, self._policy)
+            if client.entities is not None:
+                payload = client.entities.normalize(url, payload)
+            cache.put(cache_key(url, None), payload, age=age)
+
+    def load(self) -> ReferenceSnapshot | None:
+        """
+        Load and seed the snapshot file, if there is a readable one.
+
+        :return: The snapshot, or None.
+        """
+        if self._path is None or not os.path.exists(self._path):
+            return None
+        try:
+            snapshot = ReferenceSnapshot.load(self._path)
+        except (OSError, ParsingError, ConfigurationError) as exc:
+            logger.warning("Ignoring reference snapshot %s: %s", self._path, exc)
+            return None
+        self.seed(snapshot)
+        return snapshot
+
+    async def _fetch(self, url: str, priority: Priority | None) -> dict[str, Any]:
+        # Bypasses the cache: a refresh must not be answered by the entry it
+        # replaces.
+        response = await self.client.get(url, priority=priority)
+        try:
+            return response.json()
+        except ValueError as exc:
+            raise ParsingError(f"Invalid JSON from {url}: {exc}") from exc
+
+    async def refresh(self, *, priority: Priority | None = None) -> ReferenceSnapshot:
+        """
+        Fetch every path concurrently, then save and seed the new snapshot.
+
+        :param priority: Scheduling class of the requests.
+        :return: The new snapshot.
+        """
+        payloads = await asyncio.gather(
+            *(self._fetch(url, priority) for url in self.paths)
+        )
+        snapshot = ReferenceSnapshot(dict(zip(self.paths, payloads)))
+        if self._path is not None:
+            directory = os.path.dirname(os.fspath(self._path))
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            snapshot.save(self._path)
+        self.seed(snapshot)
+        return snapshot
+
+    async def warm_connections(self, count: int | None = None) -> int:
+        """
+        Open up to `count` pooled connections with concurrent `/status`
+        requests, which do not count against the daily quota.
+
+        :param count: Connections to open; defaults to `connections`.
+        :return: Number of requests that succeeded.
+        """
+        client = self.client
+        if count is None:
+            count = self._connections or client.max_concurrency
+        results = await asyncio.gather(
+            *(
+                client.get("/status", priority=Priority.BACKGROUND)
+                for _ in range(count)
+            ),
+            return_exceptions=True,
+        )
+        failures = [result for result in results if isinstance(result, Exception)]
+        if failures:
+            logger.warning("Connection warmup: %d/%d failed", len(failures), count)
+        return count - len(failures)
+
+    async def start(self) -> ReferenceSnapshot:
+        """
+        Make reference data available, then keep it fresh in the background.
+
+        With a readable snapshot file this returns at once, warming
+        connections and refreshing in the background task; otherwise it
+        fetches the data and warms connections before returning.
+
+        :return: The current snapshot.
+        """
+        snapshot = self.load()
+        warm = snapshot is not None
+        if snapshot is None:
+            snapshot, _ = await asyncio.gather(self.refresh(), self.warm_connections())
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run(warm=warm))
+        return snapshot
+
+    async def run(self, *, warm: bool = False) -> None:
+        """
+        Refresh the snapshot whenever it is older than `max_age`, until
+        cancelled.
+
+        :param warm: Whether to warm connections first.
+        :return: None
+        """
+        if warm:
+            await self.warm_connections()
+        while True:
+            delay = self.max_age - self.snapshot.age if self.snapshot else 0.0
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+            try:
+                await self.refresh(priority=Priority.BACKGROUND)
+            except (APIFootballError, OSError) as exc:
+                logger.warning("Reference snapshot refresh failed: %s", exc)
+                await asyncio.sleep(self.retry_interval)
+
+    async def stop(self) -> None:
+        """
+        Stop the background task, if running.
+
+        :return: None
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
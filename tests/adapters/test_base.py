@@ -1,8 +1,70 @@
-# tests/adapters/test_base.py
+import httpx
+import pytest
+from api_football_sdk.adapters.base import create_transport
+from api_football_sdk.adapters.memory import MemoryTransport
+from api_football_sdk.client import ApiFootballClient
+from api_football_sdk.exceptions import APIFootballHTTPError, ConfigurationError
 
 
-def test_base_placeholder():
-    """
-    Placeholder test for the base adapter.
-    """
-    assert True
+@pytest.mark.asyncio
+async def test_memory_transport_behind_client():
+    transport = MemoryTransport()
+    transport.add_route("/timezone", {"response": ["Europe/London"]})
+    transport.add_route("/fixtures", status_code=500)
+
+    async with ApiFootballClient(transport=transport) as client:
+        payload = await client.get_json("/timezone", params={"x": 1})
+        with pytest.raises(APIFootballHTTPError):
+            await client.get("/fixtures")
+
+    assert payload == {"response": ["Europe/London"]}
+    assert transport.requests[0].url.params["x"] == "1"
+
+
+@pytest.mark.asyncio
+async def test_client_retries_transport_errors():
+    attempts = []
+
+    def flaky(request):
+        attempts.append(request)
+        if len(attempts) < 2:
+            raise httpx.ConnectError("boom", request=request)
+        return httpx.Response(200, json={"response": []})
+
+    client = ApiFootballClient(transport=MemoryTransport(flaky))
+    client.BACKOFF_FACTOR = 0.0
+
+    response = await client.get("/fixtures")
+    assert response.status_code == 200
+    assert len(attempts) == 2
+
+
+def test_create_transport_rejects_unknown_name():
+    with pytest.raises(ConfigurationError):
+        create_transport("carrier-pigeon")
+
+
+@pytest.mark.asyncio
+async def test_aiohttp_transport_round_trip():
+    pytest.importorskip("aiohttp")
+    from aiohttp import web
+
+    async def timezone(request):
+        return web.json_response({"response": [request.query["probe"]]})
+
+    app = web.Application()
+    app.router.add_get("/v3/timezone", timezone)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    transport = create_transport("aiohttp", base_url=f"http://127.0.0.1:{port}/v3")
+    try:
+        async with ApiFootballClient(transport=transport) as client:
+            payload = await client.get_json("/timezone", params={"probe": 7})
+    finally:
+        await runner.cleanup()
+
+    assert payload == {"response": ["7"]}
@@ -9,7 +9,7 @@ def api_client() -> AsyncClient:
     """
     Fixture to get a shared API client instance for tests.
     """
-    client = get_client()._client
+    client = get_client().transport.client
     return client
 
 
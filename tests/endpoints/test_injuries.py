@@ -1,5 +1,32 @@
-def test_transfers_placeholder():
-    """
-    Placeholder for transfer endpoints.
-    """
-    assert True
+import httpx
+import pytest
+from api_football_sdk.endpoints.injuries import (
+    get_injuries_by_fixtures,
+    get_injuries_by_league,
+)
+
+
+@pytest.mark.asyncio
+async def test_get_injuries_by_league(mock_respx):
+    mock_respx.get("/injuries").mock(
+        return_value=httpx.Response(
+            200, json={"response": [{"player": {"id": 865, "type": "Missing Fixture"}}]}
+        )
+    )
+
+    injuries = await get_injuries_by_league(39, 2024)
+    assert injuries[0]["player"]["id"] == 865
+
+
+@pytest.mark.asyncio
+async def test_get_injuries_by_fixtures_batches_ids(mock_respx):
+    route = mock_respx.get("/injuries").mock(
+        side_effect=lambda request: httpx.Response(
+            200, json={"response": [{"ids": request.url.params["ids"]}]}
+        )
+    )
+
+    injuries = await get_injuries_by_fixtures(list(range(1, 26)))
+
+    assert route.call_count == 2
+    assert injuries[1] == {"ids": "21-22-23-24-25"}
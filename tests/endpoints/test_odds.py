@@ -0,0 +1,76 @@
+import httpx
+import pytest
+from api_football_sdk.endpoints.odds import (
+    LIVE_BOOKMAKER_ID,
+    OddsSnapshotStore,
+    iter_odds_by_league,
+)
+
+
+def _odds_row(fixture_id, home_odd):
+    return {
+        "fixture": {"id": fixture_id},
+        "update": "2024-08-01T10:00:00+00:00",
+        "bookmakers": [
+            {
+                "id": 8,
+                "name": "Bet365",
+                "bets": [
+                    {
+                        "id": 1,
+                        "name": "Match Winner",
+                        "values": [
+                            {"value": "Home", "odd": home_odd},
+                            {"value": "Away", "odd": "4.50"},
+                        ],
+                    }
+                ],
+            }
+        ],
+    }
+
+
+@pytest.mark.asyncio
+async def test_iter_odds_by_league_streams_every_page(mock_respx):
+    def handler(request):
+        page = int(request.url.params["page"])
+        return httpx.Response(
+            200,
+            json={
+                "paging": {"current": page, "total": 2},
+                "response": [_odds_row(page, "1.50")],
+            },
+        )
+
+    route = mock_respx.get("/odds").mock(side_effect=handler)
+
+    rows = [row async for row in iter_odds_by_league(39, 2024, bet_id=1)]
+
+    assert [row["fixture"]["id"] for row in rows] == [1, 2]
+    assert route.call_count == 2
+    assert route.calls.last.request.url.params["bet"] == "1"
+
+
+def test_snapshot_store_replaces_and_compacts():
+    store = OddsSnapshotStore()
+    store.add(_odds_row(10, "1.50"))
+    store.add(_odds_row(11, "2.10"))
+    store.add(_odds_row(10, "1.45"))
+    store.add(
+        {
+            "fixture": {"id": 12},
+            "odds": [
+                {
+                    "id": 36,
+                    "name": "Over/Under Line",
+                    "values": [{"value": "Over", "odd": "1.9", "handicap": "2.5"}],
+                }
+            ],
+        }
+    )
+
+    assert len(store) == 5
+    assert store.price(10, 8, 1, "Home") == 1.45
+    assert store.price(12, LIVE_BOOKMAKER_ID, 36, "Over 2.5") == 1.9
+    assert store.market_name(1) == "Match Winner"
+    assert len(store.columns()["price"]) == 5
@@ -0,0 +1,45 @@
+import time
+
+import httpx
+import pytest
+from api_football_sdk.endpoints.predictions import (
+    PredictionsPrefetcher,
+    get_predictions_by_fixture,
+)
+
+
+@pytest.mark.asyncio
+async def test_get_predictions_by_fixture(mock_respx):
+    mock_respx.get("/predictions").mock(
+        return_value=httpx.Response(
+            200, json={"response": [{"predictions": {"advice": "Double chance"}}]}
+        )
+    )
+
+    prediction = await get_predictions_by_fixture(198772)
+    assert prediction["predictions"]["advice"] == "Double chance"
+
+
+@pytest.mark.asyncio
+async def test_prefetcher_caches_until_kickoff(mock_respx):
+    route = mock_respx.get("/predictions").mock(
+        side_effect=lambda request: httpx.Response(
+            200,
+            json={"response": [{"fixture": request.url.params["fixture"]}]},
+        )
+    )
+    kickoff = int(time.time()) + 3600
+    fixtures = [
+        {"fixture": {"id": 1, "timestamp": kickoff}},
+        {"fixture": {"id": 2, "timestamp": kickoff}},
+        {"fixture": {"id": 3, "timestamp": int(time.time()) - 60}},
+    ]
+
+    prefetcher = PredictionsPrefetcher()
+    first = await prefetcher.prefetch(fixtures)
+    second = await prefetcher.prefetch(fixtures)
+
+    assert first == second
+    assert first[2] == {"fixture": "2"}
+    assert route.call_count == 4
+    assert len(prefetcher) == 2
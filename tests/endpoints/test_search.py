@@ -1,5 +1,60 @@
-def test_transfers_placeholder():
-    """
-    Placeholder for transfer endpoints.
-    """
-    assert True
+import httpx
+import pytest
+from api_football_sdk.client import get_client
+from api_football_sdk.endpoints.leagues import get_all_leagues
+from api_football_sdk.endpoints.search import SearchIndex, search_teams
+
+
+@pytest.mark.asyncio
+async def test_search_teams(mock_respx):
+    route = mock_respx.get("/teams").mock(
+        return_value=httpx.Response(
+            200, json={"response": [{"team": {"id": 33, "name": "Manchester United"}}]}
+        )
+    )
+
+    teams = await search_teams("manches")
+    assert teams[0]["team"]["id"] == 33
+    assert route.calls.last.request.url.params["search"] == "manches"
+
+
+def test_index_is_prefix_and_accent_insensitive():
+    index = SearchIndex()
+    index.add("team", 530, "Atlético Madrid", aliases=("Spain",))
+    index.add("team", 529, "Barcelona")
+    index.add("venue", 1460, "Estadio Cívitas Metropolitano", aliases=("Madrid",))
+
+    assert [hit["id"] for hit in index.search("atle")] == [530]
+    assert [hit["id"] for hit in index.search("MADR", kinds=["venue"])] == [1460]
+    assert index.search("madrid atl")[0]["name"] == "Atlético Madrid"
+
+    index.add("team", 530, "Club Atlético de Madrid")
+    assert index.search("spain") == []
+    assert index.search("club")[0]["id"] == 530
+
+
+@pytest.mark.asyncio
+async def test_index_updates_from_fetched_responses(mock_respx):
+    mock_respx.get("/leagues").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "response": [
+                    {
+                        "league": {"id": 39, "name": "Premier League"},
+                        "country": {"name": "England"},
+                    }
+                ]
+            },
+        )
+    )
+
+    index = SearchIndex()
+    index.attach(get_client())
+    try:
+        await get_all_leagues()
+    finally:
+        index.detach()
+
+    assert index.search("prem")[0]["id"] == 39
+    assert index.search("england")[0]["type"] == "league"
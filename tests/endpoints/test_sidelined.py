@@ -1,5 +1,25 @@
-def test_transfers_placeholder():
-    """
-    Placeholder for transfer endpoints.
-    """
-    assert True
+import httpx
+import pytest
+from api_football_sdk.endpoints.sidelined import get_sidelined_by_players
+
+
+@pytest.mark.asyncio
+async def test_get_sidelined_by_players(mock_respx):
+    mock_respx.get("/sidelined").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "response": [
+                    {
+                        "id": 276,
+                        "sidelined": [
+                            {"type": "Suspended", "start": "2024-02-24", "end": None}
+                        ],
+                    }
+                ]
+            },
+        )
+    )
+
+    sidelined = await get_sidelined_by_players([276])
+    assert sidelined[276][0]["type"] == "Suspended"
@@ -0,0 +1,51 @@
+import httpx
+import pytest
+from api_football_sdk.availability import AvailabilityIndex
+
+
+def _injury(fixture_id, team_id, player_id, kind):
+    return {
+        "fixture": {"id": fixture_id},
+        "team": {"id": team_id},
+        "player": {"id": player_id, "type": kind},
+    }
+
+
+@pytest.mark.asyncio
+async def test_index_answers_from_one_bulk_call(mock_respx):
+    route = mock_respx.get("/injuries").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "response": [
+                    _injury(1, 33, 865, "Missing Fixture"),
+                    _injury(1, 33, 866, "Questionable"),
+                    _injury(1, 40, 900, "Missing Fixture"),
+                ]
+            },
+        )
+    )
+
+    index = AvailabilityIndex()
+    await index.load_league(39, 2024)
+
+    assert route.call_count == 1
+    assert len(index.unavailable(1, 33)) == 2
+    assert [p["id"] for p in index.unavailable(1, 33, confirmed_only=True)] == [865]
+    assert not index.is_available(1, 40, 900)
+    assert index.is_available(1, 40, 865)
+
+
+def test_sidelined_on():
+    index = AvailabilityIndex()
+    index.add_sidelined(
+        276,
+        [
+            {"type": "Knee Injury", "start": "2024-01-01", "end": "2024-01-31"},
+            {"type": "Suspended", "start": "2024-03-01", "end": None},
+        ],
+    )
+
+    assert index.sidelined_on(276, "2024-01-15") == "Knee Injury"
+    assert index.sidelined_on(276, "2024-02-15") is None
+    assert index.sidelined_on(276, "2024-04-01") == "Suspended"
@@ -0,0 +1,128 @@
+import asyncio
+
+import httpx
+import pytest
+from api_football_sdk.adapters.memory import MemoryTransport
+from api_football_sdk.cache import CachePolicy, ResponseCache
+from api_football_sdk.circuit_breaker import OPEN, CircuitBreaker
+from api_football_sdk.client import (
+    ApiFootballClient,
+    configure_client,
+    get_client,
+    set_client,
+)
+from api_football_sdk.endpoints.standings import get_standings_by_league
+from api_football_sdk.exceptions import APIFootballHTTPError
+
+
+def _client(policy, responses):
+    transport = MemoryTransport()
+
+    def handler(request):
+        status, rank = responses.pop(0)
+        return httpx.Response(status, json={"response": [{"rank": rank}]})
+
+    transport.add_route("/standings", handler=handler)
+    cache = ResponseCache({"/standings": policy})
+    return ApiFootballClient(transport=transport, cache=cache, max_retries=1), cache
+
+
+def _expire(cache, seconds):
+    for entry in cache._entries.values():
+        entry.stored_at -= seconds
+
+
+@pytest.mark.asyncio
+async def test_stale_while_revalidate():
+    client, cache = _client(CachePolicy(60, max_stale=600), [(200, 1), (200, 2)])
+    params = {"league": 39, "season": 2024}
+
+    first = await client.get_json("/standings", params=params)
+    assert await client.get_json("/standings", params=params) is first
+
+    _expire(cache, 120)
+    stale = await client.get_json("/standings", params=params)
+    assert stale["response"] == [{"rank": 1}]
+    await asyncio.sleep(0.01)
+
+    fresh = await client.get_json("/standings", params=params)
+    assert fresh["response"] == [{"rank": 2}]
+    assert cache.stats()["stale_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_if_error_within_limit():
+    client, cache = _client(
+        CachePolicy(60, stale_if_error=300),
+        [(200, 1), (503, 0), (503, 0), (404, 0)],
+    )
+
+    await client.get_json("/standings")
+    _expire(cache, 120)
+    served = await client.get_json("/standings")
+    assert served["response"] == [{"rank": 1}]
+
+    _expire(cache, 600)
+    with pytest.raises(APIFootballHTTPError):
+        await client.get_json("/standings")
+
+    _expire(cache, -600)
+    with pytest.raises(APIFootballHTTPError):
+        await client.get_json("/standings")
+    assert cache.stats()["error_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_if_error_while_the_circuit_is_open():
+    transport = MemoryTransport(base_url="https://api.example/v3")
+    statuses = [200, 503]
+    transport.add_route(
+        "/standings",
+        handler=lambda request: httpx.Response(
+            statuses.pop(0), json={"response": [{"rank": 1}]}
+        ),
+    )
+    breaker = CircuitBreaker(minimum_calls=2, open_timeout=60)
+    cache = ResponseCache({"/standings": CachePolicy(60, stale_if_error=300)})
+    client = ApiFootballClient(
+        transport=transport, cache=cache, circuit_breaker=breaker, max_retries=1
+    )
+
+    await client.get_json("/standings")
+    _expire(cache, 120)
+    await client.get_json("/standings")
+    assert breaker.state("api.example") == OPEN
+
+    served = await client.get_json("/standings")
+    assert served["response"] == [{"rank": 1}]
+    assert len(transport.requests) == 2
+    assert cache.stats()["error_hits"] == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_request():
+    client, cache = _client(CachePolicy(60), [(200, 1)])
+
+    results = await asyncio.gather(*(client.get_json("/standings") for _ in range(5)))
+
+    assert all(result is results[0] for result in results)
+    assert cache.stats()["misses"] == 5
+    assert len(client.transport.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_configured_shared_client_caches_endpoint_functions():
+    transport = MemoryTransport()
+    transport.add_route("/standings", {"response": [{"league": {"id": 39}}]})
+    previous = get_client()
+    client = configure_client(transport=transport, cache=ResponseCache())
+    try:
+        assert get_client() is client
+        first = await get_standings_by_league(39, 2024)
+        second = await get_standings_by_league(39, 2024)
+    finally:
+        set_client(previous)
+
+    assert first == second == [{"league": {"id": 39}}]
+    assert len(transport.requests) == 1
+    assert get_client() is previous
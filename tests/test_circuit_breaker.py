@@ -0,0 +1,81 @@
+import httpx
+import pytest
+from api_football_sdk.adapters.base import Transport
+from api_football_sdk.adapters.memory import MemoryTransport
+from api_football_sdk.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+from api_football_sdk.client import ApiFootballClient
+from api_football_sdk.config import settings
+from api_football_sdk.exceptions import APIFootballHTTPError, CircuitOpenError
+
+
+def _client(breaker, statuses):
+    transport = MemoryTransport(base_url="https://api.example/v3")
+    transport.add_route(
+        "/fixtures", handler=lambda request: httpx.Response(statuses.pop(0))
+    )
+    transport.add_route("/teams", {"response": []})
+    return ApiFootballClient(transport=transport, circuit_breaker=breaker)
+
+
+@pytest.mark.asyncio
+async def test_opens_fails_fast_and_recovers_through_probe():
+    breaker = CircuitBreaker(minimum_calls=4, failure_threshold=0.5, open_timeout=60)
+    client = _client(breaker, [200, 503, 200, 503, 200])
+
+    for _ in range(4):
+        try:
+            await client.get("/fixtures")
+        except APIFootballHTTPError:
+            pass
+    assert breaker.state("api.example") == OPEN
+
+    with pytest.raises(CircuitOpenError) as excinfo:
+        await client.get("/teams")
+    assert excinfo.value.retry_after > 0
+    assert len(client.transport.requests) == 4
+
+    breaker._circuits[("api.example", "*")].opened_at -= 60
+    assert breaker.state("api.example") == HALF_OPEN
+    await client.get("/fixtures")
+    assert breaker.state("api.example") == CLOSED
+    assert breaker.snapshot()["api.example"]["times_opened"] == 1
+
+
+def test_failed_probe_reopens_and_per_path_scopes():
+    breaker = CircuitBreaker(minimum_calls=2, open_timeout=0, per_path=True)
+    for _ in range(2):
+        breaker.record(breaker.before_request("h", "/odds"), False)
+
+    assert breaker.state("h", "/odds") == HALF_OPEN
+    assert breaker.state("h", "/fixtures") == CLOSED
+
+    probe = breaker.before_request("h", "/odds")
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request("h", "/odds")
+    breaker.record(probe, False)
+    assert breaker.snapshot()["h /odds"]["times_opened"] == 2
+
+
+def test_rate_limits_do_not_count_as_failures():
+    breaker = CircuitBreaker(minimum_calls=2)
+    for _ in range(5):
+        breaker.record(breaker.before_request("h", "/"), None)
+
+    assert breaker.state("h") == CLOSED
+    assert breaker.snapshot()["h"]["calls"] == 0
+
+
+@pytest.mark.asyncio
+async def test_transports_without_a_base_url_use_the_configured_host():
+    class SendOnly(Transport):
+        async def send(self, method, url, **kwargs):
+            return httpx.Response(503, request=httpx.Request(method, url))
+
+    breaker = CircuitBreaker(minimum_calls=1)
+    client = ApiFootballClient(
+        transport=SendOnly(), circuit_breaker=breaker, max_retries=1
+    )
+
+    with pytest.raises(APIFootballHTTPError):
+        await client.get("/fixtures")
+    assert breaker.state(httpx.URL(str(settings.api_base_url)).host) == OPEN
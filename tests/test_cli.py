@@ -0,0 +1,123 @@
+import json
+import sys
+
+import httpx
+import pytest
+from api_football_sdk import cli
+from api_football_sdk.adapters.memory import MemoryTransport
+from api_football_sdk.client import ApiFootballClient
+from api_football_sdk.quota import QuotaTracker
+
+
+def _fixture(fixture_id):
+    return {"fixture": {"id": fixture_id}, "teams": {"home": {"id": 33}}}
+
+
+def _use(monkeypatch, transport, **kwargs):
+    client = ApiFootballClient(transport=transport, max_retries=1, **kwargs)
+    monkeypatch.setattr(cli, "_build_client", lambda args: client)
+    return client
+
+
+def _read(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_export_season_writes_fixture_rows(monkeypatch, tmp_path, capsys):
+    transport = MemoryTransport()
+    transport.add_route(
+        "/fixtures",
+        {"paging": {"current": 1, "total": 1}, "response": [_fixture(1), _fixture(2)]},
+        headers={"x-ratelimit-requests-limit": "100"},
+    )
+    _use(monkeypatch, transport)
+    out = tmp_path / "season.jsonl"
+
+    status = cli.main(
+        ["export-season", "--league", "39", "--season", "2024", "-o", str(out)]
+    )
+
+    assert status == 0
+    assert [row["fixture"]["id"] for row in _read(out)] == [1, 2]
+    assert transport.requests[0].url.params["league"] == "39"
+    assert "2 rows | 1 requests" in capsys.readouterr().err
+
+
+def test_hydrate_batches_ids_and_reports_failed_batches(monkeypatch, tmp_path, capsys):
+    def fixtures(request):
+        ids = [int(i) for i in request.url.params["ids"].split("-")]
+        if 41 in ids:
+            return httpx.Response(500)
+        return httpx.Response(200, json={"response": [_fixture(i) for i in ids]})
+
+    transport = MemoryTransport()
+    transport.add_route("/fixtures", handler=fixtures)
+    _use(monkeypatch, transport)
+    ids_file = tmp_path / "ids.txt"
+    ids_file.write_text("\n".join(str(i) for i in range(21, 46)) + "\n")
+    out = tmp_path / "fixtures.jsonl"
+
+    argv = ["hydrate", *map(str, range(1, 21)), "--file", str(ids_file)]
+    status = cli.main([*argv, "-o", str(out), "-q"])
+
+    assert status == 1
+    batches = [r.url.params["ids"].split("-") for r in transport.requests]
+    assert [len(batch) for batch in batches] == [20, 20, 5]
+    assert sorted(row["fixture"]["id"] for row in _read(out)) == list(range(1, 41))
+    assert capsys.readouterr().err == ""
+
+
+def test_hydrate_refuses_a_pull_beyond_the_quota(monkeypatch, tmp_path, capsys):
+    transport = MemoryTransport()
+    transport.add_route(
+        "/fixtures",
+        {"response": []},
+        headers={
+            "x-ratelimit-requests-limit": "100",
+            "x-ratelimit-requests-remaining": "1",
+        },
+    )
+    _use(monkeypatch, transport, quota=QuotaTracker())
+    argv = ["hydrate", *map(str, range(60)), "--quota-policy", "refuse"]
+
+    status = cli.main([*argv, "-o", str(tmp_path / "out.jsonl")])
+
+    assert status == 1
+    assert len(transport.requests) == 1
+    assert "needs 2 requests" in capsys.readouterr().err
+
+
+def test_reference_wraps_scalar_rows(monkeypatch, tmp_path):
+    transport = MemoryTransport()
+    transport.add_route("/leagues/seasons", {"response": [2023, 2024]})
+    _use(monkeypatch, transport)
+    out = tmp_path / "seasons.jsonl"
+
+    assert cli.main(["reference", "seasons", "-o", str(out), "-q"]) == 0
+    assert _read(out) == [{"season": 2023}, {"season": 2024}]
+
+
+def test_parquet_without_pyarrow_is_a_configuration_error(monkeypatch, capsys):
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+
+    status = cli.main(["reference", "countries", "-o", "countries.parquet"])
+
+    assert status == 1
+    assert "api-football-sdk[parquet]" in capsys.readouterr().err
+
+
+def test_parquet_rows_are_written_in_row_groups(monkeypatch, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    transport = MemoryTransport()
+    transport.add_route("/leagues/seasons", {"response": [2022, 2023, 2024]})
+    _use(monkeypatch, transport)
+    monkeypatch.setattr(cli._ParquetWriter, "batch_rows", 2)
+    out = tmp_path / "seasons.parquet"
+
+    assert cli.main(["reference", "seasons", "-o", str(out), "-q"]) == 0
+    assert pq.ParquetFile(out).num_row_groups == 2
+    assert pq.read_table(out).to_pylist() == [
+        {"season": 2022},
+        {"season": 2023},
+        {"season": 2024},
+    ]
@@ -25,3 +25,24 @@ async def test_client_raises_on_5xx(mock_respx):
 
     with pytest.raises(Exception):
         await client.get("/fixtures")
+
+
+@pytest.mark.asyncio
+async def test_client_get_json_runs_response_hooks(mock_respx):
+    mock_respx.get("/timezone").mock(
+        return_value=httpx.Response(200, json={"response": ["Europe/London"]})
+    )
+    seen = []
+
+    def hook(url, params, payload):
+        seen.append((url, payload))
+
+    client = get_client()
+    client.add_response_hook(hook)
+    try:
+        payload = await client.get_json("/timezone")
+    finally:
+        client.remove_response_hook(hook)
+
+    assert payload["response"] == ["Europe/London"]
+    assert seen == [("/timezone", payload)]
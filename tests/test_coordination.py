@@ -0,0 +1,120 @@
+import asyncio
+import time
+from contextlib import aclosing
+
+import pytest
+from api_football_sdk.adapters.memory import MemoryTransport
+from api_football_sdk.client import ApiFootballClient
+from api_football_sdk.coordination import (
+    MemoryBackend,
+    SharedRateLimiter,
+    SQLiteBackend,
+    WorkQueue,
+)
+from api_football_sdk.scheduler import Priority
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def backends(request, tmp_path):
+    """Two handles on one shared state, as two processes would hold."""
+    if request.param == "memory":
+        backend = MemoryBackend()
+        return backend, backend
+    path = str(tmp_path / "coordination.db")
+    return SQLiteBackend(path), SQLiteBackend(path)
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_is_shared(backends):
+    first, second = backends
+
+    assert await first.take_token("requests", rate=10, burst=2) == 0.0
+    assert await second.take_token("requests", rate=10, burst=2) == 0.0
+    wait = await first.take_token("requests", rate=10, burst=2)
+    assert 0.05 < wait <= 0.1
+    assert await second.take_token("other", rate=10, burst=2) == 0.0
+
+
+@pytest.mark.asyncio
+async def test_background_leaves_its_reserve(backends):
+    first, _ = backends
+    for _ in range(5):
+        assert await first.take_token("requests", rate=1, burst=10, floor=5) == 0.0
+    assert await first.take_token("requests", rate=1, burst=10, floor=5) > 0
+    assert await first.take_token("requests", rate=1, burst=10) == 0.0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("rate", [10 / 60, 1.0, 1.5])
+@pytest.mark.parametrize("priority", list(Priority))
+async def test_every_class_gets_a_token_from_a_full_shared_bucket(rate, priority):
+    limiter = SharedRateLimiter(MemoryBackend(), rate=rate)
+    await asyncio.wait_for(limiter.acquire(priority), 0.5)
+
+    limiter = SharedRateLimiter(MemoryBackend(), rate=rate, burst=1)
+    await asyncio.wait_for(limiter.acquire(priority), 0.5)
+
+
+@pytest.mark.asyncio
+async def test_workers_claim_disjoint_items(backends):
+    first, second = backends
+    queues = [WorkQueue(first, "hydrate", batch=3), WorkQueue(second, "hydrate")]
+    assert await queues[0].add(range(20)) == 20
+    assert await queues[1].add([5, 20]) == 1
+
+    seen: dict[str, list[int]] = {queue.worker: [] for queue in queues}
+
+    async def work(queue):
+        async for item in queue:
+            seen[queue.worker].append(item)
+            await asyncio.sleep(0)
+
+    await asyncio.gather(*(work(queue) for queue in queues))
+
+    done = [item for items in seen.values() for item in items]
+    assert sorted(done) == list(range(21))
+    assert await queues[0].counts() == {"pending": 0, "claimed": 0, "done": 21}
+
+
+@pytest.mark.asyncio
+async def test_expired_and_abandoned_claims_are_taken_over(backends):
+    first, second = backends
+    crashed = WorkQueue(first, "q", lease=0.0)
+    survivor = WorkQueue(second, "q")
+    await crashed.add(["a", "b", "c"])
+
+    assert await crashed.claim(1) == ["a"]
+    async with aclosing(survivor.__aiter__()) as items:
+        async for item in items:
+            if item == "c":
+                break
+
+    assert await survivor.claim() == ["c"]
+    assert await crashed.complete(["a"]) == 0
+    assert await survivor.counts() == {"pending": 0, "claimed": 1, "done": 2}
+
+
+@pytest.mark.asyncio
+async def test_clients_share_one_rate_limit():
+    backend = MemoryBackend()
+    clients = []
+    for _ in range(2):
+        transport = MemoryTransport()
+        transport.add_route("/status", {"response": {}})
+        clients.append(
+            ApiFootballClient(transport=transport, coordination=backend, rate_limit=20)
+        )
+    assert clients[0].scheduler.rate is None
+
+    started = time.monotonic()
+    await asyncio.gather(
+        *(
+            client.get("/status", priority=Priority.LIVE)
+            for client in clients
+            for _ in range(15)
+        )
+    )
+
+    # 20 tokens in the bucket, then 20 per second for the other 10.
+    assert time.monotonic() - started >= 0.45
+    assert sum(client.rate_limiter.granted for client in clients) == 30
@@ -0,0 +1,69 @@
+import asyncio
+
+import httpx
+import pytest
+from api_football_sdk.adapters.memory import MemoryTransport
+from api_football_sdk.client import ApiFootballClient
+from api_football_sdk.deadline import (
+    Deadline,
+    current_deadline,
+    deadline_scope,
+    without_deadline,
+)
+from api_football_sdk.endpoints.fixtures import get_fixture_bundle
+from api_football_sdk.exceptions import DeadlineExceededError
+
+
+def test_nested_scopes_keep_the_earliest_deadline():
+    with deadline_scope(10) as outer:
+        with deadline_scope(60) as inner:
+            assert inner is outer
+        with deadline_scope(1) as tighter:
+            assert tighter.remaining() < outer.remaining()
+        with without_deadline():
+            assert current_deadline() is None
+    assert current_deadline() is None
+
+
+@pytest.mark.asyncio
+async def test_retry_skipped_when_deadline_too_close():
+    transport = MemoryTransport()
+
+    def refuse(request):
+        raise httpx.ConnectError("refused", request=request)
+
+    transport.add_route("/fixtures", handler=refuse)
+    client = ApiFootballClient(transport=transport)
+
+    with pytest.raises(DeadlineExceededError):
+        await client.get("/fixtures", deadline=0.3)
+    assert len(transport.requests) == 1
+
+    with pytest.raises(DeadlineExceededError):
+        await client.get("/fixtures", deadline=Deadline.after(-1))
+    assert len(transport.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_bundle_returns_partial_results_within_deadline(monkeypatch):
+    transport = MemoryTransport()
+
+    async def slow(request):
+        await asyncio.sleep(5)
+        return httpx.Response(200, json={"response": []})
+
+    transport.add_route("/fixtures", {"response": [{"fixture": {"id": 1}}]})
+    transport.add_route("/fixtures/events", {"response": [{"type": "Goal"}]})
+    transport.add_route("/fixtures/lineups", handler=slow)
+    transport.add_route("/fixtures/statistics", handler=slow)
+    client = ApiFootballClient(transport=transport)
+    for module in ("fixtures", "events", "lineups", "statistics"):
+        monkeypatch.setattr(
+            f"api_football_sdk.endpoints.{module}.get_client", lambda: client
+        )
+
+    bundle = await asyncio.wait_for(get_fixture_bundle(1, deadline=0.2), 1)
+
+    assert bundle["fixture"] == {"fixture": {"id": 1}}
+    assert bundle["events"] == [{"type": "Goal"}]
+    assert bundle["missing"] == ["lineups", "statistics"]
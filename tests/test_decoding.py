@@ -0,0 +1,100 @@
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+from api_football_sdk.adapters.memory import MemoryTransport
+from api_football_sdk.client import ApiFootballClient
+from api_football_sdk.decoding import JsonDecoder
+from api_football_sdk.exceptions import ParsingError
+from api_football_sdk.loop_monitor import LoopMonitor
+
+
+def _body(rows=2000):
+    return json.dumps(
+        {
+            "paging": {"current": 1, "total": 3},
+            "response": [{"player": {"id": i, "name": f"P{i}"}} for i in range(rows)],
+        }
+    ).encode()
+
+
+@pytest.mark.asyncio
+async def test_large_bodies_are_decoded_in_slices_yielding_to_the_loop():
+    body = _body()
+    decoder = JsonDecoder(offload_threshold=1024, slice_bytes=4096)
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0)
+
+    task = asyncio.create_task(ticker())
+    payload = await decoder.decode("/players", body)
+    task.cancel()
+
+    assert payload == json.loads(body)
+    assert ticks >= len(body) // 4096
+    stats = decoder.stats()["/players"]
+    assert stats["count"] == stats["offloaded"] == 1
+    assert stats["bytes"] == len(body)
+
+
+@pytest.mark.asyncio
+async def test_small_and_non_object_bodies_are_decoded_inline():
+    decoder = JsonDecoder(offload_threshold=10)
+
+    assert await decoder.decode("/timezone", b'{"response": ["UTC"]}') == {
+        "response": ["UTC"]
+    }
+    assert await decoder.decode("/raw", b"[1, 2, 3, 4, 5, 6]") == [1, 2, 3, 4, 5, 6]
+    assert decoder.stats()["/raw"]["offloaded"] == 0
+
+
+@pytest.mark.asyncio
+async def test_executor_decoding():
+    body = _body(50)
+    with ThreadPoolExecutor(1) as executor:
+        decoder = JsonDecoder(offload_threshold=0, executor=executor)
+        assert await decoder.decode("/players", body) == json.loads(body)
+    assert decoder.stats()["/players"]["offloaded"] == 1
+
+
+@pytest.mark.asyncio
+async def test_client_reports_blocking_steps_with_their_endpoint():
+    transport = MemoryTransport()
+    transport.add_route("/players", json.loads(_body(200)))
+    blocked = []
+    monitor = LoopMonitor(threshold=0.05, on_block=blocked.append)
+    client = ApiFootballClient(
+        transport=transport,
+        decoder=JsonDecoder(offload_threshold=1024),
+        loop_monitor=monitor,
+    )
+    client.add_response_hook(lambda url, params, payload: time.sleep(0.1))
+
+    payload = await client.get_json("/players")
+
+    assert len(payload["response"]) == 200
+    assert client.decoder.stats()["/players"]["offloaded"] == 1
+    assert [(r.url, r.stage) for r in blocked] == [("/players", "hooks")]
+    assert list(monitor.reports) == blocked
+
+
+@pytest.mark.asyncio
+async def test_invalid_large_body_is_a_parsing_error():
+    transport = MemoryTransport()
+    transport.add_route(
+        "/players",
+        handler=lambda request: httpx.Response(200, content=b'{"response": [1, 2,'),
+    )
+    client = ApiFootballClient(
+        transport=transport, decoder=JsonDecoder(offload_threshold=4, slice_bytes=4)
+    )
+
+    with pytest.raises(ParsingError, match="/players"):
+        await client.get_json("/players")
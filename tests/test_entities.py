@@ -0,0 +1,70 @@
+import copy
+
+import pytest
+from api_football_sdk.adapters.memory import MemoryTransport
+from api_football_sdk.client import ApiFootballClient
+from api_football_sdk.entities import EntityGraph
+
+
+def _fixture(fixture_id, home, away, round_, winner=None):
+    return {
+        "fixture": {"id": fixture_id, "venue": {"id": 556, "name": "Old Trafford"}},
+        "league": {"id": 39, "name": "Premier League", "season": 2024, "round": round_},
+        "teams": {
+            "home": {"id": home, "name": f"Team {home}", "winner": winner},
+            "away": {"id": away, "name": f"Team {away}", "winner": None},
+        },
+    }
+
+
+def test_fixtures_share_entities_and_keep_their_shape():
+    rows = [
+        _fixture(1, 33, 40, "Regular Season - 1", winner=True),
+        _fixture(2, 40, 33, "Regular Season - 1"),
+        _fixture(3, 33, 50, "Regular Season - 2", winner=True),
+    ]
+    graph = EntityGraph()
+
+    payload = graph.normalize("/fixtures", {"response": copy.deepcopy(rows)})
+
+    assert payload["response"] == rows
+    first, second, third = payload["response"]
+    assert first["teams"]["home"] is third["teams"]["home"]
+    assert first["teams"]["away"] is second["teams"]["home"]
+    assert first["league"] is second["league"]
+    assert first["league"] is not third["league"]
+    assert first["fixture"]["venue"] is third["fixture"]["venue"]
+    assert graph.teams.get(33) == {"id": 33, "name": "Team 33"}
+    assert graph.stats() == {"leagues": 1, "teams": 3, "venues": 1, "interned": 12}
+
+
+def test_updates_propagate_to_every_variant():
+    graph = EntityGraph()
+    payload = graph.normalize(
+        "/fixtures", {"response": [_fixture(1, 33, 40, "R1", winner=True)]}
+    )
+    graph.normalize(
+        "/teams",
+        {"response": [{"team": {"id": 33, "name": "Man United", "code": "MUN"}}]},
+    )
+
+    home = payload["response"][0]["teams"]["home"]
+    assert home == {"id": 33, "name": "Man United", "winner": True, "code": "MUN"}
+    assert graph.teams.update(33, {"name": "Manchester United", "winner": False})
+    assert home["name"] == "Manchester United"
+    assert home["winner"] is True
+    assert not graph.teams.update(33, {"name": None})
+
+
+@pytest.mark.asyncio
+async def test_client_normalizes_get_json_and_streamed_rows():
+    rows = [_fixture(1, 33, 40, "R1"), _fixture(2, 40, 33, "R1")]
+    transport = MemoryTransport()
+    transport.add_route("/fixtures", {"response": rows})
+    client = ApiFootballClient(transport=transport, entities=EntityGraph())
+
+    payload = await client.get_json("/fixtures")
+    streamed = [row async for row in client.stream_json("/fixtures")]
+
+    assert payload["response"][0]["teams"]["home"] is streamed[1]["teams"]["away"]
+    assert client.entities.teams.ids() == [33, 40]
@@ -0,0 +1,166 @@
+import math
+
+import httpx
+import pytest
+from api_football_sdk.adapters.memory import MemoryTransport
+from api_football_sdk.client import ApiFootballClient
+from api_football_sdk.exceptions import ConfigurationError
+from api_football_sdk.feature_matrix import (
+    STAT_COLUMNS,
+    FeatureMatrix,
+    StatisticsMatrixBuilder,
+    parse_stat_value,
+)
+
+
+def _fixture(fixture_id, status="FT", with_stats=False):
+    row = {
+        "fixture": {
+            "id": fixture_id,
+            "timestamp": 1_700_000_000 - fixture_id,
+            "status": {"short": status},
+        },
+        "teams": {"home": {"id": 33}, "away": {"id": 40}},
+    }
+    if with_stats:
+        # Away team listed first: rows must follow `teams.home`, not order.
+        row["statistics"] = [
+            {
+                "team": {"id": 40},
+                "statistics": [
+                    {"type": "Ball Possession", "value": "45%"},
+                    {"type": "Red Cards", "value": None},
+                ],
+            },
+            {
+                "team": {"id": 33},
+                "statistics": [
+                    {"type": "Ball Possession", "value": "55%"},
+                    {"type": "Total Shots", "value": fixture_id},
+                    {"type": "expected_goals", "value": "1.42"},
+                    {"type": "Unknown Stat", "value": 3},
+                ],
+            },
+        ]
+    return row
+
+
+def _transport(statuses):
+    def fixtures(request):
+        if "ids" in request.url.params:
+            ids = [int(i) for i in request.url.params["ids"].split("-")]
+            rows = [_fixture(i, with_stats=True) for i in ids]
+        else:
+            rows = [_fixture(i, status) for i, status in statuses.items()]
+        return httpx.Response(200, json={"response": rows})
+
+    transport = MemoryTransport()
+    transport.add_route("/fixtures", handler=fixtures)
+    return transport
+
+
+def test_parse_stat_value():
+    assert parse_stat_value(7) == 7.0
+    assert parse_stat_value("55%") == pytest.approx(0.55)
+    assert parse_stat_value("1.42") == pytest.approx(1.42)
+    assert math.isnan(parse_stat_value(None))
+    assert math.isnan(parse_stat_value("n/a"))
+
+
+@pytest.mark.asyncio
+async def test_build_parses_finished_fixtures_into_a_fixed_schema(tmp_path):
+    statuses = {i: "FT" for i in range(1, 26)} | {99: "NS"}
+    transport = _transport(statuses)
+    builder = StatisticsMatrixBuilder(
+        ApiFootballClient(transport=transport), cache_dir=tmp_path
+    )
+
+    matrix = await builder.build(league_id=39, season=2024)
+
+    assert matrix.shape == (25, 2 * len(STAT_COLUMNS))
+    # Kickoff order, and the unfinished fixture is left out.
+    assert list(matrix.fixture_ids) == list(range(25, 0, -1))
+    row = dict(zip(matrix.columns, matrix.row(3)))
+    assert row["home_ball_possession"] == pytest.approx(0.55)
+    assert row["away_ball_possession"] == pytest.approx(0.45)
+    assert row["home_total_shots"] == 3.0
+    assert row["home_expected_goals"] == pytest.approx(1.42)
+    assert math.isnan(row["away_red_cards"])
+    assert len(transport.requests) == 3  # 1 listing + 2 batches of 20 ids
+
+    # A new builder reuses the saved rows: only the newly finished fixture
+    # is fetched.
+    statuses[99] = "FT"
+    again = StatisticsMatrixBuilder(
+        ApiFootballClient(transport=transport), cache_dir=tmp_path
+    )
+    matrix = await again.build(league_id=39, season=2024)
+    assert len(matrix) == 26 and again.fetched == 1
+    assert transport.requests[-1].url.params["ids"] == "99"
+
+
+@pytest.mark.asyncio
+async def test_fixtures_without_statistics_yet_are_fetched_again(tmp_path):
+    published = set()
+
+    def fixtures(request):
+        if "ids" in request.url.params:
+            ids = [int(i) for i in request.url.params["ids"].split("-")]
+            rows = [_fixture(i, with_stats=i in published) for i in ids]
+        else:
+            rows = [_fixture(1), _fixture(2)]
+        return httpx.Response(200, json={"response": rows})
+
+    transport = MemoryTransport()
+    transport.add_route("/fixtures", handler=fixtures)
+    client = ApiFootballClient(transport=transport)
+    builder = StatisticsMatrixBuilder(client, cache_dir=tmp_path)
+    published.add(1)
+
+    matrix = await builder.build(league_id=39, season=2024)
+    possession = matrix.columns.index("home_ball_possession")
+    assert math.isnan(matrix.row(2)[possession]) and builder.fetched == 1
+
+    published.add(2)
+    again = StatisticsMatrixBuilder(client, cache_dir=tmp_path)
+    matrix = await again.build(league_id=39, season=2024)
+    assert matrix.row(2)[possession] == pytest.approx(0.55)
+    assert transport.requests[-1].url.params["ids"] == "2"
+
+    matrix = await builder.build(league_id=39, season=2024)
+    assert matrix.row(2)[possession] == pytest.approx(0.55)
+
+
+def test_save_and_load_round_trip(tmp_path):
+    from array import array
+
+    matrix = FeatureMatrix(("a", "b"), array("q", [1, 2]), array("f", [1, 2, 3, 4]))
+    matrix.save(tmp_path / "m.afsm")
+
+    loaded = FeatureMatrix.load(tmp_path / "m.afsm")
+
+    assert loaded.columns == ("a", "b")
+    assert loaded.column("b") == [2.0, 4.0]
+    assert loaded.row(2) == [3.0, 4.0]
+
+
+def test_to_numpy_is_a_zero_copy_float32_view(monkeypatch):
+    from array import array
+
+    matrix = FeatureMatrix(("a", "b"), array("q", [1, 2]), array("f", [1, 2, 3, 4]))
+    numpy = pytest.importorskip("numpy")
+
+    ids, values = matrix.to_numpy()
+
+    assert values.dtype == numpy.float32 and values.shape == (2, 2)
+    assert ids.tolist() == [1, 2]
+
+
+def test_to_numpy_without_numpy_is_a_configuration_error(monkeypatch):
+    from array import array
+
+    monkeypatch.setitem(__import__("sys").modules, "numpy", None)
+    matrix = FeatureMatrix(("a",), array("q", [1]), array("f", [1]))
+
+    with pytest.raises(ConfigurationError, match="numpy"):
+        matrix.to_numpy()
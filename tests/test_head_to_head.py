@@ -0,0 +1,67 @@
+import httpx
+import pytest
+from api_football_sdk.endpoints.fixtures import get_fixtures_head_to_head
+from api_football_sdk.head_to_head import HeadToHeadService, canonical_pair
+
+
+def _fixture(fixture_id, home, away, timestamp, league_id=39, season=2024):
+    return {
+        "fixture": {"id": fixture_id, "timestamp": timestamp},
+        "league": {"id": league_id, "season": season},
+        "teams": {"home": {"id": home}, "away": {"id": away}},
+    }
+
+
+def test_canonical_pair():
+    assert canonical_pair(40, 33) == (33, 40)
+    assert canonical_pair(33, 40) == (33, 40)
+
+
+@pytest.mark.asyncio
+async def test_head_to_head_endpoint_is_order_independent(mock_respx):
+    route = mock_respx.get("/fixtures/headtohead").mock(
+        return_value=httpx.Response(200, json={"response": []})
+    )
+
+    await get_fixtures_head_to_head(40, 33)
+    assert route.calls.last.request.url.params["h2h"] == "33-40"
+
+
+@pytest.mark.asyncio
+async def test_loaded_league_is_served_locally(mock_respx):
+    mock_respx.get("/fixtures").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "response": [
+                    _fixture(2, 40, 33, 200),
+                    _fixture(1, 33, 40, 100),
+                    _fixture(3, 33, 50, 300),
+                ]
+            },
+        )
+    )
+
+    service = HeadToHeadService()
+    await service.load_league(39, 2024)
+    meetings = await service.get(40, 33, league_id=39, season=2024)
+
+    assert [m["fixture"]["id"] for m in meetings] == [1, 2]
+    assert len(mock_respx.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_many_fetches_each_gap_once(mock_respx):
+    route = mock_respx.get("/fixtures/headtohead").mock(
+        return_value=httpx.Response(
+            200, json={"response": [_fixture(7, 1, 2, 100), _fixture(8, 2, 1, 200)]}
+        )
+    )
+
+    service = HeadToHeadService()
+    result = await service.get_many([(1, 2), (2, 1)], last=1)
+    again = await service.get(2, 1)
+
+    assert route.call_count == 1
+    assert [m["fixture"]["id"] for m in result[(1, 2)]] == [8]
+    assert len(again) == 2
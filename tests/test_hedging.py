@@ -0,0 +1,112 @@
+import asyncio
+
+import httpx
+import pytest
+from api_football_sdk.adapters.memory import MemoryTransport
+from api_football_sdk.client import ApiFootballClient
+from api_football_sdk.hedging import Hedger, LatencyWindow
+from api_football_sdk.scheduler import Priority
+
+
+def _client(hedger, delays):
+    transport = MemoryTransport()
+
+    async def handler(request):
+        await asyncio.sleep(delays.pop(0) if delays else 0)
+        return httpx.Response(200, json={"response": []})
+
+    transport.add_route("/fixtures", handler=handler)
+    return ApiFootballClient(transport=transport, hedging=hedger)
+
+
+def _warm(hedger, latency=0.01, samples=20):
+    for _ in range(samples):
+        hedger.record("/fixtures", latency)
+
+
+@pytest.mark.asyncio
+async def test_slow_request_is_hedged_and_duplicate_wins():
+    hedger = Hedger(budget=1.0, min_delay=0.01)
+    _warm(hedger)
+    client = _client(hedger, [1.0, 0.0])
+
+    await asyncio.wait_for(client.get("/fixtures"), 0.5)
+
+    assert len(client.transport.requests) == 2
+    assert hedger.stats()["hedge_wins"] == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_duplicate_does_not_beat_a_pending_success():
+    hedger = Hedger(budget=1.0, min_delay=0.01)
+    _warm(hedger)
+    transport = MemoryTransport()
+    statuses = [200, 503]
+
+    async def handler(request):
+        status = statuses.pop(0)
+        await asyncio.sleep(0.2 if status == 200 else 0)
+        return httpx.Response(status, json={"response": []})
+
+    transport.add_route("/fixtures", handler=handler)
+    client = ApiFootballClient(transport=transport, hedging=hedger, max_retries=1)
+    recorded = []
+    hedger.record = lambda url, latency: recorded.append(latency)
+
+    response = await asyncio.wait_for(client.get("/fixtures"), 1.0)
+
+    assert response.status_code == 200
+    assert hedger.stats()["hedged"] == 1
+    assert hedger.stats()["hedge_wins"] == 0
+    assert len(recorded) == 1 and recorded[0] >= 0.2
+
+
+@pytest.mark.asyncio
+async def test_requests_queued_for_a_slot_are_not_hedged():
+    hedger = Hedger(budget=1.0, min_delay=0.01)
+    _warm(hedger)
+    transport = MemoryTransport()
+
+    async def slow(request):
+        await asyncio.sleep(0.2)
+        return httpx.Response(200, json={"response": []})
+
+    transport.add_route("/slow", handler=slow)
+    transport.add_route("/fixtures", {"response": []})
+    client = ApiFootballClient(transport=transport, hedging=hedger, max_concurrency=1)
+    recorded = []
+    hedger.record = lambda url, latency: recorded.append((url, latency))
+
+    busy = asyncio.ensure_future(client.get("/slow"))
+    await asyncio.sleep(0.01)
+    await asyncio.wait_for(client.get("/fixtures"), 1.0)
+    await busy
+
+    assert hedger.stats()["hedged"] == 0
+    assert [r.url.path for r in transport.requests] == ["/slow", "/fixtures"]
+    assert dict(recorded)["/fixtures"] < 0.1
+
+
+@pytest.mark.asyncio
+async def test_budget_caps_hedges_and_background_never_hedges():
+    hedger = Hedger(budget=0.5, min_delay=0.01)
+    _warm(hedger)
+    client = _client(hedger, [0.05, 0.05, 0.05, 0.05])
+
+    await client.get("/fixtures")
+    await client.get("/fixtures")
+    assert hedger.hedged == 1
+
+    await client.get("/fixtures", priority=Priority.BACKGROUND)
+    assert hedger.hedged == 1
+    assert hedger.requests == 2
+
+
+def test_latency_window_percentile():
+    window = LatencyWindow(size=4)
+    for latency in (0.1, 0.2, 0.3, 0.4, 0.9):
+        window.add(latency)
+
+    assert len(window) == 4
+    assert window.percentile(0.5) == 0.3
+    assert window.percentile(0.99) == 0.9
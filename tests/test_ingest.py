@@ -0,0 +1,70 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+from api_football_sdk.adapters.memory import MemoryTransport
+from api_football_sdk.client import ApiFootballClient
+from api_football_sdk.exceptions import APIFootballHTTPError, ParsingError
+from api_football_sdk.ingest import IngestPipeline, decode_rows
+from api_football_sdk.storage import EntityStore
+
+
+def _client():
+    def fixtures(request):
+        season = int(request.url.params["season"])
+        if season == 1999:
+            return httpx.Response(200, content=b"{not json")
+        rows = [
+            {
+                "fixture": {"id": season * 10 + i, "venue": {"id": 556}},
+                "league": {"id": 39, "season": season, "round": "R1"},
+                "teams": {"home": {"id": 33}, "away": {"id": 40 + i}},
+                "goals": {"home": i, "away": 0},
+            }
+            for i in range(3)
+        ]
+        return httpx.Response(200, json={"response": rows})
+
+    transport = MemoryTransport()
+    transport.add_route("/fixtures", handler=fixtures)
+    transport.add_route("/teams", status_code=404)
+    return ApiFootballClient(transport=transport, max_retries=1)
+
+
+@pytest.mark.asyncio
+async def test_ingest_decodes_in_worker_processes_and_writes_the_store():
+    requests = [("/fixtures", {"league": 39, "season": s}) for s in (2023, 2024, 1999)]
+    requests.append(("/teams", {"id": 1}))
+
+    with EntityStore() as store:
+        async with IngestPipeline(_client(), workers=1) as pipeline:
+            stats = await pipeline.ingest(requests, store)
+
+        assert store.count("fixtures") == 6
+        assert store.count("teams") == 4
+        assert store.fixture_ids(league_id=39, season=2024) == [20240, 20241, 20242]
+    assert stats == {
+        "fetched": 3,
+        "transformed": 2,
+        "failed": 2,
+        "bytes_fetched": stats["bytes_fetched"],
+    }
+    errors = sorted(type(exc).__name__ for _, _, exc in pipeline.failures)
+    assert errors == [APIFootballHTTPError.__name__, ParsingError.__name__]
+
+
+@pytest.mark.asyncio
+async def test_run_applies_custom_transform_and_stops_early():
+    requests = [("/fixtures", {"season": 2000 + s}) for s in range(50)]
+    with ThreadPoolExecutor(2) as executor:
+        pipeline = IngestPipeline(
+            _client(), transform=decode_rows, executor=executor, max_pending=2
+        )
+        seen = []
+        async for url, params, rows in pipeline.run(requests):
+            seen.append(len(rows))
+            if len(seen) == 3:
+                break
+
+    assert seen == [3, 3, 3]
+    assert pipeline.fetched < 50
@@ -0,0 +1,148 @@
+import asyncio
+
+import httpx
+import pytest
+from api_football_sdk.live_hub import (
+    ENDED,
+    EVENT,
+    FIXTURE,
+    LiveHub,
+    subscribe_remote,
+)
+
+
+def _live(fixture_id, league_id, goals, events):
+    return {
+        "fixture": {"id": fixture_id, "status": {"short": "1H", "elapsed": 30}},
+        "league": {"id": league_id},
+        "goals": {"home": goals, "away": 0},
+        "events": [
+            {"time": {"elapsed": 10 + i}, "type": kind, "detail": kind}
+            for i, kind in enumerate(events)
+        ],
+    }
+
+
+def _drain(subscription):
+    messages = []
+    while not subscription._queue.empty():
+        messages.append(subscription._queue.get_nowait())
+    return [(m.kind, m.fixture_id, m.event_type) for m in messages]
+
+
+@pytest.mark.asyncio
+async def test_one_poll_serves_every_subscriber_with_filtered_changes(mock_respx):
+    route = mock_respx.get("/fixtures").mock(
+        side_effect=[
+            httpx.Response(
+                200,
+                json={
+                    "response": [
+                        _live(1, 39, 0, ["Card"]),
+                        _live(2, 140, 0, []),
+                    ]
+                },
+            ),
+            httpx.Response(200, json={"response": [_live(1, 39, 1, ["Card", "Goal"])]}),
+        ]
+    )
+    hub = LiveHub()
+    everything = hub.subscribe()
+    premier_goals = hub.subscribe(leagues=[39], event_types=["Goal"])
+    subscribers = [hub.subscribe(fixtures=[2]) for _ in range(5)]
+
+    await hub.poll_once()
+    await hub.poll_once()
+
+    assert route.call_count == 2
+    assert _drain(everything) == [
+        (FIXTURE, 1, None),
+        (EVENT, 1, "Card"),
+        (FIXTURE, 2, None),
+        (FIXTURE, 1, None),
+        (EVENT, 1, "Goal"),
+        (ENDED, 2, None),
+    ]
+    assert _drain(premier_goals) == [
+        (FIXTURE, 1, None),
+        (FIXTURE, 1, None),
+        (EVENT, 1, "Goal"),
+    ]
+    assert _drain(subscribers[0]) == [(FIXTURE, 2, None), (ENDED, 2, None)]
+    assert [row["fixture"]["id"] for row in hub.fixtures()] == [1]
+
+
+@pytest.mark.asyncio
+async def test_partial_rows_end_fixtures_on_terminal_status_only():
+    hub = LiveHub()
+    subscription = hub.subscribe()
+    await hub.process([_live(1, 39, 0, []), _live(2, 39, 0, [])], partial=True)
+    finished = _live(2, 39, 0, [])
+    finished["fixture"]["status"] = {"short": "FT", "elapsed": 90}
+
+    await hub.process([finished], partial=True)
+
+    assert _drain(subscription) == [
+        (FIXTURE, 1, None),
+        (FIXTURE, 2, None),
+        (FIXTURE, 2, None),
+        (ENDED, 2, None),
+    ]
+    assert [row["fixture"]["id"] for row in hub.fixtures()] == [1]
+
+
+@pytest.mark.asyncio
+async def test_drop_policies_bound_slow_subscribers():
+    hub = LiveHub()
+    oldest = hub.subscribe(maxsize=2, policy="drop_oldest")
+    newest = hub.subscribe(maxsize=2, policy="drop_newest")
+
+    await hub.process([_live(1, 39, 0, ["a", "b", "c"])])
+
+    assert [m[2] for m in _drain(oldest)] == ["b", "c"]
+    assert [m[0] for m in _drain(newest)] == [FIXTURE, EVENT]
+    assert oldest.dropped == newest.dropped == 2
+
+    blocking = hub.subscribe(maxsize=1, policy="block")
+    publishing = asyncio.ensure_future(hub.process([_live(1, 39, 1, ["d"])]))
+    await asyncio.sleep(0)
+    assert not publishing.done()  # waits for the slow subscriber
+    assert (await blocking.get()).kind == FIXTURE
+    await publishing
+
+
+@pytest.mark.asyncio
+async def test_closing_ends_iteration():
+    hub = LiveHub()
+    subscription = hub.subscribe()
+
+    async def consume():
+        return [message async for message in subscription]
+
+    consumer = asyncio.ensure_future(consume())
+    await hub.process([_live(1, 39, 0, [])])
+    await asyncio.sleep(0)
+    await hub.stop()
+
+    assert [m.kind for m in await consumer] == [FIXTURE]
+    assert hub.stats()["subscribers"] == 0
+
+
+@pytest.mark.asyncio
+async def test_remote_subscribers_over_a_unix_socket(tmp_path):
+    hub = LiveHub()
+    path = tmp_path / "live.sock"
+    await hub.serve(path)
+
+    async with await subscribe_remote(path, event_types=["Goal"]) as feed:
+        while hub.stats()["subscribers"] == 0:
+            await asyncio.sleep(0.01)
+        await hub.process([_live(7, 39, 1, ["Card", "Goal"])])
+
+        messages = [await feed.__anext__() for _ in range(2)]
+
+    assert [(m.kind, m.fixture_id, m.event_type) for m in messages] == [
+        (FIXTURE, 7, None),
+        (EVENT, 7, "Goal"),
+    ]
+    await hub.stop()
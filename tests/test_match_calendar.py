@@ -0,0 +1,107 @@
+import httpx
+import pytest
+from api_football_sdk.match_calendar import LivePollScheduler, MatchCalendar
+
+DAY = 1_723_766_400  # 2024-08-16T00:00:00Z
+KICKOFFS = {1: DAY + 15 * 3600, 2: DAY + 15 * 3600, 3: DAY + 17.5 * 3600}
+
+
+def _status(kickoff, now):
+    minutes = (now - kickoff) / 60
+    if minutes < 0:
+        return "NS"
+    if minutes < 45:
+        return "1H"
+    if minutes < 60:
+        return "HT"
+    if minutes < 105:
+        return "2H"
+    return "FT"
+
+
+def _row(fixture_id, now, league_id=39):
+    return {
+        "fixture": {
+            "id": fixture_id,
+            "timestamp": KICKOFFS[fixture_id],
+            "status": {"short": _status(KICKOFFS[fixture_id], now)},
+        },
+        "league": {"id": league_id},
+    }
+
+
+def test_interval_follows_the_match_state():
+    scheduler = LivePollScheduler(MatchCalendar(), lead=600)
+    kickoff = DAY
+
+    assert scheduler.interval("NS", kickoff, kickoff - 3600) is None
+    assert scheduler.interval("NS", kickoff, kickoff - 300) == scheduler.pre_match
+    assert scheduler.interval("NS", kickoff, kickoff + 60) == scheduler.in_play
+    assert scheduler.interval("1H", kickoff, kickoff + 600) == scheduler.in_play
+    assert scheduler.interval("HT", kickoff, kickoff + 2800) == scheduler.half_time
+    assert scheduler.interval("FT", kickoff, kickoff + 7000) is None
+    assert scheduler.interval("NS", kickoff, kickoff + 4 * 3600) is None
+
+
+@pytest.mark.asyncio
+async def test_match_day_costs_a_fraction_of_constant_polling(mock_respx):
+    clock = {"now": DAY}
+
+    def fixtures(request):
+        ids = [int(i) for i in request.url.params["ids"].split("-")]
+        rows = [_row(i, clock["now"]) for i in ids]
+        return httpx.Response(200, json={"response": rows})
+
+    mock_respx.get("/fixtures").mock(side_effect=fixtures)
+    calendar = MatchCalendar(leagues=[39])
+    calendar.add([_row(i, DAY) for i in KICKOFFS] + [_row(1, DAY, league_id=2)])
+    received = []
+    scheduler = LivePollScheduler(calendar, on_rows=received.extend)
+
+    # Nothing is polled until the first window opens, 10 minutes before 15:00.
+    assert await scheduler.poll_once(DAY) == 0
+    assert scheduler.due(DAY)[1] == KICKOFFS[1] - scheduler.lead
+
+    while clock["now"] < DAY + 86400:
+        await scheduler.poll_once(clock["now"])
+        _, wake = scheduler.due(clock["now"])
+        if wake is None:
+            break
+        clock["now"] = wake
+
+    assert [calendar.status(i) for i in KICKOFFS] == ["FT", "FT", "FT"]
+    # Both 15:00 fixtures share every request.
+    assert all(
+        len(request.url.params["ids"].split("-")) in (1, 2)
+        for request, _ in mock_respx.calls
+    )
+    # Two match windows: about 760 requests instead of 5760.
+    constant = 86400 / scheduler.in_play
+    assert scheduler.requests < constant / 5
+    assert {row["fixture"]["id"] for row in received} == set(KICKOFFS)
+
+
+@pytest.mark.asyncio
+async def test_load_rounds_records_match_days(mock_respx):
+    mock_respx.get("/fixtures/rounds").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "response": [
+                    {
+                        "round": "Regular Season - 1",
+                        "dates": ["2024-08-16", "2024-08-17"],
+                    },
+                    {"round": "Regular Season - 2", "dates": ["2024-08-24"]},
+                ]
+            },
+        )
+    )
+    calendar = MatchCalendar()
+
+    assert await calendar.load_rounds(39, 2024) == [
+        "2024-08-16",
+        "2024-08-17",
+        "2024-08-24",
+    ]
+    assert calendar.matchdays()[0] == "2024-08-16"
@@ -0,0 +1,64 @@
+import httpx
+import pytest
+from api_football_sdk.odds_tracker import OddsMovementTracker, PriceSeries
+
+
+def _odds_row(fixture_id, home_odd, update):
+    return {
+        "fixture": {"id": fixture_id},
+        "update": update,
+        "bookmakers": [
+            {
+                "id": 8,
+                "name": "Bet365",
+                "bets": [
+                    {
+                        "id": 1,
+                        "name": "Match Winner",
+                        "values": [
+                            {"value": "Home", "odd": home_odd},
+                            {"value": "Away", "odd": "4.50"},
+                        ],
+                    }
+                ],
+            }
+        ],
+    }
+
+
+def test_price_series_keeps_only_changes():
+    series = PriceSeries(at=1000, price=2.0)
+    for step in range(1, 100):
+        series.append(1000 + step * 10, 2.0 + (step // 2) / 100)
+
+    assert len(series) == 50
+    assert series.price_at(999) is None
+    assert series.price_at(1000) == 2.0
+    assert series.price_at(1025) == 2.01
+    assert series.price_at(1985) == 2.49
+    assert series.history()[-1] == (1980, 2.49)
+
+
+@pytest.mark.asyncio
+async def test_tracker_records_movement_between_polls(mock_respx):
+    mock_respx.get("/odds").mock(
+        side_effect=[
+            httpx.Response(
+                200,
+                json={"response": [_odds_row(5, "1.80", "2024-08-01T10:00:00+00:00")]},
+            ),
+            httpx.Response(
+                200,
+                json={"response": [_odds_row(5, "1.65", "2024-08-01T11:00:00+00:00")]},
+            ),
+        ]
+    )
+
+    tracker = OddsMovementTracker([5], bet_id=1)
+    assert await tracker.poll_once() == 2
+    assert await tracker.poll_once() == 1
+
+    assert tracker.movement(5, 8, 1, "Home") == (1.8, 1.65)
+    assert tracker.movement(5, 8, 1, "Away") == (4.5, 4.5)
+    opened = tracker.series(5, 8, 1, "Home").opened_at
+    assert tracker.price_at(5, 8, 1, "Home", opened + 1800) == 1.8
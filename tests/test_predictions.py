@@ -0,0 +1,37 @@
+import time
+
+import httpx
+import pytest
+from api_football_sdk.adapters.memory import MemoryTransport
+from api_football_sdk.client import ApiFootballClient, set_client
+from api_football_sdk.endpoints.predictions import PredictionsPrefetcher
+
+
+def _fixture(fixture_id):
+    return {"fixture": {"id": fixture_id, "timestamp": time.time() + 3600}}
+
+
+@pytest.mark.asyncio
+async def test_prefetch_keeps_the_predictions_that_did_not_fail():
+    transport = MemoryTransport()
+
+    def handler(request):
+        fixture_id = int(request.url.params["fixture"])
+        if fixture_id == 2:
+            return httpx.Response(500)
+        return httpx.Response(200, json={"response": [{"fixture": fixture_id}]})
+
+    transport.add_route("/predictions", handler=handler)
+    previous = set_client(ApiFootballClient(transport=transport, max_retries=1))
+    try:
+        prefetcher = PredictionsPrefetcher()
+        fixtures = [_fixture(1), _fixture(2), _fixture(3)]
+
+        results = await prefetcher.prefetch(fixtures)
+        assert results == {1: {"fixture": 1}, 3: {"fixture": 3}}
+        assert len(prefetcher) == 2
+
+        await prefetcher.prefetch(fixtures)
+        assert [r.url.params["fixture"] for r in transport.requests[3:]] == ["2"]
+    finally:
+        set_client(previous)
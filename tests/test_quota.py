@@ -0,0 +1,92 @@
+import pytest
+from api_football_sdk.adapters.memory import MemoryTransport
+from api_football_sdk.client import ApiFootballClient
+from api_football_sdk.exceptions import QuotaExceededError
+from api_football_sdk.quota import QuotaTracker, estimate_calls, quota_job
+
+
+def _client(quota, limit=7500, remaining=7490):
+    transport = MemoryTransport()
+    transport.add_route(
+        "/timezone",
+        {"response": []},
+        headers={
+            "x-ratelimit-requests-limit": str(limit),
+            "x-ratelimit-requests-remaining": str(remaining),
+        },
+    )
+    return ApiFootballClient(transport=transport, quota=quota)
+
+
+@pytest.mark.asyncio
+async def test_usage_is_tracked_and_persisted(tmp_path):
+    path = tmp_path / "quota.json"
+    quota = QuotaTracker(path)
+    client = _client(quota)
+    quota.register_job("backfill", share=0.5)
+
+    await client.get_json("/timezone")
+    with quota_job("backfill"):
+        await client.get_json("/timezone")
+    await client.aclose()
+
+    restored = QuotaTracker(path)
+    assert restored.limit == 7500
+    assert restored.remaining == 7490
+    assert restored.used == 2
+    restored.register_job("backfill", share=0.5)
+    assert restored.job_remaining("backfill") == 3749
+
+
+@pytest.mark.asyncio
+async def test_job_share_exhausted_refuses_requests():
+    quota = QuotaTracker(daily_limit=10)
+    client = _client(quota, limit=10, remaining=9)
+    quota.register_job("backfill", share=0.1)
+
+    with quota_job("backfill"):
+        await client.get_json("/timezone")
+        with pytest.raises(QuotaExceededError):
+            await client.get_json("/timezone")
+    await client.get_json("/timezone")
+
+
+@pytest.mark.asyncio
+async def test_plan_running_over_its_estimate_is_held_to_the_share():
+    quota = QuotaTracker(daily_limit=10)
+    client = _client(quota, limit=10, remaining=9)
+    quota.register_job("backfill", share=0.2)
+
+    with quota_job("backfill"):
+        plan = quota.plan(2, job="backfill")
+        await client.get_json("/timezone")
+        await client.get_json("/timezone")
+        with pytest.raises(QuotaExceededError):
+            await client.get_json("/timezone")
+    plan.release()
+
+
+def test_plan_refuses_or_throttles():
+    quota = QuotaTracker(daily_limit=100, reserve=10)
+    quota.register_job("backfill", share=0.5)
+    calls = estimate_calls(380, per_item=3, batch_size=20)
+
+    assert calls == 57
+    with pytest.raises(QuotaExceededError):
+        quota.plan(calls, job="backfill")
+
+    throttled = quota.plan(calls, job="backfill", policy="throttle")
+    assert throttled.interval > 0
+
+    plan = quota.plan(40, job="backfill")
+    assert quota.available("backfill") == 10
+    assert quota.available() == 60
+    plan.release()
+    assert quota.available("backfill") == 50
+
+
+def test_job_shares_cannot_exceed_allowance():
+    quota = QuotaTracker()
+    quota.register_job("a", share=0.7)
+    with pytest.raises(ValueError):
+        quota.register_job("b", share=0.4)
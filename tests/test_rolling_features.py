@@ -0,0 +1,137 @@
+import math
+
+import httpx
+import pytest
+from api_football_sdk.adapters.memory import MemoryTransport
+from api_football_sdk.client import ApiFootballClient
+from api_football_sdk.exceptions import ParsingError
+from api_football_sdk.rolling_features import RollingFeatureStore, RollingWindow
+
+
+def _fixture(fixture_id, home, away, score, status="FT", stats=False):
+    row = {
+        "fixture": {
+            "id": fixture_id,
+            "timestamp": 1_700_000_000 + fixture_id,
+            "status": {"short": status},
+        },
+        "teams": {"home": {"id": home}, "away": {"id": away}},
+        "goals": {"home": score[0], "away": score[1]},
+    }
+    if stats:
+        row["statistics"] = [
+            {
+                "team": {"id": home},
+                "statistics": [{"type": "Ball Possession", "value": "60%"}],
+            }
+        ]
+        row["players"] = [
+            {
+                "team": {"id": home},
+                "players": [
+                    {
+                        "player": {"id": 7},
+                        "statistics": [
+                            {
+                                "games": {"minutes": 90, "rating": "7.5"},
+                                "goals": {"total": score[0], "assists": None},
+                            }
+                        ],
+                    },
+                    {
+                        "player": {"id": 8},
+                        "statistics": [{"games": {"minutes": None}}],
+                    },
+                ],
+            }
+        ]
+    return row
+
+
+def test_window_means_evict_the_oldest_and_skip_missing_values():
+    window = RollingWindow(2, window=3, alpha=0.5)
+    for values in ([1, math.nan], [2, 4], [3, 6], [4, math.nan]):
+        window.push(values)
+
+    assert window.means() == [3.0, 5.0]
+    assert window.ewma() == [3.125, 5.0]
+    assert window.updates == 4
+
+
+def test_window_sums_do_not_drift_as_values_are_evicted():
+    window = RollingWindow(1, window=2, alpha=0.5)
+    for _ in range(10000):
+        window.push([0.1])
+    window.push([0.0])
+    window.push([0.0])
+
+    assert window.means() == [0.0]
+
+
+def test_store_updates_team_splits_and_players_once_per_fixture():
+    store = RollingFeatureStore(window=2)
+    fixtures = [
+        _fixture(3, 33, 40, (0, 0)),
+        _fixture(1, 33, 40, (2, 1), stats=True),
+        _fixture(2, 40, 33, (3, 0)),
+        _fixture(4, 33, 40, (1, 0), status="NS"),
+    ]
+
+    assert store.add_fixtures(fixtures) == 3
+    assert store.add_fixtures(fixtures) == 0
+
+    # Window of 2: fixtures 2 and 3 for "all", 1 and 3 at home.
+    team = store.team_features(33)
+    assert team["matches"] == 3.0
+    assert team["goals_for_mean"] == 0.0 and team["points_mean"] == 0.5
+    home = store.team_features(33, split="home")
+    assert home["goals_for_mean"] == 1.0 and home["points_mean"] == 2.0
+    assert home["ball_possession_mean"] == pytest.approx(0.6)
+    assert math.isnan(store.team_features(40)["ball_possession_mean"])
+
+    player = store.player_features(7)
+    assert player["matches"] == 1.0 and player["rating_mean"] == 7.5
+    assert store.player_features(8) is None
+    assert store.stats() == {"fixtures": 3, "teams": 2, "players": 1}
+
+
+def test_saved_state_resumes_where_it_stopped(tmp_path):
+    store = RollingFeatureStore(window=3, alpha=0.5)
+    store.add_fixtures(_fixture(i, 33, 40, (i, 1), stats=True) for i in range(1, 6))
+    store.save(tmp_path / "state.afrf")
+
+    loaded = RollingFeatureStore.load(tmp_path / "state.afrf")
+    for s in (store, loaded):
+        s.add_fixture(_fixture(6, 40, 33, (0, 2)))
+
+    assert 3 in loaded
+    for features in (lambda s: s.team_features(33), lambda s: s.player_features(7)):
+        assert features(loaded) == pytest.approx(features(store), nan_ok=True)
+
+    (tmp_path / "bad.afrf").write_bytes(b"nope")
+    with pytest.raises(ParsingError):
+        RollingFeatureStore.load(tmp_path / "bad.afrf")
+
+
+@pytest.mark.asyncio
+async def test_update_date_hydrates_only_new_finished_fixtures():
+    def fixtures(request):
+        if "date" in request.url.params:
+            rows = [
+                _fixture(1, 33, 40, (1, 0)),
+                _fixture(2, 41, 42, (1, 1)),
+                _fixture(3, 43, 44, (0, 0), status="1H"),
+            ]
+        else:
+            ids = [int(i) for i in request.url.params["ids"].split("-")]
+            rows = [_fixture(i, 41, 42, (1, 1), stats=True) for i in ids]
+        return httpx.Response(200, json={"response": rows})
+
+    transport = MemoryTransport()
+    transport.add_route("/fixtures", handler=fixtures)
+    store = RollingFeatureStore(client=ApiFootballClient(transport=transport))
+    store.add_fixture(_fixture(1, 33, 40, (1, 0)))
+
+    assert await store.update_date("2024-08-17") == 1
+    assert transport.requests[-1].url.params["ids"] == "2"
+    assert store.player_features(7)["matches"] == 1.0
@@ -0,0 +1,80 @@
+import asyncio
+
+import pytest
+from api_football_sdk.adapters.memory import MemoryTransport
+from api_football_sdk.client import ApiFootballClient
+from api_football_sdk.scheduler import (
+    Priority,
+    RequestScheduler,
+    current_priority,
+    request_priority,
+)
+
+
+@pytest.mark.asyncio
+async def test_live_requests_overtake_queued_background():
+    scheduler = RequestScheduler(max_concurrency=1)
+    order = []
+
+    async def job(name, priority):
+        async with scheduler.slot(priority):
+            order.append(name)
+            await asyncio.sleep(0)
+
+    await scheduler.acquire(Priority.INTERACTIVE)
+    tasks = [asyncio.create_task(job(f"bg{i}", Priority.BACKGROUND)) for i in range(3)]
+    await asyncio.sleep(0)
+    tasks.append(asyncio.create_task(job("live", Priority.LIVE)))
+    await asyncio.sleep(0)
+    scheduler.release()
+    await asyncio.gather(*tasks)
+
+    assert order[0] == "live"
+    assert sorted(order[1:]) == ["bg0", "bg1", "bg2"]
+
+
+@pytest.mark.asyncio
+async def test_background_keeps_token_reserve_for_live():
+    scheduler = RequestScheduler(max_concurrency=10, rate=1.0, burst=4)
+
+    for _ in range(2):
+        await scheduler.acquire(Priority.BACKGROUND)
+    waiting = asyncio.create_task(scheduler.acquire(Priority.BACKGROUND))
+    await asyncio.sleep(0)
+    assert not waiting.done()
+
+    await asyncio.wait_for(scheduler.acquire(Priority.LIVE), 0.1)
+    assert scheduler.granted[Priority.LIVE] == 1
+    waiting.cancel()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("rate", [0.17, 1.0, 1.5])
+@pytest.mark.parametrize("priority", list(Priority))
+async def test_every_class_gets_a_token_from_a_full_bucket_at_low_rates(rate, priority):
+    transport = MemoryTransport()
+    transport.add_route("/timezone", {"response": []})
+    client = ApiFootballClient(transport=transport, rate_limit=rate)
+
+    await asyncio.wait_for(client.get_json("/timezone", priority=priority), 0.5)
+
+    scheduler = RequestScheduler(rate=rate, burst=1)
+    await asyncio.wait_for(scheduler.acquire(priority), 0.5)
+
+
+@pytest.mark.asyncio
+async def test_request_priority_reaches_scheduler():
+    transport = MemoryTransport()
+    transport.add_route("/timezone", {"response": []})
+    client = ApiFootballClient(transport=transport)
+
+    assert current_priority() is Priority.INTERACTIVE
+    with request_priority("background"):
+        await client.get_json("/timezone")
+    await client.get_json("/timezone", priority=Priority.LIVE)
+
+    assert client.scheduler.granted == {
+        Priority.LIVE: 1,
+        Priority.INTERACTIVE: 0,
+        Priority.BACKGROUND: 1,
+    }
@@ -0,0 +1,109 @@
+import pytest
+from api_football_sdk.adapters.memory import MemoryTransport
+from api_football_sdk.client import ApiFootballClient
+from api_football_sdk.endpoints.events import get_events_by_fixture
+from api_football_sdk.endpoints.fixtures import get_fixtures_by_league
+from api_football_sdk.storage import EntityStore
+
+
+def _fixture(fixture_id, status="FT", timestamp=1723834800):
+    return {
+        "fixture": {
+            "id": fixture_id,
+            "timestamp": timestamp,
+            "status": {"short": status},
+            "venue": {"id": 556, "name": "Old Trafford", "city": None},
+        },
+        "league": {"id": 39, "season": 2024, "round": "Regular Season - 1"},
+        "teams": {"home": {"id": 33, "name": "Manchester United"}, "away": {"id": 36}},
+        "goals": {"home": 1, "away": 0},
+    }
+
+
+@pytest.fixture(params=["sqlite", "duckdb"])
+def store(request):
+    if request.param == "duckdb":
+        pytest.importorskip("duckdb")
+    with EntityStore(backend=request.param, batch_size=2) as store:
+        yield store
+
+
+@pytest.mark.asyncio
+async def test_write_through_from_endpoint_functions(store, monkeypatch):
+    transport = MemoryTransport()
+    transport.add_route(
+        "/fixtures",
+        {"response": [_fixture(1), _fixture(2, "NS", 1723921200), _fixture(3)]},
+    )
+    transport.add_route(
+        "/fixtures/events",
+        {"response": [{"time": {"elapsed": 87}, "team": {"id": 33}, "type": "Goal"}]},
+    )
+    client = ApiFootballClient(transport=transport)
+    monkeypatch.setattr(
+        "api_football_sdk.endpoints.fixtures.get_client", lambda: client
+    )
+    monkeypatch.setattr("api_football_sdk.endpoints.events.get_client", lambda: client)
+    store.attach(client)
+
+    await get_fixtures_by_league(league_id=39, season=2024)
+    assert store.fixtures_without_events(league_id=39, season=2024) == [1, 3]
+
+    await get_events_by_fixture(fixture_id=1)
+    assert store.fixtures_without_events(league_id=39, season=2024) == [3]
+    assert store.events(1)[0]["elapsed"] == 87
+
+    store.detach()
+    await get_events_by_fixture(fixture_id=3)
+    assert store.fixtures_without_events() == [3]
+
+
+@pytest.mark.asyncio
+async def test_fixtures_fetched_without_events_are_not_listed_again(store):
+    transport = MemoryTransport()
+    transport.add_route("/fixtures/events", {"response": []})
+    client = ApiFootballClient(transport=transport)
+    store.add_fixtures([_fixture(1), _fixture(2)])
+    store.attach(client)
+
+    await client.get_json("/fixtures/events", params={"fixture": 1})
+    await client.get_json("/fixtures/events", params={"fixture": 2, "type": "Goal"})
+
+    assert store.fixtures_without_events() == [2]
+    assert store.events(1) == []
+    assert store.count("events_fetched") == 1
+
+
+def test_known_and_missing_ids(store):
+    store.add_fixtures([_fixture(1), _fixture(2)])
+
+    assert store.known_ids("fixtures", [1, 5]) == {1}
+    assert store.missing_ids("fixtures", [5, 1, 6, 5]) == [5, 6]
+    assert store.fixture_ids(statuses=["FT"]) == [1, 2]
+    assert store.get("fixtures", 2)["goals"] == {"home": 1, "away": 0}
+
+
+def test_partial_rows_do_not_erase_full_rows(store):
+    store.add_teams(
+        [
+            {
+                "team": {"id": 33, "name": "Manchester United", "code": "MUN"},
+                "venue": {"id": 556, "name": "Old Trafford", "city": "Manchester"},
+            }
+        ]
+    )
+    store.add_fixtures([_fixture(1)])
+
+    assert store.get("teams", 33)["team"]["code"] == "MUN"
+    assert store.get("venues", 556)["city"] == "Manchester"
+    assert store.get("teams", 36) is None
+    assert store.count("teams") == 2
+
+
+def test_writes_are_batched(store):
+    store.add_venues([{"id": 1, "name": "A"}])
+    assert store.pending == 1
+
+    store.add_venues([{"id": 2, "name": "B"}])
+    assert store.pending == 0
+    assert store.count("venues") == 2
@@ -0,0 +1,161 @@
+import json
+
+import httpx
+import pytest
+from api_football_sdk.adapters.memory import MemoryTransport
+from api_football_sdk.client import ApiFootballClient
+from api_football_sdk.endpoints import players
+from api_football_sdk.exceptions import ParsingError
+from api_football_sdk.streaming import JsonArrayParser
+
+PAYLOAD = {
+    "get": "players/profiles",
+    "errors": [],
+    "paging": {"current": 1, "total": 1},
+    "response": [
+        {"player": {"id": 1, "name": "Zoë Müller", "age": 27}},
+        {"player": {"id": 2, "name": 'A "quoted" [name]', "age": None}},
+        12.5,
+        [],
+    ],
+    "results": 4,
+}
+
+
+def _parse(body, size):
+    parser = JsonArrayParser()
+    items = []
+    for start in range(0, len(body), size):
+        items.extend(parser.feed(body[start : start + size]))
+    items.extend(parser.close())
+    return items, parser.fields
+
+
+@pytest.mark.parametrize("size", [1, 7, 64, 1 << 20])
+def test_parser_matches_full_decode_for_any_chunking(size):
+    body = json.dumps(PAYLOAD, ensure_ascii=False, indent=1).encode()
+
+    items, fields = _parse(body, size)
+
+    assert items == PAYLOAD["response"]
+    assert fields == {key: PAYLOAD[key] for key in PAYLOAD if key != "response"}
+
+
+def test_parser_yields_items_before_the_body_ends():
+    parser = JsonArrayParser()
+    assert parser.feed(b'{"paging": {"total": 3}, "response": [{"id": 1}, {"i') == [
+        {"id": 1}
+    ]
+    assert parser.fields == {"paging": {"total": 3}}
+    assert parser.feed(b'd": 2}]}') == [{"id": 2}]
+    assert parser.close() == []
+    assert parser.done
+
+
+@pytest.mark.parametrize(
+    "body", [b'{"response": [1, 2', b'{"response": [1,, 2]}', b"[1, 2]", b'{"a": 1} x']
+)
+def test_parser_rejects_truncated_or_invalid_bodies(body):
+    with pytest.raises(ValueError):
+        _parse(body, 3)
+
+
+class _Chunks(httpx.AsyncByteStream):
+    def __init__(self, body, size):
+        self.body = body
+        self.size = size
+        self.sent = 0
+        self.closed = False
+
+    async def __aiter__(self):
+        for start in range(0, len(self.body), self.size):
+            self.sent += 1
+            yield self.body[start : start + self.size]
+
+    async def aclose(self):
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_stream_json_reads_body_lazily_and_closes_early():
+    body = json.dumps({"response": [{"id": i} for i in range(100)]}).encode()
+    stream = _Chunks(body, 64)
+    transport = MemoryTransport()
+    transport.add_route(
+        "/players/profiles", handler=lambda request: httpx.Response(200, stream=stream)
+    )
+    client = ApiFootballClient(transport=transport)
+
+    rows = client.stream_json("/players/profiles")
+    async with rows:
+        async for row in rows:
+            if row["id"] == 3:
+                break
+
+    assert stream.sent < len(body) // 64
+    assert stream.closed
+
+
+@pytest.mark.asyncio
+async def test_stream_json_raises_parsing_error():
+    transport = MemoryTransport()
+    transport.add_route(
+        "/players", handler=lambda request: httpx.Response(200, content=b'{"resp')
+    )
+    client = ApiFootballClient(transport=transport)
+
+    with pytest.raises(ParsingError):
+        [row async for row in client.stream_json("/players")]
+
+
+@pytest.mark.asyncio
+async def test_iter_players_by_league_streams_every_page(monkeypatch):
+    def handler(request):
+        page = int(request.url.params["page"])
+        return httpx.Response(
+            200,
+            json={
+                "paging": {"current": page, "total": 3},
+                "response": [{"player": {"id": page * 10 + i}} for i in range(2)],
+            },
+        )
+
+    transport = MemoryTransport()
+    transport.add_route("/players", handler=handler)
+    client = ApiFootballClient(transport=transport)
+    monkeypatch.setattr(players, "get_client", lambda: client)
+
+    rows = [row async for row in players.iter_players_by_league(39, 2024)]
+
+    assert [row["player"]["id"] for row in rows] == [10, 11, 20, 21, 30, 31]
+    assert [r.url.params["league"] for r in transport.requests] == ["39"] * 3
+
+
+@pytest.mark.asyncio
+async def test_stream_pages_runs_response_hooks_once_per_page():
+    def handler(request):
+        page = int(request.url.params["page"])
+        return httpx.Response(
+            200,
+            json={
+                "paging": {"current": page, "total": 2},
+                "response": [{"player": {"id": page * 10 + i}} for i in range(2)],
+            },
+        )
+
+    transport = MemoryTransport()
+    transport.add_route("/players", handler=handler)
+    client = ApiFootballClient(transport=transport)
+    seen = []
+    client.add_response_hook(
+        lambda url, params, payload: seen.append((params, payload))
+    )
+
+    rows = [
+        row async for row in client.stream_pages("/players", params={"season": 2024})
+    ]
+
+    assert len(rows) == 4
+    assert [params["page"] for params, _ in seen] == [1, 2]
+    assert [payload["paging"]["current"] for _, payload in seen] == [1, 2]
+    assert [row for _, payload in seen for row in payload["response"]] == rows
@@ -0,0 +1,112 @@
+import asyncio
+import sys
+import time
+
+import httpx
+import pytest
+from api_football_sdk.adapters.memory import MemoryTransport
+from api_football_sdk.cache import ResponseCache
+from api_football_sdk.client import ApiFootballClient
+from api_football_sdk.exceptions import ConfigurationError
+from api_football_sdk.warmup import REFERENCE_PATHS, ReferenceSnapshot, ReferenceWarmup
+
+
+def _transport(version=1):
+    transport = MemoryTransport()
+    transport.in_flight = transport.peak = 0
+
+    def route(path):
+        async def handler(request):
+            transport.in_flight += 1
+            transport.peak = max(transport.peak, transport.in_flight)
+            await asyncio.sleep(0.01)
+            transport.in_flight -= 1
+            return httpx.Response(200, json={"response": [f"{path}-v{version}"]})
+
+        return handler
+
+    for path in REFERENCE_PATHS:
+        transport.add_route(path, handler=route(path))
+    transport.add_route("/status", {"response": {}})
+    return transport
+
+
+def _client(transport):
+    return ApiFootballClient(transport=transport, cache=ResponseCache({}))
+
+
+def _paths(transport):
+    return sorted(request.url.path for request in transport.requests)
+
+
+@pytest.mark.asyncio
+async def test_cold_start_prefetches_concurrently_and_warm_start_uses_the_snapshot(
+    tmp_path,
+):
+    path = tmp_path / "reference.afrs"
+    transport = _transport()
+    warmup = ReferenceWarmup(_client(transport), path=path, connections=3)
+
+    snapshot = await warmup.start()
+    await warmup.stop()
+
+    assert transport.peak == len(REFERENCE_PATHS)
+    assert _paths(transport) == sorted([*REFERENCE_PATHS, *["/status"] * 3])
+    assert snapshot.response("/timezone") == ["/timezone-v1"]
+    assert path.exists()
+
+    transport = _transport(version=2)
+    client = _client(transport)
+    warmup = ReferenceWarmup(client, path=path, connections=2)
+    snapshot = await warmup.start()
+    payload = await client.get_json("/leagues")
+    await warmup.stop()
+
+    assert snapshot.response("/leagues") == ["/leagues-v1"]
+    assert payload == {"response": ["/leagues-v1"]}
+    assert "/leagues" not in _paths(transport)
+
+
+@pytest.mark.asyncio
+async def test_stale_snapshot_is_served_and_refreshed_in_the_background(tmp_path):
+    path = tmp_path / "reference.afrs"
+    payloads = {url: {"response": ["old"]} for url in REFERENCE_PATHS}
+    ReferenceSnapshot(payloads, created_at=time.time() - 7200).save(path)
+    transport = _transport(version=2)
+    client = _client(transport)
+    warmup = ReferenceWarmup(client, path=path, max_age=3600, connections=1)
+
+    snapshot = await warmup.start()
+    assert snapshot.response("/countries") == ["old"]
+    for _ in range(100):
+        if ReferenceSnapshot.load(path).response("/countries") != ["old"]:
+            break
+        await asyncio.sleep(0.01)
+    await warmup.stop()
+
+    assert ReferenceSnapshot.load(path).response("/countries") == ["/countries-v2"]
+    assert (await client.get_json("/countries"))["response"] == ["/countries-v2"]
+
+
+def test_snapshot_falls_back_to_json_without_msgpack(monkeypatch):
+    monkeypatch.setitem(sys.modules, "msgpack", None)
+    snapshot = ReferenceSnapshot({"/timezone": {"response": ["Europe/London"]}}, 1.0)
+
+    data = snapshot.dumps()
+
+    assert data[:5] == b"AFRSJ"
+    restored = ReferenceSnapshot.loads(data)
+    assert restored.payloads == snapshot.payloads
+    assert restored.created_at == 1.0
+    with pytest.raises(ConfigurationError, match="api-football-sdk\\[msgpack\\]"):
+        snapshot.dumps("msgpack")
+
+
+def test_msgpack_snapshot_round_trips():
+    pytest.importorskip("msgpack")
+    snapshot = ReferenceSnapshot({"/leagues/seasons": {"response": [2023, 2024]}})
+
+    data = snapshot.dumps()
+
+    assert data[:5] == b"AFRSM"
+    assert ReferenceSnapshot.loads(data).payloads == snapshot.payloads